@@ -1,5 +1,6 @@
-from GramAddict.core.bot_flow import start_bot
-
-
 def run(**kwargs):
+    # imported here so the light modules (e.g. core.report) can be used by the scripts
+    # without loading the whole bot
+    from GramAddict.core.bot_flow import start_bot
+
     start_bot(**kwargs)
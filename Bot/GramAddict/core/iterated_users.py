@@ -0,0 +1,104 @@
+import logging
+import sqlite3
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Usernames kept in memory for a whole job before moving the oldest ones to disk
+MAX_ITERATED_USERS_IN_MEMORY = 5000
+
+
+class IteratedUsers:
+    """
+    Insertion ordered set of usernames iterated in a list.
+    If max_in_memory is set, the oldest usernames are moved to a sqlite file
+    (a temporary one if spill_path is None) once the limit is exceeded.
+    """
+
+    def __init__(
+        self,
+        usernames: Iterable[str] = (),
+        max_in_memory: Optional[int] = None,
+        spill_path: Optional[str] = None,
+    ):
+        self.max_in_memory = max_in_memory
+        self.spill_path = spill_path
+        self._users = {}
+        self._spilled = None
+        self._spilled_count = 0
+        self.update(usernames)
+
+    def add(self, username: str) -> bool:
+        """
+        Returns True if the username wasn't iterated yet.
+        """
+        if username in self:
+            return False
+        self._users[username] = None
+        if self.max_in_memory is not None and len(self._users) > self.max_in_memory:
+            self._spill()
+        return True
+
+    def update(self, usernames: Iterable[str]) -> None:
+        for username in usernames:
+            self.add(username)
+
+    def clear(self) -> None:
+        self._users.clear()
+        if self._spilled is not None:
+            self._spilled.close()
+            self._spilled = None
+        self._spilled_count = 0
+
+    def _spill(self) -> None:
+        # move the oldest half, so we don't hit the disk for every new username
+        to_spill = list(self._users)[: len(self._users) - self.max_in_memory // 2]
+        if self._spilled is None:
+            # an empty path is a temporary database deleted on close
+            self._spilled = sqlite3.connect(self.spill_path or "")
+            self._spilled.execute(
+                "CREATE TABLE IF NOT EXISTS iterated_users (username TEXT PRIMARY KEY)"
+            )
+            self._spilled.execute("DELETE FROM iterated_users")
+        with self._spilled:
+            self._spilled.executemany(
+                "INSERT OR IGNORE INTO iterated_users VALUES (?)",
+                ((username,) for username in to_spill),
+            )
+        for username in to_spill:
+            del self._users[username]
+        self._spilled_count += len(to_spill)
+        logger.debug(f"{len(to_spill)} iterated users moved to disk.")
+
+    def __contains__(self, username) -> bool:
+        if username in self._users:
+            return True
+        if self._spilled is None:
+            return False
+        return (
+            self._spilled.execute(
+                "SELECT 1 FROM iterated_users WHERE username = ?", (username,)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        if self._spilled is not None:
+            for (username,) in self._spilled.execute(
+                "SELECT username FROM iterated_users ORDER BY rowid"
+            ).fetchall():
+                yield username
+        yield from self._users
+
+    def __len__(self) -> int:
+        return self._spilled_count + len(self._users)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IteratedUsers):
+            return len(self) == len(other) and list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IteratedUsers({list(self)!r})"
@@ -0,0 +1,192 @@
+import codecs
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\r\n"
+WHITESPACE_BYTES = WHITESPACE.encode()
+
+
+def _byte_length(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+class _BackwardBuffer:
+    """
+    The end of a file, read backwards one chunk at a time.
+    Positions are absolute offsets in the file.
+    """
+
+    def __init__(self, f, chunk_size: int):
+        f.seek(0, os.SEEK_END)
+        self.f = f
+        self.chunk_size = chunk_size
+        self.start = f.tell()
+        self.data = b""
+
+    def _load(self) -> bool:
+        if self.start == 0:
+            return False
+        size = min(max(self.chunk_size, len(self.data)), self.start)
+        self.start -= size
+        self.f.seek(self.start)
+        self.data = self.f.read(size) + self.data
+        return True
+
+    def last_non_space(self, end: int) -> int:
+        while True:
+            stripped = self.data[: end - self.start].rstrip(WHITESPACE_BYTES)
+            if stripped or not self._load():
+                return self.start + len(stripped) - 1
+
+    def rfind(self, char: bytes, end: int) -> int:
+        while True:
+            idx = self.data.rfind(char, 0, end - self.start)
+            if idx >= 0:
+                return self.start + idx
+            if not self._load():
+                return -1
+
+    def byte(self, pos: int) -> bytes:
+        return self.data[pos - self.start : pos - self.start + 1]
+
+    def slice(self, begin: int, end: int) -> bytes:
+        return self.data[begin - self.start : end - self.start]
+
+    def trim(self, end: int) -> None:
+        self.data = self.data[: end - self.start]
+
+
+class JsonArrayReader:
+    """
+    Reads the items of a json array file (like sessions.json) one by one,
+    without loading the whole file in memory.
+    It can resume from the offset returned with an item and it can read the
+    file from its end, when we only need the last items.
+    """
+
+    def __init__(self, path: str, chunk_size: int = CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator:
+        for item, _ in self.iter_from():
+            yield item
+
+    def __reversed__(self) -> Iterator:
+        for item, _, _ in self.iter_reversed():
+            yield item
+
+    def iter_from(self, offset: int = 0) -> Iterator[Tuple[object, int]]:
+        """
+        Yields (item, offset), the offset is where to resume after that item.
+        """
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            buf = ""
+            eof = False
+            in_array = offset > 0
+            while True:
+                # skip the bracket, the commas and the spaces between the items
+                pos = 0
+                while pos < len(buf) and (
+                    buf[pos] in WHITESPACE
+                    or (buf[pos] == "," and in_array)
+                    or (buf[pos] == "[" and not in_array)
+                ):
+                    in_array = in_array or buf[pos] == "["
+                    pos += 1
+                if pos:
+                    offset += _byte_length(buf[:pos])
+                    buf = buf[pos:]
+                if buf.startswith("]"):
+                    return
+                if buf:
+                    try:
+                        item, end = decoder.raw_decode(buf)
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    else:
+                        offset += _byte_length(buf[:end])
+                        buf = buf[end:]
+                        yield item, offset
+                        continue
+                if eof:
+                    return
+                # the item is cut, read more (at least as much as we have, for big items)
+                data = f.read(max(self.chunk_size, len(buf)))
+                eof = not data
+                buf += text_decoder.decode(data, final=eof)
+
+    def iter_reversed(self) -> Iterator[Tuple[dict, int, int]]:
+        """
+        Yields (item, start, end) from the last item to the first one.
+        It only works for arrays of objects, the items of sessions.json.
+        """
+        with open(self.path, "rb") as f:
+            buf = _BackwardBuffer(f, self.chunk_size)
+            last = buf.last_non_space(buf.start)
+            if last < 0:
+                return
+            if buf.byte(last) != b"]":
+                raise ValueError(f"{self.path} is not a json array.")
+            cursor = last
+            first = True
+            while True:
+                last = buf.last_non_space(cursor)
+                if last >= 0 and buf.byte(last) == b"," and not first:
+                    last = buf.last_non_space(last)
+                elif last >= 0 and buf.byte(last) == b"[":
+                    return
+                if last < 0 or buf.byte(last) != b"}":
+                    raise ValueError(f"{self.path} is not an array of objects.")
+                end = last + 1
+                # the item starts at the first "{" on its left which parses
+                # exactly until its end and is preceded by "[" or ","
+                start = end
+                while True:
+                    start = buf.rfind(b"{", start)
+                    if start < 0:
+                        raise ValueError(f"{self.path} is not an array of objects.")
+                    try:
+                        item = json.loads(buf.slice(start, end))
+                    except ValueError:
+                        continue
+                    before = buf.last_non_space(start)
+                    if before >= 0 and buf.byte(before) in (b",", b"["):
+                        break
+                yield item, start, end
+                buf.trim(start)
+                cursor = start
+                first = False
+
+
+def last_items(path: str, count: int) -> List:
+    """
+    The last items of a json array file, in their order.
+    """
+    items = []
+    if count > 0 and os.path.exists(path):
+        for item in reversed(JsonArrayReader(path)):
+            items.append(item)
+            if len(items) == count:
+                break
+    return items[::-1]
+
+
+def items_since(path: str, key: str, since: Optional[str]) -> List:
+    """
+    The items of a json array file whose key is greater than since (e.g. sessions
+    which started after a timestamp), read from the end of the file.
+    """
+    items = []
+    if os.path.exists(path):
+        for item in reversed(JsonArrayReader(path)):
+            if since is not None and str(item.get(key)) <= since:
+                break
+            items.append(item)
+    return items[::-1]
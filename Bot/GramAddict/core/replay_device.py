@@ -0,0 +1,406 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import zipfile
+from collections import Counter
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from GramAddict.core.device_facade import DeviceFacade, Direction, SleepTime
+from GramAddict.core.filter import Filter
+from GramAddict.core.hierarchy_snapshot import (
+    HierarchySnapshot,
+    SnapshotNode,
+    SnapshotView,
+    notify_ui_changed,
+)
+from GramAddict.core.persistent_list import PersistentList
+from GramAddict.core.session_state import SessionState, SessionStateEncoder
+from GramAddict.core.storage import ACCOUNTS, FILTER, Storage
+from GramAddict.core.utils import VirtualClock, random_sleep, set_clock
+
+logger = logging.getLogger(__name__)
+
+FILENAME_SCENARIO = "scenario.json"
+HIERARCHY_IN_ARCHIVE = "hierarchy.xml"
+
+
+def load_screen(path: str) -> str:
+    """
+    Reads a hierarchy dump: a xml file or a zip archive made by `gramaddict dump`.
+    """
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(HIERARCHY_IN_ARCHIVE).decode("utf-8")
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+class ReplayDevice(DeviceFacade):
+    """
+    Fake device which replays hierarchy dumps, so the plugins can run without a phone.
+
+    The scenario maps every screen to its dump and to the screen shown after an action:
+    {
+        "start": "following_1",
+        "screens": {
+            "following_1": {
+                "file": "screen_1650000000.zip",
+                "scroll": "following_2",
+                "back": "profile",
+                "click": [{"resourceId": "...", "text": "alice", "to": "alice_profile"}]
+            }
+        }
+    }
+    Actions which are not in the scenario leave the screen as it is.
+    """
+
+    def __init__(
+        self,
+        scenario: dict,
+        dumps_path: str = ".",
+        app_id: str = "com.instagram.android",
+        virtual_sleep: bool = True,
+    ):
+        self.device_id = "replay"
+        self.app_id = app_id
+        self.scenario = scenario
+        self.dumps: Dict[str, str] = {}
+        self.screens: Dict[str, HierarchySnapshot] = {}
+        for name, screen in scenario["screens"].items():
+            self.dumps[name] = load_screen(os.path.join(dumps_path, screen["file"]))
+            self.screens[name] = HierarchySnapshot(self.dumps[name])
+        self.current = scenario.get("start", next(iter(scenario["screens"])))
+        self.calls = Counter()
+        self.transitions = 0
+        # text typed in the views of the current screen (node order -> text), the dumps stay untouched
+        self.typed_text: Dict[int, str] = {}
+        self.deviceV2 = _ReplayDeviceV2(self)
+        self._snapshot = None
+        self.clock = VirtualClock() if virtual_sleep else None
+        self._previous_clock = set_clock(self.clock) if self.clock else None
+        self._started = perf_counter()
+
+    @classmethod
+    def from_directory(cls, dumps_path: str, **kwargs) -> "ReplayDevice":
+        with open(os.path.join(dumps_path, FILENAME_SCENARIO), encoding="utf-8") as f:
+            return cls(json.load(f), dumps_path, **kwargs)
+
+    def close(self) -> None:
+        if self._previous_clock is not None:
+            set_clock(self._previous_clock)
+            self._previous_clock = None
+
+    @property
+    def screen(self) -> HierarchySnapshot:
+        return self.screens[self.current]
+
+    def transition(self, action: str, node: Optional[SnapshotNode] = None) -> bool:
+        """
+        Moves to the screen configured for that action, returns True if the screen has changed.
+        """
+        self.calls[action] += 1
+        target = None
+        rules = self.scenario["screens"][self.current].get(action)
+        if isinstance(rules, str):
+            target = rules
+        elif isinstance(rules, list) and node is not None:
+            for rule in rules:
+                selector = {k: v for k, v in rule.items() if k != "to"}
+                if self.screen._select([node], selector):
+                    target = rule["to"]
+                    break
+        notify_ui_changed()
+        if target is None or target == self.current:
+            return False
+        logger.debug(f"Replay: {action} {self.current} -> {target}")
+        self.current = target
+        self.typed_text = {}
+        self.transitions += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "elapsed_s": round(perf_counter() - self._started, 3),
+            "virtual_sleep_s": round(self.clock.slept, 3) if self.clock else 0,
+            "transitions": self.transitions,
+            "calls": dict(self.calls),
+        }
+
+    def _get_current_app(self):
+        return self.app_id
+
+    def find(self, index=None, **kwargs):
+        self.calls["find"] += 1
+        nodes = self.screen._select(self.screen.nodes, kwargs)
+        if index is not None and len(nodes) > 1:
+            nodes = nodes[index : index + 1]
+        return ReplayView(self, self.screen, nodes)
+
+    def snapshot(self, force: bool = False) -> HierarchySnapshot:
+        self.calls["dump_hierarchy"] += 1
+        # the dumps never change, the current screen is always a valid snapshot
+        self.screen.mark_valid()
+        return self.screen
+
+    def back(self, modulable: bool = True):
+        self.transition("back")
+        random_sleep(modulable=modulable)
+
+    def start_screenrecord(self, output="debug_0000.mp4", fps=20):
+        pass
+
+    def stop_screenrecord(self, crash=True):
+        pass
+
+    def screenshot(self, path=None):
+        pass
+
+    def dump_hierarchy(self, path=None):
+        self.calls["dump_hierarchy"] += 1
+        if path is None:
+            return self.deviceV2.dump_hierarchy()
+        with open(path, "w", encoding="utf-8") as outfile:
+            outfile.write(self.deviceV2.dump_hierarchy())
+
+    def press_power(self):
+        pass
+
+    def is_screen_locked(self):
+        return False
+
+    def is_keyboard_show(self):
+        return False
+
+    def is_alive(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def screen_off(self):
+        pass
+
+    def get_orientation(self):
+        return 0
+
+    def window_size(self):
+        return self.deviceV2.window_size()
+
+    def swipe(self, direction: Direction, scale=0.5):
+        self.transition("swipe")
+        DeviceFacade.sleep_mode(SleepTime.TINY)
+
+    def swipe_points(self, sx, sy, ex, ey, random_x=True, random_y=True, speed=None):
+        self.transition("swipe")
+        DeviceFacade.sleep_mode(SleepTime.TINY)
+
+    def get_info(self):
+        return self.deviceV2.info
+
+
+class ReplayView(SnapshotView):
+    """
+    SnapshotView which also accepts the actions, they move the ReplayDevice to another screen.
+    """
+
+    def __init__(
+        self,
+        device: ReplayDevice,
+        snapshot: HierarchySnapshot,
+        nodes: List[SnapshotNode],
+    ):
+        super().__init__(snapshot, nodes)
+        self.device = device
+
+    def _new(self, nodes: List[SnapshotNode]) -> "ReplayView":
+        return ReplayView(self.device, self.snapshot, nodes)
+
+    def exists(self, ui_timeout=None, ignore_bug: bool = False) -> bool:
+        self.device.calls["exists"] += 1
+        # the view is gone if the device has moved to another screen
+        return self.node is not None and self.snapshot is self.device.screen
+
+    @property
+    def viewV2(self) -> Optional[SnapshotNode]:
+        return self.node
+
+    def _typed_text(self, node: Optional[SnapshotNode]) -> Optional[str]:
+        if node is None or self.snapshot is not self.device.screen:
+            return None
+        return self.device.typed_text.get(node.order)
+
+    def ui_info(self) -> dict:
+        if self.node is None:
+            return {}
+        info = dict(self.node.attrib)
+        typed = self._typed_text(self.node)
+        if typed is not None:
+            info["text"] = typed
+        return info
+
+    def get_property(self, prop: str):
+        return self.ui_info().get(prop) if self.node else None
+
+    def get_text(self, error=True, index=None) -> str:
+        node = self.node if index is None else self.nodes[index]
+        typed = self._typed_text(node)
+        return typed if typed is not None else super().get_text(error, index)
+
+    def click(self, mode=None, sleep=None, coord=None, crash_report_if_fails=True):
+        self.device.transition("click", self.node)
+        DeviceFacade.sleep_mode(sleep)
+
+    def click_retry(self, mode=None, sleep=None, coord=None, maxretry=2):
+        self.click(mode, sleep, coord)
+        return not self.exists()
+
+    def double_click(self, padding=0.3, obj_over=0):
+        self.device.transition("double_click", self.node)
+
+    def click_gone(self, maxretry=3, interval=1.0):
+        self.click()
+
+    def scroll(self, direction):
+        self.device.transition("scroll" if direction == Direction.DOWN else "scroll_up")
+
+    def fling(self, direction):
+        self.device.transition("fling" if direction == Direction.DOWN else "fling_up")
+
+    def scroll_to(self, text):
+        self.device.transition("scroll")
+
+    def scroll_toEnd(self):
+        self.device.transition("scroll")
+
+    def wait_gone(self, ui_timeout=None):
+        return not self.exists()
+
+    def is_above_this(self, obj2) -> Optional[bool]:
+        if not self.exists() or not obj2.exists():
+            return None
+        return self.get_bounds()["top"] < obj2.get_bounds()["top"]
+
+    def set_text(self, text: str, mode=None) -> None:
+        self.device.calls["set_text"] += 1
+        if self.node is not None:
+            self.device.typed_text[self.node.order] = text
+
+
+class _ReplayToast:
+    @staticmethod
+    def get_message(wait_timeout=10, cache_timeout=10, default=None):
+        return default
+
+
+class _ReplayDeviceV2:
+    """
+    The few uiautomator2 calls which are made directly on device.deviceV2.
+    """
+
+    serial = "replay"
+    toast = _ReplayToast()
+
+    def __init__(self, device: ReplayDevice):
+        self.device = device
+
+    @property
+    def info(self) -> dict:
+        return {
+            "currentPackageName": self.device.app_id,
+            "displayHeight": 1920,
+            "displayWidth": 1080,
+            "displayRotation": 0,
+            "displaySizeDpX": 411,
+            "displaySizeDpY": 731,
+            "productName": "ReplayDevice",
+            "screenOn": True,
+            "sdkInt": 30,
+            "naturalOrientation": True,
+        }
+
+    def window_size(self):
+        return self.info["displayWidth"], self.info["displayHeight"]
+
+    def app_current(self) -> dict:
+        return {"package": self.device.app_id}
+
+    def app_start(self, *args, **kwargs):
+        pass
+
+    def app_stop(self, *args, **kwargs):
+        pass
+
+    def app_stop_all(self, *args, **kwargs):
+        return []
+
+    def set_fastinput_ime(self, enable=True):
+        pass
+
+    def press(self, key):
+        self.device.transition(key)
+
+    def click(self, x, y):
+        self.device.transition("click")
+
+    def clear_text(self):
+        pass
+
+    def send_keys(self, text, clear=False):
+        pass
+
+    def dump_hierarchy(self) -> str:
+        return self.device.dumps[self.device.current]
+
+
+def replay_jobs(configs, dumps_path: str, jobs: Optional[List[str]] = None) -> dict:
+    """
+    Runs the jobs (the enabled ones by default) on the dumps of dumps_path instead of
+    a phone and returns the stats of the ReplayDevice with the time taken by every job.
+    The interactions are stored in a temporary account folder, only filters.yml is copied.
+    """
+    device = ReplayDevice.from_directory(
+        os.path.abspath(dumps_path), app_id=configs.app_id
+    )
+    username = configs.username or "replay"
+    filters_path = os.path.abspath(os.path.join(ACCOUNTS, username, FILTER))
+    working_dir = os.getcwd()
+    durations = {}
+    with tempfile.TemporaryDirectory(prefix="replay_") as replay_dir:
+        os.chdir(replay_dir)
+        try:
+            session_state = SessionState(configs)
+            session_state.set_limits_session()
+            session_state.my_username = username
+            sessions = PersistentList("sessions", SessionStateEncoder)
+            sessions.append(session_state)
+            storage = Storage(username, configs.args.storage_backend)
+            if os.path.exists(filters_path):
+                shutil.copy(filters_path, storage.account_path)
+                storage.filter_path = os.path.join(storage.account_path, FILTER)
+            filters = Filter(storage)
+            try:
+                for job in configs.actions_enabled if jobs is None else jobs:
+                    started = perf_counter()
+                    configs.actions[job].run(
+                        device, configs, storage, sessions, filters, job
+                    )
+                    durations[job] = round(perf_counter() - started, 3)
+            finally:
+                storage.close()
+        finally:
+            os.chdir(working_dir)
+            device.close()
+    return {"jobs": durations, **device.stats()}
+
+
+def print_replay_stats(stats: dict) -> None:
+    for job, duration in stats["jobs"].items():
+        logger.info(f"Replayed {job} in {duration}s.")
+    logger.info(
+        f"Total: {stats['elapsed_s']}s, {stats['virtual_sleep_s']}s of sleep skipped, {stats['transitions']} screen changes."
+    )
+    for call, count in sorted(stats["calls"].items(), key=lambda x: x[1], reverse=True):
+        logger.info(f"  {call:<24} {count:>8}")
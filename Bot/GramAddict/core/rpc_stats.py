@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+from contextlib import nullcontext
+from functools import wraps
+from time import perf_counter
+from typing import Optional
+
+from atomicwrites import atomic_write
+
+logger = logging.getLogger(__name__)
+
+FILENAME_RPC_STATS = "rpc_stats.json"
+# upper bounds of the latency buckets, in milliseconds
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+SLEEP = "sleep"
+NO_JOB = "bot"
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        ms = seconds * 1000
+        for idx, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[idx] += 1
+                return
+        self.buckets[-1] += 1
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 3),
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else 0,
+            "min_ms": round((self.min or 0) * 1000, 1),
+            "max_ms": round(self.max * 1000, 1),
+            "histogram": {
+                label: n for label, n in zip(labels, self.buckets) if n
+            },
+        }
+
+
+class _Measure:
+    __slots__ = ("stats", "operation", "start")
+
+    def __init__(self, stats: "RpcStats", operation: str):
+        self.stats = stats
+        self.operation = operation
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *exc):
+        self.stats.record(self.operation, perf_counter() - self.start)
+        return False
+
+
+class RpcStats:
+    """
+    Opt-in (--rpc-stats) latency histograms of the device calls,
+    keyed by operation and by the job which was running.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self, enabled: Optional[bool] = None) -> None:
+        if enabled is not None:
+            self.enabled = enabled
+        self.job = NO_JOB
+        self.histograms = {}
+        self.jobs_time = {}
+        self._job_start = perf_counter()
+
+    def set_job(self, job: Optional[str]) -> None:
+        now = perf_counter()
+        self.jobs_time[self.job] = self.jobs_time.get(self.job, 0.0) + (
+            now - self._job_start
+        )
+        self.job = job or NO_JOB
+        self._job_start = now
+
+    def measure(self, operation: str):
+        return _Measure(self, operation) if self.enabled else nullcontext()
+
+    def record(self, operation: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        job_histograms = self.histograms.setdefault(self.job, {})
+        job_histograms.setdefault(operation, LatencyHistogram()).add(seconds)
+
+    def summary(self) -> dict:
+        self.set_job(self.job)
+        jobs = {}
+        for job, operations in self.histograms.items():
+            wall = self.jobs_time.get(job, 0.0)
+            sleep = operations[SLEEP].total if SLEEP in operations else 0.0
+            rpc = sum(h.total for op, h in operations.items() if op != SLEEP)
+            jobs[job] = {
+                "wall_s": round(wall, 3),
+                "rpc_s": round(rpc, 3),
+                "sleep_s": round(sleep, 3),
+                "python_s": round(max(wall - rpc - sleep, 0.0), 3),
+                "operations": {op: h.to_dict() for op, h in operations.items()},
+            }
+        return jobs
+
+    def persist(self, account_path: str, session_id: str) -> None:
+        if not self.enabled:
+            return
+        summary = {"session_id": session_id, "jobs": self.summary()}
+        logger.info(f"RPC stats: {json.dumps(summary, separators=(',', ':'))}")
+        with atomic_write(
+            os.path.join(account_path, FILENAME_RPC_STATS),
+            overwrite=True,
+            encoding="utf-8",
+        ) as outfile:
+            json.dump(summary, outfile, indent=4)
+
+
+rpc_stats = RpcStats()
+
+
+def measured(operation: str):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not rpc_stats.enabled:
+                return func(*args, **kwargs)
+            with _Measure(rpc_stats, operation):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
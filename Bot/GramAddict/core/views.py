@@ -1,120 +1,2294 @@
-from builtins import *
-from math import prod as _positive
+import datetime
+import logging
+import re
+from enum import Enum, auto
+from random import choice, randint, uniform
+from typing import Optional, Tuple
 
+from colorama import Fore, Style
 
-__obfuscator__ = 'Deluxe'
-__authors__ = "SadHam"
-__github__ = 'https://github.com/'
-__discord__ = 'https://discord.gg/'
-__license__ = 'EPL-2.0'
+from GramAddict.core.device_facade import (
+    DeviceFacade,
+    Direction,
+    Location,
+    Mode,
+    SleepTime,
+    Timeout,
+)
+from GramAddict.core.imports import lazy_import
+from GramAddict.core.resources import ClassName
+from GramAddict.core.resources import ResourceID as resources
+from GramAddict.core.resources import TabBarText
+from GramAddict.core.utils import (
+    ActionBlockedError,
+    close_instagram,
+    get_value,
+    open_instagram,
+    random_sleep,
+    save_crash,
+    skip_smart_lock,
+    sleep,
+)
 
-__code__ = 'print("Hello world!")'
+emoji = lazy_import("emoji")
 
+logger = logging.getLogger(__name__)
 
-Product, StackOverflow, Run, _random, Ceil, _modulo, While = exec, str, tuple, map, ord, globals, type
 
-class Square:
-    def __init__(self, _calculate):
-        self.Walk = _positive((_calculate, -42050))
-        self.Negative(Builtins=-94414)
+def load_config(config):
+    global args
+    global configs
+    global ResourceID
+    args = config.args
+    configs = config
+    ResourceID = resources(config.args.app_id)
 
-    def Negative(self, Builtins = True):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        self.Walk /= -69465 + Builtins
-        
-        try:
-            ({StackOverflow: _random} or Hypothesis if {StackOverflow: _random} and Hypothesis else ... or (Hypothesis, {StackOverflow: _random}))
 
-        except OSError:
-            (_random, Hypothesis) if Run <= StackOverflow else {'i6etltbgeRaR3y': _random} <= Product
+def case_insensitive_re(str_list):
+    strings = str_list if isinstance(str_list, str) else "|".join(str_list)
+    return f"(?i)({strings})"
 
-        except:
-            While(-39122 * 66622) == Ellipsis
 
-    def _theory(self, _product = 59019):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _product -= 25801 - -82978
-        self.System != str
-        
-        try:
-            (Product, Hypothesis, Product) if _modulo >= Hypothesis else (Product, Hypothesis, Product) != _random
+class TabBarTabs(Enum):
+    HOME = auto()
+    SEARCH = auto()
+    REELS = auto()
+    ORDERS = auto()
+    ACTIVITY = auto()
+    PROFILE = auto()
+
+
+class SearchTabs(Enum):
+    TOP = auto()
+    ACCOUNTS = auto()
+    TAGS = auto()
+    PLACES = auto()
+
+
+class FollowStatus(Enum):
+    FOLLOW = auto()
+    FOLLOWING = auto()
+    FOLLOW_BACK = auto()
+    REQUESTED = auto()
+    NONE = auto()
+
+
+class SwipeTo(Enum):
+    HALF_PHOTO = auto()
+    NEXT_POST = auto()
+
+
+class LikeMode(Enum):
+    SINGLE_CLICK = auto()
+    DOUBLE_CLICK = auto()
+
+
+class MediaType(Enum):
+    PHOTO = auto()
+    VIDEO = auto()
+    REEL = auto()
+    IGTV = auto()
+    CAROUSEL = auto()
+    UNKNOWN = auto()
+
+
+class Owner(Enum):
+    OPEN = auto()
+    GET_NAME = auto()
+    GET_POSITION = auto()
+
+
+class TabBarView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def _getTabBar(self):
+        return self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.TAB_BAR),
+            className=ClassName.LINEAR_LAYOUT,
+        )
+
+    def navigateToHome(self):
+        self._navigateTo(TabBarTabs.HOME)
+        return HomeView(self.device)
+
+    def navigate_to_search(self):
+        self._navigateTo(TabBarTabs.SEARCH)
+        return SearchView(self.device)
+
+    def navigateToReels(self):
+        self._navigateTo(TabBarTabs.REELS)
+
+    def navigateToOrders(self):
+        self._navigateTo(TabBarTabs.ORDERS)
+
+    def navigateToActivity(self):
+        self._navigateTo(TabBarTabs.ACTIVITY)
+
+    def navigate_to_profile(self):
+        self._navigateTo(TabBarTabs.PROFILE)
+        return ProfileView(self.device, is_own_profile=True)
+
+    def _get_new_profile_position(self) -> Optional[DeviceFacade.View]:
+        buttons = self.device.find(className=ResourceID.BUTTON)
+        for button in buttons:
+            if button.content_desc() == "Profile":
+                return button
+        return None
+
+    def _navigateTo(self, tab: TabBarTabs):
+        tab_name = tab.name
+        logger.debug(f"Navigate to {tab_name}")
+        button = None
+        UniversalActions.close_keyboard(self.device)
+        if tab == TabBarTabs.HOME:
+            button = self.device.find(
+                classNameMatches=ClassName.BUTTON_OR_FRAME_LAYOUT_REGEX,
+                descriptionMatches=case_insensitive_re(TabBarText.HOME_CONTENT_DESC),
+            )
+
+        elif tab == TabBarTabs.SEARCH:
+            button = self.device.find(
+                classNameMatches=ClassName.BUTTON_OR_FRAME_LAYOUT_REGEX,
+                descriptionMatches=case_insensitive_re(TabBarText.SEARCH_CONTENT_DESC),
+            )
+
+            if not button.exists():
+                # Some accounts display the search btn only in Home -> action bar
+                logger.debug("Didn't find search in the tab bar...")
+                home_view = self.navigateToHome()
+                home_view.navigateToSearch()
+                return
+        elif tab == TabBarTabs.REELS:
+            button = self.device.find(
+                classNameMatches=ClassName.BUTTON_OR_FRAME_LAYOUT_REGEX,
+                descriptionMatches=case_insensitive_re(TabBarText.REELS_CONTENT_DESC),
+            )
+
+        elif tab == TabBarTabs.ORDERS:
+            button = self.device.find(
+                classNameMatches=ClassName.BUTTON_OR_FRAME_LAYOUT_REGEX,
+                descriptionMatches=case_insensitive_re(TabBarText.ORDERS_CONTENT_DESC),
+            )
+
+        elif tab == TabBarTabs.ACTIVITY:
+            button = self.device.find(
+                classNameMatches=ClassName.BUTTON_OR_FRAME_LAYOUT_REGEX,
+                descriptionMatches=case_insensitive_re(
+                    TabBarText.ACTIVITY_CONTENT_DESC
+                ),
+            )
+
+        elif tab == TabBarTabs.PROFILE:
+            button = self.device.find(
+                classNameMatches=ClassName.BUTTON_OR_FRAME_LAYOUT_REGEX,
+                descriptionMatches=case_insensitive_re(TabBarText.PROFILE_CONTENT_DESC),
+            )
+            if not button.exists():
+                button = self._get_new_profile_position()
+
+        if button is not None and button.exists(Timeout.MEDIUM):
+            # Two clicks to reset tab content
+            button.click(sleep=SleepTime.SHORT)
+            if tab is not TabBarTabs.PROFILE:
+                button.click(sleep=SleepTime.SHORT)
+            return
+
+        logger.error(f"Didn't find tab {tab_name} in the tab bar...")
+
+
+class ActionBarView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+        self.action_bar = self._getActionBar()
+
+    def _getActionBar(self):
+        return self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.ACTION_BAR_CONTAINER),
+            className=ClassName.FRAME_LAYOUT,
+        )
+
+
+class HomeView(ActionBarView):
+    def __init__(self, device: DeviceFacade):
+        super().__init__(device)
+        self.device = device
+
+    def navigateToSearch(self):
+        logger.debug("Navigate to Search")
+        search_btn = self.action_bar.child(
+            descriptionMatches=case_insensitive_re(TabBarText.SEARCH_CONTENT_DESC)
+        )
+        search_btn.click()
+
+        return SearchView(self.device)
+
+
+class HashTagView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def get_recycler_view(self):
+        obj = self.device.find(resourceIdMatches=ResourceID.RECYCLER_VIEW)
+        if obj.exists(Timeout.LONG):
+            logger.debug("RecyclerView exists.")
+        else:
+            logger.debug("RecyclerView doesn't exists.")
+        return obj
+
+    def get_fist_image_view(self, recycler):
+        obj = recycler.child(
+            resourceIdMatches=ResourceID.IMAGE_BUTTON,
+        )
+        if obj.exists(Timeout.LONG):
+            logger.debug("First image in view exists.")
+        else:
+            logger.debug("First image in view doesn't exists.")
+        return obj
+
+    def get_recent_tab(self):
+        obj = self.device.find(
+            className=ClassName.TEXT_VIEW,
+            textMatches=case_insensitive_re(TabBarText.RECENT_CONTENT_DESC),
+        )
+        if obj.exists(Timeout.LONG):
+            logger.debug("Recent Tab exists.")
+        else:
+            logger.debug("Recent Tab doesn't exists.")
+        return obj
+
+
+# The place view for the moment It's only a copy/paste of HashTagView
+# Maybe we can add the com.instagram.android:id/category_name == "Country/Region" (or other obv)
+
+
+class PlacesView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def _getRecyclerView(self):
+        obj = self.device.find(resourceIdMatches=ResourceID.RECYCLER_VIEW)
+        if obj.exists(Timeout.LONG):
+            logger.debug("RecyclerView exists.")
+        else:
+            logger.debug("RecyclerView doesn't exists.")
+        return obj
+
+    def _getFistImageView(self, recycler):
+        obj = recycler.child(
+            resourceIdMatches=ResourceID.IMAGE_BUTTON,
+        )
+        if obj.exists(Timeout.LONG):
+            logger.debug("First image in view exists.")
+        else:
+            logger.debug("First image in view doesn't exists.")
+        return obj
+
+    def _getRecentTab(self):
+        return self.device.find(
+            className=ClassName.TEXT_VIEW,
+            textMatches=case_insensitive_re(TabBarText.RECENT_CONTENT_DESC),
+        )
+
+    def _getInformBody(self):
+        return self.device.find(
+            className=ClassName.TEXT_VIEW,
+            resourceId=ResourceID.INFORM_BODY,
+        )
+
+
+class SearchView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def _getSearchEditText(self):
+        for _ in range(2):
+            obj = self.device.find(
+                resourceIdMatches=case_insensitive_re(
+                    ResourceID.ACTION_BAR_SEARCH_EDIT_TEXT
+                ),
+            )
+            if obj.exists(Timeout.LONG):
+                return obj
+            logger.error(
+                "Can't find the search bar! Refreshing it by pressing Home and Search again.."
+            )
+            UniversalActions.close_keyboard(self.device)
+            TabBarView(self.device).navigateToHome()
+            TabBarView(self.device).navigate_to_search()
+        logger.error("Can't find the search bar!")
+        return None
+
+    def _getUsernameRow(self, username):
+        return self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.ROW_SEARCH_USER_USERNAME),
+            className=ClassName.TEXT_VIEW,
+            textMatches=case_insensitive_re(username),
+        )
+
+    def _getHashtagRow(self, hashtag):
+        return self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.ROW_HASHTAG_TEXTVIEW_TAG_NAME
+            ),
+            className=ClassName.TEXT_VIEW,
+            text=f"#{hashtag}",
+        )
+
+    def _getPlaceRow(self):
+        obj = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.ROW_PLACE_TITLE),
+        )
+        obj.wait(Timeout.MEDIUM)
+        return obj
+
+    def _getTabTextView(self, tab: SearchTabs):
+        tab_layout = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.FIXED_TABBAR_TABS_CONTAINER
+            ),
+        )
+        if tab_layout.exists():
+            logger.debug("Tabs container exists!")
+            tab_text_view = tab_layout.child(
+                resourceIdMatches=case_insensitive_re(ResourceID.TAB_BUTTON_NAME_TEXT),
+                textMatches=case_insensitive_re(tab.name),
+            )
+            if not tab_text_view.exists():
+                logger.debug("Tabs container hasn't text! Let's try with description.")
+                for obj in tab_layout.child():
+                    if obj.ui_info()["contentDescription"].upper() == tab.name.upper():
+                        tab_text_view = obj
+                        break
+            return tab_text_view
+        return None
+
+    def _searchTabWithTextPlaceholder(self, tab: SearchTabs):
+        tab_layout = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.FIXED_TABBAR_TABS_CONTAINER
+            ),
+        )
+        search_edit_text = self._getSearchEditText()
+
+        fixed_text = "Search {}".format(tab.name if tab.name != "TAGS" else "hashtags")
+        logger.debug(
+            "Going to check if the search bar have as placeholder: {}".format(
+                fixed_text
+            )
+        )
+
+        for item in tab_layout.child(
+            resourceId=ResourceID.TAB_BUTTON_FALLBACK_ICON,
+            className=ClassName.IMAGE_VIEW,
+        ):
+            item.click()
+
+            # Little trick for force-update the ui and placeholder text
+            if search_edit_text is not None:
+                search_edit_text.click()
+
+            if self.device.find(
+                className=ClassName.TEXT_VIEW,
+                textMatches=case_insensitive_re(fixed_text),
+            ).exists():
+                return item
+        return None
+
+    def navigate_to_target(self, target: str, job: str) -> bool:
+        target = emoji.emojize(target, use_aliases=True)
+        logger.info(f"Navigate to {target}")
+        search_edit_text = self._getSearchEditText()
+        if search_edit_text is not None:
+            logger.debug("Pressing on searchbar.")
+            search_edit_text.click(sleep=SleepTime.SHORT)
+        else:
+            logger.debug("There is no searchbar!")
+            return False
+        if self._check_current_view(target, job):
+            logger.info(f"{target} is in recent history.")
+            return True
+        search_edit_text.set_text(
+            target,
+            Mode.PASTE if args.dont_type else Mode.TYPE,
+        )
+        if self._check_current_view(target, job):
+            logger.info(f"{target} is in top view.")
+            return True
+        echo_text = self.device.find(resourceId=ResourceID.ECHO_TEXT)
+        if echo_text.exists(Timeout.SHORT):
+            logger.debug("Pressing on see all results.")
+            echo_text.click()
+        # at this point we have the tabs available
+        self._switch_to_target_tag(job)
+        if self._check_current_view(target, job, in_place_tab=True):
+            return True
+        return False
+
+    def _switch_to_target_tag(self, job: str):
+        if "place" in job:
+            tab = SearchTabs.PLACES
+        elif "hashtag" in job:
+            tab = SearchTabs.TAGS
+        else:
+            tab = SearchTabs.ACCOUNTS
+
+        obj = self._getTabTextView(tab)
+        if obj is not None:
+            logger.info(f"Switching to {tab.name}")
+            obj.click()
+
+    def _check_current_view(
+        self, target: str, job: str, in_place_tab: bool = False
+    ) -> bool:
+        if "place" in job:
+            if not in_place_tab:
+                return False
+            else:
+                obj = self._getPlaceRow()
+        else:
+            obj = self.device.find(
+                text=target,
+                resourceIdMatches=ResourceID.SEARCH_ROW_ITEM,
+            )
+        if obj.exists():
+            obj.click()
+            return True
+        return False
+
+
+class PostsViewList:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+        self.has_tags = False
+
+    def swipe_to_fit_posts(self, swipe: SwipeTo):
+        """calculate the right swipe amount necessary to swipe to next post in hashtag post view
+        in order to make it available to other plug-ins I cut it in two moves"""
+        displayWidth = self.device.get_info()["displayWidth"]
+        containers_content = ResourceID.MEDIA_CONTAINER
+        containers_gap = ResourceID.GAP_VIEW_AND_FOOTER_SPACE
+        suggested_users = ResourceID.NETEGO_CAROUSEL_HEADER
+
+        # move type: half photo
+        if swipe == SwipeTo.HALF_PHOTO:
+            zoomable_view_container = self.device.find(
+                resourceIdMatches=containers_content
+            ).get_bounds()["bottom"]
+            ac_exists, _, ac_bottom = PostsViewList(
+                self.device
+            )._get_action_bar_position()
+            if ac_exists and zoomable_view_container < ac_bottom:
+                zoomable_view_container += ac_bottom
+            self.device.swipe_points(
+                displayWidth / 2,
+                zoomable_view_container - 5,
+                displayWidth / 2,
+                zoomable_view_container * 0.5,
+            )
+        elif swipe == SwipeTo.NEXT_POST:
+            logger.info(
+                "Scroll down to see next post.", extra={"color": f"{Fore.GREEN}"}
+            )
+            gap_view_obj = self.device.find(index=-1, resourceIdMatches=containers_gap)
+            obj1 = None
+            for _ in range(3):
+                if not gap_view_obj.exists():
+                    logger.debug("Can't find the gap obj, scroll down a little more.")
+                    PostsViewList(self.device).swipe_to_fit_posts(SwipeTo.HALF_PHOTO)
+                    gap_view_obj = self.device.find(resourceIdMatches=containers_gap)
+                    if not gap_view_obj.exists():
+                        continue
+                    else:
+                        break
+                else:
+                    media = self.device.find(resourceIdMatches=containers_content)
+                    if (
+                        gap_view_obj.get_bounds()["bottom"]
+                        < media.get_bounds()["bottom"]
+                    ):
+                        PostsViewList(self.device).swipe_to_fit_posts(
+                            SwipeTo.HALF_PHOTO
+                        )
+                        continue
+                    suggested = self.device.find(resourceIdMatches=suggested_users)
+                    if suggested.exists():
+                        for _ in range(2):
+                            PostsViewList(self.device).swipe_to_fit_posts(
+                                SwipeTo.HALF_PHOTO
+                            )
+                            footer_obj = self.device.find(
+                                resourceIdMatches=ResourceID.FOOTER_SPACE
+                            )
+                            if footer_obj.exists():
+                                obj1 = footer_obj.get_bounds()["bottom"]
+                                break
+                    break
+            if obj1 is None:
+                obj1 = gap_view_obj.get_bounds()["bottom"]
+            containers_content = self.device.find(resourceIdMatches=containers_content)
+
+            obj2 = (
+                (
+                    containers_content.get_bounds()["bottom"]
+                    + containers_content.get_bounds()["top"]
+                )
+                * 1
+                / 3
+            )
+
+            self.device.swipe_points(
+                displayWidth / 2,
+                obj1 - 5,
+                displayWidth / 2,
+                obj2 + 5,
+            )
+            return True
+
+    def find_likers_container(self):
+        universal_actions = UniversalActions(self.device)
+        containers_gap = ResourceID.GAP_VIEW_AND_FOOTER_SPACE
+        media_container = ResourceID.MEDIA_CONTAINER
+        likes = 0
+        for _ in range(4):
+            gap_view_obj = self.device.find(resourceIdMatches=containers_gap)
+            likes_view = self.device.find(
+                index=-1,
+                resourceId=ResourceID.ROW_FEED_TEXTVIEW_LIKES,
+                className=ClassName.TEXT_VIEW,
+            )
+            description_view = self.device.find(
+                resourceIdMatches=ResourceID.ROW_FEED_COMMENT_TEXTVIEW_LAYOUT
+            )
+            media = self.device.find(
+                resourceIdMatches=media_container,
+            )
+            media_count = media.count_items()
+            logger.debug(f"I can see {media_count} media(s) in this view..")
+
+            if media_count > 1 and (
+                media.get_bounds()["bottom"]
+                < self.device.get_info()["displayHeight"] / 3
+            ):
+                universal_actions.swipe_points(Direction.DOWN, delta_y=100)
+                continue
+            if not likes_view.exists():
+                if description_view.exists() or gap_view_obj.exists():
+                    return False, likes
+                else:
+                    universal_actions.swipe_points(Direction.DOWN, delta_y=100)
+                    continue
+            elif media.get_bounds()["bottom"] > likes_view.get_bounds()["bottom"]:
+                universal_actions.swipe_points(Direction.DOWN, delta_y=100)
+                continue
+            logger.debug("Likers container exists!")
+            likes = self._get_number_of_likers(likes_view)
+            return likes_view.exists(), likes
+        return False, 0
+
+    def _get_number_of_likers(self, likes_view):
+        likes = 0
+        if likes_view.exists():
+            likes_view_text = likes_view.get_text().replace(",", "")
+            matches_likes = re.search(
+                r"(?P<likes>\d+) (?:others|likes)", likes_view_text, re.IGNORECASE
+            )
+            matches_view = re.search(
+                r"(?P<views>\d+) views", likes_view_text, re.IGNORECASE
+            )
+            if hasattr(matches_likes, "group"):
+                likes = int(matches_likes.group("likes"))
+                logger.info(
+                    f"This post has {likes if 'likes' in likes_view_text else likes + 1} like(s)."
+                )
+                return likes
+            elif hasattr(matches_view, "group"):
+                views = int(matches_view.group("views"))
+                logger.info(
+                    f"I can see only that this post has {views} views(s). It may contain likes.."
+                )
+                return -1
+            else:
+                if likes_view_text.endswith("others"):
+                    logger.info("This post has more than 1 like.")
+                    return -1
+                else:
+                    logger.info("This post has only 1 like.")
+                    likes = 1
+                    return likes
+        else:
+            logger.info("This post has no likes, skip.")
+            return likes
+
+    def open_likers_container(self):
+        """Open likes container"""
+        logger.info("Opening post likers.")
+        facepil_stub = self.device.find(
+            index=-1, resourceId=ResourceID.ROW_FEED_LIKE_COUNT_FACEPILE_STUB
+        )
+
+        if facepil_stub.exists():
+            logger.debug("Facepile present, pressing on it!")
+            facepil_stub.click()
+        else:
+            random_sleep(1, 2, modulable=False)
+            likes_view = self.device.find(
+                index=-1,
+                resourceId=ResourceID.ROW_FEED_TEXTVIEW_LIKES,
+                className=ClassName.TEXT_VIEW,
+            )
+            n_following_liking = likes_view.child().count_items()
+            if n_following_liking == 0:
+                logger.debug("This post is not liked by your following!")
+                likes_view.click()
+            else:
+                logger.debug(f"Post is liked by {n_following_liking} following(s).")
+                foil = likes_view.get_bounds()
+                foil_cords = set()
+                hole_cords = set()
+                for x in range(foil.get("left") + 1, foil.get("right")):
+                    foil_cords.update(
+                        (x, y) for y in range(foil.get("top") + 1, foil.get("bottom"))
+                    )
+
+                for following in likes_view.child():
+                    hole = following.get_bounds()
+                    for x in range(hole.get("left"), foil.get("right") + 1):
+                        hole_cords.update(
+                            (
+                                x,
+                                y,
+                            )
+                            for y in range(foil.get("top"), foil.get("bottom") + 1)
+                        )
+
+                available_points = foil_cords - hole_cords
+                likes_view.click(Location.CUSTOM, coord=choice(list(available_points)))
+
+    def _has_tags(self) -> bool:
+        tags_icon = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.INDICATOR_ICON_VIEW)
+        )
+        self.has_tags = tags_icon.exists()
+        return self.has_tags
+
+    def check_if_last_post(
+        self, last_description, current_job
+    ) -> Tuple[bool, str, str, bool, bool, bool]:
+        """check if that post has been just interacted"""
+        universal_actions = UniversalActions(self.device)
+        username, is_ad, is_hashtag = PostsViewList(self.device).post_owner(
+            current_job, Owner.GET_NAME
+        )
+        has_tags = self._has_tags()
+        while True:
+            post_description = self.device.find(
+                index=-1,
+                resourceIdMatches=ResourceID.ROW_FEED_TEXT,
+                textStartsWith=username,
+            )
+            if not post_description.exists() and post_description.count_items() >= 1:
+                text = post_description.get_text()
+                post_description = self.device.find(
+                    index=-1,
+                    resourceIdMatches=ResourceID.ROW_FEED_TEXT,
+                    text=text,
+                )
+            if post_description.exists():
+                logger.debug("Description found!")
+                new_description = post_description.get_text().upper()
+                if new_description != last_description:
+                    return False, new_description, username, is_ad, is_hashtag, has_tags
+                logger.info(
+                    "This post has the same description and author as the last one."
+                )
+                return True, new_description, username, is_ad, is_hashtag, has_tags
+            else:
+                gap_view_obj = self.device.find(resourceId=ResourceID.GAP_VIEW)
+                feed_composer = self.device.find(
+                    resourceId=ResourceID.FEED_INLINE_COMPOSER_BUTTON_TEXTVIEW
+                )
+                if gap_view_obj.exists() and gap_view_obj.get_bounds()["bottom"] < (
+                    self.device.get_info()["displayHeight"] / 3
+                ):
+                    universal_actions.swipe_points(
+                        direction=Direction.DOWN, delta_y=200
+                    )
+                    continue
+                row_feed_profile_header = self.device.find(
+                    resourceId=ResourceID.ROW_FEED_PROFILE_HEADER
+                )
+                if row_feed_profile_header.count_items() > 1:
+                    logger.info("This post hasn't the description...")
+                    return False, "", username, is_ad, is_hashtag, has_tags
+                profile_header_is_above = row_feed_profile_header.is_above_this(
+                    gap_view_obj if gap_view_obj.exists() else feed_composer
+                )
+                if profile_header_is_above is not None:
+                    if not profile_header_is_above:
+                        logger.info("This post hasn't the description...")
+                        return False, "", username, is_ad, is_hashtag, has_tags
+
+                logger.debug(
+                    f"Can't find the description of {username}'s post, try to swipe a little bit down."
+                )
+                universal_actions.swipe_points(direction=Direction.DOWN, delta_y=200)
+
+    def _if_action_bar_is_over_obj_swipe(self, obj):
+        """do a swipe of the amount of the action bar"""
+        action_bar_exists, _, action_bar_bottom = PostsViewList(
+            self.device
+        )._get_action_bar_position()
+        if action_bar_exists:
+            obj_top = obj.get_bounds()["top"]
+            if action_bar_bottom > obj_top:
+                UniversalActions(self.device).swipe_points(
+                    direction=Direction.UP, delta_y=action_bar_bottom
+                )
+
+    def _get_action_bar_position(self) -> Tuple[bool, int, int]:
+        """action bar is overlay, if you press on it, you go back to the first post
+        knowing his position is important to avoid it: exists, top, bottom"""
+        action_bar = self.device.find(resourceIdMatches=ResourceID.ACTION_BAR_CONTAINER)
+        if action_bar.exists():
+            return (
+                True,
+                action_bar.get_bounds()["top"],
+                action_bar.get_bounds()["bottom"],
+            )
+        else:
+            return False, 0, 0
+
+    def _refresh_feed(self):
+        logger.info("Refresh feed..")
+        refresh_pill = self.device.find(resourceId=ResourceID.NEW_FEED_PILL)
+        if refresh_pill.exists(Timeout.SHORT):
+            refresh_pill.click()
+            random_sleep(inf=5, sup=8, modulable=False)
+        else:
+            UniversalActions(self.device).reload_page()
+
+    def post_owner(self, current_job, mode: Owner, username=None):
+        """returns a tuple[var, bool, bool]"""
+        is_ad = False
+        is_hashtag = False
+        if username is None:
+            post_owner_obj = self.device.find(
+                resourceIdMatches=ResourceID.ROW_FEED_PHOTO_PROFILE_NAME
+            )
+        else:
+            for _ in range(2):
+                post_owner_obj = self.device.find(
+                    resourceIdMatches=ResourceID.ROW_FEED_PHOTO_PROFILE_NAME,
+                    textStartsWith=username,
+                )
+                notification = self.device.find(
+                    resourceIdMatches=ResourceID.NOTIFICATION_MESSAGE
+                )
+                if not post_owner_obj.exists and notification.exists():
+                    logger.warning(
+                        "There is a notification there! Please disable them in settings.. We will wait 10 seconds before continue.."
+                    )
+                    sleep(10)
+        post_owner_clickable = False
+
+        for _ in range(3):
+            if not post_owner_obj.exists():
+                if mode == Owner.OPEN:
+                    comment_description = self.device.find(
+                        resourceIdMatches=ResourceID.ROW_FEED_COMMENT_TEXTVIEW_LAYOUT,
+                        textStartsWith=username,
+                    )
+                    if (
+                        not comment_description.exists()
+                        and comment_description.count_items() >= 1
+                    ):
+                        comment_description = self.device.find(
+                            resourceIdMatches=ResourceID.ROW_FEED_COMMENT_TEXTVIEW_LAYOUT,
+                            text=comment_description.get_text(),
+                        )
+
+                    if comment_description.exists():
+                        logger.info("Open post owner from description.")
+                        comment_description.child().click()
+                        return True, is_ad, is_hashtag
+                UniversalActions(self.device).swipe_points(direction=Direction.UP)
+                post_owner_obj = self.device.find(
+                    resourceIdMatches=ResourceID.ROW_FEED_PHOTO_PROFILE_NAME,
+                )
+            else:
+                post_owner_clickable = True
+                break
+
+        if not post_owner_clickable:
+            logger.info("Can't find the owner name, skip.")
+            return False, is_ad, is_hashtag
+        if mode == Owner.OPEN:
+            logger.info("Open post owner.")
+            PostsViewList(self.device)._if_action_bar_is_over_obj_swipe(post_owner_obj)
+            post_owner_obj.click()
+            return True, is_ad, is_hashtag
+        elif mode == Owner.GET_NAME:
+            if current_job == "feed":
+                is_ad, is_hashtag, username = PostsViewList(
+                    self.device
+                )._check_if_ad_or_hashtag(post_owner_obj)
+            if username is None:
+                username = (
+                    post_owner_obj.get_text().replace("•", "").strip().split(" ", 1)[0]
+                )
+            return username, is_ad, is_hashtag
+
+        elif mode == Owner.GET_POSITION:
+            return post_owner_obj.get_bounds(), is_ad
+        else:
+            return None, is_ad, is_hashtag
+
+    def _get_post_owner_name(self):
+        return self.device.find(
+            resourceIdMatches=ResourceID.ROW_FEED_PHOTO_PROFILE_NAME
+        ).get_text()
+
+    def _get_media_container(self):
+        media = self.device.find(resourceIdMatches=ResourceID.CAROUSEL_AND_MEDIA_GROUP)
+        content_desc = media.content_desc() if media.exists() else None
+        return media, content_desc
+
+    @staticmethod
+    def detect_media_type(content_desc) -> Tuple[Optional[MediaType], Optional[int]]:
+        """
+        Detect the nature and amount of a media
+        :return: MediaType and count
+        :rtype: MediaType, int
+        """
+        obj_count = 1
+        if content_desc is None:
+            return None, None
+        if re.match(r"^,|^\s*$", content_desc, re.IGNORECASE):
+            logger.info(
+                "That media is missing content description, so I don't know which kind of video it is."
+            )
+            media_type = MediaType.UNKNOWN
+        elif re.match(r"^Photo|^Hidden Photo", content_desc, re.IGNORECASE):
+            logger.info("It's a photo.")
+            media_type = MediaType.PHOTO
+        elif re.match(r"^Video|^Hidden Video", content_desc, re.IGNORECASE):
+            logger.info("It's a video.")
+            media_type = MediaType.VIDEO
+        elif re.match(r"^IGTV", content_desc, re.IGNORECASE):
+            logger.info("It's a IGTV.")
+            media_type = MediaType.IGTV
+        elif re.match(r"^Reel", content_desc, re.IGNORECASE):
+            logger.info("It's a Reel.")
+            media_type = MediaType.REEL
+        else:
+            carousel_obj = re.finditer(
+                r"((?P<photo>\d+) photo)|((?P<video>\d+) video)",
+                content_desc,
+                re.IGNORECASE,
+            )
+            n_photos = 0
+            n_videos = 0
+            for match in carousel_obj:
+                if match.group("photo"):
+                    n_photos = int(match.group("photo"))
+                if match.group("video"):
+                    n_videos = int(match.group("video"))
+            logger.info(
+                f"It's a carousel with {n_photos} photo(s) and {n_videos} video(s)."
+            )
+            obj_count = n_photos + n_videos
+            media_type = MediaType.CAROUSEL
+        return media_type, obj_count
+
+    def like_in_post_view(
+        self,
+        mode: LikeMode,
+        skip_media_check: bool = False,
+        already_watched: bool = False,
+    ):
+        post_view_list = PostsViewList(self.device)
+        opened_post_view = OpenedPostView(self.device)
+        if skip_media_check:
+            return
+        media, content_desc = self._get_media_container()
+        if content_desc is None:
+            return
+        if not already_watched:
+            media_type, _ = post_view_list.detect_media_type(content_desc)
+            opened_post_view.watch_media(media_type)
+        if mode == LikeMode.DOUBLE_CLICK:
+            if media_type in (MediaType.CAROUSEL, MediaType.PHOTO):
+                logger.info("Double click on post.")
+                _, _, action_bar_bottom = PostsViewList(
+                    self.device
+                )._get_action_bar_position()
+                media.double_click(obj_over=action_bar_bottom)
+            else:
+                self.like_in_post_view(
+                    mode=LikeMode.SINGLE_CLICK, skip_media_check=True
+                )
+        elif mode == LikeMode.SINGLE_CLICK:
+            like_button_exists, _ = self.find_likers_container()
+            if like_button_exists:
+                logger.info("Clicking on the little heart ❤️.")
+                self.device.find(
+                    resourceIdMatches=ResourceID.ROW_FEED_BUTTON_LIKE
+                ).click()
+
+    def _follow_in_post_view(self):
+        logger.info("Follow blogger in place.")
+        self.device.find(resourceIdMatches=ResourceID.BUTTON).click()
+
+    def _comment_in_post_view(self):
+        logger.info("Open comments of post.")
+        self.device.find(resourceIdMatches=ResourceID.ROW_FEED_BUTTON_COMMENT).click()
+
+    def check_if_liked(self):
+        logger.debug("Check if like succeeded in post view.")
+        bnt_like_obj = self.device.find(
+            resourceIdMatches=ResourceID.ROW_FEED_BUTTON_LIKE
+        )
+        if bnt_like_obj.exists():
+            STR = "Liked"
+            if self.device.find(descriptionMatches=case_insensitive_re(STR)).exists():
+                logger.debug("Like is present.")
+                return True
+            else:
+                logger.debug("Like is not present.")
+                return False
+        else:
+            UniversalActions(self.device).swipe_points(
+                direction=Direction.DOWN, delta_y=100
+            )
+            return PostsViewList(self.device).check_if_liked()
+
+    def _check_if_ad_or_hashtag(
+        self, post_owner_obj
+    ) -> Tuple[bool, bool, Optional[str]]:
+        is_hashtag = False
+        is_ad = False
+        real_username = None
+        logger.debug("Checking if it's an AD or an hashtag..")
+        ad_like_obj = post_owner_obj.sibling(
+            resourceId=ResourceID.SECONDARY_LABEL,
+        )
+        if post_owner_obj.get_text().startswith("#"):
+            is_hashtag = True
+            logger.debug("Looks like an hashtag, skip.")
+        if ad_like_obj.exists():
+            sponsored = "Sponsored"
+            if ad_like_obj.get_text() == sponsored:
+                logger.debug("Looks like an AD, skip.")
+                is_ad = True
+            elif is_hashtag:
+                real_username = ad_like_obj.get_text().split("•")[0].strip()
+
+        return is_ad, is_hashtag, real_username
+
 
-        except ArithmeticError:
-            ((Run, (Product, Hypothesis, Product)) for Run in (Product, StackOverflow, _random) if StackOverflow == StackOverflow)
+class LanguageView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
 
-        except:
-            While(-97010 + -19855) == False
+    def set_language(self, language: str):
+        logger.debug(f"Set language to {language}.")
+        search_edit_text = self.device.find(
+            resourceId=ResourceID.SEARCH,
+            className=ClassName.EDIT_TEXT,
+        )
+        search_edit_text.set_text(language, Mode.PASTE if args.dont_type else Mode.TYPE)
 
-    def _while(_absolute = type):
-        return _modulo()[_absolute]
+        list_view = self.device.find(
+            resourceId=ResourceID.LANGUAGE_LIST_LOCALE,
+            className=ClassName.LIST_VIEW,
+        )
+        first_item = list_view.child(index=0)
+        first_item.click()
+        random_sleep()
 
-    def _ceil(_detectvar = -30598 * -5680, Power = str, _hypothesis = _modulo):
-        # sourcery skip: collection-to-bool, remove-redundant-boolean, remove-redundant-except-handler
-        _hypothesis()[_detectvar] = Power
-        
+
+class AccountView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def navigate_to_language(self):
+        logger.debug("Navigate to Language")
+        button = self.device.find(
+            className=ClassName.BUTTON,
+            index=6,
+        )
+        if button.exists():
+            button.click()
+            return LanguageView(self.device)
+        else:
+            logger.error("Not able to set your app in English! Do it by yourself!")
+            exit(0)
+
+    def navigate_to_main_account(self):
+        logger.debug("Navigating to main account...")
+        profile_view = ProfileView(self.device)
+        profile_view.click_on_avatar()
+        if profile_view.get_following_count() is None:
+            profile_view.click_on_avatar()
+
+    def close_logged_out_error(self):
+        error = self.device.find(resourceId="com.instagram.android:id/primary_button")
+        if error.exists(Timeout.SHORT):
+            error.click()
+
+    def changeToUsername(self, username: str, password: str):
+        action_bar = ProfileView.get_action_bar_title_btn(self)
+        if action_bar is not None:
+            current_profile_name = action_bar.get_text()
+            # in private accounts there is little lock which is codec as two spaces (should be \u1F512)
+            if current_profile_name.strip().upper() == username.upper():
+                logger.info(
+                    f"You are already logged as {username}!",
+                    extra={"color": f"{Style.BRIGHT}{Fore.BLUE}"},
+                )
+                return True
+            logger.debug(f"You're logged as {current_profile_name.strip()}")
+            action_bar.click()
+            found_obj = self.device.find(
+                resourceId=ResourceID.ROW_USER_TEXTVIEW,
+                textMatches=case_insensitive_re(username),
+            )
+            if found_obj.exists(Timeout.SHORT):
+                logger.info(
+                    f"Switching to {username}...",
+                    extra={"color": f"{Style.BRIGHT}{Fore.BLUE}"},
+                )
+                found_obj.click()
+                random_sleep()
+                action_bar = ProfileView.get_action_bar_title_btn(self)
+                if action_bar is not None:
+                    current_profile_name = action_bar.get_text()
+                    if current_profile_name.strip().upper() == username.upper():
+                        return True
+        logger.info(f"{username} is not in the logged in account list!")
+        return (
+            True
+            if self.log_in_from_account_selecting(username)
+            else self.log_in_by_credentials(username, password)
+        )
+
+    def log_in_from_account_selecting(self, username) -> bool:
+        """
+        return True if log-in succeeded
+        """
+        d = self.device.find
+        if not d(resourceId="com.instagram.android:id/aymh_recycler_view").exists():
+            logger.info("Looking in logged out accounts...")
+            user_list = self.device.find(resourceId="android:id/list")
+            user_list.scroll_to(text="Add account")
+            add_account = self.device.find(
+                resourceId=ResourceID.ROW_USER_TEXTVIEW,
+                textMatches=case_insensitive_re("Add account"),
+            )
+            if add_account.exists(Timeout.SHORT):
+                add_account.click()
+                existing_account_btn = self.device.find(
+                    resourceId="com.instagram.android:id/bb_primary_action"
+                )
+                if existing_account_btn.exists():
+                    existing_account_btn.click()
+                skip_smart_lock(self.device)
+        accounts = self.device.find(resourceId="com.instagram.android:id/title")
+        for account in accounts:
+            if account.get_text() == username:
+                account.click()
+                logger.info("Account found in list!")
+                break
+        else:
+            logging.info(f"Can't find {username} in logged-out accounts.")
+            return False
+        error = self.device.find(
+            resourceId="com.instagram.android:id/panorama_dialog_headline"
+        )
+        if error.exists(Timeout.SHORT):
+            logger.info("Ig showed an error!")
+            self.device.find(resourceId="com.google.android.gms:id/cancel").click()
+            return False
+        self.navigate_to_main_account()
+        return True
+
+    def is_account_selecting(self):
+        skip_smart_lock(self.device)
+        d = self.device.find
+        return d(resourceId=ResourceID.AYMH_RECYCLER_VIEW).exists()
+
+    def is_login_requested(self):
+        d = self.device.find
+        return (
+            d(resourceId=ResourceID.LANDING_CONTAINER).exists()
+            and not d(resourceId=ResourceID.TAB_BAR).exists()
+        )
+
+    def log_in_by_credentials(self, username, password):
+        if password is None:
+            logger.error("There is any password set!")
+            return False
+        logger.info("Let's try to log in using credentials!")
+        d = self.device.find
+        if d(resourceId=ResourceID.AYMH_RECYCLER_VIEW).exists():
+            d(resourceId=ResourceID.LEFT_BUTTON).click()
+        d(resourceId=ResourceID.LOGIN_USERNAME).set_text(username)
+        d(resourceId=ResourceID.PASSWORD).set_text(password)
+        login_btn = d(resourceId=ResourceID.BUTTON_TEXT)
+        login_btn.click()
+        login_btn.wait_gone(Timeout.LONG)
+        error = d(
+            resourceId=ResourceID.IGDS_HEADLINE_HEADLINE,
+            textMatches=case_insensitive_re("Incorrect password"),
+        )
+        return not error.exists(Timeout.SHORT)
+
+    def fresh_app_login(self, username, password):
+        log_in_btn = self.device.find(resourceId=ResourceID.LOG_IN_BUTTON)
+        if log_in_btn.exists():
+            log_in_btn.click()
+            return self.log_in_by_credentials(username, password)
+        return False
+
+    def logout_account(self, username):
+        self.navigate_to_main_account()
+        d = self.device.find
+        opt = d(descriptionMatches=case_insensitive_re("Options"))
+        if opt.exists():
+            opt.click()
+            settings = d(textMatches=case_insensitive_re("Settings"))
+            if settings.exists():
+                settings.click()
+                menu = d(resourceId=ResourceID.RECYCLER_VIEW)
+                menu.scroll_toEnd()
+                log_out_username = d(
+                    textMatches=case_insensitive_re(f"Log out {username}")
+                )
+                log_out_general = d(textMatches=case_insensitive_re("Log out"))
+                if log_out_username.exists():
+                    log_out_username.click()
+                else:
+                    logger.info("Was the last one logged-in account!")
+                    log_out_general.click()
+                remember_credentials = d(resourceId=ResourceID.MESSAGECHECKBOX)
+                if not remember_credentials.exists():
+                    d(resourceId=ResourceID.PRIMARY_BUTTON).click()
+                elif not remember_credentials.info["checked"]:
+                    remember_credentials.click()
+                    d(resourceId=ResourceID.BUTTON_POSITIVE).click()
+                full_log_out = d(
+                    resourceId=ResourceID.PRIMARY_BUTTON,
+                    textMatches=case_insensitive_re("Log out"),
+                )
+                if full_log_out.exists():
+                    full_log_out.click()
+
+                skip_smart_lock(self.device)
+                profile_view = d(resourceIdMatches=ResourceID.IS_PROFILE_VIEW)
+                if profile_view.wait(exists=True, ui_timeout=10):
+                    logger.info(f"You have logged out from {username} successfully!")
+                else:
+                    logger.warning("Screen didn't come back to a know state...")
+            else:
+                logger.info("Settings button doesn't exists!")
+        else:
+            logger.info("Options button doesn't exists!")
+
+    def refresh_account(self):
+        d = self.device.find
+        profile_view = d(resourceIdMatches=ResourceID.IS_PROFILE_VIEW)
+        if not profile_view.exists():
+            self.navigate_to_main_account()
+        textview = d(
+            resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_POST_CONTAINER
+        )
+        universal_actions = UniversalActions(self.device)
+        if textview.exists(Timeout.SHORT):
+            logger.info("Refresh account...")
+            universal_actions.swipe_points(
+                direction=Direction.UP,
+                start_point_y=textview.get_bounds()["bottom"],
+                delta_y=280,
+            )
+            random_sleep(modulable=False)
+        obj = d(
+            resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_POST_CONTAINER
+        )
+        if not obj.exists(Timeout.MEDIUM):
+            logger.debug(
+                "Can't see Posts, Followers and Following after the refresh, maybe we moved a little bit bottom.. Swipe down."
+            )
+            universal_actions.swipe_points(Direction.UP)
+
+
+class SettingsView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def navigate_to_account(self):
+        logger.debug("Navigate to Account")
+        button = self.device.find(
+            className=ClassName.BUTTON,
+            index=5,
+        )
+        if button.exists():
+            button.click()
+            return AccountView(self.device)
+        else:
+            logger.error("Not able to set your app in English! Do it by yourself!")
+            exit(2)
+
+
+class OptionsView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def navigate_to_settings(self):
+        logger.debug("Navigate to Settings")
+        button = self.device.find(
+            resourceId=ResourceID.MENU_OPTION_TEXT,
+            className=ClassName.TEXT_VIEW,
+        )
+        if button.exists():
+            button.click()
+            return SettingsView(self.device)
+        else:
+            logger.error("Not able to set your app in English! Do it by yourself!")
+            exit(0)
+
+
+class OpenedPostView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+        self.has_tags = False
+
+    def _get_post_like_button(self) -> Optional[DeviceFacade.View]:
+        post_media_view = self.device.find(resourceIdMatches=ResourceID.MEDIA_CONTAINER)
+        if post_media_view.exists(Timeout.MEDIUM):
+            attempt = 0
+            while True:
+                like_button = post_media_view.down(
+                    resourceIdMatches=ResourceID.ROW_FEED_BUTTON_LIKE
+                )
+                if like_button.viewV2 is not None or attempt == 3:
+                    return like_button if like_button.exists() else None
+                UniversalActions(self.device).swipe_points(
+                    direction=Direction.DOWN, delta_y=100
+                )
+                attempt += 1
+        return None
+
+    def is_post_liked(self) -> Tuple[Optional[bool], Optional[DeviceFacade.View]]:
+        """
+        Check if post is liked
+        :return: post is liked or not
+        :rtype: bool
+        """
+        like_btn_view = self._get_post_like_button()
+        return (
+            (like_btn_view.get_selected(), like_btn_view)
+            if like_btn_view
+            else (False, None)
+        )
+
+    def like_post(self) -> bool:
+        """
+        Like the post with a double click and check if it's liked
+        :return: post has been liked
+        :rtype: bool
+        """
+        post_media_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.MEDIA_CONTAINER)
+        )
+        liked = False
+        if post_media_view.exists():
+            logger.info("Liking post.")
+            if self.has_tags:
+                logger.info(
+                    "Post has tags, better going with a single click on the little heart ❤️."
+                )
+                like_button = self._get_post_like_button()
+                if like_button is not None:
+                    like_button.click()
+                    UniversalActions.detect_block(self.device)
+                    liked, _ = self.is_post_liked()
+                else:
+                    logger.warning("Can't find the like button object!")
+            else:
+                post_media_view.double_click()
+                UniversalActions.detect_block(self.device)
+                liked, like_button = self.is_post_liked()
+                if like_button is None:
+                    logger.warning("Can't find the like button object!")
+                elif not liked:
+                    logger.info("Double click failed, clicking on the little heart ❤️.")
+                    like_button.click()
+                    UniversalActions.detect_block(self.device)
+                    liked, _ = self.is_post_liked()
+        return liked
+
+    def start_video(self) -> bool:
+        """
+        Press on play button if present
+        :return: has play button been pressed
+        :rtype: bool
+        """
+        play_button = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.VIEW_PLAY_BUTTON)
+        )
+        if play_button.exists(Timeout.TINY):
+            logger.debug("Pressing on play button.")
+            play_button.click()
+            return True
+        return False
+
+    def open_video(self) -> bool:
+        """
+        Open video in full-screen mode
+        :return: video in full-screen mode
+        :rtype: bool
+        """
+        post_media_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.MEDIA_CONTAINER)
+        )
+        in_fullscreen = False
+        if post_media_view.exists():
+            logger.info("Going in full screen.")
+            post_media_view.click()
+            in_fullscreen, _ = self._is_video_in_fullscreen()
+        return in_fullscreen
+
+    def watch_media(self, media_type: MediaType) -> None:
+        """
+        Watch media for the amount of time specified in config
+        :return: None
+        :rtype: None
+        """
+        if (
+            media_type
+            in (MediaType.IGTV, MediaType.REEL, MediaType.VIDEO, MediaType.UNKNOWN)
+            and args.watch_video_time != "0"
+        ):
+            in_fullscreen, _ = self._is_video_in_fullscreen()
+            time_left = self._get_video_time_left()
+            watching_time = get_value(
+                args.watch_video_time, name=None, default=0, its_time=True
+            )
+            if time_left > 0 and media_type != MediaType.REEL and in_fullscreen:
+                logger.info(f"This video is about {time_left}s long.")
+                # hardcoded 5 seconds, so we have the time to doing everything without going to the next video, hopefully
+                watching_time = min(
+                    watching_time,
+                    time_left - 5,
+                )
+            logger.info(
+                f"Watching video for {watching_time if watching_time > 0 else 'few '}s."
+            )
+
+        elif (
+            media_type in (MediaType.CAROUSEL, MediaType.PHOTO)
+            and args.watch_photo_time != "0"
+        ):
+            self._has_tags()
+            watching_time = get_value(
+                args.watch_photo_time, "Watching photo for {}s.", 0, its_time=True
+            )
+        else:
+            return None
+        if watching_time > 0:
+            sleep(watching_time)
+
+    def _get_video_time_left(self) -> int:
+        timer = self.device.find(resourceId=ResourceID.TIMER)
+        if timer.exists():
+            raw_time = timer.get_text().split(":")
+            try:
+                return int(raw_time[0]) * 60 + int(raw_time[1])
+            except (IndexError, ValueError):
+                return 0
+        return 0
+
+    def _is_video_in_fullscreen(self) -> Tuple[bool, DeviceFacade.View]:
+        """
+        Check if video is in full-screen mode
+        """
+        video_container = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.VIDEO_CONTAINER_AND_CLIPS_VIDEO_CONTAINER
+            )
+        )
+        return video_container.exists(), video_container
+
+    def _is_video_liked(self) -> Tuple[Optional[bool], Optional[DeviceFacade.View]]:
+        """
+        Check if video has been liked
+        """
+        like_button = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.LIKE_BUTTON)
+        )
+        if like_button.exists():
+            return like_button.get_selected(), like_button
+        return False, None
+
+    def _has_tags(self) -> bool:
+        tags_icon = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.INDICATOR_ICON_VIEW)
+        )
+        self.has_tags = tags_icon.exists()
+        return self.has_tags
+
+    def like_video(self) -> bool:
+        """
+        Like the video with a double click and check if it's liked
+        :return: video has been liked
+        :rtype: bool
+        """
+        sidebar = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.UFI_STACK)
+        )
+        liked = False
+        full_screen, obj = self._is_video_in_fullscreen()
+        if full_screen:
+            logger.info("Liking video.")
+            obj.double_click()
+            UniversalActions.detect_block(self.device)
+            if not sidebar.exists():
+                logger.debug("Showing sidebar...")
+                obj.click()
+            liked, like_button = self._is_video_liked()
+            if not liked:
+                logger.info("Double click failed, clicking on the little heart ❤️.")
+                if like_button is not None:
+                    like_button.click()
+                    UniversalActions.detect_block(self.device)
+                else:
+                    logger.error("We are seeing another video.")
+                liked, _ = self._is_video_liked()
+        return liked
+
+    def get_listview_likers(self):
+        for _ in range(2):
+            obj = self.device.find(resourceId=ResourceID.LIST)
+            if obj.exists(Timeout.LONG):
+                return obj
+            logger.debug("Can't find likers list, try again..")
+        logger.error("Can't load likers list..")
+        return None
+
+    def get_user_container(self):
+        obj = self.device.find(
+            resourceIdMatches=ResourceID.USER_LIST_CONTAINER,
+        )
+        return obj if obj.exists(Timeout.LONG) else None
+
+    def get_user_name(self, container):
+        return container.child(
+            resourceId=ResourceID.ROW_USER_PRIMARY_NAME,
+        )
+
+    def is_following(self, container):
+        text = container.child(
+            resourceId=ResourceID.BUTTON,
+            classNameMatches=ClassName.BUTTON_OR_TEXTVIEW_REGEX,
+        )
+        if type(text) != str:
+            text = text.get_text() if text.exists() else ""
+        return text in ["Following", "Requested"]
+
+
+class PostsGridView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def scroll_down(self):
+        coordinator_layout = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.COORDINATOR_ROOT_LAYOUT)
+        )
+        if coordinator_layout.exists():
+            coordinator_layout.scroll(Direction.DOWN)
+            return True
+
+        return False
+
+    def get_post_view(self):
+        return self.device.find(resourceIdMatches=case_insensitive_re(ResourceID.LIST))
+
+    def navigate_to_post(self, row, col):
+        post_list_view = self.get_post_view()
+        post_list_view.wait(Timeout.MEDIUM)
+        OFFSET = 1  # row with post starts from index 1
+        row_view = post_list_view.child(index=row + OFFSET)
+        if not row_view.exists():
+            return None, None, None
+        post_view = row_view.child(index=col)
+        if not post_view.exists():
+            return None, None, None
+        content_desc = post_view.ui_info()["contentDescription"]
+        media_type, obj_count = PostsViewList.detect_media_type(content_desc)
+        post_view.click()
+
+        return OpenedPostView(self.device), media_type, obj_count
+
+
+class ProfileView(ActionBarView):
+    def __init__(self, device: DeviceFacade, is_own_profile=False):
+        super().__init__(device)
+        self.device = device
+        self.is_own_profile = is_own_profile
+
+    def navigate_to_options(self):
+        logger.debug("Navigate to Options")
+        button = self.action_bar.child(index=2)
+        button.click()
+
+        return OptionsView(self.device)
+
+    def get_action_bar_title_btn(self, watching_stories=False):
+        bar = case_insensitive_re(
+            [
+                ResourceID.TITLE_VIEW,
+                ResourceID.ACTION_BAR_TITLE,
+                ResourceID.ACTION_BAR_LARGE_TITLE,
+                ResourceID.ACTION_BAR_TEXTVIEW_TITLE,
+                ResourceID.ACTION_BAR_TITLE_AUTO_SIZE,
+                ResourceID.ACTION_BAR_LARGE_TITLE_AUTO_SIZE,
+            ]
+        )
+        action_bar = self.device.find(
+            resourceIdMatches=bar,
+        )
+        if (
+            watching_stories
+            or not watching_stories
+            and action_bar.exists(Timeout.EXTRA_LONG)
+        ):
+            return action_bar
+        logger.error("Can't see the action tab! (pop-up is blocking the view?)")
+        save_crash(device=self.device)
+        return None
+
+    def get_some_text(self):
+        obj = self.device.find(
+            resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_POST_CONTAINER
+        )
+        if not obj.exists(Timeout.MEDIUM):
+            UniversalActions(self.device).swipe_points(Direction.UP)
         try:
-            (((_random, Product), Ceil) for Ceil in {StackOverflow: _random})
+            post = (
+                self.device.find(
+                    resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_POST_CONTAINER
+                )
+                .child(index=1)
+                .get_text()
+            )
+            followers = (
+                self.device.find(
+                    resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_FOLLOWERS_CONTAINER
+                )
+                .child(index=1)
+                .get_text()
+            )
+            following = (
+                self.device.find(
+                    resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_FOLLOWING_CONTAINER
+                )
+                .child(index=1)
+                .get_text()
+            )
+            return post, followers, following
+        except Exception as e:
+            logger.debug(f"Exception: {e}")
+            logger.warning(
+                "Can't get post/followers/following text for check the language! Save a crash to understand the reason."
+            )
+            save_crash(self.device)
+            return None, None, None
+
+    def _new_ui_profile_button(self) -> bool:
+        found = False
+        buttons = self.device.find(className=ResourceID.BUTTON)
+        for button in buttons:
+            if button.content_desc() == "Profile":
+                button.click()
+                found = True
+        return found
+
+    def _old_ui_profile_button(self) -> bool:
+        found = False
+        obj = self.device.find(resourceIdMatches=ResourceID.TAB_AVATAR)
+        if obj.exists(Timeout.MEDIUM):
+            obj.click()
+            found = True
+        return found
+
+    def click_on_avatar(self):
+        while not self._new_ui_profile_button() and not self._old_ui_profile_button():
+            self.device.back()
+
+    def getFollowButton(self):
+        button_regex = f"{ClassName.BUTTON}|{ClassName.TEXT_VIEW}"
+        following_regex_all = "^following|^requested|^follow back|^follow"
+        following_or_follow_back_button = self.device.find(
+            classNameMatches=button_regex,
+            clickable=True,
+            textMatches=case_insensitive_re(following_regex_all),
+        )
+        if following_or_follow_back_button.exists(Timeout.MEDIUM):
+            button_text = following_or_follow_back_button.get_text().casefold()
+            if button_text in ["following", "requested"]:
+                button_status = FollowStatus.FOLLOWING
+            elif button_text == "follow back":
+                button_status = FollowStatus.FOLLOW_BACK
+            else:
+                button_status = FollowStatus.FOLLOW
+            return following_or_follow_back_button, button_status
+        else:
+            logger.warning(
+                "The follow button doesn't exist! Maybe the profile is not loaded!"
+            )
+            return None, FollowStatus.NONE
+
+    def getUsername(self, watching_stories=False):
+        action_bar = self.get_action_bar_title_btn(watching_stories)
+        if action_bar is not None:
+            return action_bar.get_text(error=not watching_stories).strip()
+        if not watching_stories:
+            logger.error("Cannot get username.")
+        return None
+
+    def getLinkInBio(self):
+        obj = self.device.find(resourceIdMatches=ResourceID.PROFILE_HEADER_WEBSITE)
+        if obj.exists():
+            website = obj.get_text()
+            return website if website != "" else None
+        return None
+
+    def getMutualFriends(self) -> int:
+        logger.debug("Looking for mutual friends tab.")
+        follow_context = self.device.find(
+            resourceIdMatches=ResourceID.PROFILE_HEADER_FOLLOW_CONTEXT_TEXT
+        )
+        if follow_context.exists():
+            text = follow_context.get_text()
+            mutual_friends = re.finditer(
+                r"((?P<others>\s\d+\s)|(?P<extra>,))",
+                text,
+                re.IGNORECASE,
+            )
+            n_others = 0
+            n_extra = 0
+            for match in mutual_friends:
+                if match.group("others"):
+                    n_others = int(match.group("others"))
+                if match.group("extra"):
+                    n_extra = 2
+            if n_others != 0:
+                mutual_friends = n_others + n_extra if n_extra != 0 else n_others + 1
+            else:
+                mutual_friends = n_extra if n_extra != 0 else 1
+        else:
+            mutual_friends = 0
+        return mutual_friends
+
+    def _parseCounter(self, raw_text: str) -> Optional[int]:
+        multiplier = 1
+        regex = r"(?!(K|M|\.))\D+"
+        subst = "."
+        text = re.sub(regex, subst, raw_text)
+        if "K" in text:
+            value = float(text.replace("K", ""))
+            multiplier = 1_000
+        elif "M" in text:
+            value = float(text.replace("M", ""))
+            multiplier = 1_000_000
+        else:
+            try:
+                value = int(text.replace(".", ""))
+            except ValueError:
+                logger.error(f"Cannot parse {repr(raw_text)}.")
+                return None
+        return int(value * multiplier)
+
+    def _getFollowersTextView(self):
+        followers_text_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_FOLLOWERS_COUNT
+            ),
+            className=ClassName.TEXT_VIEW,
+        )
+        followers_text_view.wait(Timeout.MEDIUM)
+        return followers_text_view
+
+    def getFollowersCount(self) -> Optional[int]:
+        followers = None
+        followers_text_view = self._getFollowersTextView()
+        if followers_text_view.exists():
+            followers_text = followers_text_view.get_text()
+            if followers_text:
+                followers = self._parseCounter(followers_text)
+            else:
+                logger.error("Cannot get followers count text.")
+        else:
+            logger.error("Cannot find followers count view.")
+
+        return followers
+
+    def _getFollowingTextView(self):
+        following_text_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_FOLLOWING_COUNT
+            ),
+            className=ClassName.TEXT_VIEW,
+        )
+        following_text_view.wait(Timeout.MEDIUM)
+        return following_text_view
+
+    def get_following_count(self) -> Optional[int]:
+        following = None
+        following_text_view = self._getFollowingTextView()
+        if following_text_view.exists(Timeout.MEDIUM):
+            following_text = following_text_view.get_text()
+            if following_text:
+                following = self._parseCounter(following_text)
+            else:
+                logger.error("Cannot get following count text.")
+        else:
+            logger.error("Cannot find following count view.")
+
+        return following
+
+    def getPostsCount(self) -> int:
+        post_count_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                ResourceID.ROW_PROFILE_HEADER_TEXTVIEW_POST_COUNT
+            )
+        )
+        if post_count_view.exists(Timeout.MEDIUM):
+            count = post_count_view.get_text()
+            if count is not None:
+                return self._parseCounter(count)
+        logger.error("Cannot get posts count text.")
+        return 0
+
+    def count_photo_in_view(self) -> Tuple[int, int]:
+        """return rows filled and the number of post in the last row"""
+        views = f"({ClassName.RECYCLER_VIEW}|{ClassName.VIEW})"
+        grid_post = self.device.find(
+            classNameMatches=views, resourceIdMatches=ResourceID.LIST
+        )
+        if not grid_post.exists(Timeout.MEDIUM):
+            return 0, 0
+        for i in range(2, 6):
+            lin_layout = grid_post.child(index=i, className=ClassName.LINEAR_LAYOUT)
+            if i == 5 or not lin_layout.exists():
+                last_index = i - 1
+                last_lin_layout = grid_post.child(index=last_index)
+                for n in range(1, 4):
+                    if n == 3 or not last_lin_layout.child(index=n).exists():
+                        if n == 3:
+                            return last_index, 0
+                        else:
+                            return last_index - 1, n
+
+    def getProfileInfo(self):
+
+        username = self.getUsername()
+        posts = self.getPostsCount()
+        followers = self.getFollowersCount()
+        following = self.get_following_count()
+
+        return username, posts, followers, following
+
+    def getProfileBiography(self) -> str:
+        biography = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.PROFILE_HEADER_BIO_TEXT),
+            className=ClassName.TEXT_VIEW,
+        )
+        if biography.exists():
+            biography_text = biography.get_text()
+            # If the biography is very long, blabla text and end with "...more" click the bottom of the text and get the new text
+            is_long_bio = re.compile(
+                r"{0}$".format("… more"), flags=re.IGNORECASE
+            ).search(biography_text)
+            if is_long_bio is not None:
+                logger.debug('Found "… more" in bio - trying to expand')
+                username = self.getUsername()
+                biography.click(Location.BOTTOMRIGHT)
+                if username != self.getUsername():
+                    logger.debug(
+                        "We're not in the same page - did we click a hashtag or a tag? Go back."
+                    )
+                    self.device.back()
+                    logger.info("Failed to expand biography - checking short view.")
+                return biography.get_text()
+            return biography_text
+        return ""
+
+    def getFullName(self):
+        full_name_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.PROFILE_HEADER_FULL_NAME),
+            className=ClassName.TEXT_VIEW,
+        )
+        if full_name_view.exists(Timeout.SHORT):
+            fullname_text = full_name_view.get_text()
+            if fullname_text is not None:
+                return fullname_text
+        return ""
+
+    def isPrivateAccount(self):
+        private_profile_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(
+                [
+                    ResourceID.PRIVATE_PROFILE_EMPTY_STATE,
+                    ResourceID.ROW_PROFILE_HEADER_EMPTY_PROFILE_NOTICE_TITLE,
+                    ResourceID.ROW_PROFILE_HEADER_EMPTY_PROFILE_NOTICE_CONTAINER,
+                ]
+            )
+        )
+        return private_profile_view.exists()
+
+    def StoryRing(self) -> DeviceFacade.View:
+        return self.device.find(
+            resourceId=ResourceID.REEL_RING,
+        )
+
+    def live_marker(self) -> DeviceFacade.View:
+        return self.device.find(resourceId=ResourceID.LIVE_BADGE_VIEW)
+
+    def profileImage(self):
+        return self.device.find(
+            resourceId=ResourceID.ROW_PROFILE_HEADER_IMAGEVIEW,
+        )
+
+    def navigateToFollowers(self):
+        logger.info("Navigate to followers.")
+        followers_button = self.device.find(
+            resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_FOLLOWERS_CONTAINER
+        )
+        if followers_button.exists(Timeout.LONG):
+            followers_button.click()
+            followers_tab = self.device.find(
+                resourceIdMatches=ResourceID.UNIFIED_FOLLOW_LIST_TAB_LAYOUT
+            ).child(textContains="Followers")
+            if followers_tab.exists(Timeout.LONG):
+                if not followers_tab.get_property("selected"):
+                    followers_tab.click()
+                return True
+        else:
+            logger.error("Can't find followers tab!")
+            return False
+
+    def navigateToFollowing(self):
+        logger.info("Navigate to following.")
+        following_button = self.device.find(
+            resourceIdMatches=ResourceID.ROW_PROFILE_HEADER_FOLLOWING_CONTAINER
+        )
+        if following_button.exists(Timeout.LONG):
+            following_button.click_retry()
+            following_tab = self.device.find(
+                resourceIdMatches=ResourceID.UNIFIED_FOLLOW_LIST_TAB_LAYOUT
+            ).child(textContains="Following")
+            if following_tab.exists(Timeout.LONG):
+                if not following_tab.get_property("selected"):
+                    following_tab.click()
+                return True
+        else:
+            logger.error("Can't find following tab!")
+            return False
+
+    def navigateToMutual(self):
+        logger.info("Navigate to mutual friends.")
+        has_mutual = False
+        follow_context = self.device.find(
+            resourceIdMatches=ResourceID.PROFILE_HEADER_FOLLOW_CONTEXT_TEXT
+        )
+        if follow_context.exists():
+            follow_context.click()
+            has_mutual = True
+        return has_mutual
+
+    def swipe_to_fit_posts(self) -> Tuple[int, Optional[DeviceFacade.View]]:
+        suggested_accounts = self.device.find(
+            resourceIdMatches=ResourceID.SIMILAR_ACCOUNTS_CONTAINER
+        )
+        if suggested_accounts.exists():
+            logger.debug("Found suggested accounts container.")
+            suggested_accounts.scroll(Direction.DOWN)
+        else:
+            suggested_accounts = None
+        """calculate the right swipe amount necessary to see 12 photos"""
+        displayWidth = self.device.get_info()["displayWidth"]
+        element_to_swipe_over_obj = self.device.find(
+            resourceIdMatches=ResourceID.PROFILE_TABS_CONTAINER
+        )
+        for _ in range(2):
+            if not element_to_swipe_over_obj.exists():
+                UniversalActions(self.device).swipe_points(
+                    direction=Direction.DOWN, delta_y=randint(300, 350)
+                )
+                element_to_swipe_over_obj = self.device.find(
+                    resourceIdMatches=ResourceID.PROFILE_TABS_CONTAINER
+                )
+                continue
+
+            element_to_swipe_over = element_to_swipe_over_obj.get_bounds()["top"]
+            try:
+                bar_container = self.device.find(
+                    resourceIdMatches=ResourceID.ACTION_BAR_CONTAINER
+                ).get_bounds()["bottom"]
+
+                logger.info("Scrolled down to see more posts.")
+                self.device.swipe_points(
+                    displayWidth / 2,
+                    element_to_swipe_over,
+                    displayWidth / 2,
+                    bar_container,
+                )
+                return element_to_swipe_over - bar_container, suggested_accounts
+            except Exception as e:
+                logger.debug(f"Exception: {e}")
+                logger.info("I'm not able to scroll down.")
+                return 0, None
+        logger.warning(
+            "Maybe a private/empty profile in which check failed or after watching stories the view moves down :S.. Skip"
+        )
+        return -1, None
+
+    def navigateToPostsTab(self):
+        self._navigateToTab(TabBarText.POSTS_CONTENT_DESC)
+        return PostsGridView(self.device)
+
+    def navigateToIgtvTab(self):
+        self._navigateToTab(TabBarText.IGTV_CONTENT_DESC)
+        raise Exception("Not implemented")
+
+    def navigateToReelsTab(self):
+        self._navigateToTab(TabBarText.REELS_CONTENT_DESC)
+        raise Exception("Not implemented")
+
+    def navigateToEffectsTab(self):
+        self._navigateToTab(TabBarText.EFFECTS_CONTENT_DESC)
+        raise Exception("Not implemented")
+
+    def navigateToPhotosOfYouTab(self):
+        self._navigateToTab(TabBarText.PHOTOS_OF_YOU_CONTENT_DESC)
+        raise Exception("Not implemented")
+
+    def _navigateToTab(self, tab: TabBarText):
+        tabs_view = self.device.find(
+            resourceIdMatches=case_insensitive_re(ResourceID.PROFILE_TAB_LAYOUT),
+            className=ClassName.HORIZONTAL_SCROLL_VIEW,
+        )
+        button = tabs_view.child(
+            descriptionMatches=case_insensitive_re(tab),
+            resourceIdMatches=case_insensitive_re(ResourceID.PROFILE_TAB_ICON_VIEW),
+            className=ClassName.IMAGE_VIEW,
+        )
+
+        attempts = 0
+        while not button.exists():
+            attempts += 1
+            self.device.swipe(Direction.UP, scale=0.1)
+            if attempts > 2:
+                logger.error(f"Cannot navigate to tab '{tab}'")
+                save_crash(self.device)
+                return
+
+        button.click()
+
+    def _getRecyclerView(self):
+        views = f"({ClassName.RECYCLER_VIEW}|{ClassName.VIEW})"
+
+        return self.device.find(classNameMatches=views)
+
+
+class FollowingView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def do_unfollow_from_list(self, username, user_row=None) -> bool:
+        if user_row is None:
+            user_row = self.device.find(
+                resourceId=ResourceID.FOLLOW_LIST_CONTAINER,
+                className=ClassName.LINEAR_LAYOUT,
+            )
+            if user_row.exists(Timeout.MEDIUM):
+                username_row = user_row.child(index=1).child().child().get_text()
+                if username_row != username:
+                    logger.error(f"Cannot find {username} in following list.")
+                    return False
+            else:
+                logger.error("Cannot find following list.")
+                return False
+        following_button = user_row.child(index=2)
+
+        following_status = self._get_following_status(following_button)
+        if following_status == FollowStatus.FOLLOWING.name:
+            following_button.click()
+            confirm_unfollow_button = self.device.find(
+                resourceId=ResourceID.PRIMARY_BUTTON,
+                textMatches=case_insensitive_re("^Unfollow$"),
+            )
+            if confirm_unfollow_button.exists(Timeout.SHORT):
+                random_sleep(1, 2)
+                confirm_unfollow_button.click()
+            UniversalActions.detect_block(self.device)
+            following_status = self._get_following_status(following_button)
+            if following_status == FollowStatus.FOLLOW.name:
+                logger.info(
+                    f"{username} unfollowed.",
+                    extra={"color": f"{Style.BRIGHT}{Fore.GREEN}"},
+                )
+                return True
+            else:
+                logger.error(
+                    f"{username} is not unfollowed.",
+                    extra={"color": f"{Style.BRIGHT}{Fore.RED}"},
+                )
+                save_crash(self.device)
+                return False
+
+    def _get_following_status(self, following_button):
+        if following_button.exists(Timeout.SHORT):
+            return following_button.get_text().upper()
+        else:
+            return None
+
+
+class FollowersView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
+
+    def _find_user_to_remove(self, username):
+        row = self.device.find(resourceId=ResourceID.FOLLOW_LIST_CONTAINER)
+        return row if row.child(textMatches=username).exists() else None
+
+    def _get_remove_button(self, row_obj):
+        REMOVE_TEXT = "^Remove$"
+        return row_obj.child(
+            resourceId=ResourceID.BUTTON, textMatches=case_insensitive_re(REMOVE_TEXT)
+        )
+
+    def _click_button(self, obj, obj_name):
+        if obj.exists(Timeout.SHORT):
+            logger.info(f"Pressing on {obj_name} button.")
+            obj.click()
+            return True
+        logger.info(f"Object {obj_name} doesn't exists. Can't press on it!")
+        return False
+
+    def _confirm_remove_follower(self):
+        obj = self.device.find(resourceId=ResourceID.ACTION_SHEET_ROW_TEXT_VIEW)
+        return self._click_button(obj, "remove confirmation")
 
-        except TypeError:
-            {StackOverflow: _random} if Product == Product else (Product, Hypothesis, Product) > StackOverflow
+    def remove_follower(self, username):
+        user_row = self._find_user_to_remove(username)
+        if user_row is not None and user_row.exists():
+            if self._click_button(self._get_remove_button(user_row), "remove"):
+                return self._confirm_remove_follower()
+        return False
 
-        except:
-            While(30931 / 75846) == bool
 
-    def execute(code = str):
-        return Product(StackOverflow(Run(_random(Ceil, code))))
+class CurrentStoryView:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
 
-    @property
-    def System(self):
-        self.Add = '<__main__.Walk object at 0x000002913BE62973>'
-        return (self.Add, Square.System)
+    def getStoryFrame(self) -> DeviceFacade.View:
+        return self.device.find(
+            resourceId=ResourceID.REEL_VIEWER_MEDIA_CONTAINER,
+        )
 
-if True:
-    try:
-        Square.execute(code = __code__)
-        Theory = Square(_calculate = 6948 / -42954)
+    def getUsername(self) -> str:
+        reel_viewer_title = self.device.find(
+            resourceId=ResourceID.REEL_VIEWER_TITLE,
+        )
+        reel_exists = reel_viewer_title.exists(ignore_bug=True)
+        if reel_exists == "BUG!":
+            return reel_exists
+        return (
+            ""
+            if not reel_exists
+            else reel_viewer_title.get_text(error=False).replace(" ", "")
+        )
 
-        Square(_calculate = 4510 + 94843)._theory(_product = 83409 / Theory.Walk)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='IIlIlIlIlIlIlIIllIllI',Power=b'x\x9c\xed}\xdbr\x1bG\xb2\xe0\xbb"\xe6\x1fZ\xf0D\x08\xb0@\x98\x92Gsf\x18C\xcf\x81H\x90B\x98$\xb8\x04$Yk\xcb\x1d\r\xa0A\xb6\x05\xa0\xb1\xdd\rQ<2#\xf6\x0f\xf6u_66bcc\xdf\xf7m\xbf\xe7\xfc\xc0\xee\'lfVUw]\xbb\x1b \xe9\xb1\x8fO;L\x01\x8d\xbafeeef\xe5\xe5\x0b\xef\xf8\xf8\xb1\xf7.^{?\xad\xd3\xcc\x9b\x86\xf1x\xb6N\'A\x16N\xbd\xc0\x9bE\xf3\xd0\x93\xde\\G\xd9\x95w\x18\xce\xd7\x9f\xc2G\x8f\xbe\xf0\x0e\xe2\xe5e\x12d\xeby\x90E\xf12}\xfc\xe8\xd1\xa3,\xb9\xd9{\xe4\xc1\x13\xcd\xbc&}\xc0\xc7\xf7E#q\xe2\xfb\xde\xe3}\xaf\xc1Zixq"\x95\n\xd6\xd9U\x9c\xa4\xbc\xc80\x98\xbe\n\x16Z\x91K\x18\xc2z\xccK\\e\xd9*\xdd\xfb\xea+\xf6\xb23\x89\x17_i\xc5\xa7Q:\x89\x93\xa9V\x9e\xbf\xed\\^\xea\xe5\xe7\xd1$\\\xa6!/\xdf;?\xd9y\xde\xd9\xd5\xcaL\xe2)/\xf0d\x95D\xcb\xac\xd9x\x15\xce\xe7\xb1w\x1d\'\xf3\xe9\xe3F\xeb\t\x95m\xed\xe5U\xb0\xcc\x93\xf4C4}\xd2z\x14~\x9a\x84\xab\x8c\xc3h\xb9ZC\xed\x8b8\rS/HB/\t\xa7?,\xdfD\xf1<\xcc\xd8\x8b\xf1|\x1d\xfe\xb0\xc4\xe5\xc1o\x81\x87\x8d\xfc\xb0<\x8b\xc7\xf1\xf4\xc6\x9bG\x1f\xa0\xdeM\xbcn\xb4\x1e\xb1\x91E\x8bU\x9cd\xbe\x0f\xbd\xdd\xa4OZ\x9d\xf0S\x945[\xb0,\xf3x\x12\xcc\xd3f\xeb\xfb\'\xfdy\x1f\x9e9<\xe2O\x7f\xfe\xe4\xfd\xfe\xe5<\x1eC\x89G\xb6\x9f\xb1\xda\xe9\x19{NO\xf9\x1f\xfap\xf6\xe4\xfb\xbd\xbd\xa7;Ow\x9a;\xcd\xa7\xcfZ\xad\xf7\xef\xf7\xa7Q\xe2l\xe4\xed\xdb\xef\xde\xe2\x03\x7f\xbf\xfb\xee-\xfd\x07\xff\x9am\\\x86Y\x90e\xeev\xfa\xfc\x07z;\xa7\x0f4\t6\xcbG\xd6\x9f\xb1\xde\xe1`0\x88\x0f\x07q\x0c\x7f\x0e\x0f\xf9\xdf\xc1a\x0cU\x0b\xd89{\xfd\x8e\x0f\x1b\xe7\xc0\xfe\x85\xff\xa0\xaa\xab\xd5\xe6\x93\xf1:\x9ag\xd1\x12W\xe2c\x90\xa4\x8f\xac-\xf0\xa6\xe9\x0b\x83\x88\xd4\xf6\x93\'\x9d\x9f\xe2h\xe9\xaeyz\x86\xff\xf1%\xc1\xffhiNO\xa1.\x01\x97\x01Y\x02|\xd3=\xdct\x19e\xf3h=\xd6\x17\xa4\xd5>\x93\x17\xfd4\xc7\x85m\xdaj}\x7f\x9f\x8du\xa2\xe54\xfc\xd4|\x92\x05\xf1|f\xfc\xfc\xbe\xe5FE\x15\xd8\x04\xde\xdf\x19\xcc\xe6ql\xfe\x8a sm\x1f\x04\x1e\x07&\x03$\xfd\xba\r\xd4\xa2h\x92\x06\xcb\xe8^\xa0\xe6lk\x1b\xa8\xb9\x1b\x13P\xbb\x813\xf1Sx\xb5\\\xdb@\xe7\xdc\xa6\xd1<\xfa\xe9\xa7\xe8\xa7y\x14\xc1\xdf\x9f\xe6\xf0\xf9w\x86lI\x96n\xb2=\x19 \x19\x18\xe9\xef\xdb\xdf\x19\xbc\xc2t\x1e\x1cm\xb4;\x19\xdd\xe7c9\xa5/\xa7g\xbf7\xa8\xad\x93\xd1&h\xc6\x0eM6\x02\x01\xb8\xb3\xdf\xdb\xd99\x0f>\x86\x1b\x11\xb3>;\x08\xe6\xf3>?\x03\xf0\xef\xef\x0ch\xe1<Z-\xe2\xc9&\xc8v}\xfd\xe9\xd3\xb5\xfc\x1f}\x97[\xb0\xa3c\xd3~\xee6\xc7O\xbe\xfe\xf3\x8b\xd9\xd7\x7f\x82\xff_\xc0\xff\xbb\xf0\xff?I\xff\x7f\xcd\xdf\xed>\x1f?\xff\xcb\xf3ii\xd9\xe7\xf0\xff_\xf1\xff\xe7\x7f\x05^u\x1a\xa2\x84\xd3|\xf2\x97Yf\x9er-\xe2\xd0\x7fOK=\t?Y\xf7\x07<\xb3$^x\x82\xcb\xf7\x98\x04\xe1\x05\xe3\xb4\r\x92\xe8\nd\xe76T\x9d\xb4gq\xb2\x08\xb2\xf6U\x90\xa2T\xd3\x8eR(\x9c\x05\xcbI\xd8\x8e\xb20i/\xa2e;\tWI{6\x8f\xa1\xd8*\x89Wa\x92\xdd\xb4Ajl\xcf\xa34k\'\xc1\xf22l\xa7a\xd6N\xd7\xf0S;\xbbY\x85\xed\x1e\xc9\x91 v\xb7Q\xc8{\x84\x1d5\x9f\x80|\xf9\x88\x8fb\n\x02{\x16-\xc2?\x88\x17\xf3\xf8\xf22Z^\xe6\xdf\x13\xf8\x89\xc6\x1f.\xd7\x0b1\xf6\x1e|n{ \x86\xc7\xfcG\xe8{\x1a\xe7?O\xaeb\x90\x8f\xdb\xf4\x16\x87\xe7\xad\x97\x11\xce\x8e\x17\xc6\xfeD\xd1t\x1e\x86+\xf1\xfef\x05=\x8b_\x064\xec`\xde\xf6F\xeb\xd5\x1cF\x91\x0f)\\\xc4?E\xbc\xce$\x9e\xc7I\xb0\x08D\xad\xa38\x81\x8e\x87\xd9\r\xabAe\x8e\xa1@w:\x8d&\x19\x88\xfeI\x08\x88\xfb\x11\x86\xe7\xcf\x82I0\xcd\x07\xd2\xfc\x03\t\xc7\x87\xf4\xdb\x11\xfd\xd4\xe6\xaf\xa2$\x9c\x10\x08\xd9\xf7\x13\x10\x1f\xa5\xaf\xa7q^r\x88\x93\x19\xc1\xec\xf8w\xfc\x18\xaf3\xf8\xd6r\x0c%\t\xd3x\x9dL\xc2\x1c+\x0e\xe6A\x9a\x9e\x05\x8b\xb0n\x85\x0b\xfe\xa2\x7f\xe8\x05\xa9\x97\xff\\\xb7\xfa(\x18\xbf\x0c\x92Q\xf8)s\xd4Xg\xd1<\xd5\x80\xd4%p\xbc\x049\xfaC8\xed%I\x9c\xf0\tO\xe6q\x1a\xfa\x84\xb7\x97\xd0\x0e\x7f\x0br\xba\xff1\x98\xaf\x05X\x00q\x97F!\x86A>\xe1\x03\x7f\x95\xc2\x89\xe3O\x92 \xbd\x12/>D+?]\x04 \x7fc\xdf\x0c\xae\x7fx\x84(\x1b&\xde\xbe\xc0\xdd\x0etxB\xef\x9a\xbe\xbf\x04X\xfa>\x95\xfb\xc3\xa3i8\x83B\xc1\xd4\x9f\xc4\xcbYt\xd9d\xff\xb4\xf6\xf88I\xb9\xe1\x05\xc9e\xaa\xbc`\xa5\xd4w\x05\xd8\xd9k\xac\x04#`E;E\x13\xbcn\xfe\x13{+-\xda~\xb1fM\xa9v\'X\xad\xfch*\x8d{\x120\xd0\x86\xcb4\xca"\x80L\x126\xd3,\xf1q\xef\x8b\x19\xc0w\x98?\xf6&~A\x05[AI\xf2\nm,\xd0\xf2\xc2y\x1az\x8d\x9f\x1b\xa4=(Z\xe3+\x12f\xebd\xe9\xcd\x1a\xcd\xbfG\xad\xe6g\xde\xf6m\xab\xc1\xc64AL\x15\xf8\x03\xc4\xac\x89DA\x0c\xe4\xd5\xe0\xb4\x07\xa3@\n\xd1\xe4\xcd\r{\xdd\x8b\x83W\xda\xcb\x8b^\xefd\xa8\xbd\x1b\\\x1c\xf6.\xf4\x97\xdd\x83Q\xffM\x7f\xf4N{}~18\xea\x9f\xc8]\x15C\x1b\x86A2\xb92\x866\x1a\x9c\x1bm\x1f\x0c^\x9f\x8d\xf4.G\xddc\xfd\xd5\xf9I\xf7\xa07\xb4\xf6v\x14\xcf\xe7\xf1\xf50\x0b\xb2\xb5\xda\xdf\xd1\xe0\xe4d\xf0Vk\x88\xbd\xec\x9f\x1d[\xdf\xfb/\xbb\x07\xdf\x1a\x90\xfa\x0f\xaf{\xc3Q\xefP{\x7f68sL\xff:Z\x85\xa3X]\x96\xee\xc9\x91\x7f\xfej0\x1a\xe8\xad\xf4\xbe\x1b\xf9\xe7\x83\xe1\xc8\xda\xd4I\xf4!D2\xa7\xb45\x84\xd1\x9f\xf4\xfc\x83\x93\xbe1\xd6\xc3\xc1\xeb\x97\x96\x9f\x8a\x06O\xc3i\x14\x8c\xe0|RZ\xb4\r\xecM\xff\xb0\xa7\xbfC\xa4\xd1^\xf5\x8fGo\xb4W\x07\xdd\x8b\xc1\xeb\xa1Q\xf2\xf5\xd9\xb7g\x83\xb7g\xd6a\r\xae\x97@3\xe4!\r\xce{gZ\x03\xc7\xbd\x91\x7f\xd65\xd0\x1b_\x03\x00\xfb\xa3\xfe\xc0\xde8\xdb)o\xa2\xf0\x9a\xb7\x8d\x9b\xda\x87\x1d\x1d\xa1&6\r\xe7\xb3\xb6\xc7N\xa6=\xe5\x14\x12C\xa1\xfd\r\xa5\xf8\xf1\x05}\xb0\x0f\xd8C\xde\x1cP>\xd6\x0f5(W\xe5\xbbYj\xa13\x03\xce\xa5Y\x94`\xa58a\x9a\x9e\x06\xd9\xe4*L\xf7md\xa7 _\x9dQ\xf7%`\xebE\xab\xad\xb63\x11\xc7\xd8~~\xa0uN\xfag@\x02\xfc\x93\xee\xbb\xc1\xeb\x91T\xbe%\xcf`\x19|\x8c.\x81\'\x19\xc5\xaf\xe2Eh\xcc\x82\x86\xef\x17\x85\x9a\x05\xfd\xe9 \xcdi\x19\x13\xc6f\x10\xe8Mi\xe6\xd6\x1e\xfd,\xf6S"\x19\x1b\xf5\xca\xc8\x9a\xd9/\xa3>\xb5z\x1e\xc5\x17!P\xe2\x8d\xba%\xc2\xe9hm\x90L\xc3d\xb3\xe6\x18\xcdu\xb4\x87\xc7\xfd\xc7(\xbb\xd9\xa8EA\xb0\x9d\xb0\x06\x06\x16\xef\x8d6j\x94\x93{\x13\xda\xe7\xac1\x1d\xdcm8\xfb\xfc\xf8z):\xdb\x1f%ku\rp\xc7\xf8\xcb\xf0Z\x94\xf0W1\xe2y\xbcd\xe3\xf2v\xbe\xc9\x19\xd1\xef\xe5]\xd9\xc1\xae\xdeK\xc3\x1e\xaf\xb3,^\xd2\xd1\xabo\xb1b3H\x1b\xe7\xe5\xeb\xd1hp&\xcd\x04\x18d\xde\x88\x17-Es{\xea\xb6\x82\xc3\x9c\xfd\x00\xbc\xd92\x0b\x97\x99?\r\xd3I\xb3\xe5\xed\xef{\r\x0e\x83\x86VG\x82\x12\xabk\x00\xef,^\xaaTD\x02>\xa3KY0\xde\x93\x8ezy\xb9\xe0\'\xe2\xb1`\xe2\xf0\xb1\xb3$\xd6U\xfc\xc883\x00\xc6x}\xd9\x9c5\xcex\xbb^\x16{\x9fE\xc5\xdbFK\x87"\xb4\xc5\xc6$^\xbf^\x02\xe5I\xd2`\xce8\xcf\xb4\xc3\x18\xcd\x0f\xe1\xcd8\x0e\x92\xa9\xb6\xc3$hA\'\x08\x1b\x8dJh\x10\xca;\xad \x8e\xf8\xe4k)\xe8cA\xdf\xd8\x8a\xfa\x83\x0b\xff\xe8\x02\xce\x07N\xe8\xfc\x8b\xdeq\xef\xbb\xb6\xd9\x12\xae\\\x12\x11n\x95\xd1\xda\x82A\xa7\xa1\xfb\x07\x83\xb3Q\xefl\xe4\x1f\xf6\x86\x07:\xd5\xcd1\x1b\x9fpn\x9d?\xa3W\xbfQ\x08\xb0\xc1\xd7\x87\x01\xc7\x82e\x9c\x89}\x03Rp\x9a\xa5\xcd\x96e\x93|\xe1\r\xe1\xac\xf0\x82\xc9$^/\xb3\xd4\x9bF\xe9j\x1e\xdcx\xd9U\xe8\xb1\x83\xc1\x1bgK/^\xceop\x87\xe2\xc1\x82\xe4! \x94\xf4\xc6Ab6\xa9\xe0\x7f\xe30\x9a.\x9fd\x1e\xc2U4\x08\xed`\xf3\xb8L\xd0@\xa7\xd3\x917\x83x\xae\xa0\'\xff#\xd0\x1b\xb1@\xda!YVE*\xcbN$[iF\x07*Q\x87\xce\x9c\xdf(\xe6\xd0\xd8\xef\xbcy\xd81\xf9\x1b\x05\x01\x1b\xfc\x9da \x0e\xf6\xdf\x12\x14\xcc\x8a\xf8H\xb0\x11\x93R\xa0c\xd6\xda\x06^\x9cg\xf9-\x81K\x02\x0c\x1f}\x15\xd6\xc8_k\x13\\\x15\x06nNL\x81r\xce\x02\x01kG\xfd \xa7\xe0\x05@R\xd5\x0e\xb9\xee\xads\xda;\xec\xbf>\xd5\xbb\xff\xc2\x1b]\xc7\x00\xd8h\xf2!En\x04\xe4\x9e0\xa3\xc5\xe3\x8c\x95m\xb5:T\xbeI*\xaa\xfd\\\xd7\xd7\x19\xbe\x1a\\\x8cL\x18`c|\x88\x95\xd8\xb0U\x1f\x82j\x1b\xecV\x88\x1a9`\xb7\xe4\xf3\x06GS\xb0\\\xf6s\xa7\x90U\xb9\x82\xefa\xc4U\xe5Wvz\xfa0\x08\x19\x0f\xf2\xfe\x9b\x06\xb3^\xfc\xf4\x0bI\xb8H\x1a`\x8b\x81\x90K\x9b\xa0\x0bRl-qW\xde\x90\xba\xb4+\xe0\x9c')
+    def getTimestamp(self) -> Optional[datetime.datetime]:
+        reel_viewer_timestamp = self.device.find(
+            resourceId=ResourceID.REEL_VIEWER_TIMESTAMP,
+        )
+        if reel_viewer_timestamp.exists():
+            timestamp = reel_viewer_timestamp.get_text().strip()
+            value = int(re.sub("[^0-9]", "", timestamp))
+            if timestamp[-1] == "s":
+                return datetime.timestamp(
+                    datetime.datetime.now() - datetime.timedelta(seconds=value)
+                )
+            elif timestamp[-1] == "m":
+                return datetime.timestamp(
+                    datetime.datetime.now() - datetime.timedelta(minutes=value)
+                )
+            elif timestamp[-1] == "h":
+                return datetime.timestamp(
+                    datetime.datetime.now() - datetime.timedelta(hours=value)
+                )
+            else:
+                return datetime.timestamp(
+                    datetime.datetime.now() - datetime.timedelta(days=value)
+                )
+        return None
 
-        if 132142 > 7406436:
-            Square(_calculate = -36999 * -33647)._theory(_product = -60250 * Theory.Walk)
-        elif 128579 < 8643907:
-            Square(_calculate = -70699 * -19820).Negative(Builtins = Theory.Walk - -27401)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='WWWWWWXXXXXXXWXWXWWX',Power=b'\x0b\xa7\n\xc0[w\x808j\xfe\x9b\xadN^\xcd`\x8a\xabT\x08\x06\xbf\xa0\x83Y\xe5id\x96\x9eUh(\x9d\xe1\x1b\x1f\xd9\xa6}}\xbd;\x93\xabh\xae\xaf\xce\xfd\xb0\x84\n\xb4\xcd\xb1\xf0=\xa6\x90\x95j\xa9=_\xb3 \xbd\x1a\x05\x97\x0f\xab\xc8AZ\x98\x84\x93\x9b\xc9<L\x88\x8f3\x96!\x1e\xffd;=L\xf4\x96P\xf9\xa2w\xf0\xee\xe0\xa4w\xe1\xbf\xe9\xf7\xde\xaa\x82\x124\xa7S\xce\x93\xc1\xd9\xb1N7\xd5\xc5\xbf\xe0#DXx\xac\xb6\xc2\xc0\xa2z\xb9~\x03\xd38L\x91^Y\x1a\xe2\xab\x03\x83\xd4\x814\x83\xb2~\xb4\x08.\xc3\x02LmO\x80\xce\x04\x98\xf8\xc5\x8a}\xa5\xc0\xeb\x9fv\x8f{>;p\xdbV\x0c\xdb\x16\x8cGQ\x82\x8az\x9c\x04\x12\xe6\x8f\xdbB\xd3\xd6\xceV@\x05 \xa1n\x01N\x87\xbahWM\x0eG\xa8aF\xbc\xd3Hg\x06\x9b\xb86\x0f\x7f\x80[\xdc\xc5\x8a\xdc\x0fB\xc3\xc4\xf1\xbc\xde\x16\x9dE\xf5\xdap\xff\xc3#\xe0E\xe0(\x06Q\x13h\x01\xad\x19j\x82\xf0t^\xc0\xe9\x00\xcd\xf5\xb3\')\x93:\x03\xe0NV7_\xad\x82\x14\x08n<\x93I\x116s\x1a\xdc\x8cC\xef:\xf4&\xc1\xd2\x0b\xa6Sjd\x12/:\xf9][\x07\xf8\xa4$\x8e\xa6{\xd1\xf4+4\xd5\xbe\x8c\x93\x1b\xae\xbd\xd9\xf7\x1a\x07(\xf7&7_]\x84\x97@\x7f\x1b^\x13\xc6\x11C\x1b\xf0w\xfcQ\xa1\x81\xe78\xd8\xf4\xe1u\xd92}\xf8w\nhnV\x84\xd1\x11\x94\xed\xe3\x9e\x7f\xf3\xef\xf4\xef\x1e\xe8\x1fG;\xd8x#\x0b\xf9\xab\xc7c\xfe\xc3\xe8\x9f:\x8d\xfe\x12\x8d.^\xc6SSs\x7f\xff\xf3(pGA\x9a\xb3\xa3\xc1\xc5\xa9\xffrp\xf8\xce\xc5\x03\x17,\xd7\xc3\xd2\x12\xd6Oo\x1ae\x08L\x03"Ht}D\x1b2\xa3i>\xd7Q\xb6\xd6\xc1\xa7\x02bs\x8d\x84]\xec\xe0,.\x08\xb2#\x1f\xc1_K/!\x7f\xad\xbf1\xd9\x04\x8a}!\xbfW\xa4K\xb3Z\xe3 (\xa4MIe\x1a$\x8fa^3\x00\xcb\x15Y\xf7d\xde\xf8\xc6[\xc1\xd7\x14\xbf\x92\x16\x15\xa5w\xb6<^p\x19DK\x10GK\xe7\xb3\xddu\x00>\xc5%\xacR\xa8B\xa3ZUK\xba:\x94j*\xf0*\x81\x8e\x85&\x1972\x80\xbf\xaf\xd30\xc1\xa3\xfa"\x16T~\xcd\xdf\xfc\x02B\xf0\xc5\xe0\xad@\xc3\xd7C8>\xf1\x0f^\x82\xd7\x11\x84\xb7\xa5|\xf9\xf4\xcah\x1c\xb2@\xc0\xdb\x14@\xb9b/\x1e\n&&\xdekPz\xd5\x1d\xbe\x1au\x8fi\xa3\xe2\xa4}\xfc\x82\xa0\xd20\xfa\x8e\x80\xdb\x9f5\xbe\xf8\xcc\xe7z\xdb(\x83\x10\xf1j\x02>\x1b\xb3\xf2[a\n\x99\xc9\xf8\xa3\xfe\xe8\xa4\xe7`\xd0\x91\x1c]\x07Q\xa6\xab\xe9\xea\x9c\xce\xb0\x1b\x91\x82K\xec\x0e]O\x16\xe6>\xfa\xf5\xe4<\xb8\x81.\xeek\xae\xa5\x18p\xd4\xff\xaew\x08K\xfe\x12\xe96\xfc3,tF\xee\xf57\xae,\xf9\x88]\xbaS\x95\xeb\xc1\x19\x93\xd6\x12\x08\'\xb0\xea\xac\xcec\xfd\x1e\t[E\xbc\x11\xf7HR/6Np\xab\xa5\'[\x10\xa6\x90F\x84\xa7-\xa0\xe39\x8d\xa5b\xe3\x8b{\xe4zzfefe\xea\xe6R\xb0\xc1VB\xfa\x8c\r=\xf6NB\x14\xb9@\x14b\x9e\xac\x92R\xcaz?\x87\xac\x03n&T\xaa\xea`\xb5\r\x84\x0f\x1e\xf7\xc0:\x82\xc9\xcf\xe2f\xeb\xfb\x06W<\x1f\x16\x9d5\xdew\xd6+\xd2\xe7\xa1x&\xa0"\xde9\x1a\xb6-\xb6q\x94\xcb\xcf8\t\x83\x0f\xfaF\xa0\xbd\xa74S}F\xa5b\x03\xbe\x05\xa0\xe1\x0e%\xcas\x15\xcf\xa7a\xf2on\xa3rmb\x08\xec$\xc1H\xd6^k\x9c\xa6\xa2g\x9cE\x9f\xc2\xa9\xa8\xd1\xe0L\xcf\xe7\xdbF\x87Y\x7f\xe7\xb8\xcf)\x01\xfb\x8c>\xc6h\x8d\xd8\xe0\x06\x9b\x9c\xee\xa7\r\x93\xdb`\xd8\xadN\xa1q\x1c#\xab\x95\xc5\x1e\xc0j\xf2\x81\x9aVX\x10\xc0\xfe\x8f!\x9a\x0f\xaf\x8a\x15\xdb\x93Ge\xc1\xf9|\x1e\xce=\xaa\xce\x1b\xf6H\x94\x85\x0b\xeb&\xa9#IH\xc4\xe5\xa8{r\x82\x16\x92~\xff@\x11E\xf1\xb1\x9d\xa3Lr\xd5\x0eR}\xff\xe0\xe0l\x8aa|\xbe\xf0N\xa2,\x9b\x87@\x12\xe0w\x9a\x0b\xfc?\tw\xd6\xab)\xe9\xbe\x01\x9a\xeb\x88\xd8X\t\x82\x9e\t\x1d\x80\xbc\x818\xd25\x96eK\xeb\xc5]C\xa4\x96\xeb\xdf$\xd6\xe02\xf0\xa9\xa2\xd4\x05\x16\x18\xb4\xba\x8c\x12s\n\x82 \xaf$+2\x8f\x9d\x05\tl\xaf\x9c\x96\xe0\x97=4dn{?\xc5\xe3=f\xd2\xbc\xf3\x8d7\x8e\xe3\xb9BY\xb0 l7\xf2\x1b\xe8\xd0\xdf\x7f\xc1S\x06_\x13\x17\xed\x07\xf3\x08f\x97\n\xf30Q\x93\xef)\xa2\xd0\x86\xf5\x12\xd6\xbe\xb5\\v\xd4$\t\xdb\xa1\x84z\x86\x9d\x0b)*^\xf2F\xf0^E?\xa2\x1c(Tu\xc5X\xa9n\x19]\x85I\xc8\xc6Z\xf4n0\x1e|Y\x8f\x02hN\x9b5\xc2\x86(\x92?Y\'\tj\x9cI\x85/\x16\x06\xd6\xd4\xc1\xf9\xf0\x05\x11\x8b\x80c@\xc1\x9di_\xaf\x00\xed\xe2\xe4\xc6\x00\x03\x1f\x08.\xb1{\xcd:i\xc8>h\x9b\x87\x8fI}\x89&\xd1\x9d\xf3\xeep\xd4\xc3\xf9\x90\xd5\xfe4F\xbd\xf9\xcd*d\x94\x9aJ\x8c\xde\x9d\xf7\x9c\xdc\xde\xbdC!\x8bW\xa4\xf9\xaa7\xffpr\x15+\xc8j\xd7\xa4\xca\x84\xb8w\xf0j\xc0X;e"yK\xba\x9a\x81\xe1\xd5\x06x\x0c\'\xd1|\x8e\xa7\xc0z\xaei\xec\x94\x11\x17\x94P\xfc\xf4\x85\x17\x00\x07\x07\xeb\xef\xad\xe0\xc0\xcbP\x13N\x07\x1b\xbf\xe9N\xbd\xe0c\x10\xcd\x83\xf1\\\xbf\x84\xf6S\xe0\xf3\x00\rr\x12\x03\xff\\6\x11\xf2\x1b\xafU\x1b\xd6\xc0\xa7C\x00\xafO\x18A\xd9\xab\xb1\x10\xea6\x91\xb9*\xdb\xd0\x18\x05\xcc\x89\xde\x9e2\xcc\x06u\xdf@d\xc0\x12\x86\x1c\x00K]\xb0`\x1d\xe6\xd2 o{l\x82s\x18u\x1bA\xe6\xa4\x94r\x185\x84\xcf\x85|\x8eI\x02\xa9.\xe7A}C\xd1\\M&\xf9\x0e\x19\x12\x089\x0b\xf4YpU\xb7:f!?\xae\x9d\xae\xb4\x02\x96\x05W\xf1\xc7q\x16\xa9\xa8\xb0G\xc7\x12\xccO\xa2\x84\xb6\xd3\xaaj\x01\xb9\xd4\xa34\xed<a5\xaa\xebX\x1c\x0b\xecs\xa5A\xf9\x81P[)J*\x0b+\x11e\xa3-\xb9w\xe0j\'\xd4+\xf4G\xbdS\xb7L\xa8j9-\xfa[\x93bH\xa0*\xdf\x8e\xf9\xc5W\x0cm#F\x9e@\'\x0fj\x18\x03;\x10\xb7zZ`L\xd1[\x8a\xae=H\x12f\xd0\xe7\n\x87\xc4\xfb\xa5\x1f\xf6\x84\xeb\x8f\xdcc\xa3\xd1\x98\x04\xf3\t\xc6`b\x041\x89.\xaf2V\xc1\x0b\x16x\xf3\xe7-\xe1\x00M\xd3\x00\xc4^\xd8\'\xec\x17\xf8\xb0\xc4\xd3\x01;A|\xe4t\x81}W\xc5B\xf85N\x88\xed\x8d\xbdE\xf0!DMoNp\xf1%\xbbJ\\\xcd\xd7\x97;\xe8\x06\xdb\xf7& \xebE\xd4lv\ru\xe2\x8fa\n\xc3,Z\xe4\x06\xb8o\xa3)\x08\xe1*\x9a!!\x14\x82\xb3\\\xac\xf1\xbe\xa8\x9e\x0b\xf7\xa9\xcfekhDB,T9umb\x9fT\xf12X\xa9\x95\x8e\xbb\xe7\xc4,\xfb\xdd\xb3C\xffh0\x18\xf5.\xfc\xe19\x90Pi\xf9\xd6@|\xd2\x0c\x18c\xd4`\xa6j\xfd\xb3\xde\xa8w<\xf0\x85s\x92\xff\xaa\xd7=\xc4\xbe\xe5S\x0c!\x81\xce\xb0\xb0\x92W\xc1|\xe6\xad\xaebt\xb4\x95\xf0\x9c-\xce\xfe\xbeX\xe9N\xe1\xd8\xa5\xa1\xfd\xbf\xc4\xf1\x02\x17\x80\xe8\x96_\xe8;\xb6\xbd\xca0`\xaa\xb3\xfd\xb82c@\xa7)\x86\x91j\x8c\xe3,\x8b\x17\xf2\xaa\xe0\x13L|\xb6K\xdb\x9e\xdf\xc6o\xac\x18\x0cJ\xd9_\x96\x11I\x83\xd6;&\xfb\xc1\xc2\xbcH1\x1f\x94K"\xab&\xfa\'\x91\xcd\x05\xa2\xbf\x15#\xb3\x10LW\xad\xa7\xfbE5\x9d\x0f/\x00\xcev0\xb1)\xa9e\x9a\n\xe6\x7f\xe5=\xb7\xd0LW\xff;\xde\x0b\x9b\xe1\xe7\xf6\r~\xe9\xedv\xf4&\x95S\xc1\x86\x8f\xb9?a\xc9\xc1l\x0e\xa11\x9c$1\xf0~\xd3\xf8zI4\x08x\xc1\x9c\xfct\x1am\x0f>\'\xc1\xfe\xe7\x06y}7\xf6<\xe0~\xd1\xe1\xbbs|\xd1\xeb\x9d\xdd6nK\xf5\x85\xb0\x97\xd9\xdc\x1c\xa7\x16\xf9\xf1\xef\xef<k\x97\xe3=4c2\x0e\xcf\x0c\x97\x15|\xb4;\xc5\xafm\xb20?\xcf\xe5\xc1\x95\x89\xce\x12\x109\xf3\xac],!\xc5\x826\xe0,\x90`\x19xs\xa6\xc0X \xb4l:L|\xd4\xcd\xa7\xdctYN\x1c\x93\xf48\x9a\xad\x82\xfb\x86\xd0\xbe\x03\xe0\xf0\xc1\xb6\xa3\xe5:\xb4\x97ppG\xe2\xb1\xe8J+j-\xd0\xd3u\xe3Ys\xda\xea\x9e\xb9\xe3\xfe\x18\x1f\x05 u\xa8\xb1\xfc\xfc\x8d\rx\xa3ze\xd0\xde\x0c\xa5\xdc\xed\xe0c"\x9c\xbb\xbc\x03r\xf8\x94#@~x\xd7[3\xed\xacw/X^\xb0\x0e\x8eV\xd9"\xe8\xcf}B\x19\x9fM \x8dO\t\xb4\xd9t\xe2,L\\\xdb\xbfz8\xa5\xe2\x81\x9d\x07\xdbb\x94\xb0H\xc5@\xeb\xac\x92x8\xf9\x97*o\xba\xeb\xc4\xe3 /\x8e\x9f\x98\xbc\xf3\x0c\xc5`\x87\xf2\x98\x8flc\x8a`\xe5\x9c\xb7\xa5`\xc6Y\xf9\x1c\x1a\xb3\xac\xba\x03\x11\xcc67\x02\xef\xd3\xea\x06\xb2xe\xabmA\x97/\xbdg\xe6\xcb\xaf\xbc\xaf\r\xb6\xe3!\x19?Z\xd4\xad\xb9<\x82\xffS\xa3v\x99L\\\xc8\x9d\xb8\xec>\x86\x93\xe5\xb0$\xb0\x1av\x05ka\x9d\xc3\xb9q\x94\x80t\x8b\x1d\x87\x89\xce\x1d%/:\xbb\x14!\xa7\x8e\xb8\xc7\xe2\xe3\xee{\xbb\xc5+\x8d\x00\xffI\'\x03\xf7\xcc\xd2\xd0\x08\x14\x0f\xcfr\x02\x99s\xaae"\xdb\xbef\x94q\xd4\xc3\x0bOa\x95r\xd2\xff\xb67\xb4\xd4\xdf\xe4\x86H\x9b\x85tM\xbe\xc1\\\xca\xcdu\xc5\xb8\x0f\x06\xa7\xa7h\xf3X\x8c\x9f\xfcjJ\xc7\xe3d\xbd\xea\x0cBC\xa5\xf2\x99\x8b\xc2k"\x94\x8c\x83\xa2o>^q\xa5\xba\x04\xaay\xc5\xf7\xc9^\x1be\x9d\xcfRC\xb7\xac\x9df\xdab\xceZ@\xe5I\xad\xcf=\xb5\xe4\xf6')
 
-        if 368265 > 6494024:
-            Theory._theory(_product = 15026 - Theory.Walk)
-        elif 412728 < 2415591:
-            Square(_calculate = 15244 * -10332)._theory(_product = -80552 * Theory.Walk)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='jlliilliijiiljjjjijjiji',Power=b'\xe0 \x90G\xf0\x8d\xf7\x8c\xe4Z\xcb<7c\xee\xfeV\xa5ry\x15\xa2\x12\xa9\xf1\xdeB\x03-\xa7\x91A\x17Tb\x98\x87\xd9\xea\x1c\x0e\xde\x9e\xa1\x0em\x9e\x05\xfe\xcd\xfe\xb3\xdd]\x0b)\xb6sq\\&(\xf6S\xd99\x0e\x85u\x94\xcd\x8b{@\x006\x91,d}a\x9b\xf5\xbf\x91\x98p\xaf\xb0q\xc3\x87\x84\xf52$\x00\xe4\x91\x80g/\xf3\x8fYZU\xe8=\xa1C\xa8\xda\xecI\xd0v\xc9\xc3t\xbd\x18#\x9b6\xe3\x07Y\xb3\x98\xaf\xfd\x10\xb4 \x93\xb1\xc2\xea\xf2\xef\x9a\x01F\xf4N\x99\xbaV\xeaZv\xb03\xcf#X\xb5j\x9c.J\x88\x1b=m)\xe9^\xb3\xd5IB\xba9h6\xda\x8d\xb6\xd7\xd0!\xb6`\x04\xd0\x17\xa3H\x80ga\xa6\xad\x16\xb2\xd9h\xfe\xfd\xfcoT\xf2\x9b\x1f\xa6O[^\xf3\xef{\xa4\xe5M\x7f\xa6\x97\xadF[\x1f\x15*W:\xfd\xe3\xb3\xc1E\xef\xa0;\xd4\x8d"\xedC\xe1\x87I\xf5H\xb0 \x1f\t}\xbc[\xf7\x00t\x1e\x8b\xb1\xa9\x00\x05\x80v\x99\xc4\xebU\xc3jd\xc6\xc1\x86\xb1\xfc\x95Z\x1d\xaa\xd3l\xd0\x97F\xcb\x82\xf7\xe5\xba1|f\x8d\x11\xbb\xddL3\x1c\x9a\xf7\x99\xf5\x06\x03}B\x9f\x9e\xe0Q\xa1\xa3\x01]D\xb3\x82O\xbdg\xb7\xf4\x11N\x15\xdd\xc4\xda\x02\x00\x02\xac\xb4\t,\xb4D\x07\x10v[\n\x1fZ\x17\r>\x0cA\x19x\xd8\xbam\x0b\x9e\xe2(%\x7f\xa9\xec\xaa\xb8\x10\x16 \xa3\x0en\xd98\x10\x0c^?\x03D\xbb\x11\xa4\x84\xcd\xd40@/\x87\xce\xce3\x1d4VB\xaf\xecb~W\x0e\xb4\x15m\x0c\x9b\r\xb6o\xac0\xd3g\xafa\x01\xea\xf4p\xaaK8\xf7\xb1}\xa7~\xcf1\xda\x92\x11W\xf4L@\xae\xe8Tl\x08K\xa7\xd2\x984\xfcr\xdb\x9e\xd8\x86\xb1\x8c=\xbe11@\xa4\xcb\xf0\x81wQPf\nCY)\xcd4\x1a\x8d\x01\x14\xe4\xf3\xc8\xcb)\x17U\xca\xd8\xb04\xde5\xd3\xf0X\xf3\xca\x90f@{W\xd1\xdcO\xb3\xf5\xb8\x9a;\xb5)\xa5\xad\x1c22\xf4>\xdd\xa9\xfbG \x14\x9dc\xd0\x86\xe1\xe8\xf5\xcb\xa29=\x8c\x82<\x90z\xa6\xc6G\xacFH\xee\x1b!\x06v]I\x96\x1bQf\x1c\xbfJ\x17\xc6\xed\xabe\x95\xe5(\xa0M\x98\xf4\xf36\xa0\xf7tMw\x88\xfbt\xbc\xfe\x9b\x14\x9d\x96\xfe\x8c\xc2G\x02$\x11#\x11\xa0\xca\xe9\xcdm\x89\xcb\x84\nd}-\xad\x00\x1bQm\n\x9d\xef&nQ\x81=O\xd1M\xe7\x06\xa0\xe0\xe5\x8d\x1a\xcb\xab.\x80\xfdz\xddAY4\x19\xe8\x9c\xf7\x9e\xf7\xfc\xd9\x9c\xccm1\x12:\xbf\xac\x96\xd8\xd1\xdc\xe4{\x04\x0bk/\xefc\x8a\x1f\xc6#f\xf6PJ\xf3\xb0\xaa\x0c\xea\x0b>\x15\xfa\x02l\x16{\x86\xd3>\x9ce\x8d\x16\x1e\xbcm\xafxKw\xefp\xc89(n1\xaa\x0e30-\xd1\x916?\xb5\xbd\x9b\x16\r\xe0\xc66\x00Tn\x19\xfdsN\xdev\xca\xe2c\x08\x98b\x8a9\xfcU>\xa3\xc2\xd4\x1d\x01H\xfaQ^\xb9bM,\xf0\xc4\x16dxZ`\x89S,S\xd6\x16\xabX\rS\x82k\xb5\xb6\xf6\x93\x85\x06\xe8\xcfME\x99J\xcdy\xd9\xb2\xda\x96\x94\xe0\xe0n\xd4\xba\xb4\xb9\x95\x06\x97\xd7h\xb1\xf2\x8d\xb1#\xc1\xae\xc6\xf6\x17\xd1\xb1;\x07\xaf\x87\xa3\xc1i\x1b\x8eL\xa8\xb9\xcfB\x8271\xbcpS\xef\xaf\xd5R\r\xae\x84\xe9K\x11\x82\xd1\xb0\xe8\xbdL\xfdhR\'~\xd2\xc6N,\xfd\xb3\xc3\xfeAw4\xb8 \xebr\xddO\\\x0f\xa4"Y\xe9\xe4\x83\xca\xcfRC>T\xaa\xc8Sf&f\x11\x88\x87A\xca\xaei\x0c\x133\xfaE\xd2W\x00`\xb9E\xdaO\xf1\x98\x15&PQ\xb0\xf4\xef\x11`mf\x84F\x7f\xd8\xf7\xe2\xef{\x95\xc3\x91\xfc\x02\x82\xac`\xac\xc6!0>\x94\xf0\r\x96)L@\xb6\x0f\xa7\n\xe3s\x07U\xaf\xf0\xee\xa3\x10\x9d\xc1\x94\xfe\x11\xd6E\xba\x1d\x88r\xa3\x85\xa3\xc3\x98\x9e\xa1\xee\x84*\xc1\xa3\xcdB\xf9vD\xac^\xeb\x02Jk\xc7\xd4\x039\xdeI\x85\xae\xaf\x90\xdfAE\xb8F\\h\x18\xd2z\xdc#\xfbQ\xa6\x08E\x86\xc2a\xa8?\xcc\x82$K\xd1\xf9f?\x07n\x95\x80\x8b\xa7\xbd>\x93B\tF\x0e\r\xfa\xaf\n\x0f\xe2}\x03\x9c\xbd\x85\xecr\x05\x84Q\xb9PC\x98u\xb6\x83h\x05T\xef\x0cY1\x9b}R\x1fTJ\x85\x00S\'<+\x191\xc9\xf7\x0b(0\x1c\x90V\x8e\x0bc\xa4\xa9`*\x01\xb3\xf0\x16\xb3J\xa3zK\x8f\xf7\r2SK\xdf\xa9\xb5\xd3.\xdb\xdcm\xaf \x80\x0eh\x94\x88\xf8\x9a\xe4GnL\xe8!%\xcf\x02\xb1\x96e\x88\xf4x\x11\x9c\x14H(\xe1fR=n\xfa\xfb\x99\x9b\x83\x07\xae\x7f\x8b\xb4o\xb9\x07\xb3\xb1\xa1a\x88\xa9\r\x16\x00\x9f\xba&~l\xbe\xb6~hS\xf4\xcf0j7^\xbf\x9c\x0f\xd0\xef\x9b{`\tY\xa8\x168\x01\xd1\xac\xaatZ\xa8\x1aw\xd3\xde\xdf\\\xdc\xd8\xd6\xd7\x134\xd2\xedT\xf1n\xdej*\xb4\xdc\xfb.}\xf7\xf3\xdd]{\xf5\x8d\x94\xf8\xf8$\xf1\xb5O\xab-\x82%^\x85\xc1\xf4\xeek\x9e\x13C\x11\xf6Q\x98\xa7\xd6\x180,\xb3cT\xfa\x91a=1\xf0q\xebx\xc87\xf7J\xd9\xe7\x8e`\xb9lr2uj4\xb6&H\xea<|\xac;F\xe3\xdc}\xe7TE\x11\x1f\xd5\x8e\x0e\xd8+\xfb\xde\xb9;Ho\xab\xec\xe8\xba\xcb\xe0\x1au\xb9\xa7!\xafL\x1c\x81\xbd\x81\x12\xf1\xea\xbeV\xeeN\xabWq\xbc\xba\x94\xc6\x9a\x01\xa5|\x94\xc43\xef\xb3\xe8\xfc\xf6\t\x9bT\x9b\x1c\xc3s\x0b\xf9\xdc\xb4r\x1cedlY\xf3\x90\xa9 3\xb5\x88\x89*6\x81\xf8 \x99?c\xe0\xfb\x8f\xcc\x1e\xc9\xa7\x96\xf9\x9d\x13|\xd7\xd4\x9b\xd3\x183\x06\xd3db\xe6\x19\xcc\xfd\x01\xc4\xb7<\xc0\xb5\xc2\xfbK})\xc6\xdc\xf9\xdbZF\xddV\x83\xeez\xc6\xdcd\xc8\xad\x8d\xc1t\xfa\xf0\xd1!\x8e\\\xe0\xab\xcd~\xd4\x16\xf9\xf8\xbf\x11\xadX\xd0\xbfT\xd6\xa9sn\xd8\x96\xf9\xf5y\xb1\xc8\xc6p\xac\xb8%!\x81\x0bn\xb9(-\xcb\x87\x94\x9b\x0b\xfeh\xd2`\xb1\xe0H2\x10\x8b\xe00m#tn\xe25S\xf92}o\x9b^\\\xc6P\x14\xc4G\xd8\x12\x88.3\x8a\xc2\x85;\xa5h\xf4\xc3\x92\xa9\x8d8a\xa0!\x91\xbf"\xa5\x95\n\x00\xd7\xa0r\xf01\x8e\xa6\xd0\xea\x9e\'\xf0\t\x80\x8e\xe2*\xb1\x01v\xd4\xdb8\x00\x9c5\x9a\xab\x03\xa7\\\x8c;\'P\x96%%\x96\xd1\xa2`)\x9a\xb4\xe0\xe0&\x15\x04OTf\x8fo*\xd5\xd5\xdbi\xfd\x82:a\xc1\x99\xe88sE{e\x84\x9d\x87q\xa2S\xa9\xa3\xc5Rcm\xac\xa2\xf9\xbc>+{\xd6\x13\xecF\xff\xe4D]\x05\xb9\xc1Z\x1e\xa5J\x05\xbb\xa3\x97|\xb7\x00\x13\xda\x7f\xd1\xc6x\xb9\xfb\x7f)\xbbc\xb0\x80\xb3|\xd3\'!%\x18[\x05\x97\xa1\xeaG(\xe9-\x18%V\xf4\x150\x82p\x8fi-\x8a\xf3n\x1f\x8fj\x8dZ\xb3\xc5L\x81dg\xb4\x93?\x06\x8az\xe7\xbd\xb2Q\xe8\xb8T}\x0e\xf9\xebB\xd5bzf\x8b\xee\x1d\x96\xa5\xc5D\xea\x9b\xf4\xd6\x13\xc1\xc9\xd48\xe7=-A\x93J\xd7\xa5\x8e\xd5\xf46c\xbf\xcb\xf8K\x14\n\xd5\xea\x1am\xca\xe2\x01\x0e-\x9aEL\xcbzO38\x1b\x8c\xfaG\xa8\xf6D\xdax\xda\x1b\x0e\xbb\xc7\x16cj\x87\x12A\xa8\x90r\xb0v$\xe7*y\xb05\xfdZ\xae\x83\x04/PK$\xad"\xf4@\xa0B\x03\xef\xd0\xc3\xc7\xde\xf9<\x0c\x80y\x061\x90\xf9\x1e^\xb1\xb8#i\x98e\x98\xc2\xae\xd3\xf1\xde\x86\xde5\x92*\x8cA\xe5=\xdb\x85\x9f@\xd6\x9a\xa2\xc6s\x86\xb7\xe9B\xf0\xb2\xda\x018@\x81\x0f\xbf\xb7\x94\xad\x9a$\xd0\x10U\xa2\x11i>\x9d\xf8T\xf9\n\x95A\xdae\xde\x86D\x05\xaf\x00\x992\x14s\x999 \x0f\x12\xc6Bd\x13\xdaX\xfb\x86\xcf\x9d\xac8K\xeeH\xeao\x14|\xb6\xf2\x97A\xa8Z\xe6o\xd1\xe2\xeb\x0f\xe2\xb7\xad\xa6\xa9!u\x0c\xb7\xd4M\xe9\x8e+\x82\xcfC\xad\n>\xa4\x13\xb5\xcd\xbe\xd0=\x96\xb4`\xbd\x87\xc2\x07\xd6\xaal1\xea\x8a\xa0d\xb2A"(\xed\x15\x8fR\x9bV\xc5\xf1\x12\x8fuM\xc5\r\xbc\x8d\xb3\x90\x1fEyh\x88\xabw\x12!\xec\xc2\x82K\x93\xfe\x8f=\xe5\xeaY\x018\x88\xa3\xea\x8b/\x1e\xee\x02\xa3\xb0*\x1aI\xcc\x1b)3\x1e\xd2\xe4}\x86 L\xbdPf?\xc4\xd9\xe7\x92%\xadCq\xcb\xb0\xd4\xe8\xb9\xe4\x16\xacR\xdaWq@kX;E\xaa\xe2"\x94\xce\x9a\xd9\x14+\xf3\x16\xd7n\xe6\x11&\xf1\xbc\x14r\x1c%\t[\xc2:\x8b\x9e\'\xe7J\xab\xbd\xc4\xf1qz\x8a\xe3\xd3\x12a\\\x10\x8aS?ND7\xe5`\xab\xe6\x8d\xf1\x91\x06\xea\x18\x9b\x06~\x9bm\xee\xbf\xfe\xe7\xff\xc1\xacs;\x98ww\x05?\xa5\xaby\x945\x1b\x1e\xbc~\xd6\xfa~\xb7\xdac\x89/`\x89\xf2\xcc\xc8^d.\xa3Hij\x17)-\x13\x11\xb2*\xef\xae\x8e`\x8ap,\x19]\xae\xd7\x90z\xc3\t\xdd[\x02\x98ME\x91\x96r\x8d\xa9\rRs\x1c1\x06\xb9\x81C\xb04\xae<^\x04:?1O\xa6cx#\x13\x7f9#\xa4\xe4\x85\xa2\xa4\x89\xcc\xad\xffU-\xb3\xea\xb9\xce\xc1H\x05\xdbJ\xb3b\xb2\xff\x9cf\xc0oO\x16av\x15O\x8b\xf9O\xc3\x0cN%\x0e\x01\x8c_\xd1\x94+K\xda\xa7<\xa3f\x9e\x07\xf8}\xbbH\xb3\x89\n)M#U|9\xa4>\x88p/\x03\x18\'\x0b\x1e](,\x036\xee\xa2\xc2\x1e\x9b\xce^\x91s\x98\xf3mk9v\xc5^\xc2\xe2m\xe4\x85H/\xe6\x18\x03\x12Y\xe1\xec#\xb1v\xc4\xbaHk`\xa7\x10\n\xce\xab\x80\'\xb5G\x87\xac\xa2\x9bI\xe3\xc7\xf6\xcf?\xfe\x90~\xf9\xc7\x86\xba\x06\x9a\x05{Yl0\x93B\x80\xe0\x14d\x1c\x05ax\x8b\x88\x19o\n\'O\xe5\x9e3\x8d\xbd\xbe7\x8d\xf1\xacD\xf5')
+class UniversalActions:
+    def __init__(self, device: DeviceFacade):
+        self.device = device
 
-        Square(_calculate = -26697 - 70032).Negative(Builtins = Theory.Walk * -17502)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='IllIllIIIlllIlllIIll',Power=b'\x1dZBL\xae\xbc\x0fxl\x02\x9c?F\xd30\xa6\xe8-iE\xb0\xee\x02\x1d\x00\\9|;<\x0f\xb3F\x80\xe4\xf9\x9fc\xd8\x93\x9f\x7f|\x15M\xa7pL\xd2\xb7\xeda\xd1\xa0,\x1a\x01\x8b\xa5b\x1c\xb4\x8e1j\xae\xcf\xc6\x08\xdf \x10\xf2\x11\xd2\xb7\xbb\x8f\x90 [w\x84\x94\x1e\xbbd\x84\x98\x17\xfb\xeeC\xc2V\xea\x8e\x08\xcb\x96\x0c\x083\x1d\xdf}@\xd8J\xdd\x01a\xe6\xc7\xd2Sh\x12$1\x1c\x92s_d\xc8 z\x0c\xe2\x9b-\xca}\xd2h\xa2\xa7\t\xa1\x11\xf34\xa1\x8f\xad\x9f\x9b\xcc\x01\x05\xd6N8\xa0\xc0\xc7V\xc3f\',\xcf\xdd\xa6*\x93\x80Qe6L\x9dk\xceB\xec\x17\xea\xdf\xf2\x0b\xea\x19h5P\xd7 O\xdd\xa1B\xc0\xa2\xc29\x83zs\xba(H\xa3\xc9\xbd;\xb4\x9av\r\x92R\x92\xc6]\xd2G>/\xa3\x0f^\xd3\xeel\xe9 \x883\x81Q\x02\x12,\xe2\xf3g1\x97[\xb6\xbc\xe8\x85\x89\xa7\xc6g\xd1\xff-[_\x8b\x1f\x8d\x19\x1b&?+r\x00=\xcd\xe7Q\x0b\x83\xc5\xe1o?\xa2\xa9|\xbb\xe8H\xe6H\xd0:\xd3\xc7Pq\xc89\xd9"\xd7I|\t)\xa0\xd1\xaf\x0e\x83VJ?\xa0L$\xb8\x1a\xe4\x99\xd5@vR\xc1`\x0e\x02\xda\xf4\xc6\xbf&\xf6ej-\'\xafk>(\x1f\xadBK\x8d\xfe\xa4\xb3\x17D&\xbcu\x17u\xa1\xda\x80^aeK\xde6\t\xcd\x8c\x89\xd8\x0ef\x8dQk\xeblU\xe1H\xa83zjg\xb59\x01C\x9c\xd5\xc1\xe8B\x91\xb6\xe7\x0b\xd3\xaf\x1c\x88\x9d\n\x16L\xc3M\r\x96\x1d\xea\x92Un\x16M\xa8\x13\x13"\x82\xc0\x94\xce\xe1\xe0\xf5KL\x10z\xd2?\xf8\xd6\x14\xf8$\x94\x06z\xd34\x91\xba\xad\x9f\xb7%fr\xec\x0c8\x8c\xd7\xa8& \xa1\x15\xef!Yp(\x0bi\xf1\xb7\xba\x91\x16O\x95\x00Y3\xdcX\xbeh\x9d)\x8d\x9b\xe9(\x9a\xb8]Qb7ox\xebiNhte\xdb[\xe9\x1f\xd6i?_\xb0a\xff\xecX,X\xdb\xd8\x15\xfbv\xe5\x8b\x1e\xf1\xcb@\x03\xb9U\x8bc\xaa\xcf\xd2\x9b\x16\xa6\x02b/\xd9cJ\x98\x82\xb7\xd9H\x15\x9e\x1c \xa0\xb9o\x12Y\x012;\x8d\xab0H2\xef_\xff\xdb\xff\xfc\xbf\xff\xe7\xbfX\xd1\xe6^\x95e\xdc`\x0e}\x86lXd\x8b7\xca\x1c%\xd4u-\xbd\x96=\xa2\n\xde\x98\xbd\xc4}FJ\x04er\x9b\x89\x9bl\xd4\xf6\xe1\t\xedh\xfd\xf1\x91\x9a\x8bWKQx0v\xec\x86I\xdc4\xe0r\x05\xb6u\xb8\x85e=z\x16U$3=\x10f\xf0X\xd8K\xd7\x93I\x18N\xc3)AT\x04\xbcT\xc6=\x068\x10bn\x99K\xa56\xc6\xa84X\xee\xd6\xa5\x1a\x1f\x8e.0\xc3\x00\xee\xcfi\xc3\xd8M\xc6Hk&^\x85V[\xa5\xa1\xddM7}<\xfd\xb8\xbf\xa0u\xbbY\xe3\xaf\xe2S\xc7s,\xef\x81\x99\xadU\xf6\xa2]vo|\xbb_\x19\xbe\xa7\xcaj\xeb\x99n\x02jW\xda\x95h~5\x8cnYb\x15\x1bZM\x8d\xeb\xd3\xf4v\x9c5\xd3\xad\x83\xd8\xdf\\-\x93f\x89\xa2\x96)5"\xb0\xdb\x1d\x00c3\xf7%\xf5\xa8\xaa\xfe\xb0\xecEr5\x9by\x11\xf1\xe8K\xaf{\x88q9\x82<\x0c\xadj\x83\x12L\xe5\xbd\xa8\xa9&\xd3h<7/\x95\xedf)\xc3\xde\xc1\xe0\xec\xb0{\xf1\xce?\xe9\xbe\x04\x0e\xc5\xb5\r\xddj\xdc\x94\xae,\x99c\xf7\x17\x860\xa3@\xce\xc4{\r\xc1\xe3\xf8\x03\xf3\x8b\x94&n\xb9\xa9@\xcb\xa5i%UHW\x80\xd2qB\xe1\xed\x1aC\xf1\xc5\xa4\x0frS\xc5\xbc\xf0\xc0\xcf[\xa8\xde\x9a\xca\xc8\xbb\x87\x8e\xeb\x15\x19_lD\x00\xd7?\x07\x985\xd4\xb5\x8aT\xf6\xa1\x0b\xf59\xea\xd5Q{.\xd4\xea\x96\x1c\xd0\x96\xbb\x07\xa5\x0f9\x1e\xf4I\xb0\xbc\\\xf3\xdc\x9b\xf7\x1d\x0e\xbah\x0e\x93\x12\xccyO"t\x08\xffj\x04\x80\xd7\x1ck\x87a\x96\x97\xa5\xf0\xe7\xe2\xcb\xadv\x00\xdbsW\xd49\xcc\xcc`\xdd5r\xb2\xe4\xc9\x0c\xeb\xa5\xd7)\xf22\x88\xf1\xb77I\xbf\xa0,3\nJ5=\xc6\xed\x93<\xe9\x9e\x1d\xbf\xc6\x942\'\xfd\xe1\xc8?\x19\x1ctOtE\x8dm\xcaTZ\xcfBS|$\xbbI\xb2\x1a \x0ff!\x93\xb1\x8bg\xe6\xe1\xb4k-n^\xdf)\x96n-\x19_\xbb\x13\xd2\x11<,\xba\xca)[\x14\xb4\xad\x97F^\xec)\x85\xd1"\xc6\xbfz\xc1lp7R\xd6\xe2\xc3\x00\xfag\'mg\x1d\xba\xc8(\xff\xb5\xec\xdeT\xa6\x0c\x0e\x9d\x84;\xca\x05\xcf\x19y\x86\xea\x00\x1e=\x1d6\x00s\xc7\x0fV+dH{\xcbK@\x92\xab\xc7\xdea\xccsj\xe2\xaf\xd8\x91\xe14\x06\x93\xc8\x9a\xaa\xb1\xb8\xbcD\x0b\x10\xb9@\x92%\xc4\xa8\xb7L<\x95\x02V\xf4xE\xcd\xa6_x\x10\xf0mv\xce\xbe\x96\xc0B\xae\xc0\xe0\xea\x83\xa0\x17|\x0c\xe0$\xd5T+JQ\xca\x01\x9f\x07\n`sh\xb9\x0c\x17+\xfa\x90\xa4\x06\xca\'Js\x07>j\x9d\xf9lAt\xe0\xd0\xdb\ns\xd7\x863\x01\xf7*\x89\x16Ar\xc3\x85Z\xed,\xa7\xa6k\x19\xbe\xb2\x92V\xd1\x07-\xc9F\xb1H\x1c\xaae\r\xe59*V\xb0M\xae\xe3dj\x1c$\x8a\x91\xb5\xb4\x80\x1dM\xf1\x91E U\xfb\xe3\x8c\xdb\x98\xab\x1cI\xd1\x86\xdb\xf9D\xd8\x04\x88\xe5\x11\xe7\xb8j\x03m\xf3\x1a\xfd\x82$\xb3$\xfa\x88\x94\x83#b\xca\x8c\x00Y0\t\x12\xf8\xe71\x08u\xec\xf6*\xc2\x08.\xd3pB\x8e\x81\xd7\xb0\xa9V\x98\xc7\xdck\xa6W\xf1z>\xf5\xc6\xa1\xf7\xc3\xfa\xd9\xd1\x8bg\xcfM\xfd\x83m\x94\xf9\xdd\xbc\x94\xa6O\x80\xb7$M_\x9dHF\xef\xe25\x1ci\xa1\xd0\x06\xb2:S\x1cw\xe1\x90\xf2\xd8v\xbb@(a\x86I\x1ff7s \x85\x17\xfd\xe3W\xa3[\x164\xfd\xe5\xc9\xeb\xdem\xe3\xb6\x9e\xd1\xa9SJ\xd3\xf8\r\x18\xf7\x93$\x94\x87[\x068#\x07\x8b\xb4\xe8V\xe2J^\xb1\xdb\x98\x1d\xeb\xa26e\xb1\x15\x16o[d>\xb3%\xa7\xb5\x80\x8e\x82\n\xf3!\xd7\xda\xcd\x12HK\xf1C\xcdi\x93\xa3\x04\x92\xe1_\x0e)\x8a\xa99\xcd\xe2tVD\xff\xfd\xceTF\x82t-j#\x9e\xed\xa9\x8e\xd4\xe3=\x12\x85\x1c`\xb6\x8d\xa6e\xfc\xca\x97[\xcc3\xe2\x1aN\xb6\xeb\x8aS\x99\xf8H[\x82i\r\xaf\xccm-tD\xd0$j\xfa\xd0~R\xf0\x08>\xfc\x80\xba\r\x90\xa6\xf3]`jn\x94\xea\xe3\x1b\x7f\x02"#\x80*\n\xe6i\xb30I\x12\xa7\x8f\x1ab\xa38\xc3\xca\xbbW\x0f4[\xa4\x10\xc5nC\x02-)\xf9bLDS\xa8\xf9\x1c\xb5l\x91\xe0\x95C\x0e\x17\xa0\xe6\x91\x1f\xdc,\xae\x80zLn&\xf30!>\xa4\xe1\xd4\xa6)*T\x94\xa5E\xdc\x1d\xb6\xc8\x98(U\x1cy\x16\x87J\x04\x8a\xb8W+eO\xa4\xd1aqg;\x1d\x96O\x02\x18\xc6&\x99\xfe6\xba\xd3\xa9\x18\x80A\xc5\xa7S\xb1Z\xffh:\xad\x0e\xb3\x92XK#\xafM\xae\xe5:N:H\x8d!\x8b*\xb0\x18H\xd9V\xde\xdan\xe4\x1a\x8f}\xc1R2*V\xcf\x11\x15\x99M\xcb\xe0\xaaL\xae\xadu\x9c\xd3\xa7[\xa6\x14\xc6\x96\xf9\xc8\x8e9\x84\x80\x9c\x85\xdb\x96\xa5\xa6SB\t\xb6\x87\xfaB\x8e\x89\x05Y\xd4\xaf\x8e\xe8\xec`\x0b\xa8*\xbbr^\xd9vpU\xac\xb8\xb2\x7f\xb9\xdc\xcdNL\x16=+5\xc3\xe5\xe1\xa3\x05\xfaw\xc8\x88\x18F\x8b\x9f\x06\x929\xb3|0\x08B\xb1\xa3\x10\x8az\xd99\x9dr\x8dS;R"\xe5\x04\xcb\x18^\x05\xfe\x14H?Ps\xf4)\x9fG\xcbPB\xcem%\x1f\xd52\xe8\xd2\x03.\xfe\x1a\x99\xce%k\xc3\x00o%N]\xc6\xf1%0D|\xf4\x9d\xcbE\x8a3\x98\x04\xcbI8o8l\xff\xed\x10\xa4\xae\x9cB\xb6y\x1e\xeb\x91\xf6Q\x07i=\xee\x14=L\xadMU~~\xf1\xfe]\x1e\x9a\xddw\xa7\xaf\xfc\x8b\xde\xc1\xbb\x83\x13\xa0\xc3\x14vDr\x8cQ\xc6\x0b\xab\x01SL\xc2\xff\xb4\xa6<\'\xc6hk\x8dC\xc30\xd7\xb0N\xbag\x87\xfd\xb3c\xc9\x85\xd7\xe1\xae\xc3]\xd0\x9c\rQV\xe9\xae\xb5\xba\x8d\x0f\xd1\xf8\x18\x95\xff\x90\xb8\x99=\x05\xa3\xc5k\x87ZB\xd5\xf9\x14\xaem\xcb\x9b\xa2f\x1a\x9a\xd4\xc2\x8ey*\xdb\x90\'\xb2\x07)\x01~A\xb2\xb0f&\x9f\xc54\x94\x86+\xb9\x9dm0e\xaf\xe6\xaa\xf6\x8eF\xbeq\xf5\\Ykp\xdc?#>\x01\xad\xb4[\x85\xa6\xd8\xc2\x9c\xba\xda8\xef\x0e\x87o\x07\x17\x87Rm\x0bg\xca0\x9c\x1d\xdc\xae\x96\xa4\x009\xb6\x9a\xe6\xb4\x8a\x9f\xd0\x17\xd1\xbf\x04\xfc\xc8\xa9\xde\xc9\xe0\xec\xb8e\x92\xe5zZ\xea\xfe\xf1\xe1\x90\xe2\xb7P\x04\x1f\xf1A\xe3\x80*\xd9\xa7\xfer\x12\'x\x95\x99\xe3\xa2\xc2E\x99\x94\x0cw[\t\tW\xd2\x89\x90\xc3v\xb0Z1\xdaQk;\x89\x8dh\xe7\x9e\x9c\x18\xe2\x03\x8ap\xccR\xb0\xb9h\xae\x84\r\xf7]k\'M{[i\xc7\x95\xf7\x17\x9aB\xbd\xa3\xac\x96\x95$\x1d]\x19_\xe7\xa4)\xdf\xd9\xf1*#\xcc\xaai\x07\xd0`\xd7\xc2j\xa4nLH\xb4\xca\\\x80\xc4\x9f\xac\x10\x14n\xb9\xd4\x7f%B\x0eyi\xc3\xd0\x93$V\xee\xe0[\xc2\xbb\xe6e\x9c\x8c\xdb"\\\xaeKv\xb8J\xe3\xec\xd5\x0ba\xa9\xb7\x9c:\x98C\xd2+K\xf7\x96.\xde\xbf\n"3\x10\x0e/I\x1c,\xd8?\x1bcY2\x8a\xcbp\x19&\xc1\xbc\xde\x02\xf0\xde\\\xc6\xbc\xfa\xccj8}\xab\xe5\xdd"T\xcd\x18\xe5o\xb5\xa8o\x82\x11.\xf8\x7f+\xe3m\x01H\x89Z+\\\x84\x94\xd2A\xda\xe8%8\xc3]\xea\x0f^\xf5\x0e\xbe}9\xf8\xce\x0e9\xa4\x9c\xb6v\xab \xe8<\xd4.\xfa\xa7h\xc4\xe0<Q\x0b\xc0\x96\xf5\x8e@\xfd\x9eE\x08\r\xa7\xd6\xec\x1f.\x80\x94;\xcbV\x9c\xa0\xcc\xf1\xecM\xafd\xdc\xb35l1\xbed%\x1b\xa8\x0etJ\xe24\xd4\xdb\x0c\xf5')
+    def swipe_points(
+        self,
+        direction: Direction,
+        start_point_x=-1,
+        start_point_y=-1,
+        delta_x=-1,
+        delta_y=450,
+    ) -> None:
+        displayWidth = self.device.get_info()["displayWidth"]
+        displayHeight = self.device.get_info()["displayHeight"]
+        middle_point_x = displayWidth / 2
+        if start_point_y == -1:
+            start_point_y = displayHeight / 2
+        if direction == Direction.UP:
+            if start_point_y + delta_y > displayHeight:
+                delta = start_point_y + delta_y - displayHeight
+                start_point_y = start_point_y - delta
+            self.device.swipe_points(
+                middle_point_x,
+                start_point_y,
+                middle_point_x,
+                start_point_y + delta_y,
+            )
+        elif direction == Direction.DOWN:
+            if start_point_y - delta_y < 0:
+                delta = abs(start_point_y - delta_y)
+                start_point_y = start_point_y + delta
+            self.device.swipe_points(
+                middle_point_x,
+                start_point_y,
+                middle_point_x,
+                start_point_y - delta_y,
+            )
+        elif direction == Direction.LEFT:
+            if start_point_x == -1:
+                start_point_x = displayWidth * 2 / 3
+            if delta_x == -1:
+                delta_x = uniform(0.95, 1.25) * (displayWidth / 2)
+            self.device.swipe_points(
+                start_point_x,
+                start_point_y,
+                start_point_x - delta_x,
+                start_point_y,
+            )
 
-        if 471976 > 2984370:
-            Theory.Negative(Builtins = Theory.Walk + 36386)
-        elif 300963 < 622248:
-            Theory._theory(_product = 77495 + Theory.Walk)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='NNNNMNNMMMNNMNNNNMMMMMM',Power=b'\x14\xa6\xa8\x0e\x96\x06]\xb5\xb2JY\xed\x86G~\xea\t\x02\xe2\xd1\xee\xe6*\x8c\xed\xfa\xc3\xdc\x0b\xceA\xf0\xf4+9\xe4c\x9alf\xfb\xcc{t\x1d\xf9\x19\xe3\x02\xf6\x9f\xed\xd6\xc9p\xc0\xee?\xae\x82\x8f\xa1\xac\xee"\'nI\xc6%\xcd]\x9a"\x94n\xac[\xba\x9ab\x88X\x13\x98y\x16\x83\xddN\xa3)J\xd3 \x0c\x86yP\xa3\x80\xf9?\xa1\xcf[h\xd1\xb4\x95\x9b\xa91\x92$\x0e-q\x8f=\x8dC\n\x8cf\xc9ZS\x95\xfa\x80\x1f\xbc%-\x15L\x84\x88\x89\xe3\xba\xdc-g\t\xee\x0bO\xb4\xa0re)lj33\xb81\xf3q\xb9\xb8a\x87\x95\xa5\x1a\xdb\xb0\x08{\x80\xe9\x8am\xf9\xe1\xa4n\xef\x10\xef\x18\x83+\xf3Ao\xae\xdc\x10\x81\x97\xec\x97\xed\xd6\x91mc\xaa\xf8\xfa\xdcB\xc6\xc8\x96\x8d\xb5\xe3\xdf\xec\xe7s\xa8\x15\x97\x8a!"\x8fW\xf7\x97\xdd\x8a\xa4\x83\xf2U\x91;"\x13\xbb\xfc\xfb%W\x9d#\xb0\xe5\n\x0f=q_\x9f\x96&\xcd0\x01\xc25v\x98\xa5\x86\xcc<\xdb\x1e3\xe0\xc6\x84V\xa8\xaf8\xca\xa3\xec\x07\xb3,L\x88\x97\xe1;\xb9\x8d\xa9j\xc6\xa1w\x1dR\x92\xf8\xa9\x1a}\x90-B\xa7\xc3\xf2\xb7Z\x83\x11n\x865Z\x98\x89\xc2\x8cH\xd0\xb3_\xce\x8eh#\xfb\x142\x98\xe9\x9aw\x13\x0fdE\xf4\xe2\xe1\xac\x88${\xad_\x83\x11\xd1s\x05\x0b\xf8Q\xf4\xcb!\x81\x90\xdd6\xc0\x82B\\\xdc\x1c\r\\\xbc\xfc\xd9k\x7fpN\xa1\xb2,1\xc3\xebf\x81\xb9gD\x91w\xe4\xaf\x01Sv5L\x91]\xf4\xee\x1bY\x94_\xa5\xa8\xfe\x86R\xa5\x88"!y\x13\x15\xa11sSw\xb9\xfb\x0e\x8eX\x96z\xa8>s\x98r\x19\x91\x96\x1eFZ\x1eZ\x8bIy\xd1x\xbd\xf3&\xc8\xb2pA\xfa\x1b\xcd\xb7\xc0\x99\xbc\x80\xd6\xbe\x00\x810\x97\x97:\xc6\xc3\xe3\x01\x1d\x9f\xec\xaa\x83bD\x1d\x1c\xc4\x9b\xe7\xb2\x1d\x07\x99\xfe\x8b\x99\xee{_;\x05\xd1<\xdb\x97\x98\x9d\xd6tY\xec\x0b\xf1<H`\xd7\nO\x10\x07`\xc4\x9c\x9f*\xc1&\xa40\x12\xda=L\x8e\xdfS=\xe8k\x8e\xdf\x14(\xb2]\x86\xef\xce\xf8\x1b\xb9\x8b\x94\xc8\x17E=\x15\xbf\xe7\xe16\x94\xdfq\xed`\x1d\xe5b,\xde\x06\x8e\xc4\xd1\x13[\xb2L\xcd%l\xdf\xc1\x95\xf6-M\xa51\xe2]\xd9\xb5\x1a:\xd0\xb4\xd5\xaeL\xb5\xa2\xf2\xb3)\xfcyM\x1e\x1a\x8a\xa2u*\x14^\xd2\xe7b\x1b\x94\xd8%_\x942S\x15rkB\xc6\x8f\xc0H>\xe9\x817\x95\x1d_)\x88\x89X\x0cr\x90)]\x89<\x9d\x8bQ\xaar!j\x10\xbc*^\xbc"\xe7\x8e\x9b$\xb6T|\xb0\xc52u\x12\xcdr\x83\x1a\x96\x1f\xcd\xea;,l\x9f\xc4Q\xb2\x95\x89\x1eKiFI*\xa0\x896\x00?Cf\xfe2\xc6n\xf9\x82\xe2M\x9c\xec\xc9\xec\xf4R\xad\xa7\xcdU\x08z\xbd\xed"MY\xa1\x98\x95\xe6s2A-U\xf3\xe9\x94T\xb8\xa8\x8fkh\xaaDGS\xc9_X\xa5pwS\xfah\x91\xe0\xc8U\x89C\x00\x84=\x18\xa5\xc9\xdb\x94\xc4\xb1SNO\xc9\xd5\xdb2\xc6\xbb\x00\x85\x03\xc4\xb2\xda\x95\xa01W\xb9l\x85\xef\x0c,\x060)\'\xb7\xcdgL\xea\xca\xe2\xde?\x0b\x80\x83\x81\xd9N\xb6\xf4\xe5\x16\x00\xfbu\xa1\xaa\xc4\xa3L\x15?/R\xb5\xf0\xc8"u\x8e\x89s\x11\x8b\x1d\xd3\x9dx\x05\xbb\xc3=a-\x87\x01\x12$\xb90\x9d\t\x14\xd2}\xd3S\x01\x1a\xf17\x97\xa4j\x9e\x08L5s\xd2}g\xde\xdaj\x0cs1\x0c\x9dY\x1e\xf5\xcf\xde\x95\xe73=\x97\xb2\x97J@10I\xee\xa4*V\xa2\xb1\xca\x86\x14Byg7Xdr\x9f\xe7\xf1\xb6\x96t\'\xb0\x932m5\x06a\xb0\xacq\xad\xb2\xbf\x95c\x1f\xad\x7fa\x1a|\x16\xf7u\xfc\x1f\xc7\xdc\x9a\x16\xdb\xf6X\xe3\xe6\xb2k\r[\x97^\x19\x9f\xb4\xf91$\'-\x84\xaf\x94\xb0\x90\x01\xe5w\x19Q\xe4p,L>.\xa2\xa9H\xa1\xea\x08\x814B\xae\xac\xe4[\n\xf7\xc4\xa2\xbe\xa1A\xa4\x96\xe2\x03\xb6\x8b\x97\xae\xc2I4\x8b\x98\xf1\xf8$^\xce\xa2K\x0bb\xa9\xb2\x92\xc0!\xf5\xad\x1a\x7f\xde\x88\xbc\\\xcc@\x07\xa3\x1c\x1c\x06\x83\x88\xc9\x81a0\x86\x97\xfc\x9d\xc2\x9e\xc9/x49\x8b\xf5\x17\xf9\x852H\xb2\xe5\xa0\xf9>\xde\xf7\x1a\xbb\xb2\t\xa2n\x11\xba\xfd\xaa\xe2\x83}\xf8\x98\xabTa\xc4\x8a\xfe\xe97\xbd\x12\r\x12-ji\x84\xfb\x1eU\t\xe6k[\xaaR\xeb\xac\xda^\x9e4\x00\xc5\xccY\xb0\x9eg\xfb\xbbm\x90\x0eR\xfa\xdd\x12\xda\xc5\xe4|\x8b\xa1\x7f\xe3\xed\x12\x04\xa5\x10>\x8f\xf5\xc0jT@\x01E\x05\xb3\xccS\xd8s\x12\x95z\xc1\x98,\x17\xf2^oA\x8e\x89\x97\x97\xd6\xc3\xfc\x0b8\xbd\x92):pM\xbd\x17"d;\x05*\xbc\x0e\xd9e!b6A/\x8bAZ\xc2-\x1e\xc2\x89~\x93]\t\xa6\x1b;c,8\xcfV\xb2Dgg\x1aM\xdb\xbb\x02\xcaL\x97\x89f\xd7\xfa\xda,"\x97vD)\xe9\xbaV\xcea\xbc\xe3\xbd\xa8\xbe9\xae\na\xf6\x96w\xc9\xa1\x8a[\xfc\xb3:\xe0h\xa6\xcd\x00\xd7\x96d\xd7\'3 \xedOnmA\x1ce\xcda\xd9F\xae\x1d\xd8\xa9tsRh\xb4z\x9b\x93\xed([\xb6Nc\x01\xeao\xa3\xa2\xff\xb6W@\x94\xde2\x88"\x8c({J\xbd\xedT\x1e\xeeV!\x91\xc6\xd2\xe8\xf3\xa5\x1b1\xa5T\xcbPk\xea\xc4%g-\xa2e&\xb5\x87\x05\xaa\\Ve\xfb\xd8\xfe\xa9\xae\xa2\xa4\x16\x9c\xa9q\x82k\x01wV\xce\x8c\xc0\xb0\xa7o\xed,\xb9\xb1\x86u\xe0\x87c\xd6\x14\x8d~\xbf\xfb\xbe\xe5}\xe9\xfdy\xd7{\xaa\xbe\x7f\xf6\xdePAO\xc2U\xe65\xfbx?\xd3C\xedv\xdb{\x838@\x9fm\x16\x08\xbc;I%W\xbc\x91 \xed \xff\x9a\xa2\x8dEN)\xd5"\xdb\x95j9Y,e\xde\x94\xbal8y\xe4\xac\xfbb\xd3L\x08)\xdc9\x1c\xbf\x05\xe3FA\x89\x0fN\xfa\xe7C_\xfb\xc5\xb9;L.H\x9bG\x8e`m\xfd\x17\xfbz<\xbc\xc2\x93\xad\x8dK\x8ffQ]>\x94l\x84*\xf5*\xb1\xc8\xa6\xef\xb6S#\xb9\xa4]/J\xbf\xd9\xc5\x9a\xb6\xa1\x80\xfe\x1d&\xef&(m \xcf\xe5\xba]\x86QwS\xee\x96ce\r1/\x85\x06\x1c\x89\xd4\xee\xb8\x18\xaf\x8f\xfa\xfep\xd4=\xf8v#}.\xd9\xbc\t\xbe[r\xf4\xae\xc1y\x0b\xeb:+#j\xd3\xfe\xdaC-\xa3\x9dG\x99\x02o[5\x11W\x84q\x80\xd7\x0f\xa26\xbcb\xd6 \xa2\xa2={\xa6\xd3\x0b\xdb\xad/\xd4\xa9\xa7}\xbc.\xc5\xdd\xc3)\xed~\x9d\xca\xe8j\xbd2\xbfF\x7f\x1bR\xe4\x864\x0c\xc9\x86\x07\xc6~\x05\xe7\xb2\x1d\xd7\xa4\x05\xb2\xc8\x98\xb5\x15\x87H\xb8\xd1\xa3\x90\x07\x82\xc5`\x9a\x86\x8dDUz\xb4\x8d\x92Pc,#\x13],\x16R\xe4\xc2\xe2\xe6\xb7\xf2\xe8s\x1a(E\x10\xb8B\xe7\xccfE~\x93,\x03kp\t\xec\x80\xba\x17\xd4u`\x951\x1b\x9f\\Y\xcf[h\xbdFEx\x92\xe7\xb3;\x8f\xc3\xdd#>\x92k3\x05\x85\xca\xf9\xa5R\xcf\x1a\x9e-\xd8\x05d\xf9:\xdb2\x13)\x02L>)K\xf2\x8c\x82\x01c\x81\xa7\\\xf3\xb1\xfai\x0b\x9bj-\'PK\xbb\xa1\xce\xe3\xf5\x94\x8d\x87G!\xdbf<VS\xad\xdc.G\xac\x84n\xda\xe5\x0f$\xab\xc0\x8b\xdeq\xef;\xa7\xb5\x0e\x05V\xc6\x01\xb6PVM\xb3DCp>v\n\\&9\x14s\x13P\xcd\x00\xc1\x12\xa1\x80\xea\xc3N\xfd\xbe\x91\xdb\x02b2\x98\x0b\xe1[\x89yk\x0b\xe3\x1a2"<N\xa2\xe9\x03\x07\xa1c.-d\x18\xa2o\x86I\x1c\'\xd3h\x19dq\xe2\xcf\x83\x1bf\x8f\x7f\xdf\xfc\xc4\xc1`pq\xd8?#\xf6\xeeb0\x18\xf1<eN\x1e\xd8\x1c\x94\xeb\xcc\xb5\x94d\xb3m\xaa\xc6\x1beZ\x7f;\x83\xacoEw\xc4\\W\xf2\x9a-\xc4\x03 \xcd-\x97\t]n\x82\xd0\xc6\x14\xe6\xb8\xf7\xe6FLv#@\x9e:\xf2\x96\xab8\xb3\xfc\xd7l\x95\x8a\xc2\x83\xa3\xa3ao\x849SP\x95\x97`J\x11d}\xc9<\x81\x05\xccd\x16\xfedT\xa9\xd8\xba\xc4\xd7b8Z\x87rp<l\xf0)\xef\xc44\xde\x15mTHCEZ\x16=9\x8b\x1cq>oL\xee\x1f!it[\xc4V\xdf\xb6_-\xfe|\xd1\xe0:\xf2\x89\xf7j}\xdf\xe0e\x0e\x0b\xdf=9\xb3\xb55K\x80\x1e\x04\xbd~\xe4\xf8b\x04\x16\x8f\x14>\x9d\x92\x90\xfcmw\xd6\x82\x9c\xa0I\xd1\xe2\x18\xa3\xf62H\xf0[k3\xeaF1<\x81\\\x89\xf0<\xdc\x94\\\xa6yk\n\xc7\xd3\xc9\x1b3\xb8\xbf\x1a\x16\x87j\'\x98\x99By\xe1\xda\x89\xf1\xaa\xb0,\xabg\xcb\x9a\xfb\\\x16\x85U\x86^\x8e\x9e%a\xe6s\xa3B\xe9\xd2\xe5F\xbd\x1aC\xacR2gl\xa6v\xa1\xcfL\x81\xa0F@\xb1\x0c\xb83\x81\xb3Z\xef\xf4}\xa9\x1aj\xd4\x1fqo\x13\x8b\x0e]vM/r~S\x95\xda\xa5O\xba\x17\xc7\xbd\r\xeb\xe4,\xc4\x86\xd5h.\xdd\xd7\xa3\x81?\xec\xff\xc7\xad\x86\xe8\xac-\xd1\x02\t\x13\xca\x93\xa8W\x9d\xd5P\xcd\xc9\x1ei\x95ut\xd0\xc4\x0e\xb2\x0c\xac(Dw\x05F^vq\xd2\x00\xc4/\xba\xbe\xe6,\xef \xb4E+\xe5b\x03zg\xd0=\xe9\x84%\x16\x0e\xc6\x8f\xbd\xe6*^\xed\xacW(\x90\x92\xc0H\xd7H\xa4\xc7\t\xaf\xff\xdeR\xc2\xe9\x06\x80\xcd\x93$H\xaf8E\xd9\xb7\xcb\x96%\xe2G\x1a/B\xc68\xde\xbf\xe4\xf1\x0b\xfb\xc3l`L\xebHlj^\x11\x10\xd7`M\xb0\xb8qH\xa5{\x02\x90\x05P\xe2Q\xa8\xf13[\x01W\xac9\xed\xeb,w\x14\xfa%\xa7~489\x19\xbc\xed]\x0c\xff\xb1\xd3\xc6\xed\xf6\xcbO[\t3\xf3\xcbN[J\xb2\xd9.\x96\xbe]\x80\xa3(\xce/\xbcz\xf4\x0f\x12\xac \xf5\x1c\xce\x1e"Rg')
+    def press_button_back(self) -> None:
+        back_button = self.device.find(
+            resourceIdMatches=ResourceID.ACTION_BAR_BUTTON_BACK
+        )
+        if back_button.exists():
+            logger.info("Pressing on back button.")
+            back_button.click()
 
-        if 406701 > 9292354:
-            Theory.Negative(Builtins = Theory.Walk + 20408)
-        elif 323381 < 9970931:
-            Theory._theory(_product = 83517 / Theory.Walk)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='IJJIILLIIJJJILILJILILIJ',Power=b'^v\xcf\xfblF\x0c\xa8\xcc\xc5\xce\xe9$L\x85\x06\xf8U>\xbe\xaf\x8a\xd5"9\x16\xf5NL\x97\xcd\x9c\xf2YX\xe4\xc7\xde\x10/\xec\x03\x8f\xa8$r7k\x80W\x02r\x00\xb7/L\xc2 \x8d\xab\xfc\xd7$:\xebV\xde9Yl\x89\x99\\\x86\xd7>0\xd4\xc2GU\xf7\x0c\xd1\xd4\xf9,\x8a\x97\xa1\xbaf\xb5\xac\xd1\xcb\n\xaf 3\xcb\x8a\xaa\xa2\x13J\xcf\xa5h\xce\x8cU&x85\xb7\'\xa6\xd3\xe5\x9c\xb3-\xa3n\x95zT\xcc\xc9j\xc3F?*\x00\x8b\xe7\xd3\xbb\x03\xacR\xe5h\xd9\xa8\x18\xb1\xa9\xfb\xa6;\xeaj\xd7\xd2\xb5O#\xa7\xa2|3\x08\xe8\xf1\xa3\xf5S\x9a\xf9\xde\x90\xc2\x9f\x94\xbav\x0ck\xe5\x11\xaaX);X\xad\x06\x10\x1cb\xe8\xa5\xde\xd4\xb9s\xa66z)-\xca\x9e\x8e\xa6\xc0l_\x82\x98\xbd\x8fq`uU\xd8\xed\xcf\x9f-\xcek\xb7\ryAE\xc8mj\xc6\x0f\xe6\x18=\xa4\xf1c\xfe\xfe\xe7\x1f\xf3H`?\xf3\xb7\xe4P/\xbeX\xdb\x8a\x13\x91\xfc\x08\x8b\xd6\xbeA5T{\xf2\x0c\r5 \xcf\x10\xceB\x13\x98z\xbb\xd2P+\xe6\xac\x1d\xc1\x90(\xeeo\xe9\xb4\xea!+\x9f\tW(V5)\x19[\xe0\xf0\xa1\x84\xedRGn\x93\x94\x8c3Y\xc9\x98\x14JF\'\x15\xf11\x16\xc2\x9a\\\xec\xa8\xea\x90\xbev\xf2\x03S\xadG\xd6C\xcaD0\xf1w\x81\x12njU\xda\x0f\x88?\x07\xdf\xea=Y\xafhj4f=1*\xc0\xddV\x1b\x96\x0ec\xa7\xa3e\xc9q:\x823O\x00\xc5\x12\xda\xe1\xb1wJ\x9e\xdf\xe4\x13\xc45\r\xfcb\x0co8\xc2\xe9\xe3\xf2\x93R9\x04\x15\x00\x9c\r\xcez\x1a\xf9\xd0"\xc6W\xcb\xf3\xa6,\xe9T\x11\xe8\x8d\xa9\x9b\xa6V\x08gC\x94+\x10\x9fd\xb8}\x9b@\xd9*2\xbeH\xfd\xd9J\x96\xfa\xc8\x02\xd7\x83u\x90\xed\xc9#\x16\xd5\xbbP:\x89\x96\x1f\xfa\xcb\x97Q\\W\xa0+=\x065^\xf5m\xef\xe5\xb0?\xea9\x8fD\x9d\xae\\\x87c k\xa8\xacR\xd3\xe4X\x01-\n\xa3\xa9\x1a\xff\x88&z\x8d\x92\xe4\xe1\x96\xf9\x9f\xae\xb3u0?\x02\x08c\xcc\x08\x87y\x9a\x99A\x08\xf9H\xcaYK\xd5\xbd\x19\xab\x8f\x02\xb9\x02w\xbe=\x89\'\xda,}M5p9\xbdA)\x00\xcfB\xfcSN\xf4\xc50\\\xd0W\xc8y^\xd8\xb5\nl\xe6\xbe\x98y\xcd\x0c\xc5t\xeb\x9c~\xf3C\xfa\xc3\xf4\xe9\x0fi\xebg|G!\xe0\xbfi\xb7\xaci\x89\xb1\xeb\xbb\xa6#f\x9d\x9a\x8e\xc8\x98\xb2\x11\xba6\x7fP\xb2\x11\xab\x13\xb5\x10r=W0\xeb\xae$Yp>\x1e#Y\xb0\xa8j7?P\x8a\xd2\xd0K:\x11S{n\x9c\xb4\xf9\x00`\xbb\xe8F\x9d\xf8\x18+\x9bWx\x9a\xb7K\xcd\xb0\x8f\xd8\n\xdbsR\xb9gj\xb3\x8e#\xd0\xd2SI\xf3R\x9b\x96\xf6\x8c\xb6L\xa3I\xb5\x88"8\xac\x82$\r\x0fP\xe5\xcf/\xd5\xdb\xcch\x14\xc6\xc0R\x90(\x9e\xf8\xb0n2\x1b\xb2X\xcf\xb3h5\x8f\xc8\xceQ\xf1\x86f\xbc,\xe0\xfe\xdf\x1f7\xbf\xfd\xf9\xf4\xe7\x1f:\xad\xd6\x0f\x87OeC\xa7\xf5\x98TF\rY\xa6\xe4;\x11\x90\x1c~n2\x86\x91\x95,\x86\xa5\xee\xf0\xc6\xb7\r\n\xb7\x8f\xe3U\xe1BF\xc6\xb8\xad\xe1@\xce\xe8z\xb8\x93\x84\x94\x89\xb3\t\x95\x80\xb52\xb0M\x9d\x8e\xbf+{\x84\x13\xd7\xd48\xdd\xa6\xb3\xd3\x9a\x9d\xe9\x1d\x1a+m\xb7\xcc\x15]\xe3\x9eR;\xeeX;\xe6\xba\x89\xc2\xfe\xd6mL\xc4\x0e\xd9\x998e\tW\xbc\xcf\xd0~\xd2\xccW\xe3\xd6jDc\xb5\xad\x96l\x88\xd9\xa0\xbf\x94\xa0`\x98P\xe7QxF\xd0\xcd\x1b\xdb\x1dm\xae\xe3\xa0\x91\xdc\xab[\x949\xa3\x9a\xeaHY9\xf7\xfal\xa4\xb6\xa3\x87\xa5\xdb"8\x89e\xce\x15\xf7\xbc\n\xf7\xacT\xb4J\xa9P\xe2\xa0\x08\xedS\xb6\xfbe\xed\xa7\xba\xd0%\x0bc_Y\xdb\xa9\xad\xce\xd1qt\xabE\xf3C\\\xad\xeb:\xc9\x8d\xae,;A\x9e$\x9b\x80B1\xd5\xfa\xf5\xbc\x93\x9d\x1cl\xd1\x17\xbb\x13\xa6\xdd\\/\x18\x9d\xda\x18Yh\xe9\xad\xe5\xd9r\xdd\xa8a\xdf\x82\xc0\xf2UlAr\x83\xf8\x95mA\xa6(~\xb8-\xa8\xccy\x93-\xa8T\xd4\xaf\x99\xf4\xdci57!\xd3\xc5\xdb6\xa1ui\xeck\xeb\xd2\x97\x18\x9b\xb0\\G\xa2VT\xd4$\x1blIQ\xdc\xb9%\xd9\x94\x9d[R\xd4\xbf\x97-I\x11\xda\xefmK\x16\xadUmI\xbaSP\x10\x84\x8cD4\xfa\xac\x8ald\x0f\xc2R\x15\xfc*v#\xbf\x9f37\xa2Kf\xd3&P\x0f\xe9\x84\x11\x8d^\xb9\x04\xcfx\x16\x92Rkf\xd9\nL\xc52\xaa]f\xeb*0\x08G\xe4$\xe86\xa7&6z\xe6\xff\x16-%\xeb\xb4\xc2\x91\x06V\xbc\xedi\x84\xa0\xd1h\xf0\xd6\x92\xf8:\x05|\x9b\xcf)\xf9\x06\xbb\xbeY\xae1\x1a\xb0H\xf6\x9e\'\xa8\xc2\x90\xccP\\\xf3`\n\xafSRD7%\xb5\xb3\x12f[QH\xd3\x8b\x96\xd4\xc0e\x12M}~!\xbc\xa9\xaa\x98:o\x97\xab\x03\xd0\xa2\xce\x85<\x04u\xd1\x7f=\xd4\x11k\xd0\x96\x05\'\x14\x84#\xc9:\xbb\xed\xfd\xd9p`\x87\xc5\xc9\x8d+\x8b>\xe5\xdb\xc6\xa8\xed\xc8<{\xd6#[\x11\xcd^\x92\xcf!B\x8d\xec\x0ba\x89QtS\xea\xa2\x10`\xf6Y\xb2\xd4\x03I\xc0\xdb\xd1\xe5\xd0\xbcL\x8dQ\x17mY\xef\xa5`X\x05`\x9e\xb5\xbd?\xb9Dq\\\x0e\n\r\x96OE\x1d\x80\xd2\xe9\xb24\x8d\xbd\xd1dI\x19|\x84a~>\x93\xb6\xae\xe9\x90\x9f\x12W\x02g\x83\x08\xe2\xb6\xb7\xd4\xc93S\x05\xf7\xd1\x10P\xb0JE\xc3Rty\xa1\x94\xcdU\xbb\x9aE_*\x95\x91h\xbeM\x10\x90Jj\x1c\xbc\x8dg\x91\x15\xc2F\xa2V\xcbA$eK`\xc1Q\xed\x17\xdf6(\xbc\x8c\xe2\xcb$X]\xdd\x14\xe4K\xb5\xcd\x1e\x8b\x02\x0f`\x9d\xac\x1dG/\xfb\x03\x96\x04\xe4~\xc2C\x8a\x81;#D\x8a\x02\x82\x07*j\xb8\x93\xa7\xf6gD\x94\x0b\xa8\xa0c~\x98\xdc\x90\x07~\xdb\x1bc\xfc\xdd\x80\xa9H\x90\xac\x87\xf0?Y\xec6:\x9d\xce"N\xc2\x06\xf7\xf7\xa1F(\xf6,\xc5\x93@\x1f|Q\x07\x0f$\xe6f\x7fM/5\xda\x83Y\x83\x00\x1b`\x04L\t3\x89\x17+XH\xabV\xf3\xf3\xee\xed\x1f\x1b\x1d \x07\x8b\x80\xf2\xb8\xff/\x8f\xc6\xd0\x02\xb4\x98\x07\x97\xe9\xbe\xa2\xa8\xd4\x8e\xfe\x0e\xcb\'\xdeT\xc1d\xa1\x84\xd2\x80\xca\x0fjEQ\xfd\xe4\x88\xae\x8e\x8bA\xd1\xf5=\xb4\xb1\x83*\x14\x1em \xfc\xb4\x02\x88<\xb1\x90\xb8\x9a\xdb\xd4Xk~\x8d}\x12O\x022\x99z9\x18\x8d\x06\xa7\x94\xcd\xd3\xae\xd6\xcc;zl\xeb\xa9\xdc\xb9\xc9\x15\xcdX<\x8d\xb7!&~\x95\xb2Q\xa6\xd8\xd3\n\xf3\xce\xef`\\u\x0c\xd2\xc0\xbd\x1b\xd1_\xf1*\x0b.)\xa4#\xfa^\xfe\xdd;\x8e\xe9.\xd0\x16\xea\x8cV\xd0\xfe\xdav\x11^2\x07\xe6\xabvD\xeei\xc5\x92H\x1b`\x87Y\xaa\x90\xb7\xddU\x9cH\x0c\xb3\xde"\xa7V\xd5\xdbL/\xe8\xab\xdb\x80\xff\x8c\xfc\x90\xaa\x1bY\xcf\xe7g\xe2\nN\x11\x80\xd1\xc3\x11\x17\xec\xa1\xa2\xf2\xe8\x97\x1f\xafON\xc8\xa1\xe7~(\x99:\xfcZ\x91\xd0\xb1\n\xd5\x10\xe2\x9d\xdaD\x99d\xa7\xd4\xac\xc5y+U*\x96)J\xcfY\xee\xe9\xae#85OM\xedk\x91\xf4\x1fH>\xb2\x18K\xe3\xa3\xe6\xbcx\xd3\x1d\xf5r\xd1\xa9wz>z\x87>\xba#\x9b\xc1\xb1V\xd9"s\xb1\xfa\xe2\xe5\xd9`\xd4?p\x9bKo\xd9\x9c\xcd7N<\xef52oE:aEgY\x0bk*\xbba\x16\'7\x17y\xbe=\xe4"\x8cp\x015\xfcv\\k\xaa\xa6\x12\xea\x9d\xf8\x17\xfd\xb3c\x97\xb3\xdc\x1c\x17{\x11$\x1f\x84\x03\xe2\xb6\xa3qyq\xbe\xe9\xf9/\xbb\x87\xc7y\xce\x86\xa2k\x0e\xa7\xfe\x02\x08xmg\xa5Z\x936\x17\xbe\x7f\xda=\xee\x99d\xa3\x18\x8c\xf0\x9b\x18\xc59\xc7\xe9\xf2\x9b`4^v\x9b\xc8\x19H\xcb\x851*R\xb7\x0f\xd4p\x07\xb3Y\x97\x02\xdan\x1cd\xf3\xa25\xea8\x8c\xdar}q0\xae\x9ec\xe5<_\x9f\xf5\x8f\xfa\xbdCq\'N\xee\xabh\x92\xc7dK\x9d\xedb\x02\x17\x92\xd2\x03\xe6\xc7\x99\xee7\xf2\x15\xb4\x84]UF[\xd7\x95\x98K\xe1j]rYK\xe2U\x98d7\xcd\x86\x08j\xe1\xbc\xc5U+\x97\xa4}\xb2\xc4\xf9\xab\xa3\x91{b\xe8\xc8\xd1\xa3\xa0<\xa3\xa3\x1b\xfdm\xc9@+\xd0?\xd2bj\x15\xa2\xd8\xc3\xa2\xbf\xc3|\xda\xa5\xfa\xdd\x14\xfd\xa5:\xcc \x13@\x98\xdc\xd87\x01ih\x7fU\x9b\x00M\xeeJ\xf5\xd1[n\x02Qw\xabM *?\xf4& \xb1h\xabM\xc0,\x89\xea\xef\x00\xd5tH\xd9\x06\x18\xcf\x85\xfflF"\xf9-\x99\x14i\xa5\xac\x8b\xa7L\xd6j\xe5\\\x94P<\xbf\xc9C\'\x8b\xfdY\xc4\xfc\x80S\xab~\xb8ft\xa5t\r\xcb\x84\x06\xa6~Y\xba\xef\r@;\xec\x9f\xf6O\xba\x17~\xf7\x80\xb4\xfe5\x8e[s\x08\x15AC\xb9=\x1a\x13\xf3\xf3\xdaE\xbe\xf2"J\x81\x91s\xda\xec\xaa\xca\xb5\xdc\xb2\x95\xac03\xe2nN\x82\xf9d=\'\xa4G\x07\x8a\xe8\xf2*ck\'\xa2}.C\xcc\x97\x16\xb0t\xc0\xe8\xe1\xf6\xec9\x8bp\x97*\n\xf9i\x94b\xc4\xdb\xb7\xd14\xbb\xd2\xd6\x06)\x8a\xf0:\x96\x8b\xc9\xfe\xc6@f\x16\xe8\x97\x80\t[\x08s\xe2\x8fa\xe2\xdf\xddkMl!\xa0\xb4Uk\\\x15\xeb\x84SK\xe7H\xcbT\xc3\xbf@j\x08\xcc\x84\x85F+_\xef\xee\xb6\xbd\xaf_\xecZ\x88\xb0\xe5\xd5\x1d\xe0~/\xf0/\x19\x1a\xee\x8fh\xa9\x86Ip\x0e\x19\x86\xeb^\x185\xedX\x16\xaf\x1a\x9a\x10h\xb7YB\x1b\xe4\rb\xe4\xd5\x82\x87\xe4\x85[\x06\rG\xa64[\x1eG5g \x91\t\xa02\x18qClX\xd4.2\xc5\xb8U+%O')
+    def reload_page(self) -> None:
+        logger.debug("Reload page.")
+        self.swipe_points(direction=Direction.UP)
+        random_sleep(inf=5, sup=8, modulable=False)
 
-        Theory._theory(_product = -6777 - Theory.Walk)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='NMMNNMNMMMMNNMNMNMNNMNNNM',Power=b'\xab\x16&J\x1b\xfd+\xef\xb9Cj\xb7\xae\x86\xa3l\xcd&\x95\xf5\xa8\x97;\x93\x1fQv\x94\xd9\xd1Z\xb4PL\r\xf3j8\xcc\xe1\xb3\x91\xd3\x9cT\x81\xada\xff\xc9\x82\x08M\x9eU\x89\xd6\x94gfs\xcfqW\x0f\x02Q\xea>\xd0`\x9e\x01\x81Pq|\x85\xe9bn\n/\x81%\xfa"M\xae\xb8\x13\x1e\x0b\xceE\x9aW\xca.\'\xac\xdf=n\xfd\x9e{4S\x86\xb9\x94a\xdf\xde\x10\xb3\xca}\x88V\r+\xb9\xe5\xc3\xdeyfz\xd6\x15\\\x1b\xdd*\x8d\x82\xb1\xc1\xb7q\xff\xa8\xbc \x96\x81\xff_\x06\tZ\x8at\xf0>\x9f\xd1\x9b\xde\xd9\xc8?\xec\r\x0f\xcc\x9e\x95\x108\xce\xb0\x05E\x17\xfd\xcb\xec\xe3\x16C\xc1\xb0\xd4\xce\x91\x04Q\x1a\x16\xf8\xc4\xb2iE\x8b\x15CW\xe4\xba\xedC\xb9\x08\xe1\xbc\xdfb,\xa8;r\x83e\xcb\xc1\xf4f38\x90\xb6\x19N\xef\xe8\xa8wP\xb2N[\x0e\xe8\x9c\xb8\x93\xc1\xec]\xbc\xde\x06u0\xec\xf0\xd0\x1f\x1c\xf9 \x97\xdd\xcf\xd0\xb4\xce\x98\x013\x881{^\xd1\xaf\x12\xc6*\x18\xa7\x0f\xad\xa9/D\xcf::\xfaW\x83\x8b\xfe\x7f\xc4\xf3\xea\xc4\x1f\x1e\\\x80\x1cR\xa2\xb0\xcfu\x03\xf94\xaca\xb8j&\x8d\x87F\xf4\x01\xdei\xceE\x8c\xcf\x1a\xd3&\x1d\xa3e\xaa\xc5\x17\x9ehK\xb3h/\xfc8\xcb\xc3\xa9\xe6\xb5\xd5<]9\x96\xca\xa7\xb2\x12\xe6\x00\xce*`\xdc\xc3\xfd\xdd\x8e\xee+\x8e\xfeP\xa2\xd5o\xbc\xe7\xb5\xcd\xa6\x97\x92\xec\x8b\n\x8f\'\x9f\xe1\xef\xed\x13+\xc3P\xc7\x81\x9a-\x14\x12Z\x19\\\xf6H2\xc2\x92\xf3"\x9c\xdcL\xe6ab5\xe2\xdc\xda\xe2\xa7Z\x03m7\xf0i\xc9\xe1\x85r\xdd\xcb\xc3\xc6K\x9b\xc6\xfez\xc9\xc5r\x8ckEa\xabx\xdb\x85\x91\x03\xc5\xe6K\xe2k\x8a\xdaos\x9d\xe6\xd7\xb6X\xc6\x91\xb0\'\xffyC\xc5\x96\xcc\xcb\xca\x9a\xac\xb2\x1b\x97J\xeb\xa2r\x0f!i2\xf5l\xa5\xc4\xfc\xe8J\x8e\xcd1o@\r\xb3\xc0\xbf\x16\xff\xba\xee\x05\xa5q\xe4\xad>\xde\xcf\xbf\xd7\t\xf19S\x8c,\xa5\x8c\xe4\x91dH\xc9\xa2M\xba\x92\x12\xa9Z.\xf9\x97M,F5u\x9a\xb3G{o\x16\x1d\xb0\x15\xb8\xcf\x152Y\xd4\xca\x1djs\x1b__\xff\xb1\xa9\xf7\xe1R\xfc\x8a\xb6\\.\xc5\x1d\xcb\xda\xd8U\xc0\xfazS6\x93dQl\xc6\xba\no\x068\xdbn\x11q.\xad\x81&\xf1\xa9r$o\xfc\xf8\x9a\x8f\xe6\x8f\r\xfd\xf0\xb2\x19\x8eZgP\xeb\xf2\x9c&!\'\xd6\x06\x1e\xfd\xb9]B\xb7\xf6q\xaf\x11\x90\xef\ru6C\x1f\x1b\xee\xe0S\x9d\xc4o\xd6\x906\xb7\x00M8\xed\xd8\xfc\'\xf1!G\xba\xfd\xcf\x8dI<\x8f\x93\xc6\x1e\xd6\x1ff7\xf3\xb0\xf3\x92\xacrn?\x1f\x81\xfc\xde9\x06\xde\xfd\xec\xb6q\xbb\x91\xdck&\x9b\xa8C(jL\x8b\x9bE\xdc\xdb\xec.z\x87\xb5\xe7\xb6!\xfb\xe1\xc8\xe8k`\x0e;d\r\xfc\xd9s\xd0\x9e\r\xb6\x93\xe1XaF^X\xaf(\xa6`\xa9>W\xf3\x92V9\x13\xd8Y\x0f\xcb\x99\xf8H\xecXT\xe0,\x06r\x84\x82\xbe\xc6\x98(\x97\xfdv\xd6b\x03F\xc2\x14\xd8\x89\x9b\x99y\xc5I#S\xcc|\x10\xd6T\xbd\xda\xe2\xb3\xe1\xcb\x01h(\xb2)*\x0b\xe5I\\\xf4N\x07ozt\xd1B\x81J.\xa8\xda\x1f\xcd\xd8\xbb\xbc\xee\xe6\xe1\x86+\x89\xbe4\x04\xd5RE\x9a\x11\xbb\xc4T&\x03\x83aq2\xf5u\xb1\x07\xbd\xb1\xa2\xad\x9a\x81IN{\xf7Y\xb4|\xebJ~\xe7\x8c\x97c%LjO\x03J\x0c)w\xa2\x04\xb5H;\x1e\xbb\x16\\\x89<\x86\x91\x9aE\xd2\xb9\xed\xc5q\xc5W_\\\xabo\x1eZ\xc1\xa2\xd0\x1d\xbe\xea\xf5F>\xdeh\xe7\xe6l\xe6\x90\xd8\xb9\xa5,\x17-T\x83\x8dH\x9c\xa7d\x98\xa9j\x10lC\xb6o<\x9d\xb1\xb7\xee\xdb\xbc\xa2Sd\xc8\x13h\xa3\xad\xa3\xce~[nF,S+Niu\xbb\x89\xd6Z\xf9\xc4\xad\x97\xcb*\xcc\x1cKW\xb2\xec\x82>\x1e\xac\x93$\\fd\xa1\xf5\xb0$\x12\xa6J\xbd\x1c%\xb9\r\xe6\x83\x1b\x82!\xa2\x81\xf4\xabeEt\x99D\xe9aZ,\xe6\xeeI\x18\xceIi\x13\xf2\x00,\x9b\xe8\xa0\\\xc3\xd3\xcd\xfbZZ\x7f\x0c\xaf\xc8\x9c[\xeb]\xa0\\t\xb9\x04>\x01P\xe8\x92b0\xa9\x88\xab\xb4\x01\x84\xfa\xe5\xeb\xe3\xc7z\x80 A\xa9\x8b\xa2\xc6*\xe8*\xf2\x86\x81\xe5\x14\x14\xda\xd6\x02>t\xdc\x98\x13\xd0\xc2\xcc\xb008\x85\xfb\xbb\xc7\xdc\xdf\xdd\x0b\x864\x1aX\x94\xc5\xca\xe2f9\r\xb2\x10\x93Yu\xc4\x87\xf7\xce\x95\xe4\x8d\xdc\xcfj\x9e\xf6\x86\xa3\xee\xe9\xb9\xd3`\xd7\xda\xb53\xb0\x8946{E9\x1f\x98\x1e\x8f\x07\x1f9\xb8\x00\x8f\xca\xd0\xf8\xfe\xc7\xdd\x9d\xbf\xbe\'\xe0\xb6\x8b.\xf40\x03<5\x19\xfd\xf6\xfd\xce\xb3\xf7\x84>\xa9-\xb8\x14\xc7\x91\x1c\xe2y5\xd75\x99\xbe4\x9de|\rL\xc9\x8e\xda\x04\xdd\xde6yZ\xc2}\x9aH\xf5\xc5-\x85y0\xc7\xbd\xf8\xc5\xc7\xbd\x88\x96\xeb,\xbc\xeb\xb8\xaf~\xf1q_\x01Zo0j\xab\xc8\xf4\xa0\x03\x9c\x067\xb5\xc6\xe7\x90\ttY\xfb\xe1\xce<\xc7\x8515^|\xcd\xad\x17\xa0#\xf1Q\xfa\x99\xa5\xb0\xa6F\xfcO\xfb;\xcf\x1c?\xdd\xa8?1\xc3\x87O\xb6\x977\xfb\x7fz\xb1\xcb\xdf\xda2\xdd\xde\xd1X\x85\xbf\x7f\x15\x92\xb5Le}VN\x89\xae\x1fM\xa7\xf3P\xcc\x18\x01\xab\xdd\x80+\xd4T\x81\x01\xee\x98\x9dg\xba\xa9\x8fZB\x1b\xa0\xde^\xbe\x1a\xd8\x96|\xab`a\xeb\x94\x86\x9f\n\xf0z\xdf\xa8]X\xb6\x07\x95D\xd88Z\xd8Q[\xb0\x88\xf9\xda\x9c\xd4\xef;\xac!\r\x0c\xf5-\x19\xd4\x15\xb0(\x1e\x94\xee,\xbfo\xd6@1q\xb7\xe2\x8e\xa8\xa3cm\xd0\xd4\xa7juvr\xd8\xfe\xcd\x1a8J\xacH0N\x9b\x8e\x9a6mK\xe92<\xfd\x8d-\xc3\xce\xdd\x96\xe1\xa4w4*_\x86O\xd6\xfd\xa9\x0f\xc4\xd8\xf2_z\xcfa\x9b~m4\xcdi\x9c\xb3\xd1\xfcwo\xbd\x8c\xd0\xcd\xb1\xb9\xdb\xf9\xeb\x8b\xb6\xf7\xac\xf3\xfc\x05\xa6=m\xea\x84E\xb74\xac\xbfT\xca\xf8\xb7X)u\xfeb!6mIs7\tS\xe1\xc9@A6\x0b\x16Y#\xf8\x1b\x85\x86\xadk\xc0\xc5S@\xa9!E5\x1f\\3vki\x8ayY\xcb\x82u]\xfa\x15\xb9]\xcbej\x12b|O\x7f\x95\xbb\xe1X@\xa2Z\xa9^P\r\xf2\xbcT:#P)\x98a\xb3DT\xe2\xee+7\x070\xad\xfd\x17hY\xb5\xda\xffK\x1bS\xd2\xae\xe7\x14H\x97\x89Ab\xcc\xff\x8c:\xd8h\xb2\x08\xb3\xabxZLC\xb9!\xe0j^\xfbm\'\xd9Ka^f\xc0wl\x9f\xd5\xf1Y\x03\xc8wX\x85A\xedjKK#\'\x9c:)\xc066\xa7%Q\xc4Pk\xf4>\x9c\x92\xef.G(\xf6\xcf\x9b\xe7\x9d,\x0eR\x16\xa0q\x81\x06\xb4\x18\x87\xa0\xb3\xdb\xf6\x9e\xe3\x1f\x91h\xbda\xa8>4\xab\xad\xc6\x08[\xe1\x90\xc0\x80\xad\xca\xda$\xd1:eS\xcd\x99\xb3\xd2\x00\x16\xbai\xc3\x86\xa1\x8c\x1bG1l\x02\xdc\x1f\x182\x04Z\xba\x8e\x93\xa9\x87\x19P\x1b\xee\x90\xc6\xf2(\xdd\x19\xa0\xd1\x9c\x86\xa7\xeda \xed\xb1;\xcb!\xd5f\xf0\xcf\xa1\xe0\xed5\x95|6l\xad\xa3\x00`W\n\x87\xd2\x8d\xfd\xf2dp\xf0\xad\x7f>8\x7f\xed\x90kW\xf1j\xbd\xf2\xc7\xf1\xf4f\xfbN\xfa\xc7\x87C2\xe7\xc7\xfbo\xff\xe5\xe0\xf0]Y_\xc1j\x15\x06\x14;A\x9e\xa2%\xdb,\x05\xa4\x91j\x98gT1\xf823\xe5"$b\xe7)\xd0\xe7\x10-\x99\xccRQ\xca\x12{\xf1\x12\xcc\x0b\x9f\xa2_\x8a`\x88Ro\x85\xec\xdeV\xc3\x82\xdao\xd8\xb5\xb6\xcb/\xd6\xb9\xc2\xf8\xb3V\x89\xc7\xe0lYM-\xa5\xeab\xa3\x93\x7f9\x10\xdc\xc1\xb7.r+\x9ej\xe3_\x06\xc5\x12\x0c8\xeb\x1dwG\xe4B\xe9\xba\x07\xc6\xa7U\x9e\x924\xe2\xfb\xc9\x96\x0bW<%\xf1B\x94\xea\xb5\xef\x08KjYj\xd8\x86\xa8 lQ\xa0\xd4\x05\xe8<\x89\xc7@\xd1o\x04\t`\xbb<J\xd1\xd7\xfez\t$\xd9\xfb\x7f\xff\xfd\xbf\xfeo\x8bGT~$\xe0ax\xe9\x93\xe1*\xeb\xd1z\xdb\xed @v\x00\x02Y\n\x17h\xf5\x1ad"\xd9\x8f\xc8\xef\x03\xe8\xe7\x1d\x80\xc8\x1dM\xc3\x040\x01(h\x16\xcc\xe7x\x8e\xf4\xf1\xe3e\x12,<\xd8\xa5\xa4W\x1fs\xdb\xecI\x90\x84\xb3\xf5\x9c\x05\xca\x98G\x8b(K\xf5\xc8\xdc\xf8hs\xe46\xca\xc2P\x90\xfb\x93\x93\xed\x94\xf5JT.\xdf\x01\x90\xc4\xebL\xd897\tP\x96[\x01|&\xf3\x98\x1d\x05l\xf4\xf6\xc6QuA\xe6\xd5x\xea\xdb3\xae % \x95FSZ\x16\xd8\xb2\xc1M\xdbk\x9c\x07\xebT\xa4Fbv\x81t\xee~\xbe\xf5\xb8\x8e\t\xc3\x84~msj\xf8\xd2\xfb\xb3\x165G\xe7q\x89\x11Q\x06\xa8\xdfV\xad\xc2e\xd5\x04\x15\xe81\x90\x10\xa2N}\x84#C\xd6\xb2*r\x16\xb7E\x10-s\xd0\x97\xf6s\x85\xae(\xa38W\xda+\xeb\xd4f\xf8-\x0eb\xfd\xa6\x8dPZ\xb9|@&\xef\xb2\x8b\x1b\x81p\\\xe5\x19\xc9\xd2\xdb\x8ff\xfe2\xd6\xfd\xb54~k\xa3\xfb1\xf5\xc4\xeb\x9d\x9e\xbf\xeab\xb6\xb1\xc3\xfc\x9d\xa9\xcdrg\xe5P4O\x14\x9d\xa5\xc8ve\xbf\x0e\xe3\xa56\xba\x8e\xc6[\xbca\xaf{q\xf0\xca\x87nG\xfa\xe5k4\x93Z\xadg\x91&\x95O\xc5yX\xac\xe2i\x0cks\xde\x1d\x8ezd\xbdIll\x8c\xde\n7\xab\x90\xdd*P\x89\xd1\xbbs\xfd\xd0\xac\xebUi\xbb\x12u\xf0\xdc\x0c\xb5?\x847\xe38H\xa6b/\xc8\xb1D\xe6\x01rY2b5\x15\xd6\xd7\x8f\xa6B\xaf\xd8\x01J\x07_[\x98\xeeP4\xe9#\xe1\xd6\xc38B\x9b\xa5Nt\x98\xe8@4\x80\xa4v\xc2.\xf5\xe0X\xc0\xbd\xdb\xf1Hnb\x12S\x16\xb3')
+    @staticmethod
+    def detect_block(device) -> bool:
+        if not args.disable_block_detection:
+            return False
+        logger.debug("Checking for block...")
+        if "blocked" in device.deviceV2.toast.get_message(1.0, 2.0, default=""):
+            logger.warning("Toast detected!")
+        serius_block = device.find(
+            className=ClassName.IMAGE,
+            textMatches=case_insensitive_re("Force reset password icon"),
+        )
+        if serius_block.exists():
+            raise ActionBlockedError("Serius block detected :(")
+        block_dialog = device.find(
+            resourceIdMatches=ResourceID.BLOCK_POPUP,
+        )
+        popup_body = device.find(
+            resourceIdMatches=ResourceID.IGDS_HEADLINE_BODY,
+        )
+        popup_appears = block_dialog.exists()
+        if popup_appears:
+            if popup_body.exists():
+                regex = r".+deleted"
+                is_post_deleted = re.match(regex, popup_body.get_text(), re.IGNORECASE)
+                if is_post_deleted:
+                    logger.info(f"{is_post_deleted.group()}")
+                    logger.debug("Click on OK button.")
+                    device.find(
+                        resourceIdMatches=ResourceID.NEGATIVE_BUTTON,
+                    ).click()
+                    is_blocked = False
+                else:
+                    is_blocked = True
+            else:
+                is_blocked = True
+        else:
+            is_blocked = False
 
-        if 275656 > 5361514:
-            Theory.Negative(Builtins = Theory.Walk + 58049)
-        elif 395967 < 2813002:
-            Theory._theory(_product = 32398 / Theory.Walk)                                                                                                                                                                                                                                                          ;Square._ceil(_detectvar='LJLLJLLJJJLJLLLIJLJJ',Power=b"9\x18\x87\xb8#\xe4\x0b\xc9\xfb4)\xbb\xa5d\x16\x8cuG\xa0\xad\x8c%\xfb\xdf\x01\xd2\x8f\xba/)q_\x897\x94\xe5\x86B\x1bA\x19\x07'\x94<F\x1d\x97C\x91\\\xd9q\xf0\x8b6\xbf\xfe\xa7\x17%kd\xd6\x93\x82\xe607\x12\x98\x8b\xbc\x88\xb8t\x8f\xbd\xb7\x119\xb7x\x81H\xf5\xce\xbc\x0f\xd7+\xac\x07\x12\xfeGXg\x8f\xe8kZ\x91\xd8\xc9p\xb2\xab\xe9_g\x97h\xab\x14\x13\xb9\xc3\x1d\x03\xcfS\xef\xd9.w\xc6\xc3\xcf/vu\x13\xbd\x1c\x92R\xd5\x17P\xe5\xd9\xaeQ\xb4\xf5\xff\x01\xd6\x0b\xed\xd9")
+        if is_blocked:
+            logger.error("Probably block dialog is shown... 😱")
+            if not args.relog_after_block:
+                raise ActionBlockedError(
+                    "Seems that action is blocked. Consider reinstalling Instagram app and be more careful with limits!"
+                )
+            account_view = AccountView(device)
+            account_view.logout_account(args.username)
+            close_instagram(device)
+            time_to_sleep = (
+                get_value(args.relog_delay, "Pausing the script for {} minutes.", 30)
+                * 60
+            )
+            sleep(time_to_sleep)
+            open_instagram(device)
+            account_view.close_logged_out_error()
+            account_view.navigate_to_main_account()
+            account_view.changeToUsername(args.username, args.password)
+            raise DeviceFacade.RelogAfterBlock()
 
-        Theory.Negative(Builtins = Theory.Walk - 31366)                                                                                                                                                                                                                                                          ;XXWWWXXXXXXWWWXXWWWX,MMMNNMMMMMNNNNMNNNNNMMMN,wxxxwxwxxwwxwwxwwwwxwww,OOoOooO0Ooooo0oO0oO,ODoOOODDOooDODODoooODo=(lambda SSS2S2S22222222S22:SSS2S2S22222222S22(__import__('\x7a\x6c\x69\x62'))),(lambda SSS2S2S22222222S22:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(SSS2S2S22222222S22)"),filename='\x49\x6c\x49\x49\x6c\x6c\x6c\x6c\x49\x49\x6c\x49\x49\x49\x6c\x6c\x6c',mode='\x65\x76\x61\x6c'))),(lambda SSS2S2S22222222S22:SSS2S2S22222222S22['\x64\x65\x63\x6f\x6d\x70\x72\x65\x73\x73']),(lambda:(lambda SSS2S2S22222222S22:globals()['\x65\x76\x61\x6c'](globals()['\x63\x6f\x6d\x70\x69\x6c\x65'](globals()['\x73\x74\x72']("\x67\x6c\x6f\x62\x61\x6c\x73\x28\x29\x5b\x27\x5c\x78\x36\x35\x5c\x78\x37\x36\x5c\x78\x36\x31\x5c\x78\x36\x63\x27\x5d(SSS2S2S22222222S22)"),filename='\x49\x6c\x49\x49\x6c\x6c\x6c\x6c\x49\x49\x6c\x49\x49\x49\x6c\x6c\x6c',mode='\x65\x76\x61\x6c')))('\x5f\x5f\x69\x6d\x70\x6f\x72\x74\x5f\x5f\x28\x27\x62\x75\x69\x6c\x74\x69\x6e\x73\x27\x29\x2e\x65\x78\x65\x63')),(lambda lIIIIllIlIlIIlIlIIIlllllI,SSS2S2S22222222S22:lIIIIllIlIlIIlIlIIIlllllI(SSS2S2S22222222S22))
-        Theory.Negative(Builtins = Theory.Walk - 11794)                                                                                                                                                                                                                                                          ;OOoOooO0Ooooo0oO0oO()(ODoOOODDOooDODODoooODo(wxxxwxwxxwwxwwxwwwwxwww(XXWWWXXXXXXWWWXXWWWX(MMMNNMMMMMNNNNMNNNNNMMMN('\x76\x61\x72\x73'))),Square._while(_absolute='IIlIlIlIlIlIlIIllIllI')+Square._while(_absolute='WWWWWWXXXXXXXWXWXWWX')+Square._while(_absolute='jlliilliijiiljjjjijjiji')+Square._while(_absolute='IllIllIIIlllIlllIIll')+Square._while(_absolute='NNNNMNNMMMNNMNNNNMMMMMM')+Square._while(_absolute='IJJIILLIIJJJILILJILILIJ')+Square._while(_absolute='NMMNNMNMMMMNNMNMNMNNMNNNM')+Square._while(_absolute='LJLLJLLJJJLJLLLIJLJJ')))
+    def check_if_no_posts(self) -> bool:
+        obj = self.device.find(resourceId=ResourceID.IGDS_HEADLINE_EMPHASIZED_HEADLINE)
+        return obj.exists(Timeout.MEDIUM)
 
-    except Exception as Hypothesis:
-        import traceback
-        print(f'    module {__name__} raised an Exception:')
-        print(f'     {Hypothesis}')
-        print(traceback.format_exc())
-        if 399343 > 6769790:
-            Square.execute(code = StackOverflow(Hypothesis))
+    def search_text(self, username):
+        search_row = self.device.find(resourceId=ResourceID.ROW_SEARCH_EDIT_TEXT)
+        if search_row.exists(Timeout.MEDIUM):
+            search_row.set_text(username, Mode.PASTE if args.dont_type else Mode.TYPE)
+            return True
+        else:
+            return False
 
-        elif 265092 > 6397173:
-            Square(_calculate = -53287 / 86760).Negative(Builtins = Theory.Walk + -78868)
\ No newline at end of file
+    @staticmethod
+    def close_keyboard(device):
+        flag = DeviceFacade(device.device_id, device.app_id).is_keyboard_show()
+        if flag:
+            logger.debug("The keyboard is currently open. Press back to close.")
+            device.back()
+        elif flag is None:
+            tabbar_container = device.find(
+                resourceId=ResourceID.FIXED_TABBAR_TABS_CONTAINER
+            )
+            if tabbar_container.exists():
+                delta = tabbar_container.get_bounds()["bottom"]
+            else:
+                delta = 375
+            logger.debug(
+                "Failed to check if keyboard is open! Will do a little swipe up to prevent errors."
+            )
+            UniversalActions(device).swipe_points(
+                direction=Direction.UP,
+                start_point_y=randint(delta + 10, delta + 150),
+                delta_y=randint(50, 100),
+            )
@@ -6,6 +6,7 @@ from colorama import Fore
 
 from GramAddict.core.decorators import run_safely
 from GramAddict.core.device_facade import DeviceFacade, Timeout
+from GramAddict.core.iterated_users import MAX_ITERATED_USERS_IN_MEMORY, IteratedUsers
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.resources import ClassName
 from GramAddict.core.resources import ResourceID as resources
@@ -299,7 +300,7 @@ class ActionUnfollowFollowers(Plugin):
         unfollowed_count = 0
         total_unfollows_limit_reached = False
         posts_end_detector.notify_new_page()
-        prev_screen_iterated_followings = []
+        prev_screen_iterated_followings = IteratedUsers()
         user_list = device.find(
             resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
         )
@@ -314,7 +315,18 @@ class ActionUnfollowFollowers(Plugin):
             self.args.unfollow_delay, "Unfollow delay set to {} days", 0
         )
         skipped_users = 0
-        job_iterated_users = []
+        job_iterated_users = IteratedUsers(max_in_memory=MAX_ITERATED_USERS_IN_MEMORY)
+        followed_by_script = unfollow_restriction in [
+            UnfollowRestriction.FOLLOWED_BY_SCRIPT,
+            UnfollowRestriction.FOLLOWED_BY_SCRIPT_NON_FOLLOWERS,
+        ]
+        if followed_by_script:
+            pending_candidates = storage.build_unfollow_index(unfollow_delay)
+            logger.info(
+                f"{len(pending_candidates)} users followed by this bot can be unfollowed."
+            )
+            if not pending_candidates:
+                return
         # screen_dimensions = device.get_info()["displayWidth"]
         list_view = device.find(
             resourceId=self.ResourceID.LIST,
@@ -325,15 +337,19 @@ class ActionUnfollowFollowers(Plugin):
                 logger.info("Reached skip limit. Stop unfollowing.")
                 break
             start = time.time()
-            screen_iterated_followings = []
+            screen_iterated_followings = IteratedUsers()
             logger.info("Iterate over visible followings.")
-            skip, n_users = inspect_current_view(user_list, std_height)
-            for idx, item in enumerate(user_list):
-                if skipped_users >= total_skip_limit:
-                    break
+            # read the whole screen from one hierarchy dump
+            user_list.wait()
+            screen_list = device.snapshot().find(
+                resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
+            )
+            skip, n_users = inspect_current_view(screen_list, std_height)
+            screen_rows = []
+            for idx, (item, screen_item) in enumerate(zip(user_list, screen_list)):
                 if idx in skip:
                     continue
-                user_info_view = item.child(index=1)
+                user_info_view = screen_item.child(index=1)
                 user_name_view = user_info_view.child(index=0).child()
                 if not user_name_view.exists():
                     logger.info(
@@ -341,20 +357,48 @@ class ActionUnfollowFollowers(Plugin):
                         extra={"color": f"{Fore.GREEN}"},
                     )
                     break
-
-                username = user_name_view.get_text()
-                screen_iterated_followings.append(username)
-                if username in job_iterated_users:
+                screen_rows.append((item, user_name_view.get_text()))
+            screen_usernames = [username for _, username in screen_rows]
+            screen_users = storage.classify_usernames(screen_usernames)
+            if followed_by_script:
+                screen_eligible = set(storage.get_unfollow_eligible(screen_usernames))
+            for item, username in screen_rows:
+                if skipped_users >= total_skip_limit:
+                    break
+                screen_iterated_followings.add(username)
+                if not job_iterated_users.add(username):
                     continue
-                job_iterated_users.append(username)
-                if storage.is_user_in_whitelist(username):
+                if followed_by_script:
+                    pending_candidates.discard(username)
+                user = screen_users[username]
+                if user.in_whitelist:
                     logger.info(f"@{username} is in whitelist. Skip.")
                     skipped_users += 1
                     continue
 
-                following_status = storage.get_following_status(username)
-                filtered_when, interacted_when = storage.check_user_was_interacted(
-                    username
+                following_status = user.following_status
+                if followed_by_script:
+                    if following_status == FollowingStatus.NOT_IN_LIST:
+                        logger.info(
+                            f"@{username} has not been followed by this bot. Skip."
+                        )
+                        skipped_users += 1
+                        continue
+                    elif following_status == FollowingStatus.NONE:
+                        logger.info(
+                            f"@{username} has not been followed by this bot. Skip. (but it was in the list)"
+                        )
+                        skipped_users += 1
+                        continue
+                    elif username not in screen_eligible:
+                        logger.info(
+                            f"@{username} has been followed less then {unfollow_delay} days ago. Skip."
+                        )
+                        continue
+
+                filtered_when, interacted_when = (
+                    user.filtered_when,
+                    user.interacted_when,
                 )
                 if following_status == FollowingStatus.UNFOLLOWED:
                     logger.warning(
@@ -374,32 +418,6 @@ class ActionUnfollowFollowers(Plugin):
                     if not can_recheck:
                         continue
 
-                if unfollow_restriction in [
-                    UnfollowRestriction.FOLLOWED_BY_SCRIPT,
-                    UnfollowRestriction.FOLLOWED_BY_SCRIPT_NON_FOLLOWERS,
-                ]:
-
-                    if following_status == FollowingStatus.NOT_IN_LIST:
-                        logger.info(
-                            f"@{username} has not been followed by this bot. Skip."
-                        )
-                        skipped_users += 1
-                        continue
-                    elif following_status == FollowingStatus.NONE:
-                        logger.info(
-                            f"@{username} has not been followed by this bot. Skip. (but it was in the list)"
-                        )
-                        skipped_users += 1
-                        continue
-                    elif not storage.can_be_unfollowed(
-                        interacted_when,
-                        unfollow_delay,
-                    ):
-                        logger.info(
-                            f"@{username} has been followed less then {unfollow_delay} days ago. Skip."
-                        )
-                        continue
-
                 if unfollow_restriction in [
                     UnfollowRestriction.ANY,
                     UnfollowRestriction.FOLLOWED_BY_SCRIPT,
@@ -447,6 +465,12 @@ class ActionUnfollowFollowers(Plugin):
             logger.debug(
                 f"Iterated {len(screen_iterated_followings)} followings in {end - start:.2} seconds."
             )
+            if followed_by_script and not pending_candidates:
+                logger.info(
+                    "All the users which can be unfollowed have been checked, finish.",
+                    extra={"color": f"{Fore.GREEN}"},
+                )
+                return
 
             if screen_iterated_followings != prev_screen_iterated_followings:
                 prev_screen_iterated_followings = screen_iterated_followings
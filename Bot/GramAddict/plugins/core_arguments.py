@@ -165,7 +165,7 @@ class CoreArguments(Plugin):
             {
                 "arg": "--can-recheck-after",
                 "nargs": None,
-                "help": "amount of hours that have to pass from the last check",
+                "help": "amount of hours that have to pass from the last check, a profile rejected by the filters isn't opened again before",
                 "metavar": "24",
                 "default": None,
             },
@@ -221,6 +221,30 @@ class CoreArguments(Plugin):
                 "help": "enable debug logging",
                 "action": "store_true",
             },
+            {
+                "arg": "--rpc-stats",
+                "help": "measure the latency of the device calls, the summary is saved in rpc_stats.json at the end of the session",
+                "action": "store_true",
+            },
+            {
+                "arg": "--events",
+                "nargs": None,
+                "help": 'write the bot events (session start/finish, profile, limits, crashes, sleeping, jobs) as json lines in a file, or in a file descriptor opened by the parent process with "fd:N"',
+                "metavar": "events.jsonl",
+                "default": None,
+            },
+            {
+                "arg": "--import-profile",
+                "help": "at startup, print how long importing every package of the bot takes",
+                "action": "store_true",
+            },
+            {
+                "arg": "--replay",
+                "nargs": None,
+                "help": "run the enabled jobs on the hierarchy dumps of a folder described by its scenario.json instead of a phone, then print how long they took",
+                "metavar": "dumps_folder",
+                "default": None,
+            },
             {
                 "arg": "--screen-record",
                 "help": "enable screen recording for debugging",
@@ -355,6 +379,13 @@ class CoreArguments(Plugin):
                 "help": "disable the using of filters without have to remove/rename the json file",
                 "action": "store_true",
             },
+            {
+                "arg": "--storage-backend",
+                "nargs": None,
+                "help": "where to store the interacted users: json (default) or sqlite, interacted_users.json is migrated on the first sqlite run",
+                "metavar": "sqlite",
+                "default": "json",
+            },
             {
                 "arg": "--total-crashes-limit",
                 "nargs": None,
@@ -379,6 +410,13 @@ class CoreArguments(Plugin):
                 "help": "count as a crash if the app crashes/loses view",
                 "action": "store_true",
             },
+            {
+                "arg": "--crashes-to-keep",
+                "nargs": None,
+                "help": "number of crash archives kept in the crashes folder, the older ones are deleted, 20 by default",
+                "metavar": "20",
+                "default": "20",
+            },
             {
                 "arg": "--skipped-posts-limit",
                 "nargs": None,
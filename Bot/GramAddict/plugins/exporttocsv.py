@@ -1,6 +1,48 @@
 import csv
 import json
+import logging
+import os
+import sys
+from array import array
+from datetime import datetime, timedelta
+
+from atomicwrites import atomic_write
+
+from GramAddict.core.json_stream import items_since
 from GramAddict.core.plugin_loader import Plugin
+from GramAddict.core.report import session_totals
+from GramAddict.core.storage import ACCOUNTS, FILENAME_SESSIONS
+
+logger = logging.getLogger(__name__)
+
+FIELDNAMES = [
+    "start",
+    "finish",
+    "likes",
+    "watched",
+    "followed",
+    "unfollowed",
+    "comments",
+    "pm_sent",
+    "followers",
+    "following",
+]
+# typecodes of the columnar export: timestamps in microseconds, counters in 32 bit
+COLUMN_TYPES = {"start": "q", "finish": "q"}
+COLUMN_DEFAULT_TYPE = "i"
+FILENAME_EXPORT_STATE = "csv_report.json"
+COLUMNS_FOLDER = "session_data_columns"
+FILENAME_COLUMNS_SCHEMA = "schema.json"
+WRITE_BUFFER = 1024 * 1024
+EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp_us(value) -> int:
+    try:
+        return (datetime.fromisoformat(value) - EPOCH) // timedelta(microseconds=1)
+    except (TypeError, ValueError):
+        return -1
+
 
 class CSVReportPlugin(Plugin):
     """Outputs session data to a CSV file"""
@@ -11,39 +53,106 @@ class CSVReportPlugin(Plugin):
         self.arguments = [
             {
                 "arg": "--csv-report",
-                "help": "at the end of every session write a report to a CSV file",
+                "help": "at the end of every session append the new sessions to a CSV file",
                 "action": "store_true",
-                "operation": True,
-            }
+                "operation": False,
+                "analytics": True,
+            },
+            {
+                "arg": "--csv-report-columnar",
+                "help": f"with csv-report, also append the sessions to one binary column per field in the account folder ({COLUMNS_FOLDER})",
+                "action": "store_true",
+            },
         ]
 
-    def run(self, config, plugin, followers_now, following_now, time_left):
-        # Get the username from the config.
-        username = config.args.username
-        print(f'Username: {username}')  # Print the username for debugging.
-
-        # Define the name of the CSV file.
-        filename = f'{username}_session_data.csv'
-        print(f'Filename: {filename}')  # Print the filename for debugging.
+    def run(self, config, plugin, parameters):
+        username = config.get("username")
+        if username is None:
+            logger.error("You have to specify an username for exporting the sessions!")
+            return
+        account_path = os.path.join(ACCOUNTS, username)
+        filename = f"{username}_session_data.csv"
+        state_path = os.path.join(account_path, FILENAME_EXPORT_STATE)
+        state = self._load_state(state_path, filename)
 
-        # Define the fieldnames for the CSV file.
-        fieldnames = ['start', 'finish', 'likes', 'watched', 'followed', 'unfollowed', 'comments', 'pm_sent', 'followers', 'following']
+        # only the sessions after the last exported one, read from the end of sessions.json
+        rows = []
+        for session in items_since(
+            os.path.join(account_path, FILENAME_SESSIONS),
+            "start_time",
+            state.get("last_start_time"),
+        ):
+            if session.get("id") == state.get("last_session_id"):
+                continue
+            state["last_session_id"] = session.get("id")
+            state["last_start_time"] = session.get("start_time")
+            try:
+                rows.append(session_totals(session))
+            except ValueError as e:
+                logger.error(f"{e} Skip.")
+        if not rows:
+            logger.info("There isn't any new session to export.")
+            return
 
-        # Load the session data from the JSON file.
-        with open(f"accounts/{username}/sessions.json") as json_data:
-            sessions = json.load(json_data)
-        print(f'Sessions: {sessions}')  # Print the sessions data for debugging.
-
-        # Open the CSV file in append mode.
-        with open(filename, 'a', newline='') as csvfile:
-            # Create a CSV writer.
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            # If the file is empty, write the header.
+        with open(filename, "a", newline="", buffering=WRITE_BUFFER) as csvfile:
+            writer = csv.DictWriter(
+                csvfile, fieldnames=FIELDNAMES, extrasaction="ignore"
+            )
             if csvfile.tell() == 0:
                 writer.writeheader()
+            writer.writerows(rows)
+        if config.get("csv-report-columnar", False):
+            state["columnar_rows"] = self._append_columns(
+                os.path.join(account_path, COLUMNS_FOLDER),
+                rows,
+                state.get("columnar_rows", 0),
+            )
+        with atomic_write(state_path, overwrite=True, encoding="utf-8") as outfile:
+            json.dump(state, outfile, indent=4)
+        logger.info(f"{len(rows)} new session(s) exported in {filename}.")
+
+    @staticmethod
+    def _load_state(state_path: str, filename: str) -> dict:
+        if os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as json_file:
+                return json.load(json_file)
+        state = {}
+        if os.path.exists(filename):
+            # exported before we kept the state, the last row is the last exported session
+            last_row = None
+            with open(filename, newline="") as csvfile:
+                for last_row in csv.DictReader(csvfile):
+                    pass
+            if last_row is not None:
+                state["last_start_time"] = last_row["start"]
+        return state
 
-            # Write each session to the CSV file.
-            for session in sessions:
-                writer.writerow(session)
-            print('CSV file written.')  # Print a message when the CSV file has been written.
+    @staticmethod
+    def _append_columns(path: str, rows: list, exported_rows: int) -> int:
+        """
+        Appends the rows to one little-endian file per field (readable with
+        numpy.fromfile), returns the number of rows in the columns.
+        """
+        os.makedirs(path, exist_ok=True)
+        schema = {}
+        for field in FIELDNAMES:
+            typecode = COLUMN_TYPES.get(field, COLUMN_DEFAULT_TYPE)
+            column = array(typecode)
+            if field in COLUMN_TYPES:
+                column.extend(_timestamp_us(row[field]) for row in rows)
+            else:
+                column.extend(int(row[field]) for row in rows)
+            if sys.byteorder == "big":
+                column.byteswap()
+            column_path = os.path.join(path, f"{field}.bin")
+            with open(column_path, "ab") as column_file:
+                # drop what an interrupted export may have written after the last row
+                column_file.truncate(exported_rows * column.itemsize)
+                column.tofile(column_file)
+            schema[field] = f"<i{column.itemsize}"
+        rows_count = exported_rows + len(rows)
+        with atomic_write(
+            os.path.join(path, FILENAME_COLUMNS_SCHEMA), overwrite=True, encoding="utf-8"
+        ) as outfile:
+            json.dump({"rows": rows_count, "columns": schema}, outfile, indent=4)
+        return rows_count
@@ -2,11 +2,11 @@ import logging
 from functools import partial
 from random import seed
 
-import emoji
 from colorama.ansi import Fore
 
 from GramAddict.core.decorators import run_safely
 from GramAddict.core.handle_sources import handle_posts
+from GramAddict.core.imports import lazy_import
 from GramAddict.core.interaction import (
     interact_with_user,
     is_follow_limit_reached_for_source,
@@ -14,6 +14,8 @@ from GramAddict.core.interaction import (
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.utils import get_value, init_on_things, sample_sources
 
+emoji = lazy_import("emoji")
+
 logger = logging.getLogger(__name__)
 
 # Script Initialization
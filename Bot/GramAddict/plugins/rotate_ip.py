@@ -1,10 +1,10 @@
 import logging
 import re
-import time
 from subprocess import PIPE, run
 
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.resources import AndroidElements
+from GramAddict.core.utils import sleep
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class RotateIp(Plugin):
 
     def get_ip(self):
         ip = None
-        time.sleep(5)
+        sleep(5)
         output = self._execute_cmd(self.rmnet0)
         if output:
             regex = r"inet (?P<ip>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
@@ -48,7 +48,7 @@ class RotateIp(Plugin):
         logger.debug("Switch to airplane mode")
         switcher.click()
         logger.debug("Wait for 5 seconds...")
-        time.sleep(5)
+        sleep(5)
         logger.debug("Switch back")
         switcher.click()
         new_ip = self.get_ip()
@@ -1,24 +1,19 @@
-import json
-import csv
 import logging
-import sys
+import os
 from datetime import datetime, timedelta
 from textwrap import dedent
 
-import requests
 import yaml
 from colorama import Fore, Style
 
+from GramAddict.core.imports import lazy_import
 from GramAddict.core.plugin_loader import Plugin
+from GramAddict.core.report import load_daily_summary
+from GramAddict.core.storage import ACCOUNTS
 
-logger = logging.getLogger(__name__)
+requests = lazy_import("requests")
 
-try:
-    import pandas as pd
-except ImportError:
-    logger.warning(
-        "If you want to use telegram_reports, please type in console: 'pip3 install gramaddict[telegram-reports]'"
-    )
+logger = logging.getLogger(__name__)
 
 
 class TelegramReports(Plugin):
@@ -43,12 +38,6 @@ class TelegramReports(Plugin):
         following_now = parameters["following_now"]
         time_left = None
         username = config.get("username")
-        modulename = "pandas"
-        if modulename not in sys.modules:
-            logger.error(
-                f"You can't use {plugin} without installing {modulename}. Type that in console: 'pip3 install gramaddict[telegram-reports]'"
-            )
-            return
 
         def telegram_bot_sendtext(text):
             with open(
@@ -75,177 +64,41 @@ class TelegramReports(Plugin):
         if username is None:
             logger.error("You have to specify an username for getting reports!")
             return None
-        with open(f"accounts/{username}/sessions.json") as json_data:
-            activity = json.load(json_data)
-
-        aggActivity = []
-        for session in activity:
-            try:
-                id = session["id"]
-                start = session["start_time"]
-                finish = session["finish_time"]
-                followed = session.get("total_followed", 0)
-                unfollowed = session.get("total_unfollowed", 0)
-                likes = session.get("total_likes", 0)
-                watched = session.get("total_watched", 0)
-                comments = session.get("total_comments", 0)
-                pm_sent = session.get("total_pm", 0)
-                followers = int(session.get("profile", 0).get("followers", 0))
-                following = int(session.get("profile", 0).get("following", 0))
-                aggActivity.append(
-                    [
-                        start,
-                        finish,
-                        likes,
-                        watched,
-                        followed,
-                        unfollowed,
-                        comments,
-                        pm_sent,
-                        followers,
-                        following,
-                    ]
-                )
-            except TypeError:
-                logger.error(f"The session {id} has malformed data, skip.")
-                continue
-
-        df = pd.DataFrame(
-            aggActivity,
-            columns=[
-                "start",
-                "finish",
-                "likes",
-                "watched",
-                "followed",
-                "unfollowed",
-                "comments",
-                "pm_sent",
-                "followers",
-                "following",
-            ],
-        )
-        df["date"] = df.loc[:, "start"].str[:10]
-        df["duration"] = pd.to_datetime(df["finish"], errors="coerce") - pd.to_datetime(
-            df["start"], errors="coerce"
-        )
-        df["duration"] = df["duration"].dt.total_seconds() / 60
+        stats = load_daily_summary(os.path.join(ACCOUNTS, username)).stats()
+        if stats is None:
+            logger.error("There isn't any session to report yet!")
+            return None
+        last = stats["last_session"]
+        today = stats["today"]
+        weekly = stats["weekly_average"]
+        gained = stats["followers_gained"]
 
         if time_left is not None:
             timeString = f'Next session will start at: {(datetime.now()+ timedelta(seconds=time_left)).strftime("%H:%M:%S (%Y/%m/%d)")}.'
         else:
             timeString = "There is no new session planned!"
 
-        dailySummary = df.groupby(by="date").agg(
-            {
-                "likes": "sum",
-                "watched": "sum",
-                "followed": "sum",
-                "unfollowed": "sum",
-                "comments": "sum",
-                "pm_sent": "sum",
-                "followers": "max",
-                "following": "max",
-                "duration": "sum",
-            }
-        )
-        if len(dailySummary.index) > 1:
-            dailySummary["followers_gained"] = dailySummary["followers"].astype(
-                int
-            ) - dailySummary["followers"].astype(int).shift(1)
-        else:
+        if stats["first_day"]:
             logger.info(
                 "First day of botting eh? Stats for the first day are meh because we don't have enough data to track how many followers you earned today from the bot activity."
             )
-            dailySummary["followers_gained"] = dailySummary["followers"].astype(int)
-        dailySummary.dropna(inplace=True)
-        dailySummary["followers_gained"] = dailySummary["followers_gained"].astype(int)
-        dailySummary["duration"] = dailySummary["duration"].astype(int)
-        numFollowers = int(dailySummary["followers"].iloc[-1])
+        numFollowers = today["followers"]
         n = 1
         milestone = ""
         try:
             for x in range(10):
                 if numFollowers in range(x * 1000, n * 1000):
-                    milestone = f"• {str(int(((n * 1000 - numFollowers)/dailySummary['followers_gained'].tail(7).mean())))} days until {n}k!"
+                    milestone = f"• {str(int(((n * 1000 - numFollowers)/weekly['followers_gained'])))} days until {n}k!"
                     break
                 n += 1
-        except OverflowError:
+        except (OverflowError, ZeroDivisionError):
             logger.info("Not able to get milestone ETA..")
-            # Define the name of the CSV file.
-        # Get the username from the config.
-        username = config.get("username")
-        print(f'Username: {username}')  # Print the username for debugging.
-
-        # Define the name of the CSV file.
-        filename = f'accounts/{username}/session_data.csv'
-        print(f'Filename: {filename}')  # Print the filename for debugging.
-
-        # Define the fieldnames for the CSV file.
-        fieldnames = ['start', 'finish', 'likes', 'watched', 'followed', 'unfollowed', 'comments', 'pm_sent', 'followers', 'following']
-
-        # Load the session data from the JSON file.
-        with open(f"accounts/{username}/sessions.json") as json_data:
-            activity = json.load(json_data)
-        # Load the timestamp of the last session that was written to the CSV file.
-        try:
-            with open('last_session_timestamp.txt', 'r') as f:
-                last_session_timestamp = f.read().strip()
-        except FileNotFoundError:
-            last_session_timestamp = ''
-
-        # Open the CSV file in append mode.
-        with open(filename, 'a', newline='') as csvfile:
-            # Create a CSV writer.
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            # If the file is empty, write the header.
-            if csvfile.tell() == 0:
-                writer.writeheader()
-
-            # Write each session to the CSV file.
-            for session in activity:
-                try:
-                    start = session["start_time"]
-                    finish = session["finish_time"]
-                    followed = session.get("total_followed", 0)
-                    unfollowed = session.get("total_unfollowed", 0)
-                    likes = session.get("total_likes", 0)
-                    watched = session.get("total_watched", 0)
-                    comments = session.get("total_comments", 0)
-                    pm_sent = session.get("total_pm", 0)
-                    followers = int(session.get("profile", 0).get("followers", 0))
-                    following = int(session.get("profile", 0).get("following", 0))
-
-                    filtered_session = {
-                        'start': start,
-                        'finish': finish,
-                        'likes': likes,
-                        'watched': watched,
-                        'followed': followed,
-                        'unfollowed': unfollowed,
-                        'comments': comments,
-                        'pm_sent': pm_sent,
-                        'followers': followers,
-                        'following': following
-                    }
-
-                    writer.writerow(filtered_session)
-                except TypeError:
-                    logger.error(f"The session {id} has malformed data, skip.")
-                    continue
-
-            print('CSV file written.')  # Print a message when the CSV file has been written. 
-        # Store the timestamp of the last session that was written to the CSV file.
-        with open('last_session_timestamp.txt', 'w') as f:
-            f.write(activity[-1]['start_time'])
-
 
         def undentString(string):
             return dedent(string[1:])[:-1]
 
-        followers_before = int(df["followers"].iloc[-1])
-        following_before = int(df["following"].iloc[-1])
+        followers_before = last["followers"]
+        following_before = last["following"]
         statString = f"""
                 *Stats for {username}*:
 
@@ -254,38 +107,38 @@ class TelegramReports(Plugin):
                 • {following_now} following ({following_now - following_before:+})
 
                 *🤖 Last session actions*
-                • {str(df["duration"].iloc[-1].astype(int))} minutes of botting
-                • {str(df["likes"].iloc[-1])} likes
-                • {str(df["followed"].iloc[-1])} follows
-                • {str(df["unfollowed"].iloc[-1])} unfollows
-                • {str(df["watched"].iloc[-1])} stories watched
-                • {str(df["comments"].iloc[-1])} comments done
-                • {str(df["pm_sent"].iloc[-1])} PM sent
+                • {last["duration"]} minutes of botting
+                • {last["likes"]} likes
+                • {last["followed"]} follows
+                • {last["unfollowed"]} unfollows
+                • {last["watched"]} stories watched
+                • {last["comments"]} comments done
+                • {last["pm_sent"]} PM sent
 
                 *📅 Today's total actions*
-                • {str(dailySummary["duration"].iloc[-1])} minutes of botting
-                • {str(dailySummary["likes"].iloc[-1])} likes
-                • {str(dailySummary["followed"].iloc[-1])} follows
-                • {str(dailySummary["unfollowed"].iloc[-1])} unfollows
-                • {str(dailySummary["watched"].iloc[-1])} stories watched
-                • {str(dailySummary["comments"].iloc[-1])} comments done
-                • {str(dailySummary["pm_sent"].iloc[-1])} PM sent
+                • {today["duration"]} minutes of botting
+                • {today["likes"]} likes
+                • {today["followed"]} follows
+                • {today["unfollowed"]} unfollows
+                • {today["watched"]} stories watched
+                • {today["comments"]} comments done
+                • {today["pm_sent"]} PM sent
 
                 *📈 Trends*
-                • {str(dailySummary["followers_gained"].iloc[-1])} new followers today
-                • {str(dailySummary["followers_gained"].tail(3).sum())} new followers past 3 days
-                • {str(dailySummary["followers_gained"].tail(7).sum())} new followers past week
+                • {gained[1]} new followers today
+                • {gained[3]} new followers past 3 days
+                • {gained[7]} new followers past week
                 {milestone if not "" else ""}
 
                 *🗓 7-Day Average*
-                • {str(round(dailySummary["followers_gained"].tail(7).mean(), 1))} followers / day
-                • {str(int(dailySummary["likes"].tail(7).mean()))} likes
-                • {str(int(dailySummary["followed"].tail(7).mean()))} follows
-                • {str(int(dailySummary["unfollowed"].tail(7).mean()))} unfollows
-                • {str(int(dailySummary["watched"].tail(7).mean()))} stories watched
-                • {str(int(dailySummary["comments"].tail(7).mean()))} comments done
-                • {str(int(dailySummary["pm_sent"].tail(7).mean()))} PM sent
-                • {str(int(dailySummary["duration"].tail(7).mean()))} minutes of botting
+                • {weekly["followers_gained"]} followers / day
+                • {weekly["likes"]} likes
+                • {weekly["followed"]} follows
+                • {weekly["unfollowed"]} unfollows
+                • {weekly["watched"]} stories watched
+                • {weekly["comments"]} comments done
+                • {weekly["pm_sent"]} PM sent
+                • {weekly["duration"]} minutes of botting
             """
         try:
             r = telegram_bot_sendtext(f"{undentString(statString)}\n\n{timeString}")
@@ -7,6 +7,7 @@ from colorama import Fore, Style
 from GramAddict.core.decorators import run_safely
 from GramAddict.core.device_facade import Direction
 from GramAddict.core.interaction import _send_PM
+from GramAddict.core.iterated_users import IteratedUsers
 from GramAddict.core.navigation import nav_to_blogger
 from GramAddict.core.plugin_loader import Plugin
 from GramAddict.core.resources import ResourceID as resources
@@ -146,31 +147,43 @@ class WelcomeDmNewFollowers(Plugin):
                 skipped_fling_limit=skipped_fling_limit,
             )
             logger.info("Iterate over visible followers.")
-            screen_iterated_followers = []
+            screen_iterated_followers = IteratedUsers()
             scroll_end_detector.notify_new_page()
 
-            skip, n_users = inspect_current_view(user_list, std_height)
+            # read the whole screen from one hierarchy dump
+            user_list.wait()
+            screen_list = device.snapshot().find(
+                resourceIdMatches=self.ResourceID.USER_LIST_CONTAINER,
+            )
+            skip, n_users = inspect_current_view(screen_list, std_height)
             posts_end_detector.notify_new_page()
             try:
-                for idx, item in enumerate(user_list):
+                screen_rows = []
+                reached_end = False
+                for idx, (item, screen_item) in enumerate(zip(user_list, screen_list)):
                     if idx in skip:
                         continue
-                    user_info_view = item.child(index=1)
-                    user_name_view = user_info_view.child(index=0).child()
-                    if not user_name_view.exists():
+                    screen_name_view = screen_item.child(index=1).child(index=0).child()
+                    if not screen_name_view.exists():
                         logger.info(
                             "Next item not found: probably reached end of the screen.",
                             extra={"color": f"{Fore.GREEN}"},
                         )
-                        can_continue = False
+                        reached_end = True
+                        break
+                    user_name_view = item.child(index=1).child(index=0).child()
+                    screen_rows.append((user_name_view, screen_name_view.get_text()))
+                screen_users = storage.classify_usernames(
+                    username for _, username in screen_rows
+                )
 
-                    username = user_name_view.get_text()
-                    screen_iterated_followers.append(username)
+                for user_name_view, username in screen_rows:
+                    screen_iterated_followers.add(username)
                     scroll_end_detector.notify_username_iterated(username)
-                    if storage.is_user_in_blacklist(username):
+                    if screen_users[username].in_blacklist:
                         logger.info(f"@{username} is in blacklist. Skip.")
                     else:
-                        welcomed = storage.check_user_was_welcomed(username)
+                        welcomed = screen_users[username].welcomed
                         if welcomed:
                             skip_counter += 1
                             logger.info(
@@ -249,6 +262,8 @@ class WelcomeDmNewFollowers(Plugin):
                                 can_continue = False
                     if not can_continue:
                         break
+                if reached_end:
+                    can_continue = False
                 end = time.time()
                 logger.debug(
                     f"Iterated {len(screen_iterated_followers)} followers in {end - start:.2} seconds."
@@ -27,7 +27,7 @@ setuptools.setup(
         "spintax==1.0.4",
     ],
     extras_require={
-        "telegram-reports": ["pandas==1.2.4"],
+        "telegram-reports": [],
         "analytics": ["matplotlib==3.4.2"],
     },
     entry_points={"console_scripts": ["gramaddict = GramAddict.__main__:main"]},
@@ -0,0 +1,15 @@
+import threading
+
+from GramAddict.core import utils
+
+
+def test_exit_doesnt_wait_for_a_stuck_archive(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(utils, "write_crash_archive", lambda **crash: release.wait())
+    monkeypatch.setattr(utils.atexit, "register", lambda *args: None)
+    archiver = utils.CrashArchiver()
+    assert archiver.submit({"crash_path": "crash"})
+
+    assert not archiver.wait(0.2)
+    release.set()
+    assert archiver.wait(5)
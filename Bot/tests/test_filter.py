@@ -0,0 +1,28 @@
+import pytest
+
+from GramAddict.core.filter import WordMatcher
+
+
+@pytest.mark.parametrize(
+    "words, text, expected",
+    [
+        (["sex"], "ſex", "sex"),
+        (["σας"], "σασ", "σας"),
+        (["σας"], "ΣΑΣ", "σας"),
+        (["ΣΑΣ"], "και σας", "ΣΑΣ"),
+        (["Straße"], "STRASSE", "Straße"),
+        (["Straße"], "straße", "Straße"),
+    ],
+)
+def test_literal_words_ignore_the_unicode_case(words, text, expected):
+    assert WordMatcher(words).search(text) == expected
+
+
+def test_substrings_ignore_the_unicode_case():
+    assert WordMatcher(["σας"], whole_words=False).find_all("xΣΑΣx") == ["σας"]
+
+
+def test_whole_words_and_expressions():
+    matcher = WordMatcher(["cat", "do+g"])
+    assert matcher.find_all("Doooog and CAT") == ["cat", "do+g"]
+    assert matcher.search("cats") is None
@@ -0,0 +1,40 @@
+from GramAddict.core.hierarchy_snapshot import HierarchySnapshot
+
+DUMP = """<hierarchy rotation="0">
+  <node resource-id="list" class="android.widget.ListView" bounds="[0,0][100,200]">
+    <node resource-id="row" class="android.widget.LinearLayout" bounds="[0,0][100,100]">
+      <node resource-id="name" class="android.widget.TextView" text="alice" bounds="[0,0][50,100]" />
+    </node>
+    <node resource-id="row" class="android.widget.LinearLayout" bounds="[0,100][100,200]">
+      <node resource-id="name" class="android.widget.TextView" text="bob" bounds="[0,100][50,200]" />
+      <node resource-id="follow" class="android.widget.Button" text="Follow" bounds="[50,100][100,200]" />
+    </node>
+  </node>
+</hierarchy>"""
+
+
+def test_scoped_child_keeps_the_equality_selectors():
+    snapshot = HierarchySnapshot(DUMP)
+    first_row = snapshot.find(resourceId="row")
+    assert not first_row.child(resourceId="follow").exists()
+    assert not first_row.child(text="Follow").exists()
+    assert not first_row.child(className="android.widget.Button").exists()
+    assert first_row.child(resourceId="name").get_text() == "alice"
+
+
+def test_child_of_the_second_row():
+    snapshot = HierarchySnapshot(DUMP)
+    second_row = snapshot.find(resourceId="row", index=1)
+    assert second_row.child(resourceId="name").get_text() == "bob"
+    assert second_row.child(resourceId="follow").get_text() == "Follow"
+
+
+def test_sibling_and_relative_views():
+    snapshot = HierarchySnapshot(DUMP)
+    bob = snapshot.find(text="bob")
+    assert bob.sibling(resourceId="follow").get_text() == "Follow"
+    assert not snapshot.find(text="alice").sibling(resourceId="follow").exists()
+    assert bob.right(resourceId="follow").get_text() == "Follow"
+    assert not bob.left(resourceId="follow").exists()
+    assert snapshot.find(text="alice").down(resourceId="name").get_text() == "bob"
+    assert bob.up(resourceId="name").get_text() == "alice"
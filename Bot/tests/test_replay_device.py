@@ -0,0 +1,110 @@
+import json
+from argparse import Namespace
+
+import pytest
+
+from GramAddict.core import filter, utils
+from GramAddict.core.replay_device import FILENAME_SCENARIO, ReplayDevice, replay_jobs
+
+SEARCH = """<hierarchy rotation="0">
+  <node resource-id="search" class="android.widget.EditText" text="" bounds="[0,0][100,50]" />
+  <node resource-id="result" class="android.widget.TextView" text="alice" bounds="[0,50][100,100]" />
+</hierarchy>"""
+PROFILE = """<hierarchy rotation="0">
+  <node resource-id="name" class="android.widget.TextView" text="alice" bounds="[0,0][100,50]" />
+</hierarchy>"""
+SCENARIO = {
+    "start": "search",
+    "screens": {
+        "search": {
+            "file": "search.xml",
+            "click": [{"resourceId": "result", "to": "profile"}],
+        },
+        "profile": {"file": "profile.xml", "back": "search"},
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def config(monkeypatch):
+    monkeypatch.setattr(utils, "args", Namespace(speed_multiplier=1), raising=False)
+
+
+def make_device(tmp_path) -> ReplayDevice:
+    write_dumps(tmp_path)
+    return ReplayDevice(SCENARIO, str(tmp_path))
+
+
+def write_dumps(path) -> None:
+    path.mkdir(exist_ok=True)
+    (path / "search.xml").write_text(SEARCH, encoding="utf-8")
+    (path / "profile.xml").write_text(PROFILE, encoding="utf-8")
+    (path / FILENAME_SCENARIO).write_text(json.dumps(SCENARIO), encoding="utf-8")
+
+
+def test_typed_text_is_not_kept_by_the_screen(tmp_path):
+    device = make_device(tmp_path)
+    try:
+        search = device.find(resourceId="search")
+        search.set_text("alice")
+        assert device.find(resourceId="search").get_text() == "alice"
+        device.find(resourceId="result").click()
+        device.back()
+        assert device.find(resourceId="search").get_text() == ""
+        assert device.screen.find(resourceId="search").get_text() == ""
+    finally:
+        device.close()
+
+
+def test_relative_views(tmp_path):
+    device = make_device(tmp_path)
+    try:
+        search = device.find(resourceId="search")
+        assert search.down(resourceId="result").get_text() == "alice"
+        assert search.sibling(resourceId="result").get_text() == "alice"
+        assert search.down(resourceId="result").viewV2 is not None
+        assert search.up(resourceId="result").viewV2 is None
+    finally:
+        device.close()
+
+
+class OpenAliceProfile:
+    def run(self, device, configs, storage, sessions, profile_filter, plugin):
+        device.find(resourceId="search").set_text("alice")
+        device.find(resourceId="result").click()
+
+
+def test_replay_jobs_runs_the_plugin_on_the_dumps(tmp_path, monkeypatch):
+    write_dumps(tmp_path / "dumps")
+    limits = (
+        "total_likes_limit",
+        "total_follows_limit",
+        "total_unfollows_limit",
+        "total_comments_limit",
+        "total_pm_limit",
+        "total_watches_limit",
+        "total_successful_interactions_limit",
+        "total_interactions_limit",
+        "total_scraped_limit",
+        "total_crashes_limit",
+    )
+    configs = Namespace(
+        app_id="com.instagram.android",
+        username="me",
+        actions={"open-alice": OpenAliceProfile()},
+        actions_enabled=["open-alice"],
+        args=Namespace(
+            storage_backend=None,
+            disable_filters=True,
+            **{limit: None for limit in limits},
+        ),
+    )
+    monkeypatch.setattr(filter, "configs", configs, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    stats = replay_jobs(configs, "dumps")
+
+    assert list(stats["jobs"]) == ["open-alice"]
+    assert stats["transitions"] == 1
+    assert stats["calls"]["set_text"] == 1
+    assert not (tmp_path / "accounts").exists()
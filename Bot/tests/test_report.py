@@ -0,0 +1,36 @@
+import json
+import os
+
+from GramAddict.core.report import _sessions_size, update_daily_summary
+from GramAddict.core.storage import FILENAME_SESSIONS
+
+
+def session(index):
+    return {
+        "id": f"session-{index}",
+        "start_time": f"2023-05-0{index} 10:00:00.000000",
+        "finish_time": f"2023-05-0{index} 10:30:00.000000",
+        "total_likes": index,
+        "profile": {"followers": 100 + index, "following": 50},
+    }
+
+
+def persist(account_path, sessions):
+    with open(os.path.join(account_path, FILENAME_SESSIONS), "w") as outfile:
+        json.dump(sessions, outfile, indent=4)
+
+
+def test_sessions_persisted_without_the_summary_are_counted(tmp_path):
+    account_path = str(tmp_path)
+    size = _sessions_size(account_path)
+    persist(account_path, [session(1)])
+    update_daily_summary(account_path, [session(1)], size)
+    # a crash saves sessions.json but not daily_summary.json
+    persist(account_path, [session(1), session(2)])
+
+    size = _sessions_size(account_path)
+    persist(account_path, [session(1), session(2), session(3)])
+    report = update_daily_summary(account_path, [session(3)], size)
+
+    assert report.sessions == 3
+    assert sorted(report.days) == ["2023-05-01", "2023-05-02", "2023-05-03"]
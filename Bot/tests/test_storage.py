@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from GramAddict.core.filter import SkipReason
+from GramAddict.core.storage import Storage
+
+
+class Profile:
+    def __init__(self):
+        self.datetime = str(datetime.now())
+        self.is_restricted = True
+        self.follow_button_text = None
+
+
+def test_rejections_of_other_filters_are_rechecked(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    storage = Storage("me")
+    storage.filters_hash = "old filters"
+    storage.add_filter_user("alice", Profile(), SkipReason.RESTRICTED)
+    assert storage.get_filter_rejection("alice", None) is not None
+
+    storage.filters_hash = "new filters"
+    assert storage.get_filter_rejection("alice", None) is None
+    storage.close()
@@ -0,0 +1,67 @@
+import pytest
+
+from GramAddict.core.storage_backends import (
+    JOURNAL_SUFFIX,
+    JsonUsersBackend,
+    SqliteUsersBackend,
+    migrate_json_to_sqlite,
+)
+
+USERS = {
+    "followed": {"following_status": "followed", "last_interaction": "2023-05-01"},
+    "requested": {"following_status": "requested", "last_interaction": "2023-05-02"},
+    "unfollowed": {"following_status": "unfollowed", "last_interaction": "2023-05-03"},
+    "scraped": {"following_status": "scraped", "last_interaction": "2023-05-04"},
+    "legacy": {"followed": True, "last_interaction": "2023-05-05"},
+    "legacy_none": {
+        "following_status": "none",
+        "followed": True,
+        "last_interaction": "2023-05-06",
+    },
+    "interacted": {"following_status": "none", "last_interaction": "2023-05-07"},
+    "welcomed": {"welcomed": True, "last_interaction": "2023-05-08"},
+}
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "json":
+        users = JsonUsersBackend(str(tmp_path / "interacted_users.json"))
+    else:
+        users = SqliteUsersBackend(str(tmp_path / "interacted_users.db"))
+    for username, user in USERS.items():
+        users.save(username, user)
+    yield users
+    users.close()
+
+
+def test_followed_times_has_every_user_followed_by_the_bot(backend):
+    assert sorted(backend.followed_times(), key=lambda x: x[1]) == [
+        ("followed", "2023-05-01"),
+        ("requested", "2023-05-02"),
+        ("unfollowed", "2023-05-03"),
+        ("scraped", "2023-05-04"),
+        ("legacy", "2023-05-05"),
+        ("legacy_none", "2023-05-06"),
+    ]
+
+
+def test_migration_leaves_the_json_files_untouched(tmp_path):
+    json_path = str(tmp_path / "interacted_users.json")
+    users = JsonUsersBackend(json_path)
+    users.save("alice", USERS["followed"])
+    users.compact()
+    users.save("bob", USERS["requested"])
+    with open(json_path, "rb") as json_file:
+        json_before = json_file.read()
+    with open(json_path + JOURNAL_SUFFIX, "rb") as journal:
+        journal_before = journal.read()
+
+    sqlite = SqliteUsersBackend(str(tmp_path / "interacted_users.db"))
+    assert migrate_json_to_sqlite(json_path, sqlite) == 2
+    sqlite.close()
+
+    with open(json_path, "rb") as json_file:
+        assert json_file.read() == json_before
+    with open(json_path + JOURNAL_SUFFIX, "rb") as journal:
+        assert journal.read() == journal_before
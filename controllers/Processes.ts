@@ -15,15 +15,12 @@ import {
 import os from "node:os";
 import { Process } from "../helpers/classes/Process";
 import { startBotChecks } from "../helpers/Processes";
+import { callWorker, WorkerResponse } from "../helpers/Worker";
 import path from "node:path";
 import {
-  checkBotFinished,
-  checkOutputCrashes,
-  checkOutputCritical,
-  checkOutputErrors,
-  checkOutputLogs,
-  checkOutputSleeping,
-  checkOutputWarnings
+  BOT_EVENTS_FD,
+  checkBotOutput,
+  listenBotEvents
 } from "../helpers/ServerActions";
 import { Device } from "../helpers/classes/Device";
 import { DevicesList } from "../helpers/Devices";
@@ -73,20 +70,15 @@ export class Processes {
       const cmd: ChildProcessWithoutNullStreams = spawn(`${command} ${path.join(process.cwd(),
         'scripts', 'start_bot.py',)
         }`,
-        { shell: true }
-      );
-      cmd.stdin.write(JSON.stringify(_startBotData));
+        { shell: true, stdio: ["pipe", "pipe", "pipe", "pipe"] }
+      ) as ChildProcessWithoutNullStreams;
+      cmd.stdin.write(JSON.stringify({ ..._startBotData, events_fd: BOT_EVENTS_FD }));
       cmd.stdin.end();
+      const withEvents: boolean = listenBotEvents(cmd, _process, () => names.set(_process.username, _process.status));
       cmd.stdout.on("data", (chunk: string | Buffer) => {
         const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
         if (_process.result.includes(output)) return;
-        checkOutputCrashes(output, _process);
-        checkBotFinished(output, _process);
-        checkOutputWarnings(output, _process);
-        checkOutputErrors(output, _process);
-        checkOutputLogs(output, _process);
-        checkOutputSleeping(output, _process);
-        checkOutputCritical(output, _process);
+        checkBotOutput(output, _process, withEvents);
         processes.map((proc: Process) => {
           if (proc.username === _process.username) {
             proc = _process;
@@ -98,13 +90,7 @@ export class Processes {
       cmd.stderr.on("data", (chunk: string | Buffer) => {
         const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
         if (_process.result.includes(output)) return;
-        checkOutputCrashes(output, _process);
-        checkBotFinished(output, _process);
-        checkOutputWarnings(output, _process);
-        checkOutputErrors(output, _process);
-        checkOutputLogs(output, _process);
-        checkOutputSleeping(output, _process);
-        checkOutputCritical(output, _process);
+        checkBotOutput(output, _process, withEvents);
         names.set(_process.username, _process.status);
       });
       sessions.set(_process.username, _process.session);
@@ -153,20 +139,15 @@ export class Processes {
         const cmd: ChildProcessWithoutNullStreams = spawn(`${command} ${path.join(process.cwd(),
           'scripts', 'start_bot.py',)
           }`,
-          { shell: true }
-        );
+          { shell: true, stdio: ["pipe", "pipe", "pipe", "pipe"] }
+        ) as ChildProcessWithoutNullStreams;
         const _startBotData = { username: _process.username, config_name: _process.configFile };
-        cmd.stdin.write(JSON.stringify(_startBotData));
+        cmd.stdin.write(JSON.stringify({ ..._startBotData, events_fd: BOT_EVENTS_FD }));
         cmd.stdin.end();
+        const withEvents: boolean = listenBotEvents(cmd, _process, () => names.set(_process.username, _process.status));
         cmd.stderr.on("data", (chunk: string | Buffer) => {
           const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
-          checkOutputCrashes(output, _process);
-          checkBotFinished(output, _process);
-          checkOutputWarnings(output, _process);
-          checkOutputErrors(output, _process);
-          checkOutputLogs(output, _process);
-          checkOutputSleeping(output, _process);
-          checkOutputCritical(output, _process);
+          checkBotOutput(output, _process, withEvents);
           processes.map((proc: Process) => {
             if (proc.username === _process.username) {
               proc = _process;
@@ -178,13 +159,7 @@ export class Processes {
         cmd.stdout.on("data", (chunk: string | Buffer) => {
           const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
           if (_process.result.includes(output)) return;
-          checkOutputCrashes(output, _process);
-          checkBotFinished(output, _process);
-          checkOutputWarnings(output, _process);
-          checkOutputErrors(output, _process);
-          checkOutputLogs(output, _process);
-          checkOutputSleeping(output, _process);
-          checkOutputCritical(output, _process);
+          checkBotOutput(output, _process, withEvents);
           processes.map((proc: Process) => {
             if (proc.username === _process.username) {
               proc = _process;
@@ -229,20 +204,15 @@ export class Processes {
       const cmd: ChildProcessWithoutNullStreams = spawn(`${command} ${path.join(process.cwd(),
         'scripts', 'start_bot.py',)
         }`,
-        { shell: true }
-      );
+        { shell: true, stdio: ["pipe", "pipe", "pipe", "pipe"] }
+      ) as ChildProcessWithoutNullStreams;
       const _startBotData = { username: _process.username, config_name: _process.configFile };
-      cmd.stdin.write(JSON.stringify(_startBotData));
+      cmd.stdin.write(JSON.stringify({ ..._startBotData, events_fd: BOT_EVENTS_FD }));
       cmd.stdin.end();
+      const withEvents: boolean = listenBotEvents(cmd, _process, () => names.set(_process.username, _process.status));
       cmd.stderr.on("data", (chunk: string | Buffer) => {
         const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
-        checkOutputCrashes(output, _process);
-        checkBotFinished(output, _process);
-        checkOutputWarnings(output, _process);
-        checkOutputErrors(output, _process);
-        checkOutputLogs(output, _process);
-        checkOutputSleeping(output, _process);
-        checkOutputCritical(output, _process);
+        checkBotOutput(output, _process, withEvents);
         processes.map((proc: Process) => {
           if (proc.username === _process.username) {
             proc = _process;
@@ -254,13 +224,7 @@ export class Processes {
       cmd.stdout.on("data", (chunk: string | Buffer) => {
         const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
         if (_process.result.includes(output)) return;
-        checkOutputCrashes(output, _process);
-        checkBotFinished(output, _process);
-        checkOutputWarnings(output, _process);
-        checkOutputErrors(output, _process);
-        checkOutputLogs(output, _process);
-        checkOutputSleeping(output, _process);
-        checkOutputCritical(output, _process);
+        checkBotOutput(output, _process, withEvents);
         processes.map((proc: Process) => {
           if (proc.username === _process.username) {
             proc = _process;
@@ -363,23 +327,18 @@ export class Processes {
           const cmd: ChildProcessWithoutNullStreams = spawn(`${command} ${path.join(process.cwd(),
             'scripts', 'start_bot.py',)
             }`,
-            { shell: true }
-          );
+            { shell: true, stdio: ["pipe", "pipe", "pipe", "pipe"] }
+          ) as ChildProcessWithoutNullStreams;
           const _startBotData: { username: string, config_name: ConfigNames } = {
             username: _process.username,
             config_name: _process.configFile
           };
-          cmd.stdin.write(JSON.stringify(_startBotData));
+          cmd.stdin.write(JSON.stringify({ ..._startBotData, events_fd: BOT_EVENTS_FD }));
           cmd.stdin.end();
+          const withEvents: boolean = listenBotEvents(cmd, _process, () => names.set(_process.username, _process.status));
           cmd.stderr.on("data", (chunk: string | Buffer) => {
             const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
-            checkOutputCrashes(output, _process);
-            checkBotFinished(output, _process);
-            checkOutputWarnings(output, _process);
-            checkOutputErrors(output, _process);
-            checkOutputLogs(output, _process);
-            checkOutputSleeping(output, _process);
-            checkOutputCritical(output, _process);
+            checkBotOutput(output, _process, withEvents);
             processes.map((proc: Process) => {
               if (proc.username === _process.username) {
                 proc = _process;
@@ -391,13 +350,7 @@ export class Processes {
           cmd.stdout.on("data", (chunk: string | Buffer) => {
             const output = chunk.toString('utf-8').split("\n").map((line: string) => line).join("\n");
             if (_process.result.includes(output)) return;
-            checkOutputCrashes(output, _process);
-            checkBotFinished(output, _process);
-            checkOutputWarnings(output, _process);
-            checkOutputErrors(output, _process);
-            checkOutputLogs(output, _process);
-            checkOutputSleeping(output, _process);
-            checkOutputCritical(output, _process);
+            checkBotOutput(output, _process, withEvents);
             processes.map((proc: Process) => {
               if (proc.username === _process.username) {
                 proc = _process;
@@ -452,37 +405,20 @@ export class Processes {
           _process.device.battery = _battery;
         }, 200);
         const data: ServerActionSessionData = { username: _process.username, followers_now: _process.followers, following_now: _process.following };
-        const _path: string = path.join(process.cwd(), 'scripts', 'sessions.py');
-        const command: string = os.platform() === "win32" ? "python" : "python3";
-        const cmd: ChildProcessWithoutNullStreams = spawn(`${command} ${_path}`, { shell: true });
-        cmd.stdin.write(JSON.stringify(data));
-        cmd.stdin.end();
-        cmd.stdout.on("data", (data: string | Buffer) => {
-          // convert to string
-          const fData = data.toString('utf-8');
-          if (fData.includes("[ERROR] You have to run the bot at least once to generate a report!") ||
+        callWorker("sessions", JSON.stringify(data)).then((response: WorkerResponse) => {
+          const fData: string = response.output;
+          if (!response.ok ||
+            fData.includes("[ERROR] You have to run the bot at least once to generate a report!") ||
             fData.includes("[ERROR] If you want to use telegram_reports,")) {
             sessions.set(_process.username, ConfigRows);
             return;
           }
-          else {
+          try {
             const pData: ConfigRowsSkeleton = JSON.parse(fData) as ConfigRowsSkeleton;
             sessions.set(_process.username, pData);
-            return;
           }
-        });
-        cmd.stderr.on("data", (data: string | Buffer) => {
-          // convert to string
-          const fData = data.toString('utf-8');
-          if (fData.includes("[ERROR] You have to run the bot at least once to generate a report!") ||
-            fData.includes("[ERROR] If you want to use telegram_reports")) {
+          catch (e) {
             sessions.set(_process.username, ConfigRows);
-            return;
-          }
-          else {
-            const pData: ConfigRowsSkeleton = JSON.parse(fData) as ConfigRowsSkeleton;
-            sessions.set(_process.username, pData);
-            return;
           }
         });
         const session: ConfigRowsSkeleton | undefined = sessions.get(_process.username);
@@ -1,8 +1,6 @@
 import { Socket } from "socket.io";
 import { EmitTypes } from "./Types";
-import { ChildProcessWithoutNullStreams, spawn } from "node:child_process";
-import path from "node:path";
-import { transferChildProcessOutput } from "./ServerActions";
+import { transferWorkerOutput } from "./Worker";
 
 // Read Config
 export function readConfig(username: string, connection: Socket) {
@@ -10,13 +8,6 @@ export function readConfig(username: string, connection: Socket) {
     connection.emit<EmitTypes>("read-config-message", "[ERROR] Username is not valid.");
     return;
   }
-  const command: string = "python";
-  const cmd: ChildProcessWithoutNullStreams = spawn(command,
-    [path.join(process.cwd(), 'scripts', 'read_config.py')],
-    { shell: true }
-  );
-  cmd.stdin.write(username);
-  cmd.stdin.end();
-  transferChildProcessOutput(cmd, connection, "read-config-message");
+  transferWorkerOutput("read_config", username, connection, "read-config-message");
 }
 
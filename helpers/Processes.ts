@@ -3,43 +3,44 @@ import type { BotFormData, EmitTypes } from "./Types";
 import path from "path";
 import { ChildProcessWithoutNullStreams, spawn } from "node:child_process";
 import { transferChildProcessOutput } from "./ServerActions";
+import { callWorker, transferWorkerOutput, WorkerResponse } from "./Worker";
 import dayjs from "dayjs";
 import os from "node:os";
-import { readFile, writeFile } from "node:fs";
+import { readdir, stat, truncate } from "node:fs";
+import { stat as statAsync, unlink } from "node:fs/promises";
 import { Process } from "./classes/Process";
 
 // Delete Older Logs
+// The bot rotates username.log at midnight and when it's too big (see Bot/GramAddict/core/log.py),
+// so the older lines are in the username.log.N backups last written before today, or in
+// username.log if it's from another day. The backups of today's size rotations are kept.
 export function deleteOlderLogs(username: string, connection: Socket) {
-  const month: string = dayjs().format("MM");
-  const date: string = dayjs().format("DD");
-  const format: string = `[${month}/${date}`;
-  const _logPath: string = path.join(process.cwd(), 'logs', `${username}.log`)
-  // read username.log file
-  try {
-    readFile(_logPath, "utf8", (_, data) => {
-      const lines = data.split("\n");
-      const rewrite = lines.map((line: string) => {
-        return line.startsWith(format) ? line : null;
-      }).filter((l: string | null) => l !== null);
-      // // write new content to file
-      writeFile(_logPath, rewrite.length > 0 ? rewrite.join("\n") : "", (err) => {
-        if (err) {
-          console.log({ err });
-          connection.emit<EmitTypes>("delete-older-logs-message", "[ERROR] Something unexpected happened while deleting older logs !")
-          return;
-        }
-        else {
-          connection.emit<EmitTypes>("delete-older-logs-message", "Deleted older files !")
-          return;
-        }
+  const logsPath: string = path.join(process.cwd(), 'logs');
+  const logName: string = `${username}.log`;
+  const onError = (err: NodeJS.ErrnoException) => {
+    console.log({ err });
+    connection.emit<EmitTypes>("delete-older-logs-message", "[ERROR] Something unexpected happened while deleting older logs !");
+  };
+  readdir(logsPath, (err, files: string[]) => {
+    if (err) return onError(err);
+    const backups: string[] = files.filter((file: string) => file.startsWith(`${logName}.`));
+    const deleteBackups = () => Promise.all(backups.map(async (file: string) => {
+      const backupPath: string = path.join(logsPath, file);
+      const backupStats = await statAsync(backupPath);
+      if (!dayjs(backupStats.mtime).isSame(dayjs(), "day")) await unlink(backupPath);
+    }))
+      .then(() => connection.emit<EmitTypes>("delete-older-logs-message", "Deleted older files !"))
+      .catch(onError);
+    if (!files.includes(logName)) return deleteBackups();
+    stat(path.join(logsPath, logName), (err, stats) => {
+      if (err) return onError(err);
+      if (dayjs(stats.mtime).isSame(dayjs(), "day")) return deleteBackups();
+      truncate(path.join(logsPath, logName), 0, (err) => {
+        if (err) return onError(err);
+        deleteBackups();
       });
     });
-  }
-  catch (err) {
-    console.log(err);
-    connection.emit<EmitTypes>("delete-older-logs-message",)
-    return;
-  }
+  });
 }
 
 // Get Config
@@ -48,12 +49,7 @@ export function getProcessConfig(username: string, connection: Socket) {
     connection.emit<EmitTypes>("get-config-message", "[ERROR] Can not read file when username is not provided");
     return;
   }
-  const _path: string = path.join(process.cwd(), 'scripts', 'get_config.py');
-  const command: string = os.platform() === "win32" ? "python" : "python3";
-  const cmd: ChildProcessWithoutNullStreams = spawn(`${command} ${_path}`, { shell: true });
-  cmd.stdin.write(username);
-  cmd.stdin.end();
-  transferChildProcessOutput(cmd, connection, "get-config-message");
+  transferWorkerOutput("get_config", username, connection, "get-config-message");
 }
 
 // Get Process ID
@@ -87,25 +83,11 @@ export function terminateProcess(pid: string, connection: Socket) {
 
 // Start Bot Checks
 export function startBotChecks(data: BotFormData, _process: Process): void {
-  const command: string = os.platform() === "win32" ? "python" : "python3";
-  const cmd = spawn(`${command} ${path.join(process.cwd(), 'scripts', 'start_bot_checks.py')}`,
-    { shell: true });
   const { device, ...rest } = data;
-  cmd.stdin.write(JSON.stringify({ device: device._id, ...rest }));
-  cmd.stdin.end()
-  cmd.stderr.on("data", (chunk: string | Buffer) => {
-    console.log(`Stderr data : ${chunk.toString('utf-8')}`);
-  })
-  cmd.stdout.on("data", (chunk: string | Buffer) => {
-    const chunkString = chunk.toString("utf-8");
-    const fData: string = chunkString
-      .split("\n")
-      .map((line: string) => line)
-      .join("\n");
+  callWorker("start_bot_checks", JSON.stringify({ device: device._id, ...rest })).then((response: WorkerResponse) => {
+    const fData: string = response.ok ? response.output : `${response.output}${response.error}`;
+    console.log("[INFO] FINISHED.\nOK : ", response.ok);
     if (_process.result.includes(fData)) return;
     else _process.result += fData;
   });
-  cmd.on("close", (code: number | null) => {
-    console.log("[INFO] FINISHED.\nCODE : ", code);
-  });
 }
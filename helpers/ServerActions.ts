@@ -1,19 +1,89 @@
 import { ChildProcessWithoutNullStreams } from "node:child_process";
+import os from "node:os";
+import { createInterface } from "node:readline";
+import { Readable } from "node:stream";
 import { Socket } from "socket.io";
 import { EmitTypes } from "./Types";
 import { Process } from "./classes/Process";
 
-export const checkOutputSleeping = (output: string, proc: Process) => {
+// The bot writes its events on this file descriptor (--events, see Bot/GramAddict/core/log.py)
+export const BOT_EVENTS_FD = 3;
+// scripts/start_bot.py doesn't pass the events file descriptor to the bot on Windows
+export const BOT_EVENTS_SUPPORTED: boolean = os.platform() !== "win32";
+export type BotEvent = { ts: string, event: string, [field: string]: unknown };
+
+export const handleBotEvent = (botEvent: BotEvent, proc: Process) => {
+  switch (botEvent.event) {
+    case "session_start":
+      proc.status = "RUNNING";
+      proc.scheduled = false;
+      return;
+    case "session_finish":
+      proc.status = "FINISHED";
+      return;
+    case "sleeping":
+      proc.status = "WAITING";
+      return;
+    case "profile":
+      proc.followers = Number(botEvent.followers);
+      proc.following = Number(botEvent.following);
+      return;
+    case "limits":
+      proc.total_crashes = Number((botEvent.crashes as { count: number }).count);
+      return;
+    case "crashes":
+      // an exception which stops the bot counts as all the crashes allowed
+      proc.total_crashes = Number(botEvent.fatal ? botEvent.limit : botEvent.count);
+      if (botEvent.reached) proc.status = "STOPPED";
+      return;
+    default:
+      return;
+  }
+};
+
+// One json event per line, parsed once instead of matching the log lines.
+// Returns false if the bot can't write its events, the log lines are checked instead.
+export function listenBotEvents(cmd: ChildProcessWithoutNullStreams, proc: Process, onEvent: () => void): boolean {
+  const events = cmd.stdio[BOT_EVENTS_FD] as Readable | null | undefined;
+  if (!events || !BOT_EVENTS_SUPPORTED) return false;
+  createInterface({ input: events }).on("line", (line: string) => {
+    let botEvent: BotEvent;
+    try {
+      botEvent = JSON.parse(line) as BotEvent;
+    } catch (error) {
+      console.log(`Bot event : ${line}`);
+      return;
+    }
+    handleBotEvent(botEvent, proc);
+    onEvent();
+  });
+  return true;
+}
+
+// Keeps the interesting log lines in the result. The status, the profile and the
+// crashes are read from the log lines only when there are no events (withEvents).
+export const checkBotOutput = (output: string, proc: Process, withEvents: boolean) => {
+  if (!withEvents) checkOutputCrashes(output, proc);
+  checkBotFinished(output, proc, withEvents);
+  checkOutputWarnings(output, proc);
+  checkOutputErrors(output, proc, withEvents);
+  checkOutputLogs(output, proc, withEvents);
+  checkOutputSleeping(output, proc, withEvents);
+  checkOutputCritical(output, proc);
+};
+
+export const checkOutputSleeping = (output: string, proc: Process, withEvents: boolean = false) => {
   if (output.includes("INFO | Next session will start at:")) {
     proc.result += output
-    proc.status = "WAITING";
+    if (!withEvents) proc.status = "WAITING";
     return;
   }
 };
 
-export const checkOutputLogs = (output: string, proc: Process) => {
+export const checkOutputLogs = (output: string, proc: Process, withEvents: boolean = false) => {
   if (output.includes(`INFO | Hello, @${proc.username}`)) {
     proc.result += output;
+    if (withEvents) return;
     const c = output.split(" ").filter((el) => el);
     const followers = parseInt(c[8]);
     const following = parseInt(c[11]);
@@ -29,8 +99,10 @@ export const checkOutputLogs = (output: string, proc: Process) => {
   else if (output.includes("INFO | Duration")) return proc.result += output;
   else if (output.includes("INFO | You have logged out from")) return proc.result += output;
   else if (output.includes("INFO | -------- START:")) {
-    proc.status = "RUNNING";
-    proc.scheduled = false;
+    if (!withEvents) {
+      proc.status = "RUNNING";
+      proc.scheduled = false;
+    }
     return proc.result += output;
   }
   else if (output.includes("scheduled for this session")) return proc.result += output;
@@ -48,14 +120,14 @@ export const checkOutputLogs = (output: string, proc: Process) => {
   else return;
 };
 
-export const checkOutputErrors = (output: string, proc: Process) => {
+export const checkOutputErrors = (output: string, proc: Process, withEvents: boolean = false) => {
   if (output.includes("ERROR | Probably block dialog is shown")) return proc.result += output;
   else if (output.includes("ERROR | Can't unlock your screen.")) return proc.result += output;
   else if (output.includes("ERROR | Something is keeping closing IG APP. Please check your logcat to understand the reason! `adb logcat`")) return proc.result += output;
   else if (output.includes("ERROR | Cannot get followers count text")) return proc.result += output;
   else if (output.includes("ERROR | Cannot get following count text")) return proc.result += output;
   else if (output.includes("ERROR | Reached crashes limit.")) {
-    proc.status = "STOPPED";
+    if (!withEvents) proc.status = "STOPPED";
     return proc.result += output;
   }
   else return;
@@ -66,14 +138,14 @@ export const checkOutputWarnings = (output: string, proc: Process) => {
   else return;
 };
 
-export const checkBotFinished = (output: string, proc: Process) => {
+export const checkBotFinished = (output: string, proc: Process, withEvents: boolean = false) => {
   if (output.includes("INFO | -------- FINISH:")) {
-    proc.status = "FINISHED";
+    if (!withEvents) proc.status = "FINISHED";
     proc.result += output;
     return;
   }
   else if (output.includes("INFO | This bot is backed with love by me for free.")) {
-    proc.status = "FINISHED";
+    if (!withEvents) proc.status = "FINISHED";
     proc.result += output;
     return;
   }
@@ -0,0 +1,87 @@
+import { Socket } from "socket.io";
+import { ChildProcessWithoutNullStreams, spawn } from "node:child_process";
+import { createInterface } from "node:readline";
+import path from "node:path";
+import os from "node:os";
+import { EmitTypes } from "./Types";
+
+export type WorkerScript = "get_config" | "read_config" | "sessions" | "send_data_to_telegram" | "start_bot_checks";
+export type WorkerResponse = { id: number | null, ok: boolean, output: string, error?: string };
+
+// One python process for all the script calls, see scripts/worker.py
+let worker: ChildProcessWithoutNullStreams | null = null;
+let nextRequestId: number = 0;
+const pending = new Map<number, (response: WorkerResponse) => void>();
+
+// Answer the pending requests with an error, the next call starts a new worker
+function failPending(cmd: ChildProcessWithoutNullStreams, error: string) {
+  if (worker === cmd) worker = null;
+  pending.forEach((resolve, id) => resolve({ id, ok: false, output: "", error }));
+  pending.clear();
+}
+
+function startWorker(): ChildProcessWithoutNullStreams {
+  const command: string = os.platform() === "win32" ? "python" : "python3";
+  const cmd: ChildProcessWithoutNullStreams = spawn(command, [path.join(process.cwd(), 'scripts', 'worker.py')]);
+  // one json response per line, whatever the size of the chunks
+  createInterface({ input: cmd.stdout }).on("line", (line: string) => {
+    let response: WorkerResponse;
+    try {
+      response = JSON.parse(line) as WorkerResponse;
+    } catch (error) {
+      console.log(`Worker output : ${line}`);
+      return;
+    }
+    if (response.id === null) {
+      console.log(`Worker error : ${response.error}`);
+      return;
+    }
+    const resolve = pending.get(response.id);
+    if (!resolve) return;
+    pending.delete(response.id);
+    resolve(response);
+  });
+  cmd.stderr.on("data", (chunk: string | Buffer) => {
+    console.log(`Stderr data : ${chunk.toString('utf-8')}`);
+  });
+  cmd.on("close", (code: number | null) => {
+    console.log("[INFO] Python worker exited.\nCODE : ", code);
+    failPending(cmd, "[ERROR] The python worker exited.");
+  });
+  // e.g. python isn't installed (ENOENT), without a listener it would crash the server
+  cmd.on("error", (error: Error) => {
+    console.log(`[ERROR] Python worker : ${error.message}`);
+    failPending(cmd, `[ERROR] The python worker failed: ${error.message}`);
+  });
+  // e.g. EPIPE when writing to a worker which has just exited
+  cmd.stdin.on("error", (error: Error) => {
+    console.log(`[ERROR] Python worker stdin : ${error.message}`);
+    failPending(cmd, `[ERROR] The python worker failed: ${error.message}`);
+  });
+  return cmd;
+}
+
+// Send a request to the worker, it's started on the first call and restarted if it exited
+export function callWorker(script: WorkerScript, input: string): Promise<WorkerResponse> {
+  if (!worker) worker = startWorker();
+  const id: number = nextRequestId++;
+  const _worker: ChildProcessWithoutNullStreams = worker;
+  return new Promise<WorkerResponse>((resolve) => {
+    pending.set(id, resolve);
+    _worker.stdin.write(`${JSON.stringify({ id, script, input })}\n`);
+  });
+}
+
+// Same as transferChildProcessOutput, for a script run by the worker
+export function transferWorkerOutput(
+  script: WorkerScript,
+  input: string,
+  connection: Socket,
+  emitType: EmitTypes,
+) {
+  callWorker(script, input).then((response: WorkerResponse) => {
+    const output: string = response.ok ? response.output : `${response.output}${response.error}`;
+    console.log(`${emitType} -> ${output}`);
+    connection.emit<EmitTypes>(emitType, output);
+  });
+}
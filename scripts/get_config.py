@@ -4,23 +4,31 @@ import sys
 import json
 
 
-username = sys.stdin.read()
 def logger(x): return print(x, flush=True)
 
 
-if (username.strip() == "" or not username):
-    logger("Please enter a valid username.")
-    exit()
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'Bot'))
+from GramAddict.core.config import load_yaml  # noqa: E402
 
 
-iBot_path = os.path.join(os.path.dirname(
-    os.path.dirname(__file__)), 'accounts', username)
+def main(username: str):
+    if (username.strip() == "" or not username):
+        logger("Please enter a valid username.")
+        return
 
+    iBot_path = os.path.join(os.path.dirname(
+        os.path.dirname(__file__)), 'accounts', username)
 
-with open(os.path.join(iBot_path, 'config.yml'), 'r', encoding='utf-8') as stream:
     try:
-        config = json.dumps(yaml.safe_load(stream))
+        # parsed again only if the file changed since the last call of the worker
+        _, config = load_yaml(os.path.join(iBot_path, 'config.yml'))
     except yaml.YAMLError as e:
-        logger.error(e)
+        logger(f"[ERROR] {e}")
+        return
 
-    logger(config)
+    logger(json.dumps(config))
+
+
+if __name__ == "__main__":
+    main(sys.stdin.read())
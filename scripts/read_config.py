@@ -3,19 +3,27 @@ import logging
 import os
 import yaml
 
-username = sys.stdin.read()
 logger = logging.getLogger(__name__)
 
-if username == "":
-    print("Please enter a valid username.")
-    exit()
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'Bot'))
+from GramAddict.core.config import load_yaml  # noqa: E402
 
-telegramPath = os.path.join(os.path.dirname(
-    os.path.dirname(__file__)), 'accounts', username, 'config.yml')
 
-with open(telegramPath, 'r', encoding='utf-8') as configFile:
+def main(username: str):
+    if username == "":
+        print("Please enter a valid username.")
+        return
+
+    telegramPath = os.path.join(os.path.dirname(
+        os.path.dirname(__file__)), 'accounts', username, 'config.yml')
+
     try:
-        config = yaml.safe_load(configFile)
+        _, config = load_yaml(telegramPath)
         print(config)
     except yaml.YAMLError as e:
         logger.error(e)
+
+
+if __name__ == "__main__":
+    main(sys.stdin.read())
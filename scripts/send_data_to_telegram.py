@@ -7,31 +7,24 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
-username = sys.stdin.read()
-if (username == ""):
-    logger.error(
-        "Please enter a valid username.")
-    exit()
-
-
-telegramPath = os.path.join(os.path.dirname(
-    os.path.dirname(__file__)), 'accounts', username, 'telegram.yml')
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'Bot'))
+from GramAddict.core.config import load_yaml  # noqa: E402
 
 
 class SendTelegramEndSession():
 
     def run(self, username):
+        telegramPath = os.path.join(os.path.dirname(
+            os.path.dirname(__file__)), 'accounts', username, 'telegram.yml')
 
         def telegram_bot_sendtext(text):
-            with open(
-                telegramPath, "r", encoding="utf-8"
-            ) as stream:
-                try:
-                    config = yaml.safe_load(stream)
-                    bot_api_token = config.get("telegram-api-token")
-                    bot_chat_ID = config.get("telegram-chat-id")
-                except yaml.YAMLError as e:
-                    logger.error(e)
+            try:
+                _, config = load_yaml(telegramPath)
+                bot_api_token = config.get("telegram-api-token")
+                bot_chat_ID = config.get("telegram-chat-id")
+            except yaml.YAMLError as e:
+                logger.error(e)
             if bot_api_token is not None and bot_chat_ID is not None:
                 method = "sendMessage"
                 parse_mode = "markdown"
@@ -63,5 +56,14 @@ class SendTelegramEndSession():
             return logger.error(f"Telegram message failed to send. Error: {e}")
 
 
-sendTelegram = SendTelegramEndSession()
-sendTelegram.run(username)
+def main(username: str):
+    if (username == ""):
+        logger.error(
+            "Please enter a valid username.")
+        return
+    sendTelegram = SendTelegramEndSession()
+    sendTelegram.run(username)
+
+
+if __name__ == "__main__":
+    main(sys.stdin.read())
@@ -23,7 +23,18 @@ config_path = os.path.join(os.path.dirname(os.path.dirname(
 
 print(f"[INFO] Starting Bot for {data['username']}")
 command = "python" if platform.system() == "Windows" else "python3"
-output = subprocess.Popen(
-    [command, run_path, '--config',  config_path])
+bot_args = [command, run_path, '--config',  config_path]
+# the server reads the bot events from this file descriptor
+events_fd = data.get("events_fd")
+pass_fds = ()
+if events_fd is not None and platform.system() != "Windows":
+    try:
+        os.fstat(events_fd)
+    except OSError:
+        events_fd = None
+    else:
+        bot_args += ['--events', f'fd:{events_fd}']
+        pass_fds = (events_fd,)
+output = subprocess.Popen(bot_args, pass_fds=pass_fds)
 print(f"[INFO] Bot for {data['username']} started.")
 print(f"{output.stdout.read() if output.stdout else ''}")
@@ -2,8 +2,8 @@ import os
 import sys
 import json
 import collections
+import shutil
 import ruamel.yaml
-from time import sleep
 from ruamel.yaml.comments import CommentedSeq
 
 yaml = ruamel.yaml.YAML()
@@ -20,14 +20,6 @@ LIST_OF_FILES = [
     "whitelist.txt",
 ]
 
-AVAILABLE_FILES = []
-
-command = (
-    "copy"
-    if sys.platform.startswith("win32") or sys.platform.startswith("cygwin")
-    else "cp"
-)
-
 
 def compare(x, y):
     return collections.Counter(x) == collections.Counter(y)
@@ -47,38 +39,6 @@ def _print(value: str):
     print(value, flush=True)
 
 
-botConfig = sys.stdin.read()
-customConfig = json.loads(botConfig)
-if not customConfig["username"]:
-    _print("Please enter a valid instagram username")
-    exit()
-if not customConfig["device"]:
-    _print("Please enter a valid device.")
-    exit()
-
-
-# format as list
-if customConfig["blogger-followers"]:
-    customConfig["blogger-followers"] = customConfig["blogger-followers"][0].split(",")
-# format as list
-if customConfig["hashtag-likers-top"]:
-    customConfig["hashtag-likers-top"] = customConfig["hashtag-likers-top"][0].split(
-        ","
-    )
-
-#  default working hours
-if (
-    type(customConfig["working-hours"]) == list
-    and len(customConfig["working-hours"]) == 0
-):
-    customConfig["working-hours"] = ["8.30-16.40", "18.15-22.46"]
-# format as an list
-elif customConfig["working-hours"]:
-    customConfig["working-hours"] = customConfig["working-hours"][0].split(",")
-
-jobs = customConfig.pop("jobs", "follow")
-
-
 # def clear_contents_of_file(file_path: str):
 #     with open(file_path, "w") as f:
 #         f.seek(0)
@@ -109,7 +69,7 @@ jobs = customConfig.pop("jobs", "follow")
 #         return ["hashtag-likers-top", "total-unfollows-limit", "unfollow-non-followers", "unfollow", "unfollow-any", "unfollow-any-non-followers", "unfollow-any-followers", "total-unfollows-limit"]
 
 
-def create_default_configs(username):
+def create_default_configs(username, available_files):
     config_names = ["config2.yml", "unfollow.yml"]
     default_path = os.path.join(
         os.path.dirname(os.path.dirname(__file__)), "accounts", username, "config.yml"
@@ -122,10 +82,10 @@ def create_default_configs(username):
             username,
             config_name,
         )
-        if config_name not in AVAILABLE_FILES:
+        if config_name not in available_files:
             _print(f"[INFO] Copying file from  : {default_path} to {config_path}")
             # copy config files to that dir
-            os.popen(f"{command} {default_path} {config_path}")
+            shutil.copyfile(default_path, config_path)
         else:
             _print(f"[INFO] File {config_name} already exists.")
 
@@ -161,7 +121,7 @@ def comment_key(data, key: str):
     return data.replace(key, f"# {key}")
 
 
-def change_keys_in_config(username):
+def change_keys_in_config(username, customConfig, available_files):
     """
     Change config.yml file based on username
     """
@@ -173,7 +133,7 @@ def change_keys_in_config(username):
             data = yaml.load(fp)
     except Exception as e:
         _print(f"[ERROR] {e}")
-        exit()
+        return
 
     for config in customConfig:
         if config in data:
@@ -205,20 +165,22 @@ def change_keys_in_config(username):
             _print(f"[INFO] Skipping `{config}`")
 
     _print("Commenting out keys...")
-    with open(config_path, "w") as fp:
+    # replaced at once, a running bot reloads it between two sessions
+    tmp_path = f"{config_path}.tmp"
+    with open(tmp_path, "w") as fp:
         _print(f"[INFO] Writing to {config_path}")
         yaml.default_flow_style = True
         yaml.width = float("inf")
         yaml.dump(data, fp)
+    os.replace(tmp_path, config_path)
 
-    sleep(1)
-    create_default_configs(username)
+    create_default_configs(username, available_files)
 
 
 # Make the default config files and folders for a user
 
 
-def make_config(_instagram_username):
+def make_config(_instagram_username, available_files):
     """
     Make the default config files and folders for a user
     """
@@ -235,10 +197,10 @@ def make_config(_instagram_username):
         default_path = os.path.join(
             os.path.dirname(os.path.dirname(__file__)), "Bot", "config-examples", file
         )
-        if file not in AVAILABLE_FILES:
+        if file not in available_files:
             _print(f"[INFO] Copying file from  : {default_path} to {config_path}")
             # copy config files to that dir
-            os.popen(f"{command} {default_path} {config_path}")
+            shutil.copyfile(default_path, config_path)
         else:
             _print(f"[INFO] File {file} already exists.")
     return "[INFO] Success"
@@ -264,39 +226,73 @@ def make_directories(_username):
         return True
 
 
-# check base accounts folder
-if os.path.exists(os.path.join(os.path.dirname(os.path.dirname(__file__)), "accounts")):
-    _print("[INFO] Folder located.")
-else:
-    _print("[INFO] Creating accounts folder.")
-    os.mkdir(os.path.join(os.path.dirname(os.path.dirname(__file__)), "accounts"))
-    _print("[INFO] Folder created.")
-
-# check accounts/username folder.
-user_dir = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "accounts", customConfig["username"]
-)
-if os.path.exists(user_dir):
-    _print("[INFO] Folder located.")
-    _instagram_client_config_files = os.listdir(user_dir)
-    AVAILABLE_FILES = _instagram_client_config_files
-    # check files
-    if compare(_instagram_client_config_files, LIST_OF_FILES):
-        _print("[INFO] Config is correct. ")
-        # try to change configs to the ones provided
-        change_keys_in_config(customConfig["username"])
+def main(botConfig: str):
+    customConfig = json.loads(botConfig)
+    if not customConfig["username"]:
+        _print("Please enter a valid instagram username")
+        return
+    if not customConfig["device"]:
+        _print("Please enter a valid device.")
+        return
+
+    # format as list
+    if customConfig["blogger-followers"]:
+        customConfig["blogger-followers"] = customConfig["blogger-followers"][0].split(",")
+    # format as list
+    if customConfig["hashtag-likers-top"]:
+        customConfig["hashtag-likers-top"] = customConfig["hashtag-likers-top"][0].split(
+            ","
+        )
+
+    #  default working hours
+    if (
+        type(customConfig["working-hours"]) == list
+        and len(customConfig["working-hours"]) == 0
+    ):
+        customConfig["working-hours"] = ["8.30-16.40", "18.15-22.46"]
+    # format as an list
+    elif customConfig["working-hours"]:
+        customConfig["working-hours"] = customConfig["working-hours"][0].split(",")
+
+    # the jobs aren't a key of config.yml
+    customConfig.pop("jobs", None)
+
+    # check base accounts folder
+    if os.path.exists(os.path.join(os.path.dirname(os.path.dirname(__file__)), "accounts")):
+        _print("[INFO] Folder located.")
     else:
-        _print("[INFO] Config is not correct. ")
-        _print("[INFO] Replacing files...")
-        make_config(customConfig["username"])
-        sleep(0.4)
-        change_keys_in_config(customConfig["username"])
-    _print("[INFO] End")
-else:
-    os.mkdir(user_dir)
-    _print("[INFO] Folder created.")
-    _print("[INFO] Creating config files...")
-    make_config(customConfig["username"])
-    sleep(0.4)
-    change_keys_in_config(customConfig["username"])
-    _print("[INFO] End")
+        _print("[INFO] Creating accounts folder.")
+        os.mkdir(os.path.join(os.path.dirname(os.path.dirname(__file__)), "accounts"))
+        _print("[INFO] Folder created.")
+
+    # check accounts/username folder.
+    user_dir = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "accounts", customConfig["username"]
+    )
+    if os.path.exists(user_dir):
+        _print("[INFO] Folder located.")
+        _instagram_client_config_files = os.listdir(user_dir)
+        available_files = _instagram_client_config_files
+        # check files
+        if compare(_instagram_client_config_files, LIST_OF_FILES):
+            _print("[INFO] Config is correct. ")
+            # try to change configs to the ones provided
+            change_keys_in_config(customConfig["username"], customConfig, available_files)
+        else:
+            _print("[INFO] Config is not correct. ")
+            _print("[INFO] Replacing files...")
+            make_config(customConfig["username"], available_files)
+            change_keys_in_config(customConfig["username"], customConfig, available_files)
+        _print("[INFO] End")
+    else:
+        available_files = []
+        os.mkdir(user_dir)
+        _print("[INFO] Folder created.")
+        _print("[INFO] Creating config files...")
+        make_config(customConfig["username"], available_files)
+        change_keys_in_config(customConfig["username"], customConfig, available_files)
+        _print("[INFO] End")
+
+
+if __name__ == "__main__":
+    main(sys.stdin.read())
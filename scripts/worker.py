@@ -0,0 +1,147 @@
+"""
+Long-lived python worker of the server.
+
+Instead of spawning a python process for every script call, the server starts
+this once and writes one json request per line on its stdin:
+    {"id": 1, "script": "sessions", "input": "<what the script reads from stdin>"}
+and reads one json response per line on its stdout:
+    {"id": 1, "ok": true, "output": "<what the script printed>"}
+
+The scripts are imported once, so the interpreter startup and the imports
+(yaml, requests, GramAddict..) are paid only when the worker starts.
+Calls of different scripts run in parallel, calls of the same script in order.
+"""
+import importlib
+import io
+import json
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPTS = (
+    "get_config",
+    "read_config",
+    "sessions",
+    "send_data_to_telegram",
+    "start_bot_checks",
+)
+WORKER_THREADS = len(SCRIPTS)
+
+
+def load_handlers() -> dict:
+    """
+    The main function of every script, or the error which prevents to import it,
+    so that a missing module only breaks the calls of the script which needs it.
+    """
+    handlers = {}
+    for script in SCRIPTS:
+        try:
+            handlers[script] = importlib.import_module(script).main
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            handlers[script] = e
+    return handlers
+
+
+class CapturedOutput(io.TextIOBase):
+    """
+    The sys.stdout of the worker: what a script prints goes in the response
+    of the request handled by that thread, never in the protocol stream.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def start(self):
+        self._local.buffer = io.StringIO()
+
+    def stop(self) -> str:
+        output = self._local.buffer.getvalue()
+        self._local.buffer = None
+        return output
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return sys.stderr.write(text)
+        return buffer.write(text)
+
+
+class Worker:
+    def __init__(self, protocol=sys.stdout):
+        self.protocol = protocol
+        self.output = CapturedOutput()
+        self.handlers = load_handlers()
+        self.protocol_lock = threading.Lock()
+        self.script_locks = {script: threading.Lock() for script in SCRIPTS}
+
+    def respond(self, response: dict):
+        with self.protocol_lock:
+            self.protocol.write(json.dumps(response) + "\n")
+            self.protocol.flush()
+
+    def handle(self, request: dict):
+        script = request["script"]
+        response = {"id": request.get("id"), "ok": True}
+        with self.script_locks[script]:
+            self.output.start()
+            try:
+                handler = self.handlers[script]
+                if isinstance(handler, Exception):
+                    raise handler
+                handler(request.get("input") or "")
+            except SystemExit:
+                pass
+            except Exception as e:
+                traceback.print_exc(file=sys.stderr)
+                response["ok"] = False
+                response["error"] = f"[ERROR] {script} failed: {e}"
+            finally:
+                response["output"] = self.output.stop()
+        self.respond(response)
+
+    def run(self, requests=sys.stdin):
+        sys.stdout = self.output
+        try:
+            with ThreadPoolExecutor(max_workers=WORKER_THREADS) as executor:
+                for line in requests:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                    except ValueError as e:
+                        self.respond(
+                            {"id": None, "ok": False, "output": "", "error": f"[ERROR] Invalid request: {e}"}
+                        )
+                        continue
+                    if not isinstance(request, dict):
+                        self.respond(
+                            {
+                                "id": None,
+                                "ok": False,
+                                "output": "",
+                                "error": "[ERROR] Invalid request: not an object.",
+                            }
+                        )
+                        continue
+                    if request.get("script") not in self.handlers:
+                        self.respond(
+                            {
+                                "id": request.get("id"),
+                                "ok": False,
+                                "output": "",
+                                "error": f"[ERROR] Unknown script {request.get('script')}.",
+                            }
+                        )
+                        continue
+                    executor.submit(self.handle, request)
+        finally:
+            sys.stdout = self.protocol
+
+
+if __name__ == "__main__":
+    Worker().run()